@@ -0,0 +1,95 @@
+const COMPACT_MAGIC = "NBAC";
+const COMPACT_VERSION = 1;
+const COMPACT_PREFIX_BYTES = 12;
+const INT32_NULL = -(2 ** 31);
+const DAY_IN_MS = 24 * 60 * 60 * 1000;
+
+type CompactColumn =
+  | { type: "null" }
+  | { type: "bool" | "int" | "float" | "date" | "string" | "json"; buffer: number }
+  | { type: "list"; ends: number; items: CompactColumn }
+  | { type: "struct"; fields: Record<string, CompactColumn> };
+
+type CompactValue =
+  | { kind: "object"; fields: Record<string, CompactValue> }
+  | { kind: "column"; length: number; column: CompactColumn }
+  | { kind: "literal"; value: unknown };
+
+interface CompactHeader {
+  format: string;
+  origin_date: string;
+  strings: string[];
+  buffers: { typecode: "b" | "i" | "d"; offset: number; count: number }[];
+  root: CompactValue;
+}
+
+type TypedBuffer = Int8Array | Int32Array | Float64Array;
+
+export function decodeCompactContract(data: ArrayBuffer): unknown {
+  const view = new DataView(data);
+  const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+  const version = view.getUint32(4, true);
+  if (magic !== COMPACT_MAGIC || version !== COMPACT_VERSION) {
+    throw new Error(`unsupported compact contract: ${magic} v${version}`);
+  }
+  const headerLength = view.getUint32(8, true);
+  const header = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(data, COMPACT_PREFIX_BYTES, headerLength)),
+  ) as CompactHeader;
+  // The encoder pads the header so every buffer is 8-byte aligned and can be viewed without copying.
+  const bodyOffset = COMPACT_PREFIX_BYTES + headerLength;
+  const buffers: TypedBuffer[] = header.buffers.map((spec) => {
+    const byteOffset = bodyOffset + spec.offset;
+    if (spec.typecode === "b") {
+      return new Int8Array(data, byteOffset, spec.count);
+    }
+    if (spec.typecode === "d") {
+      return new Float64Array(data, byteOffset, spec.count);
+    }
+    return new Int32Array(data, byteOffset, spec.count);
+  });
+  const originMs = Date.parse(`${header.origin_date}T00:00:00Z`);
+
+  const decodeColumn = (column: CompactColumn, length: number): unknown[] => {
+    if (column.type === "null") {
+      return new Array(length).fill(null);
+    }
+    if (column.type === "struct") {
+      const fields = Object.entries(column.fields).map(([key, child]) => [key, decodeColumn(child, length)] as const);
+      return Array.from({ length }, (_, index) => Object.fromEntries(fields.map(([key, values]) => [key, values[index]])));
+    }
+    if (column.type === "list") {
+      const ends = buffers[column.ends];
+      const items = decodeColumn(column.items, ends.length ? ends[ends.length - 1] : 0);
+      return Array.from(ends, (end, index) => items.slice(index === 0 ? 0 : ends[index - 1], end));
+    }
+    const values = buffers[column.buffer];
+    switch (column.type) {
+      case "bool":
+        return Array.from(values, (value) => (value < 0 ? null : value === 1));
+      case "int":
+        return Array.from(values, (value) => (value === INT32_NULL ? null : value));
+      case "float":
+        return Array.from(values, (value) => (Number.isNaN(value) ? null : value));
+      case "date":
+        return Array.from(values, (value) =>
+          value === INT32_NULL ? null : new Date(originMs + value * DAY_IN_MS).toISOString().slice(0, 10));
+      case "string":
+        return Array.from(values, (value) => (value < 0 ? null : header.strings[value]));
+      case "json":
+        return Array.from(values, (value) => (value < 0 ? null : JSON.parse(header.strings[value])));
+    }
+  };
+
+  const decodeValue = (node: CompactValue): unknown => {
+    if (node.kind === "object") {
+      return Object.fromEntries(Object.entries(node.fields).map(([key, child]) => [key, decodeValue(child)]));
+    }
+    if (node.kind === "column") {
+      return decodeColumn(node.column, node.length);
+    }
+    return node.value;
+  };
+
+  return decodeValue(header.root);
+}
@@ -0,0 +1,57 @@
+import { describe, expect, it } from "vitest";
+import {
+  fetchContractManifest,
+  loadPublishedContract,
+  resolvePublishedContractUrl,
+  type ContractManifest,
+} from "./contractManifest";
+
+const manifest: ContractManifest = {
+  format: "contract-manifest-v1",
+  artifacts: {
+    "layout-contract": {
+      logical_name: "layout-contract",
+      file_name: "layout-contract.0123456789abcdef.json",
+      gzip_file_name: "layout-contract.0123456789abcdef.json.gz",
+      content_hash: "0123456789abcdef",
+      byte_count: 12,
+      gzip_byte_count: 10,
+    },
+  },
+};
+
+function fakeFetch(bodies: Record<string, unknown>, requested: string[]) {
+  return async (url: string) => {
+    requested.push(url);
+    return url in bodies
+      ? new Response(JSON.stringify(bodies[url]), { status: 200 })
+      : new Response("", { status: 404 });
+  };
+}
+
+describe("contract manifest", () => {
+  it("resolves logical contract names to their hashed files", () => {
+    expect(resolvePublishedContractUrl(manifest, "layout-contract", "/contracts/")).toBe(
+      "/contracts/layout-contract.0123456789abcdef.json",
+    );
+    expect(resolvePublishedContractUrl(manifest, "editorial-chapters")).toBeNull();
+  });
+
+  it("loads a contract through the manifest and rejects unknown manifest formats", async () => {
+    const requested: string[] = [];
+    const fetchImpl = fakeFetch(
+      {
+        "/contracts/contract-manifest.json": manifest,
+        "/contracts/layout-contract.0123456789abcdef.json": { layout_meta: {} },
+      },
+      requested,
+    );
+
+    const loaded = await fetchContractManifest("/contracts", fetchImpl);
+    await expect(loadPublishedContract(loaded, "layout-contract", "/contracts", fetchImpl)).resolves.toEqual({ layout_meta: {} });
+    expect(requested).toEqual(["/contracts/contract-manifest.json", "/contracts/layout-contract.0123456789abcdef.json"]);
+
+    const stale = fakeFetch({ "/contracts/contract-manifest.json": { ...manifest, format: "v0" } }, []);
+    await expect(fetchContractManifest("/contracts", stale)).rejects.toThrow("unsupported contract manifest format");
+  });
+});
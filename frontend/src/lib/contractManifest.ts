@@ -0,0 +1,68 @@
+const CONTRACT_MANIFEST_FORMAT = "contract-manifest-v1";
+const CONTRACT_MANIFEST_NAME = "contract-manifest.json";
+const DEFAULT_CONTRACT_BASE_URL = "/contracts";
+
+export type PublishedContractName = "presentation-contract" | "layout-contract" | "editorial-chapters";
+
+export interface PublishedContractArtifact {
+  logical_name: string;
+  file_name: string;
+  gzip_file_name: string;
+  content_hash: string;
+  byte_count: number;
+  gzip_byte_count: number;
+}
+
+export interface ContractManifest {
+  format: string;
+  artifacts: Record<string, PublishedContractArtifact>;
+}
+
+type FetchLike = (url: string, init?: RequestInit) => Promise<Response>;
+
+function joinUrl(baseUrl: string, fileName: string): string {
+  return `${baseUrl.replace(/\/+$/, "")}/${fileName}`;
+}
+
+export function resolvePublishedContractUrl(
+  manifest: ContractManifest,
+  name: PublishedContractName,
+  baseUrl = DEFAULT_CONTRACT_BASE_URL,
+): string | null {
+  const artifact = manifest.artifacts[name];
+  return artifact ? joinUrl(baseUrl, artifact.file_name) : null;
+}
+
+export async function fetchContractManifest(
+  baseUrl = DEFAULT_CONTRACT_BASE_URL,
+  fetchImpl: FetchLike = fetch,
+): Promise<ContractManifest> {
+  // The manifest is the only unhashed file, so it is revalidated on every load; the hashed
+  // contracts it points at can then be cached indefinitely.
+  const response = await fetchImpl(joinUrl(baseUrl, CONTRACT_MANIFEST_NAME), { cache: "no-cache" });
+  if (!response.ok) {
+    throw new Error(`contract manifest request failed: ${response.status}`);
+  }
+  const manifest = (await response.json()) as ContractManifest;
+  if (manifest.format !== CONTRACT_MANIFEST_FORMAT) {
+    throw new Error(`unsupported contract manifest format: ${manifest.format}`);
+  }
+  return manifest;
+}
+
+export async function loadPublishedContract<T = unknown>(
+  manifest: ContractManifest,
+  name: PublishedContractName,
+  baseUrl = DEFAULT_CONTRACT_BASE_URL,
+  fetchImpl: FetchLike = fetch,
+): Promise<T | null> {
+  const url = resolvePublishedContractUrl(manifest, name, baseUrl);
+  if (url === null) {
+    return null;
+  }
+  const response = await fetchImpl(url);
+  if (!response.ok) {
+    throw new Error(`contract request failed for ${name}: ${response.status}`);
+  }
+  return (await response.json()) as T;
+}
@@ -12,6 +12,7 @@ import {
   getDefaultUiState,
   jumpTimelineToMinimapSegment,
   normalizeTimelineUiState,
+  querySpatialIndex,
   renderTimelineScene,
   setTimelineViewportWindow,
   setTimelineZoomLevel,
@@ -495,6 +496,50 @@ describe("timeline utilities", () => {
     ).toBeUndefined();
   });
 
+  it("hides labels that the active LOD tier suppressed for a collision", () => {
+    const contract = cloneJson(generatedContract);
+    const bounds = getContractBounds(contract);
+    const inlineLabel = layoutForContract(contract, bounds.start, bounds.end).inlineLabels.find((row) => row.visible);
+
+    expect(inlineLabel).toBeDefined();
+
+    if (contract.layout) {
+      contract.layout.lod_tiers = [
+        {
+          tier_id: "lod-0",
+          tier_index: 0,
+          detail_level: "full",
+          min_zoom_days: 0,
+          max_zoom_days: 100000,
+          min_segment_days: 0,
+          min_label_days: 0,
+          segments: [],
+          event_clusters: [],
+          label_placements: [
+            {
+              segment_id: inlineLabel!.segment_id,
+              lane_group: inlineLabel!.lane_group,
+              band_slot: 0,
+              placement_kind: "inline",
+              placed: false,
+              suppressed_reason: "collision",
+              offset_days: 0,
+              width_days: 1,
+              label_priority: inlineLabel!.priority,
+            },
+          ],
+        },
+      ];
+    }
+
+    const layout = layoutForContract(contract, bounds.start, bounds.end);
+
+    expect(layout.inlineLabels.find((row) => row.segment_id === inlineLabel?.segment_id)).toMatchObject({ visible: false });
+    expect(
+      layout.identityMarkers.find((row) => row.segment_id === inlineLabel?.segment_id && row.visible),
+    ).toBeUndefined();
+  });
+
   it("preserves the left identity marker when an inline-capable strand is clipped too tightly to fit its label", () => {
     const contract = cloneJson(generatedContract);
     const candidate = contract.layout?.label_layout.find((row) =>
@@ -569,4 +614,33 @@ describe("timeline utilities", () => {
     expect(markup).toContain("timeline-identity-marker--text_only");
     expect(markup).toContain('href="/headshots/placeholder-headshot.svg"');
   });
+
+  it("looks up viewport candidates from the spatial index bucket range", () => {
+    const index = {
+      origin_date: "2020-01-01",
+      bucket_days: 30,
+      bucket_count: 6,
+      lanes: [
+        {
+          lane_key: "main_roster:0",
+          max_bucket_span: 3,
+          segment_entries: [[0, 1, 0], [0, 3, 2], [4, 1, 3]] as [number, number, number][],
+          event_cluster_entries: [],
+          label_entries: [[0, 1, 0]] as [number, number, number][],
+        },
+        {
+          lane_key: "main_roster:1",
+          max_bucket_span: 1,
+          segment_entries: [[1, 1, 1]] as [number, number, number][],
+          event_cluster_entries: [[1, 1, 0]] as [number, number, number][],
+          label_entries: [],
+        },
+      ],
+    };
+
+    const hits = querySpatialIndex(index, "2020-02-01", "2020-03-15");
+    expect([...hits.segmentRows].sort()).toEqual([1, 2]);
+    expect([...hits.eventClusterRows]).toEqual([0]);
+    expect([...querySpatialIndex(index, "2020-01-01", "2020-12-31", ["main_roster:0"]).segmentRows]).toEqual([0, 2, 3]);
+  });
 });
@@ -163,12 +163,80 @@ export interface TimelineLayoutEvent {
   transition_links: TimelineLayoutTransitionLink[];
 }
 
+export interface TimelineLayoutLodSegment {
+  lod_segment_id: string;
+  lane_group: string;
+  band_slot: number;
+  date_start: string;
+  date_end: string;
+  primary_asset_id: string;
+  member_segment_ids: string[];
+  asset_ids: string[];
+  label_text: string | null;
+  label_priority: number;
+}
+
+export interface TimelineLayoutLodEventCluster {
+  lod_cluster_id: string;
+  date_start: string;
+  date_end: string;
+  anchor_date: string;
+  member_cluster_ids: string[];
+  event_count: number;
+}
+
+export interface TimelineLayoutLabelPlacement {
+  segment_id: string;
+  lane_group: string;
+  band_slot: number;
+  placement_kind: "inline" | "marker" | "none";
+  placed: boolean;
+  suppressed_reason: "collision" | "no_label" | null;
+  offset_days: number;
+  width_days: number;
+  label_priority: number;
+}
+
+export interface TimelineLayoutLodTier {
+  tier_id: string;
+  tier_index: number;
+  detail_level: "full" | "aggregated";
+  min_zoom_days: number;
+  max_zoom_days: number;
+  min_segment_days: number;
+  min_label_days: number;
+  segments: TimelineLayoutLodSegment[];
+  event_clusters: TimelineLayoutLodEventCluster[];
+  label_placements?: TimelineLayoutLabelPlacement[];
+}
+
+// [start_bucket, bucket_span, row_index]; row_index points into lane_layout, event_layout, or the
+// full tier's label_placements.
+export type TimelineLayoutSpatialIndexEntry = [number, number, number];
+
+export interface TimelineLayoutSpatialIndexLane {
+  lane_key: string;
+  max_bucket_span: number;
+  segment_entries: TimelineLayoutSpatialIndexEntry[];
+  event_cluster_entries: TimelineLayoutSpatialIndexEntry[];
+  label_entries: TimelineLayoutSpatialIndexEntry[];
+}
+
+export interface TimelineLayoutSpatialIndex {
+  origin_date: string;
+  bucket_days: number;
+  bucket_count: number;
+  lanes: TimelineLayoutSpatialIndexLane[];
+}
+
 export interface TimelineGeneratedLayoutContract {
   layout_meta: TimelineLayoutMeta;
   lane_layout: TimelineLayoutLaneSegment[];
   label_layout: TimelineLayoutLabel[];
   event_layout: TimelineLayoutEvent[];
   chapter_layout: TimelineChapterLayout[];
+  lod_tiers?: TimelineLayoutLodTier[];
+  spatial_index?: TimelineLayoutSpatialIndex | null;
 }
 
 export interface TimelinePresentationContract {
@@ -1531,6 +1599,103 @@ function buildNodeFocusState(node: TimelineContractNode, focus: TimelineFocus |
   return eventMatch || assetMatch || laneMatch;
 }
 
+export function labelPlacementsForWindow(
+  layout: TimelineGeneratedLayoutContract,
+  windowDays: number,
+): Map<string, TimelineLayoutLabelPlacement> {
+  const tiers = layout.lod_tiers ?? [];
+  const tier = tiers.find((row) => windowDays <= row.max_zoom_days) ?? tiers[tiers.length - 1];
+  return new Map((tier?.label_placements ?? []).map((row) => [row.segment_id, row]));
+}
+
+function collectSpatialEntries(
+  entries: TimelineLayoutSpatialIndexEntry[],
+  maxBucketSpan: number,
+  firstBucket: number,
+  endBucket: number,
+  rows: Set<number>,
+): void {
+  // Entries are sorted by start bucket, so nothing starting before firstBucket - maxBucketSpan can reach the window.
+  let low = 0;
+  let high = entries.length;
+  const earliestStart = firstBucket - maxBucketSpan + 1;
+  while (low < high) {
+    const middle = (low + high) >> 1;
+    if (entries[middle][0] < earliestStart) {
+      low = middle + 1;
+    } else {
+      high = middle;
+    }
+  }
+  for (let position = low; position < entries.length; position += 1) {
+    const [startBucket, bucketSpan, rowIndex] = entries[position];
+    if (startBucket > endBucket) {
+      break;
+    }
+    if (startBucket + bucketSpan > firstBucket) {
+      rows.add(rowIndex);
+    }
+  }
+}
+
+export function querySpatialIndex(
+  index: TimelineLayoutSpatialIndex,
+  dateStart: string,
+  dateEnd: string,
+  laneKeys?: string[],
+): { segmentRows: Set<number>; eventClusterRows: Set<number>; labelRows: Set<number> } {
+  const lastBucket = index.bucket_count - 1;
+  const firstBucket = Math.min(lastBucket, Math.floor(daysBetween(index.origin_date, dateStart) / index.bucket_days));
+  const endBucket = Math.min(lastBucket, Math.floor(daysBetween(index.origin_date, dateEnd) / index.bucket_days));
+  const laneFilter = laneKeys ? new Set(laneKeys) : null;
+  const segmentRows = new Set<number>();
+  const eventClusterRows = new Set<number>();
+  const labelRows = new Set<number>();
+  for (const lane of index.lanes) {
+    if (laneFilter && !laneFilter.has(lane.lane_key)) {
+      continue;
+    }
+    collectSpatialEntries(lane.segment_entries, lane.max_bucket_span, firstBucket, endBucket, segmentRows);
+    collectSpatialEntries(lane.event_cluster_entries, lane.max_bucket_span, firstBucket, endBucket, eventClusterRows);
+    collectSpatialEntries(lane.label_entries, lane.max_bucket_span, firstBucket, endBucket, labelRows);
+  }
+  return { segmentRows, eventClusterRows, labelRows };
+}
+
+const edgePositionsByContract = new WeakMap<TimelineContract, { byId: Map<string, number>; unindexed: number[] }>();
+
+function viewportEdgeCandidates(contract: TimelineContract, windowStart: string, windowEnd: string): TimelineContractEdge[] {
+  const spatialIndex = contract.layout?.spatial_index;
+  if (!spatialIndex) {
+    return contract.edges;
+  }
+  let positions = edgePositionsByContract.get(contract);
+  if (!positions) {
+    const segmentIds = new Set(contract.layout?.lane_layout.map((row) => row.segment_id) ?? []);
+    const byId = new Map<string, number>();
+    const unindexed: number[] = [];
+    contract.edges.forEach((edge, position) => {
+      if (segmentIds.has(edge.edge_id)) {
+        byId.set(edge.edge_id, position);
+      } else {
+        unindexed.push(position);
+      }
+    });
+    positions = { byId, unindexed };
+    edgePositionsByContract.set(contract, positions);
+  }
+  const laneLayout = contract.layout?.lane_layout ?? [];
+  const { segmentRows } = querySpatialIndex(spatialIndex, windowStart, windowEnd);
+  const candidatePositions = [...positions.unindexed];
+  for (const rowIndex of segmentRows) {
+    const position = positions.byId.get(laneLayout[rowIndex]?.segment_id ?? "");
+    if (position !== undefined) {
+      candidatePositions.push(position);
+    }
+  }
+  return candidatePositions.sort((left, right) => left - right).map((position) => contract.edges[position]);
+}
+
 function estimateTextWidth(text: string, fontSize = 12): number {
   return Math.max(fontSize * 3, Math.round(text.length * fontSize * 0.58));
 }
@@ -1551,11 +1716,15 @@ function buildLabelAndIdentityLayouts(
   contract: TimelineContract,
   edges: TimelineEdgeLayout[],
   segmentById: Map<string, TimelineLayoutLaneSegment>,
+  windowDays: number,
 ): {
   inlineLabels: TimelineInlineLabelLayout[];
   identityMarkers: TimelineIdentityMarkerLayout[];
 } {
   const labelBySegmentId = new Map(contract.layout?.label_layout.map((row) => [row.segment_id, row]) ?? []);
+  const placementBySegmentId = contract.layout
+    ? labelPlacementsForWindow(contract.layout, windowDays)
+    : new Map<string, TimelineLayoutLabelPlacement>();
   const inlineLabels: TimelineInlineLabelLayout[] = [];
   const identityMarkers: TimelineIdentityMarkerLayout[] = [];
 
@@ -1566,10 +1735,13 @@ function buildLabelAndIdentityLayouts(
       continue;
     }
 
+    // A label the build-time sweep dropped for a collision stays hidden at this tier's zoom.
+    const suppressed = placementBySegmentId.get(edge.edge_id)?.suppressed_reason === "collision";
     const label = resolveSegmentLabel(segment, edge);
     const availableWidth = Math.max(0, edge.x2 - edge.x1);
     const labelWidth = estimateTextWidth(label) + INLINE_LABEL_HORIZONTAL_PADDING * 2;
-    const inlineVisible = labelHint.inline_label_allowed
+    const inlineVisible = !suppressed
+      && labelHint.inline_label_allowed
       && availableWidth >= labelWidth + INLINE_LABEL_MIN_CLEARANCE;
     const labelY = edge.y1 + (edge.y2 - edge.y1) / 2;
 
@@ -1586,7 +1758,8 @@ function buildLabelAndIdentityLayouts(
       visible: inlineVisible,
     });
 
-    const markerVisible = labelHint.marker_side === "left"
+    const markerVisible = !suppressed
+      && labelHint.marker_side === "left"
       && (labelHint.fallback_marker_required || !inlineVisible);
     const imagePath = normalizeStaticAssetPath(segment.identity_marker.image_path);
     const usesHeadshot = segment.identity_marker.marker_variant === "headshot_text" && Boolean(imagePath);
@@ -1633,7 +1806,7 @@ export function buildTimelineLayout(contract: TimelineContract, state: TimelineU
   const windowEnd = scene.chronology.windowEnd;
   const width = viewport.viewportWidth;
 
-  const visibleEdges = contract.edges
+  const visibleEdges = viewportEdgeCandidates(contract, windowStart, windowEnd)
     .filter((edge) => dateRangesOverlap(edge.start_date, edge.end_date, windowStart, windowEnd))
     .filter((edge) => {
       const kind = assetKindForEdge(edge);
@@ -1715,7 +1888,12 @@ export function buildTimelineLayout(contract: TimelineContract, state: TimelineU
     visible: isDateVisible(String(marker.marker_date), windowStart, windowEnd),
     payload: marker.payload as Record<string, unknown>,
   }));
-  const { inlineLabels, identityMarkers } = buildLabelAndIdentityLayouts(contract, edgeLayouts, segmentById);
+  const { inlineLabels, identityMarkers } = buildLabelAndIdentityLayouts(
+    contract,
+    edgeLayouts,
+    segmentById,
+    viewport.windowDays,
+  );
 
   return {
     width,
@@ -79,6 +79,20 @@ create index if not exists idx_evidence_normalized_claims_claim_type_date
 create index if not exists idx_evidence_normalized_claims_normalizer_version
   on evidence.normalized_claims (normalizer_version);
 
+-- One row per source record the normalizer has processed at a version, written
+-- even when the record yields no new claims, so incremental runs can skip it.
+create table if not exists evidence.normalization_ledger (
+  source_record_id text not null references evidence.source_records (source_record_id) on delete cascade,
+  normalizer_version text not null,
+  normalized_at timestamptz not null default now(),
+  primary key (source_record_id, normalizer_version)
+);
+
+insert into evidence.normalization_ledger (source_record_id, normalizer_version)
+select distinct source_record_id, normalizer_version
+from evidence.normalized_claims
+on conflict do nothing;
+
 -- ---------------------------------------------------------------------------
 -- Manual overrides
 -- ---------------------------------------------------------------------------
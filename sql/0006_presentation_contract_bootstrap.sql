@@ -1,6 +1,12 @@
 -- Stage 6 presentation contract bootstrap.
 -- Adds deterministic frontend-ready timeline nodes, edges, lanes, and
 -- presentation build metadata derived from canonical rows.
+--
+-- Rows are stored per presentation build and a single-row pointer names the
+-- current build. A rebuild inserts a new build and swaps the pointer in the same
+-- transaction, so readers never see an empty contract, and switching the pointer
+-- back rolls a bad build back. The timeline_nodes, asset_lanes, and
+-- timeline_edges views keep the original read shape over the current build.
 
 begin;
 
@@ -17,34 +23,49 @@ create table if not exists presentation.builds (
 create index if not exists idx_presentation_builds_built_at
   on presentation.builds (built_at desc);
 
-create table if not exists presentation.timeline_nodes (
-  node_id text primary key,
-  event_id text references canonical.events (event_id) on delete set null,
+create table if not exists presentation.current_build (
+  singleton boolean primary key default true,
+  presentation_build_id text not null references presentation.builds (presentation_build_id),
+  previous_presentation_build_id text references presentation.builds (presentation_build_id) on delete set null,
+  swapped_at timestamptz not null default now(),
+  constraint chk_presentation_current_build_singleton
+    check (singleton)
+);
+
+-- Build rows are self-contained snapshots: no foreign keys into canonical tables,
+-- whose rebuilds would otherwise cascade into every retained build.
+create table if not exists presentation.build_timeline_nodes (
+  presentation_build_id text not null references presentation.builds (presentation_build_id) on delete cascade,
+  node_id text not null,
+  event_id text,
   event_date date not null,
   event_order integer not null,
   node_type text not null,
   label text not null,
   payload jsonb not null default '{}'::jsonb,
   created_at timestamptz not null default now(),
+  primary key (presentation_build_id, node_id),
   constraint chk_presentation_timeline_node_type
     check (node_type in ('event', 'state_boundary', 'calendar_marker'))
 );
 
-create index if not exists idx_presentation_timeline_nodes_order
-  on presentation.timeline_nodes (event_date, event_order, node_id);
+create index if not exists idx_presentation_build_timeline_nodes_order
+  on presentation.build_timeline_nodes (presentation_build_id, event_date, event_order, node_id);
 
-create index if not exists idx_presentation_timeline_nodes_event
-  on presentation.timeline_nodes (event_id);
+create index if not exists idx_presentation_build_timeline_nodes_event
+  on presentation.build_timeline_nodes (presentation_build_id, event_id);
 
-create table if not exists presentation.asset_lanes (
-  asset_lane_id text primary key,
-  asset_id text not null references canonical.asset (asset_id) on delete cascade,
+create table if not exists presentation.build_asset_lanes (
+  presentation_build_id text not null references presentation.builds (presentation_build_id) on delete cascade,
+  asset_lane_id text not null,
+  asset_id text not null,
   lane_group text not null,
   lane_index integer not null,
   effective_start_date date not null,
   effective_end_date date not null,
   assignment_method text not null,
   created_at timestamptz not null default now(),
+  primary key (presentation_build_id, asset_lane_id),
   constraint chk_presentation_asset_lane_group
     check (lane_group in ('main_roster', 'two_way', 'future_picks')),
   constraint chk_presentation_asset_lane_index
@@ -53,17 +74,18 @@ create table if not exists presentation.asset_lanes (
     check (effective_end_date >= effective_start_date)
 );
 
-create index if not exists idx_presentation_asset_lanes_asset
-  on presentation.asset_lanes (asset_id);
+create index if not exists idx_presentation_build_asset_lanes_asset
+  on presentation.build_asset_lanes (presentation_build_id, asset_id);
 
-create index if not exists idx_presentation_asset_lanes_group_index
-  on presentation.asset_lanes (lane_group, lane_index, effective_start_date, effective_end_date);
+create index if not exists idx_presentation_build_asset_lanes_group_index
+  on presentation.build_asset_lanes (presentation_build_id, lane_group, lane_index, effective_start_date, effective_end_date);
 
-create table if not exists presentation.timeline_edges (
-  edge_id text primary key,
-  asset_id text not null references canonical.asset (asset_id) on delete cascade,
-  source_node_id text not null references presentation.timeline_nodes (node_id) on delete cascade,
-  target_node_id text not null references presentation.timeline_nodes (node_id) on delete cascade,
+create table if not exists presentation.build_timeline_edges (
+  presentation_build_id text not null references presentation.builds (presentation_build_id) on delete cascade,
+  edge_id text not null,
+  asset_id text not null,
+  source_node_id text not null,
+  target_node_id text not null,
   start_date date not null,
   end_date date not null,
   edge_type text not null,
@@ -71,6 +93,11 @@ create table if not exists presentation.timeline_edges (
   lane_index integer not null,
   payload jsonb not null default '{}'::jsonb,
   created_at timestamptz not null default now(),
+  primary key (presentation_build_id, edge_id),
+  foreign key (presentation_build_id, source_node_id)
+    references presentation.build_timeline_nodes (presentation_build_id, node_id) on delete cascade,
+  foreign key (presentation_build_id, target_node_id)
+    references presentation.build_timeline_nodes (presentation_build_id, node_id) on delete cascade,
   constraint chk_presentation_timeline_edge_type
     check (edge_type in ('player_line', 'pick_line', 'transition_line')),
   constraint chk_presentation_timeline_edge_lane_group
@@ -81,13 +108,79 @@ create table if not exists presentation.timeline_edges (
     check (end_date >= start_date)
 );
 
-create index if not exists idx_presentation_timeline_edges_asset
-  on presentation.timeline_edges (asset_id);
+create index if not exists idx_presentation_build_timeline_edges_asset
+  on presentation.build_timeline_edges (presentation_build_id, asset_id);
+
+create index if not exists idx_presentation_build_timeline_edges_nodes
+  on presentation.build_timeline_edges (presentation_build_id, source_node_id, target_node_id);
+
+create index if not exists idx_presentation_build_timeline_edges_lane
+  on presentation.build_timeline_edges (presentation_build_id, lane_group, lane_index, start_date, end_date);
+
+-- Databases bootstrapped before build-scoped storage hold plain tables under the
+-- view names; their rows are derived and are rebuilt by the next Stage 6 run.
+do $$
+declare
+  legacy_table text;
+begin
+  foreach legacy_table in array array['timeline_edges', 'asset_lanes', 'timeline_nodes'] loop
+    if exists (
+      select 1
+      from pg_class
+      join pg_namespace on pg_namespace.oid = pg_class.relnamespace
+      where pg_namespace.nspname = 'presentation'
+        and pg_class.relname = legacy_table
+        and pg_class.relkind = 'r'
+    ) then
+      execute format('drop table presentation.%I', legacy_table);
+    end if;
+  end loop;
+end
+$$;
+
+create or replace view presentation.timeline_nodes as
+select
+  nodes.node_id,
+  nodes.event_id,
+  nodes.event_date,
+  nodes.event_order,
+  nodes.node_type,
+  nodes.label,
+  nodes.payload,
+  nodes.created_at
+from presentation.build_timeline_nodes as nodes
+join presentation.current_build
+  on current_build.presentation_build_id = nodes.presentation_build_id;
 
-create index if not exists idx_presentation_timeline_edges_nodes
-  on presentation.timeline_edges (source_node_id, target_node_id);
+create or replace view presentation.asset_lanes as
+select
+  lanes.asset_lane_id,
+  lanes.asset_id,
+  lanes.lane_group,
+  lanes.lane_index,
+  lanes.effective_start_date,
+  lanes.effective_end_date,
+  lanes.assignment_method,
+  lanes.created_at
+from presentation.build_asset_lanes as lanes
+join presentation.current_build
+  on current_build.presentation_build_id = lanes.presentation_build_id;
 
-create index if not exists idx_presentation_timeline_edges_lane
-  on presentation.timeline_edges (lane_group, lane_index, start_date, end_date);
+create or replace view presentation.timeline_edges as
+select
+  edges.edge_id,
+  edges.asset_id,
+  edges.source_node_id,
+  edges.target_node_id,
+  edges.start_date,
+  edges.end_date,
+  edges.edge_type,
+  edges.lane_group,
+  edges.lane_index,
+  edges.payload,
+  edges.created_at
+from presentation.build_timeline_edges as edges
+join presentation.current_build
+  on current_build.presentation_build_id = edges.presentation_build_id;
 
 commit;
@@ -0,0 +1,48 @@
+-- Stage 5 asset lineage bootstrap.
+-- Materializes the ancestor/descendant closure of canonical.event_asset_flow
+-- so lineage-tree lookups are a single indexed read. Both tables are derived
+-- from event_asset_flow and rebuilt by Stage 5, so they carry no foreign keys
+-- to canonical.asset: Stage 3 and Stage 4 replace asset rows on every persist.
+
+begin;
+
+create schema if not exists canonical;
+
+create table if not exists canonical.asset_lineage (
+  asset_lineage_id text primary key,
+  ancestor_asset_id text not null,
+  descendant_asset_id text not null,
+  depth integer not null,
+  path_asset_ids jsonb not null,
+  path_event_ids jsonb not null,
+  created_at timestamptz not null default now(),
+  constraint chk_canonical_asset_lineage_depth
+    check (depth >= 1),
+  constraint chk_canonical_asset_lineage_distinct
+    check (ancestor_asset_id <> descendant_asset_id)
+);
+
+create unique index if not exists uq_canonical_asset_lineage_pair
+  on canonical.asset_lineage (ancestor_asset_id, descendant_asset_id);
+
+create index if not exists idx_canonical_asset_lineage_ancestor
+  on canonical.asset_lineage (ancestor_asset_id, depth);
+
+create index if not exists idx_canonical_asset_lineage_descendant
+  on canonical.asset_lineage (descendant_asset_id, depth);
+
+-- Existing databases bootstrapped with the cascading foreign keys.
+alter table canonical.asset_lineage
+  drop constraint if exists asset_lineage_ancestor_asset_id_fkey,
+  drop constraint if exists asset_lineage_descendant_asset_id_fkey;
+
+-- Direct edges the closure was built from, so a removed edge is detected
+-- on the next build and triggers a full rebuild.
+create table if not exists canonical.asset_lineage_edge (
+  ancestor_asset_id text not null,
+  descendant_asset_id text not null,
+  event_id text not null,
+  primary key (ancestor_asset_id, descendant_asset_id, event_id)
+);
+
+commit;
@@ -0,0 +1,23 @@
+from benchmarks.harness import (
+    BENCHMARK_STAGES,
+    BenchmarkResult,
+    NormalizerThroughput,
+    StageMeasurement,
+    measure_normalizer_throughput,
+    run_benchmark,
+    write_benchmark_result,
+)
+from benchmarks.synthetic import SyntheticDataset, SyntheticFranchiseConfig, generate_synthetic_dataset
+
+__all__ = [
+    "BENCHMARK_STAGES",
+    "BenchmarkResult",
+    "NormalizerThroughput",
+    "StageMeasurement",
+    "SyntheticDataset",
+    "SyntheticFranchiseConfig",
+    "generate_synthetic_dataset",
+    "measure_normalizer_throughput",
+    "run_benchmark",
+    "write_benchmark_result",
+]
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from benchmarks.synthetic import SyntheticDataset, SyntheticFranchiseConfig, generate_synthetic_dataset
+from canonical.event_asset_flow import build_event_asset_flows
+from canonical.events import build_canonical_events
+from canonical.pick_lifecycle import build_pick_lifecycle
+from canonical.player_tenure import build_player_tenures
+from evidence.models import OverrideBundle, SourceRecord
+from evidence.normalize import NORMALIZER_REGISTRY, normalize_source_record
+from pipeline.stages import STAGE_BUILDER_VERSIONS, persist_stage
+from presentation.contract import build_layout_contract, build_presentation_contract
+from storage.memory import InMemoryRepository
+from storage.repository import StageRepository
+
+
+JsonDict = dict[str, Any]
+
+BENCHMARK_STAGES = (
+    "normalize-source-records",
+    "canonical-events",
+    "canonical-player-tenures",
+    "canonical-pick-lifecycle",
+    "canonical-event-asset-flows",
+    "presentation-contract",
+    "layout-contract",
+)
+
+PRESENTATION_INPUT_NAMES = (
+    "events",
+    "assets",
+    "player_identities",
+    "player_tenures",
+    "pick_assets",
+    "pick_resolutions",
+    "asset_states",
+    "event_asset_flows",
+    "canonical_build_id",
+)
+
+
+@dataclass(frozen=True)
+class StageMeasurement:
+    stage: str
+    seconds: float
+    peak_memory_bytes: int | None
+    output_counts: JsonDict
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class NormalizerThroughput:
+    normalizer: str
+    record_count: int
+    claim_count: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float | None:
+        return round(self.record_count / self.seconds, 1) if self.seconds else None
+
+    def as_dict(self) -> JsonDict:
+        return {**asdict(self), "records_per_second": self.records_per_second}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    config: SyntheticFranchiseConfig
+    dataset_counts: JsonDict
+    measurements: list[StageMeasurement]
+    repeat: int
+    git_revision: str | None
+    python_version: str
+    created_at: datetime
+    normalizer_throughput: list[NormalizerThroughput] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return round(sum(measurement.seconds for measurement in self.measurements), 6)
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "config": self.config.as_dict(),
+            "dataset_counts": self.dataset_counts,
+            "stages": [measurement.as_dict() for measurement in self.measurements],
+            "normalizer_throughput": [row.as_dict() for row in self.normalizer_throughput],
+            "total_seconds": self.total_seconds,
+            "repeat": self.repeat,
+            "git_revision": self.git_revision,
+            "python_version": self.python_version,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _measure(run: Callable[[], Any], *, repeat: int, trace_memory: bool) -> tuple[Any, float, int | None]:
+    result = None
+    best_seconds: float | None = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    peak_memory_bytes = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            run()
+            _, peak_memory_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return result, round(best_seconds or 0.0, 6), peak_memory_bytes
+
+
+def measure_normalizer_throughput(source_records: Iterable[SourceRecord], *, repeat: int = 1) -> list[NormalizerThroughput]:
+    records_by_normalizer: dict[str, list[SourceRecord]] = defaultdict(list)
+    for record in source_records:
+        normalizer = NORMALIZER_REGISTRY.get(record.source_type)
+        if normalizer is not None:
+            records_by_normalizer[normalizer.name].append(record)
+
+    rows: list[NormalizerThroughput] = []
+    for name, records in sorted(records_by_normalizer.items()):
+        claims, seconds, _ = _measure(
+            lambda records=records: [claim for record in records for claim in normalize_source_record(record)],
+            repeat=repeat,
+            trace_memory=False,
+        )
+        rows.append(NormalizerThroughput(normalizer=name, record_count=len(records), claim_count=len(claims), seconds=seconds))
+    return rows
+
+
+def _stage_runner(stage_name: str, repository: StageRepository) -> Callable[[], Any]:
+    builder_version = STAGE_BUILDER_VERSIONS.get(stage_name, "")
+    if stage_name == "canonical-events":
+        inputs = repository.fetch_event_build_inputs()
+        return lambda: build_canonical_events(*inputs, builder_version=builder_version)
+    if stage_name == "canonical-player-tenures":
+        inputs = repository.fetch_player_tenure_build_inputs()
+        return lambda: build_player_tenures(*inputs, builder_version=builder_version)
+    if stage_name == "canonical-pick-lifecycle":
+        inputs = repository.fetch_pick_lifecycle_build_inputs()
+        return lambda: build_pick_lifecycle(*inputs, builder_version=builder_version)
+    if stage_name == "canonical-event-asset-flows":
+        inputs = repository.fetch_event_asset_flow_build_inputs()
+        return lambda: build_event_asset_flows(*inputs, builder_version=builder_version)
+    if stage_name == "presentation-contract":
+        inputs = dict(zip(PRESENTATION_INPUT_NAMES, repository.fetch_presentation_contract_build_inputs()))
+        return lambda: build_presentation_contract(**inputs, builder_version=builder_version)
+    if stage_name == "layout-contract":
+        presentation_result = repository.fetch_presentation_contract()
+        return lambda: build_layout_contract(presentation_result=presentation_result)
+    raise ValueError(f"unknown benchmark stage: {stage_name}")
+
+
+def _output_counts(result: Any) -> JsonDict:
+    counts = result.counts()
+    return {key: value for key, value in counts.items() if isinstance(value, int)}
+
+
+def run_benchmark(
+    config: SyntheticFranchiseConfig,
+    *,
+    repeat: int = 1,
+    trace_memory: bool = True,
+    dataset: SyntheticDataset | None = None,
+) -> BenchmarkResult:
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    dataset = dataset or generate_synthetic_dataset(config)
+    repository = InMemoryRepository()
+    repository.insert_source_records(dataset.source_records)
+    repository.insert_override_bundle(OverrideBundle(overrides=[], override_links=[]))
+
+    measurements: list[StageMeasurement] = []
+    claims, seconds, peak_memory_bytes = _measure(
+        lambda: [claim for record in dataset.source_records for claim in normalize_source_record(record)],
+        repeat=repeat,
+        trace_memory=trace_memory,
+    )
+    repository.insert_normalized_claims([*claims, *dataset.supplemental_claims])
+    measurements.append(
+        StageMeasurement(
+            stage="normalize-source-records",
+            seconds=seconds,
+            peak_memory_bytes=peak_memory_bytes,
+            output_counts={"claim_count": len(claims)},
+        )
+    )
+
+    for stage_name in BENCHMARK_STAGES[1:]:
+        # Inputs are fetched once up front so each timing covers the pure builder only.
+        result, seconds, peak_memory_bytes = _measure(
+            _stage_runner(stage_name, repository),
+            repeat=repeat,
+            trace_memory=trace_memory,
+        )
+        if stage_name != "layout-contract":
+            persist_stage(stage_name, repository, result)
+        measurements.append(
+            StageMeasurement(
+                stage=stage_name,
+                seconds=seconds,
+                peak_memory_bytes=peak_memory_bytes,
+                output_counts=_output_counts(result),
+            )
+        )
+
+    return BenchmarkResult(
+        config=config,
+        dataset_counts=dataset.counts(),
+        measurements=measurements,
+        repeat=repeat,
+        git_revision=_git_revision(),
+        python_version=platform.python_version(),
+        created_at=datetime.utcnow(),
+        normalizer_throughput=measure_normalizer_throughput(dataset.source_records, repeat=repeat),
+    )
+
+
+def write_benchmark_result(result: BenchmarkResult, output_path: Path | str) -> Path:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result.as_dict(), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
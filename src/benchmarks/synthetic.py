@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from evidence.ingest import capture_source_records
+from evidence.models import NormalizedClaim, SourceRecord
+from shared.ids import stable_id
+
+
+JsonDict = dict[str, Any]
+
+SYNTHETIC_CAPTURED_AT = "2026-01-01T00:00:00Z"
+SYNTHETIC_NORMALIZER_VERSION = "synthetic-normalizer-v1"
+SYNTHETIC_TEAMS = (
+    ("MEM", "Memphis"),
+    ("BOS", "Boston"),
+    ("DAL", "Dallas"),
+    ("DEN", "Denver"),
+    ("GSW", "Golden State"),
+    ("HOU", "Houston"),
+    ("LAL", "Los Angeles"),
+    ("MIA", "Miami"),
+    ("MIL", "Milwaukee"),
+    ("MIN", "Minnesota"),
+    ("NOP", "New Orleans"),
+    ("NYK", "New York"),
+    ("OKC", "Oklahoma City"),
+    ("ORL", "Orlando"),
+    ("PHI", "Philadelphia"),
+    ("PHX", "Phoenix"),
+    ("POR", "Portland"),
+    ("SAC", "Sacramento"),
+    ("SAS", "San Antonio"),
+    ("TOR", "Toronto"),
+    ("UTA", "Utah"),
+    ("WAS", "Washington"),
+    ("ATL", "Atlanta"),
+    ("BKN", "Brooklyn"),
+    ("CHA", "Charlotte"),
+    ("CHI", "Chicago"),
+    ("CLE", "Cleveland"),
+    ("DET", "Detroit"),
+    ("IND", "Indiana"),
+    ("LAC", "LA Clippers"),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticFranchiseConfig:
+    teams: int = 2
+    seasons: int = 5
+    trades_per_season: int = 4
+    multi_asset_trade_rate: float = 0.3
+    pick_swaps_per_season: int = 1
+    roster_size: int = 5
+    first_season: int = 2015
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if not 2 <= self.teams <= len(SYNTHETIC_TEAMS):
+            raise ValueError(f"teams must be between 2 and {len(SYNTHETIC_TEAMS)}")
+        if self.seasons < 1:
+            raise ValueError("seasons must be at least 1")
+        if self.roster_size < 3:
+            raise ValueError("roster_size must be at least 3")
+        if not 0.0 <= self.multi_asset_trade_rate <= 1.0:
+            raise ValueError("multi_asset_trade_rate must be between 0 and 1")
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    config: SyntheticFranchiseConfig
+    source_records: list[SourceRecord]
+    supplemental_claims: list[NormalizedClaim] = field(default_factory=list)
+
+    def counts(self) -> JsonDict:
+        return {
+            "source_record_count": len(self.source_records),
+            "supplemental_claim_count": len(self.supplemental_claims),
+        }
+
+
+@dataclass
+class _GeneratorState:
+    config: SyntheticFranchiseConfig
+    rng: random.Random
+    raw_records: list[JsonDict] = field(default_factory=list)
+    pick_movements: list[tuple[str, str, int, int, date, str]] = field(default_factory=list)
+    rosters: dict[str, list[str]] = field(default_factory=dict)
+    player_names: dict[str, str] = field(default_factory=dict)
+    pick_owners: dict[str, str] = field(default_factory=dict)
+    next_player: int = 0
+    next_sequence: int = 0
+
+    def sequence(self) -> int:
+        self.next_sequence += 1
+        return self.next_sequence
+
+    def new_player(self) -> str:
+        self.next_player += 1
+        player_identity = f"player_synthetic_{self.next_player:06d}"
+        self.player_names[player_identity] = f"Synthetic Player {self.next_player:06d}"
+        return player_identity
+
+
+def _team_name(team_code: str) -> str:
+    return dict(SYNTHETIC_TEAMS)[team_code]
+
+
+def _pick_identity(draft_year: int, origin_team: str, draft_round: int) -> str:
+    return f"pick_{draft_year}_{origin_team.lower()}_{draft_round}"
+
+
+def _transaction_record(
+    state: _GeneratorState,
+    *,
+    event_ref: str,
+    event_date: date,
+    event_type: str,
+    description: str,
+    player_identity: str,
+    counterparty: str,
+) -> None:
+    sequence = state.sequence()
+    state.raw_records.append(
+        {
+            "source_system": "synthetic",
+            "source_type": "transaction",
+            "source_locator": f"synthetic://transactions/{event_ref}/{player_identity}",
+            "source_url": None,
+            "captured_at": SYNTHETIC_CAPTURED_AT,
+            "parser_version": "synthetic_transactions_v1",
+            "raw_payload": {
+                "source_event_ref": event_ref,
+                "source_sequence": sequence,
+                "event_date": event_date.isoformat(),
+                "event_type": event_type,
+                "event_description": description,
+                "transaction_counterparty": counterparty,
+                "player_name": state.player_names[player_identity],
+                "player_identity": player_identity,
+            },
+        }
+    )
+
+
+def _sign_player(state: _GeneratorState, team_code: str, signed_on: date) -> None:
+    player_identity = state.new_player()
+    state.rosters[team_code].append(player_identity)
+    event_ref = f"synthetic-signing-{team_code.lower()}-{player_identity}"
+    _transaction_record(
+        state,
+        event_ref=event_ref,
+        event_date=signed_on,
+        event_type="signing",
+        description=f"{_team_name(team_code)} sign {state.player_names[player_identity]}",
+        player_identity=player_identity,
+        counterparty="NBA",
+    )
+    state.raw_records.append(
+        {
+            "source_system": "synthetic",
+            "source_type": "contract",
+            "source_locator": f"synthetic://contracts/{team_code.lower()}/{player_identity}",
+            "source_url": None,
+            "captured_at": SYNTHETIC_CAPTURED_AT,
+            "parser_version": "synthetic_contracts_v1",
+            "raw_payload": {
+                "source_event_ref": event_ref,
+                "source_sequence": state.sequence(),
+                "player_name": state.player_names[player_identity],
+                "player_identity": player_identity,
+                "contract_metadata": {
+                    "contract_type": "standard",
+                    "start_date": signed_on.isoformat(),
+                    "end_date": (signed_on + timedelta(days=365 * 2)).isoformat(),
+                },
+            },
+        }
+    )
+
+
+def _draft(state: _GeneratorState, team_codes: list[str], season: int) -> None:
+    draft_date = date(season, 6, 22)
+    overall_pick = 0
+    for draft_round in (1, 2):
+        for origin_team in team_codes:
+            overall_pick += 1
+            pick_identity = _pick_identity(season, origin_team, draft_round)
+            owner = state.pick_owners.pop(pick_identity, origin_team)
+            player_identity = state.new_player()
+            state.rosters[owner].append(player_identity)
+            state.raw_records.append(
+                {
+                    "source_system": "synthetic",
+                    "source_type": "draft_history",
+                    "source_locator": f"synthetic://draft_history/{season}/{overall_pick}",
+                    "source_url": None,
+                    "captured_at": SYNTHETIC_CAPTURED_AT,
+                    "parser_version": "synthetic_draft_history_v1",
+                    "raw_payload": {
+                        "source_event_ref": f"synthetic-draft-{season}-{overall_pick}",
+                        "source_sequence": state.sequence(),
+                        "event_date": draft_date.isoformat(),
+                        "pick_identity": pick_identity,
+                        "pick_draft_year": season,
+                        "pick_round": draft_round,
+                        "player_name": state.player_names[player_identity],
+                        "player_identity": player_identity,
+                    },
+                }
+            )
+
+
+def _trade(
+    state: _GeneratorState,
+    *,
+    event_ref: str,
+    event_date: date,
+    team_code: str,
+    counterparty: str,
+    asset_count: int,
+    pick_identity: str | None = None,
+) -> None:
+    moves: list[tuple[str, str, str]] = []
+    for from_team, to_team in ((team_code, counterparty), (counterparty, team_code), (team_code, counterparty))[:asset_count]:
+        roster = state.rosters[from_team]
+        if len(roster) <= 1:
+            continue
+        player_identity = roster.pop(state.rng.randrange(len(roster)))
+        state.rosters[to_team].append(player_identity)
+        moves.append((player_identity, from_team, to_team))
+
+    if not moves:
+        return
+    for player_identity, from_team, to_team in moves:
+        _transaction_record(
+            state,
+            event_ref=event_ref,
+            event_date=event_date,
+            event_type="trade",
+            description=(
+                f"{state.player_names[player_identity]} traded from "
+                f"{_team_name(from_team)} to {_team_name(to_team)}"
+            ),
+            player_identity=player_identity,
+            counterparty=to_team if from_team == team_code else from_team,
+        )
+    if pick_identity is not None:
+        _, draft_year, origin_team, draft_round = pick_identity.split("_")
+        state.pick_owners[pick_identity] = counterparty
+        state.pick_movements.append(
+            (event_ref, pick_identity, int(draft_year), int(draft_round), event_date, state.raw_records[-1]["source_locator"])
+        )
+
+
+def _pick_movement_claims(
+    state: _GeneratorState,
+    source_record_ids: dict[str, str],
+    created_at: datetime,
+) -> list[NormalizedClaim]:
+    claims: list[NormalizedClaim] = []
+    for event_ref, pick_identity, draft_year, draft_round, event_date, source_locator in state.pick_movements:
+        source_record_id = source_record_ids[source_locator]
+        origin_team = pick_identity.split("_")[2]
+        for claim_type, payload in (
+            ("pick_identity", {"pick_identity": pick_identity}),
+            ("pick_origin_team", {"origin_team": origin_team}),
+            ("pick_draft_year", {"draft_year": draft_year}),
+            ("pick_round", {"round_number": draft_round}),
+        ):
+            claims.append(
+                NormalizedClaim(
+                    claim_id=stable_id("claim", source_record_id, claim_type, "pick", pick_identity, payload),
+                    source_record_id=source_record_id,
+                    claim_type=claim_type,
+                    claim_subject_type="pick",
+                    claim_subject_key=pick_identity,
+                    claim_group_hint=event_ref,
+                    claim_date=event_date,
+                    source_sequence=None,
+                    claim_payload=payload,
+                    confidence_flag="high",
+                    normalizer_version=SYNTHETIC_NORMALIZER_VERSION,
+                    created_at=created_at,
+                )
+            )
+    return claims
+
+
+def generate_synthetic_dataset(config: SyntheticFranchiseConfig) -> SyntheticDataset:
+    state = _GeneratorState(config=config, rng=random.Random(config.seed))
+    team_codes = [team_code for team_code, _ in SYNTHETIC_TEAMS[: config.teams]]
+    state.rosters = {team_code: [] for team_code in team_codes}
+
+    for team_code in team_codes:
+        for _ in range(config.roster_size):
+            _sign_player(state, team_code, date(config.first_season - 1, 7, 1))
+
+    for season in range(config.first_season, config.first_season + config.seasons):
+        for team_code in team_codes:
+            others = [other for other in team_codes if other != team_code]
+            for trade_index in range(config.trades_per_season + config.pick_swaps_per_season):
+                counterparty = state.rng.choice(others)
+                event_date = date(season - 1, 10, 1) + timedelta(days=state.rng.randrange(120))
+                is_pick_swap = trade_index >= config.trades_per_season
+                asset_count = 1
+                if state.rng.random() < config.multi_asset_trade_rate:
+                    asset_count = state.rng.randint(2, 3)
+                pick_identity = None
+                if is_pick_swap:
+                    draft_year = season + state.rng.randint(0, 2)
+                    candidates = [
+                        _pick_identity(draft_year, origin_team, draft_round)
+                        for origin_team in team_codes
+                        for draft_round in (1, 2)
+                        if state.pick_owners.get(_pick_identity(draft_year, origin_team, draft_round), origin_team) == team_code
+                    ]
+                    pick_identity = state.rng.choice(candidates) if candidates else None
+                _trade(
+                    state,
+                    event_ref=f"synthetic-trade-{season}-{team_code.lower()}-{trade_index}",
+                    event_date=event_date,
+                    team_code=team_code,
+                    counterparty=counterparty,
+                    asset_count=asset_count,
+                    pick_identity=pick_identity,
+                )
+        _draft(state, team_codes, season)
+
+    source_records = capture_source_records(state.raw_records)
+    source_record_ids = {source_record.source_locator: source_record.source_record_id for source_record in source_records}
+    created_at = datetime.fromisoformat(SYNTHETIC_CAPTURED_AT.replace("Z", "+00:00")).replace(tzinfo=None)
+    return SyntheticDataset(
+        config=config,
+        source_records=source_records,
+        supplemental_claims=_pick_movement_claims(state, source_record_ids, created_at),
+    )
@@ -12,11 +12,36 @@ from canonical.event_asset_flow import (
     fetch_event_asset_flow_build_inputs,
     persist_canonical_event_asset_flow_build,
 )
+from canonical.holdings import (
+    HoldingInterval,
+    HoldingsDiff,
+    HoldingsIndex,
+    build_holdings_index,
+    load_holdings_index,
+    write_holdings_index,
+)
+from canonical.lineage import (
+    bootstrap_canonical_asset_lineage_schema,
+    build_and_persist_canonical_asset_lineage,
+    build_asset_lineage,
+    fetch_asset_lineage,
+    fetch_asset_lineage_build_inputs,
+    persist_canonical_asset_lineage_build,
+)
+from canonical.merge_suggestions import (
+    MergeSuggestion,
+    MergeSuggestionResult,
+    merge_suggestions_to_yaml,
+    suggest_event_merges,
+    write_merge_suggestions,
+)
 from canonical.models import (
     AssetProvenance,
     AssetState,
     AssetStateProvenance,
     CanonicalAsset,
+    CanonicalAssetLineage,
+    CanonicalAssetLineageBuildResult,
     CanonicalBuild,
     CanonicalEvent,
     CanonicalEventAssetFlow,
@@ -64,6 +89,8 @@ __all__ = [
     "AssetState",
     "AssetStateProvenance",
     "CanonicalAsset",
+    "CanonicalAssetLineage",
+    "CanonicalAssetLineageBuildResult",
     "CanonicalBuild",
     "CanonicalEvent",
     "CanonicalEventAssetFlow",
@@ -76,6 +103,11 @@ __all__ = [
     "CanonicalPlayerTenure",
     "CanonicalPlayerTenureBuildResult",
     "EventAssetFlowProvenance",
+    "HoldingInterval",
+    "HoldingsDiff",
+    "HoldingsIndex",
+    "MergeSuggestion",
+    "MergeSuggestionResult",
     "CanonicalEventValidationReport",
     "CanonicalEventAssetFlowValidationReport",
     "CanonicalPickLifecycleValidationReport",
@@ -84,28 +116,40 @@ __all__ = [
     "CanonicalPlayerTenureValidationReport",
     "EventProvenance",
     "PlayerIdentityProvenance",
+    "bootstrap_canonical_asset_lineage_schema",
     "bootstrap_canonical_events_schema",
     "bootstrap_canonical_event_asset_flow_schema",
     "bootstrap_canonical_pick_lifecycle_schema",
     "bootstrap_canonical_player_tenure_schema",
+    "build_and_persist_canonical_asset_lineage",
     "build_and_persist_canonical_event_asset_flows",
     "build_and_persist_canonical_pick_lifecycle",
     "build_and_persist_canonical_player_tenures",
+    "build_asset_lineage",
     "build_event_asset_flows",
     "build_and_persist_canonical_events",
     "build_canonical_events",
+    "build_holdings_index",
     "build_pick_lifecycle",
     "build_player_tenures",
+    "fetch_asset_lineage",
+    "fetch_asset_lineage_build_inputs",
     "fetch_event_build_inputs",
     "fetch_event_asset_flow_build_inputs",
     "fetch_pick_lifecycle_build_inputs",
     "fetch_player_tenure_build_inputs",
+    "load_holdings_index",
+    "merge_suggestions_to_yaml",
+    "persist_canonical_asset_lineage_build",
     "persist_canonical_event_asset_flow_build",
     "persist_canonical_event_build",
     "persist_canonical_pick_lifecycle_build",
     "persist_canonical_player_tenure_build",
+    "suggest_event_merges",
     "validate_canonical_events",
     "validate_canonical_event_asset_flows",
     "validate_canonical_pick_lifecycle",
     "validate_canonical_player_tenures",
+    "write_holdings_index",
+    "write_merge_suggestions",
 ]
@@ -4,7 +4,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from canonical.models import (
     CanonicalAsset,
@@ -19,6 +19,8 @@ from canonical.models import (
 )
 from db_config import load_database_url
 from shared.ids import stable_id, stable_payload_hash
+from shared.profiling import traced
+from shared.streaming import DEFAULT_PAGE_SIZE, keyset_rows
 
 
 FLOW_DIRECTIONS = {"in", "out"}
@@ -82,27 +84,6 @@ def _connect():
     return psycopg.connect(load_database_url())
 
 
-def _event_direction_keywords(description: str | None) -> str:
-    text = (description or "").lower()
-    if any(marker in text for marker in ("to memphis", "to the grizzlies", "joins memphis", "acquired by memphis", "memphis acquires")):
-        return "incoming"
-    if any(
-        marker in text
-        for marker in (
-            "from memphis",
-            "sent to",
-            "traded away",
-            "trades",
-            "trading",
-            "released by memphis",
-            "waived by memphis",
-            "buyout",
-        )
-    ):
-        return "outgoing"
-    return "unknown"
-
-
 def _event_support_row(event_id: str, provenance_by_event: dict[str, list[EventProvenance]]) -> EventProvenance | None:
     rows = list(provenance_by_event.get(event_id, []))
     if not rows:
@@ -242,6 +223,76 @@ def _build_flow_candidates(
     return candidates
 
 
+def _event_flow_rows(
+    event_candidates: list[_FlowCandidate],
+    support_row: EventProvenance | None,
+    asset_by_id: dict[str, CanonicalAsset],
+    *,
+    built_at: datetime,
+) -> Iterator[tuple[CanonicalEventAssetFlow, EventAssetFlowProvenance]]:
+    event_candidates = sorted(
+        event_candidates,
+        key=lambda candidate: (
+            0 if candidate.flow_direction == "in" else 1,
+            FLOW_ROLE_ORDER.get(candidate.flow_role, 99),
+            asset_by_id[candidate.asset_id].asset_label,
+            candidate.asset_id,
+            candidate.source_key,
+        ),
+    )
+    if support_row is None:
+        support_key = None
+        source_record_id = claim_id = override_id = fallback_reason = None
+    else:
+        support_key = support_row.claim_id or support_row.source_record_id or support_row.override_id
+        source_record_id = support_row.source_record_id
+        claim_id = support_row.claim_id
+        override_id = support_row.override_id
+        fallback_reason = (
+            support_row.fallback_reason
+            if source_record_id is None and claim_id is None and override_id is None
+            else None
+        )
+
+    for flow_order, candidate in enumerate(event_candidates, start=1):
+        flow_id = stable_id(
+            "event_asset_flow",
+            candidate.event_id,
+            candidate.asset_id,
+            candidate.flow_direction,
+            candidate.flow_role,
+        )
+        provenance_role = FLOW_ROLE_TO_PROVENANCE_ROLE[candidate.flow_role]
+        yield (
+            CanonicalEventAssetFlow(
+                event_asset_flow_id=flow_id,
+                event_id=candidate.event_id,
+                asset_id=candidate.asset_id,
+                flow_direction=candidate.flow_direction,
+                flow_role=candidate.flow_role,
+                flow_order=flow_order,
+                effective_date=candidate.effective_date,
+                created_at=built_at,
+            ),
+            EventAssetFlowProvenance(
+                event_asset_flow_provenance_id=stable_id(
+                    "event_asset_flow_prov",
+                    flow_id,
+                    provenance_role,
+                    support_key or candidate.source_key,
+                ),
+                event_asset_flow_id=flow_id,
+                source_record_id=source_record_id,
+                claim_id=claim_id,
+                override_id=override_id,
+                provenance_role=provenance_role,
+                fallback_reason=f"derived_from_{candidate.provenance_source}" if support_row is None else fallback_reason,
+                created_at=built_at,
+            ),
+        )
+
+
+@traced("build")
 def build_event_asset_flows(
     events: Iterable[CanonicalEvent],
     event_provenance: Iterable[EventProvenance],
@@ -266,73 +317,23 @@ def build_event_asset_flows(
     for row in event_provenance_list:
         provenance_by_event[row.event_id].append(row)
 
+    candidates_by_event: dict[str, list[_FlowCandidate]] = defaultdict(list)
+    for candidate in flow_candidates:
+        candidates_by_event[candidate.event_id].append(candidate)
+
     flow_rows_by_id: dict[str, CanonicalEventAssetFlow] = {}
     provenance_rows_by_id: dict[str, EventAssetFlowProvenance] = {}
 
-    for event_id in sorted({candidate.event_id for candidate in flow_candidates}, key=lambda value: (event_by_id[value].event_date, event_by_id[value].event_order, value)):
-        event_candidates = [candidate for candidate in flow_candidates if candidate.event_id == event_id]
-        event_candidates.sort(
-            key=lambda candidate: (
-                0 if candidate.flow_direction == "in" else 1,
-                FLOW_ROLE_ORDER.get(candidate.flow_role, 99),
-                asset_by_id[candidate.asset_id].asset_label,
-                candidate.asset_id,
-                candidate.source_key,
-            )
+    for event_id in sorted(candidates_by_event, key=lambda value: (event_by_id[value].event_date, event_by_id[value].event_order, value)):
+        rows = _event_flow_rows(
+            candidates_by_event[event_id],
+            _event_support_row(event_id, provenance_by_event),
+            asset_by_id,
+            built_at=built_at_value,
         )
-        for flow_order, candidate in enumerate(event_candidates, start=1):
-            flow_id = stable_id(
-                "event_asset_flow",
-                candidate.event_id,
-                candidate.asset_id,
-                candidate.flow_direction,
-                candidate.flow_role,
-            )
-            flow_rows_by_id[flow_id] = CanonicalEventAssetFlow(
-                event_asset_flow_id=flow_id,
-                event_id=candidate.event_id,
-                asset_id=candidate.asset_id,
-                flow_direction=candidate.flow_direction,
-                flow_role=candidate.flow_role,
-                flow_order=flow_order,
-                effective_date=candidate.effective_date,
-                created_at=built_at_value,
-            )
-
-            support_row = _event_support_row(candidate.event_id, provenance_by_event)
-            provenance_role = FLOW_ROLE_TO_PROVENANCE_ROLE[candidate.flow_role]
-            if support_row is None:
-                provenance_rows_by_id[stable_id("event_asset_flow_prov", flow_id, provenance_role, candidate.source_key)] = EventAssetFlowProvenance(
-                    event_asset_flow_provenance_id=stable_id("event_asset_flow_prov", flow_id, provenance_role, candidate.source_key),
-                    event_asset_flow_id=flow_id,
-                    source_record_id=None,
-                    claim_id=None,
-                    override_id=None,
-                    provenance_role=provenance_role,
-                    fallback_reason=f"derived_from_{candidate.provenance_source}",
-                    created_at=built_at_value,
-                )
-            else:
-                fallback_reason = (
-                    support_row.fallback_reason
-                    if support_row.source_record_id is None and support_row.claim_id is None and support_row.override_id is None
-                    else None
-                )
-                provenance_rows_by_id[stable_id("event_asset_flow_prov", flow_id, provenance_role, support_row.claim_id or support_row.source_record_id or support_row.override_id or candidate.source_key)] = EventAssetFlowProvenance(
-                    event_asset_flow_provenance_id=stable_id(
-                        "event_asset_flow_prov",
-                        flow_id,
-                        provenance_role,
-                        support_row.claim_id or support_row.source_record_id or support_row.override_id or candidate.source_key,
-                    ),
-                    event_asset_flow_id=flow_id,
-                    source_record_id=support_row.source_record_id,
-                    claim_id=support_row.claim_id,
-                    override_id=support_row.override_id,
-                    provenance_role=provenance_role,
-                    fallback_reason=fallback_reason,
-                    created_at=built_at_value,
-                )
+        for flow_row, provenance_row in rows:
+            flow_rows_by_id[flow_row.event_asset_flow_id] = flow_row
+            provenance_rows_by_id[provenance_row.event_asset_flow_provenance_id] = provenance_row
 
     flow_rows = sorted(flow_rows_by_id.values(), key=lambda row: (event_by_id[row.event_id].event_date, event_by_id[row.event_id].event_order, row.flow_order, row.asset_id, row.flow_role, row.event_asset_flow_id))
     provenance_rows = sorted(provenance_rows_by_id.values(), key=lambda row: (row.event_asset_flow_id, row.provenance_role, row.event_asset_flow_provenance_id))
@@ -532,6 +533,58 @@ def fetch_event_asset_flow_build_inputs(
     return events, event_provenance, assets, player_tenures, pick_resolutions
 
 
+def iter_event_asset_flow_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[CanonicalEventAssetFlow]:
+    sql = """
+        select
+            event_asset_flow_id,
+            event_id,
+            asset_id,
+            flow_direction,
+            flow_role,
+            flow_order,
+            effective_date,
+            created_at
+        from canonical.event_asset_flow
+    """
+    for row in keyset_rows(conn, sql, key_columns=("event_asset_flow_id",), page_size=page_size):
+        yield CanonicalEventAssetFlow(
+            event_asset_flow_id=row[0],
+            event_id=row[1],
+            asset_id=row[2],
+            flow_direction=row[3],
+            flow_role=row[4],
+            flow_order=row[5],
+            effective_date=row[6],
+            created_at=row[7],
+        )
+
+
+def iter_event_asset_flow_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EventAssetFlowProvenance]:
+    sql = """
+        select
+            event_asset_flow_provenance_id,
+            event_asset_flow_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.event_asset_flow_provenance
+    """
+    for row in keyset_rows(conn, sql, key_columns=("event_asset_flow_provenance_id",), page_size=page_size):
+        yield EventAssetFlowProvenance(
+            event_asset_flow_provenance_id=row[0],
+            event_asset_flow_id=row[1],
+            source_record_id=row[2],
+            claim_id=row[3],
+            override_id=row[4],
+            provenance_role=row[5],
+            fallback_reason=row[6],
+            created_at=row[7],
+        )
+
+
 def persist_canonical_event_asset_flow_build(conn: Any, result: CanonicalEventAssetFlowBuildResult) -> dict[str, int]:
     with conn.cursor() as cur:
         cur.execute("delete from canonical.event_asset_flow_provenance")
@@ -4,12 +4,14 @@ from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from canonical.models import CanonicalBuild, CanonicalEvent, CanonicalEventBuildResult, EventProvenance
 from db_config import load_database_url
 from evidence.models import NormalizedClaim, OverrideRecord
 from shared.ids import stable_id, stable_payload_hash
+from shared.profiling import traced
+from shared.streaming import DEFAULT_PAGE_SIZE, keyset_rows
 
 
 EVENT_RELEVANT_CLAIM_TYPES = {
@@ -19,6 +21,7 @@ EVENT_RELEVANT_CLAIM_TYPES = {
     "transaction_counterparty",
     "event_order_hint",
 }
+MERGE_OVERRIDE_TYPES = {"merge_event_cluster", "event_merge_hint"}
 
 
 @dataclass
@@ -53,7 +56,7 @@ def _event_date_from_claims(claims: list[NormalizedClaim]) -> date:
     return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[0][0]
 
 
-def _event_type_from_claims(claims: list[NormalizedClaim]) -> str:
+def event_type_from_claims(claims: list[NormalizedClaim]) -> str:
     values = [
         str(claim.claim_payload.get("event_type") or "").strip()
         for claim in claims
@@ -65,7 +68,7 @@ def _event_type_from_claims(claims: list[NormalizedClaim]) -> str:
     return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[0][0]
 
 
-def _description_from_claims(claims: list[NormalizedClaim]) -> str | None:
+def description_from_claims(claims: list[NormalizedClaim]) -> str | None:
     descriptions = [
         str(
             claim.claim_payload.get("description")
@@ -88,7 +91,19 @@ def _cluster_key_for_claim(claim: NormalizedClaim) -> str:
     return f"{claim.claim_date or 'undated'}::{claim.claim_subject_type}::{claim.claim_subject_key}"
 
 
-def _build_clusters(
+def merge_override_keys(override: OverrideRecord) -> tuple[str, list[str]] | None:
+    if override.override_type not in MERGE_OVERRIDE_TYPES:
+        return None
+    target_key = str(override.payload.get("target_cluster_key") or override.target_key).strip()
+    if not target_key:
+        return None
+    source_keys = override.payload.get("source_cluster_keys") or [override.target_key]
+    if not isinstance(source_keys, list):
+        source_keys = [override.target_key]
+    return target_key, [str(source_key) for source_key in source_keys]
+
+
+def build_event_clusters(
     claims: Iterable[NormalizedClaim],
     overrides: Iterable[OverrideRecord],
 ) -> list[EventCluster]:
@@ -108,16 +123,12 @@ def _build_clusters(
 
     cluster_rewrites: dict[str, str] = {}
     for override in active_overrides:
-        if override.override_type not in {"merge_event_cluster", "event_merge_hint"}:
-            continue
-        target_key = str(override.payload.get("target_cluster_key") or override.target_key).strip()
-        if not target_key:
+        merge_keys = merge_override_keys(override)
+        if merge_keys is None:
             continue
-        source_keys = override.payload.get("source_cluster_keys") or [override.target_key]
-        if not isinstance(source_keys, list):
-            source_keys = [override.target_key]
+        target_key, source_keys = merge_keys
         for source_key in source_keys:
-            cluster_rewrites[str(source_key)] = target_key
+            cluster_rewrites[source_key] = target_key
 
     claims_by_cluster: dict[str, list[NormalizedClaim]] = defaultdict(list)
     for claim in relevant_claims:
@@ -179,7 +190,7 @@ def _base_provenance_rows(
             )
 
     for override in overrides:
-        if override.override_type in {"merge_event_cluster", "event_merge_hint"}:
+        if override.override_type in MERGE_OVERRIDE_TYPES:
             rows.append(
                 EventProvenance(
                     event_provenance_id=stable_id("event_prov", event_id, "event_merge_support", override.override_id),
@@ -195,6 +206,7 @@ def _base_provenance_rows(
     return rows
 
 
+@traced("build")
 def build_canonical_events(
     claims: Iterable[NormalizedClaim],
     overrides: Iterable[OverrideRecord],
@@ -204,13 +216,13 @@ def build_canonical_events(
 ) -> CanonicalEventBuildResult:
     built_at_value = built_at or datetime.utcnow()
     overrides_list = list(overrides)
-    clusters = _build_clusters(claims, overrides_list)
+    clusters = build_event_clusters(claims, overrides_list)
 
     staged_by_date: dict[date, list[dict[str, Any]]] = defaultdict(list)
     for cluster in clusters:
         event_date = _event_date_from_claims(cluster.claims)
-        event_type = _event_type_from_claims(cluster.claims)
-        description = _description_from_claims(cluster.claims)
+        event_type = event_type_from_claims(cluster.claims)
+        description = description_from_claims(cluster.claims)
         event_id = stable_id("event", cluster.cluster_key)
         event = CanonicalEvent(
             event_id=event_id,
@@ -431,6 +443,64 @@ def fetch_event_build_inputs(conn: Any) -> tuple[list[NormalizedClaim], list[Ove
     return claims, overrides
 
 
+def iter_event_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[CanonicalEvent]:
+    sql = """
+        select
+            event_id,
+            event_type,
+            event_date,
+            event_order,
+            event_label,
+            description,
+            transaction_group_key,
+            is_compound,
+            notes,
+            created_at,
+            updated_at
+        from canonical.events
+    """
+    for row in keyset_rows(conn, sql, key_columns=("event_id",), page_size=page_size):
+        yield CanonicalEvent(
+            event_id=row[0],
+            event_type=row[1],
+            event_date=row[2],
+            event_order=row[3],
+            event_label=row[4],
+            description=row[5],
+            transaction_group_key=row[6],
+            is_compound=row[7],
+            notes=row[8],
+            created_at=row[9],
+            updated_at=row[10],
+        )
+
+
+def iter_event_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EventProvenance]:
+    sql = """
+        select
+            event_provenance_id,
+            event_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.event_provenance
+    """
+    for row in keyset_rows(conn, sql, key_columns=("event_provenance_id",), page_size=page_size):
+        yield EventProvenance(
+            event_provenance_id=row[0],
+            event_id=row[1],
+            source_record_id=row[2],
+            claim_id=row[3],
+            override_id=row[4],
+            provenance_role=row[5],
+            fallback_reason=row[6],
+            created_at=row[7],
+        )
+
+
 def persist_canonical_event_build(conn: Any, result: CanonicalEventBuildResult) -> dict[str, int]:
     with conn.cursor() as cur:
         cur.execute("delete from canonical.event_provenance")
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable
+
+from canonical.models import AssetState, CanonicalAsset, CanonicalPickResolution, CanonicalPlayerTenure
+
+
+JsonDict = dict[str, Any]
+
+HOLDINGS_INDEX_FORMAT = "holdings-index-v1"
+INTERVAL_KINDS = ("player_tenure", "pick_stage", "asset_state")
+_OPEN_END = date.max.toordinal() + 1
+
+
+@dataclass(frozen=True)
+class HoldingInterval:
+    interval_kind: str
+    record_id: str
+    subject_id: str
+    asset_id: str | None
+    state_type: str
+    label: str | None
+    start_date: date
+    end_date: date | None
+
+    def as_dict(self) -> JsonDict:
+        return {
+            **asdict(self),
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: JsonDict) -> HoldingInterval:
+        return cls(
+            interval_kind=payload["interval_kind"],
+            record_id=payload["record_id"],
+            subject_id=payload["subject_id"],
+            asset_id=payload.get("asset_id"),
+            state_type=payload["state_type"],
+            label=payload.get("label"),
+            start_date=date.fromisoformat(payload["start_date"]),
+            end_date=date.fromisoformat(payload["end_date"]) if payload.get("end_date") else None,
+        )
+
+
+def _start_ordinal(interval: HoldingInterval) -> int:
+    return interval.start_date.toordinal()
+
+
+def _end_ordinal(interval: HoldingInterval) -> int:
+    # Intervals are half-open; a same-day interval still covers its start date.
+    if interval.end_date is None:
+        return _OPEN_END
+    return max(interval.end_date.toordinal(), interval.start_date.toordinal() + 1)
+
+
+def _max_end_tree(ends: list[int]) -> list[int]:
+    size = 1
+    while size < len(ends):
+        size *= 2
+    tree = [-1] * (2 * size)
+    tree[size : size + len(ends)] = ends
+    for node in range(size - 1, 0, -1):
+        tree[node] = max(tree[2 * node], tree[2 * node + 1])
+    return tree
+
+
+@dataclass(frozen=True)
+class HoldingsDiff:
+    from_date: date
+    to_date: date
+    added: list[HoldingInterval]
+    removed: list[HoldingInterval]
+
+    def counts(self) -> JsonDict:
+        return {"added_count": len(self.added), "removed_count": len(self.removed)}
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "from_date": self.from_date.isoformat(),
+            "to_date": self.to_date.isoformat(),
+            "added": [row.as_dict() for row in self.added],
+            "removed": [row.as_dict() for row in self.removed],
+        }
+
+
+@dataclass(frozen=True)
+class HoldingsIndex:
+    intervals: list[HoldingInterval]
+    canonical_build_id: str | None = None
+    _starts: list[int] = field(default_factory=list, repr=False, compare=False)
+    _tree: list[int] = field(default_factory=list, repr=False, compare=False)
+
+    @classmethod
+    def from_intervals(
+        cls,
+        intervals: Iterable[HoldingInterval],
+        *,
+        canonical_build_id: str | None = None,
+    ) -> HoldingsIndex:
+        ordered = sorted(
+            intervals,
+            key=lambda row: (_start_ordinal(row), _end_ordinal(row), row.interval_kind, row.record_id),
+        )
+        return cls(
+            intervals=ordered,
+            canonical_build_id=canonical_build_id,
+            _starts=[_start_ordinal(row) for row in ordered],
+            _tree=_max_end_tree([_end_ordinal(row) for row in ordered]),
+        )
+
+    def counts(self) -> JsonDict:
+        counts: JsonDict = {"interval_count": len(self.intervals)}
+        for kind in INTERVAL_KINDS:
+            counts[f"{kind}_count"] = sum(1 for row in self.intervals if row.interval_kind == kind)
+        return counts
+
+    def _overlapping(self, low: int, high: int, kinds: Iterable[str] | None) -> list[HoldingInterval]:
+        # Intervals are sorted by start, so only the prefix starting before `high` can overlap;
+        # the max-end tree prunes every subtree whose intervals all end at or before `low`.
+        limit = bisect_left(self._starts, high)
+        if limit == 0:
+            return []
+        allowed = set(kinds) if kinds is not None else None
+        size = len(self._tree) // 2
+        matches: list[HoldingInterval] = []
+        stack = [(1, 0, size)]
+        while stack:
+            node, node_start, node_end = stack.pop()
+            if node_start >= limit or self._tree[node] <= low:
+                continue
+            if node >= size:
+                row = self.intervals[node_start]
+                if allowed is None or row.interval_kind in allowed:
+                    matches.append(row)
+                continue
+            middle = (node_start + node_end) // 2
+            stack.append((2 * node + 1, middle, node_end))
+            stack.append((2 * node, node_start, middle))
+        return matches
+
+    def as_of(self, as_of_date: date, *, kinds: Iterable[str] | None = None) -> list[HoldingInterval]:
+        ordinal = as_of_date.toordinal()
+        return self._overlapping(ordinal, ordinal + 1, kinds)
+
+    def between(self, start_date: date, end_date: date, *, kinds: Iterable[str] | None = None) -> list[HoldingInterval]:
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self._overlapping(start_date.toordinal(), end_date.toordinal() + 1, kinds)
+
+    def diff(self, from_date: date, to_date: date, *, kinds: Iterable[str] | None = None) -> HoldingsDiff:
+        before = self.as_of(from_date, kinds=kinds)
+        after = self.as_of(to_date, kinds=kinds)
+        before_ids = {row.record_id for row in before}
+        after_ids = {row.record_id for row in after}
+        return HoldingsDiff(
+            from_date=from_date,
+            to_date=to_date,
+            added=[row for row in after if row.record_id not in before_ids],
+            removed=[row for row in before if row.record_id not in after_ids],
+        )
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "format": HOLDINGS_INDEX_FORMAT,
+            "canonical_build_id": self.canonical_build_id,
+            "intervals": [row.as_dict() for row in self.intervals],
+            "max_end_tree": self._tree,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: JsonDict) -> HoldingsIndex:
+        if payload.get("format") != HOLDINGS_INDEX_FORMAT:
+            raise ValueError(f"unsupported holdings index format: {payload.get('format')}")
+        intervals = [HoldingInterval.from_dict(row) for row in payload["intervals"]]
+        tree = list(payload["max_end_tree"])
+        if len(tree) < 2 * len(intervals):
+            raise ValueError("holdings index max_end_tree does not cover its intervals")
+        return cls(
+            intervals=intervals,
+            canonical_build_id=payload.get("canonical_build_id"),
+            _starts=[_start_ordinal(row) for row in intervals],
+            _tree=tree,
+        )
+
+
+def build_holdings_index(
+    *,
+    assets: list[CanonicalAsset],
+    player_tenures: list[CanonicalPlayerTenure],
+    pick_resolutions: list[CanonicalPickResolution],
+    asset_states: list[AssetState],
+    canonical_build_id: str | None = None,
+) -> HoldingsIndex:
+    asset_by_tenure_id = {asset.player_tenure_id: asset for asset in assets if asset.player_tenure_id}
+    asset_by_pick_id = {asset.pick_asset_id: asset for asset in assets if asset.pick_asset_id}
+    asset_by_id = {asset.asset_id: asset for asset in assets}
+
+    intervals: list[HoldingInterval] = []
+    for tenure in player_tenures:
+        asset = asset_by_tenure_id.get(tenure.player_tenure_id)
+        intervals.append(
+            HoldingInterval(
+                interval_kind="player_tenure",
+                record_id=tenure.player_tenure_id,
+                subject_id=tenure.player_id,
+                asset_id=asset.asset_id if asset else None,
+                state_type=tenure.tenure_type,
+                label=asset.asset_label if asset else None,
+                start_date=tenure.tenure_start_date,
+                end_date=tenure.tenure_end_date,
+            )
+        )
+    for resolution in pick_resolutions:
+        asset = asset_by_pick_id.get(resolution.pick_asset_id)
+        intervals.append(
+            HoldingInterval(
+                interval_kind="pick_stage",
+                record_id=resolution.pick_resolution_id,
+                subject_id=resolution.pick_asset_id,
+                asset_id=asset.asset_id if asset else None,
+                state_type=resolution.state_type,
+                label=asset.asset_label if asset else None,
+                start_date=resolution.effective_start_date,
+                end_date=resolution.effective_end_date,
+            )
+        )
+    for state in asset_states:
+        asset = asset_by_id.get(state.asset_id)
+        intervals.append(
+            HoldingInterval(
+                interval_kind="asset_state",
+                record_id=state.asset_state_id,
+                subject_id=state.asset_id,
+                asset_id=state.asset_id,
+                state_type=state.state_type,
+                label=asset.asset_label if asset else None,
+                start_date=state.effective_start_date,
+                end_date=state.effective_end_date,
+            )
+        )
+    return HoldingsIndex.from_intervals(intervals, canonical_build_id=canonical_build_id)
+
+
+def write_holdings_index(index: HoldingsIndex, output_path: Path | str) -> Path:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(index.as_dict(), sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def load_holdings_index(input_path: Path | str) -> HoldingsIndex:
+    return HoldingsIndex.from_dict(json.loads(Path(input_path).read_text(encoding="utf-8")))
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+from canonical.models import CanonicalAssetLineage, CanonicalAssetLineageBuildResult, CanonicalEventAssetFlow
+from db_config import load_database_url
+from shared.ids import stable_id
+from shared.profiling import traced
+
+
+LINEAGE_DIRECTIONS = ("descendants", "ancestors")
+
+LineageEdge = tuple[str, str, str]
+_LineagePath = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def bootstrap_canonical_asset_lineage_schema(sql_path: Path | str) -> None:
+    try:
+        import psycopg
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("psycopg is required to bootstrap canonical asset lineage tables.") from exc
+
+    sql_text = Path(sql_path).read_text(encoding="utf-8")
+    with psycopg.connect(load_database_url()) as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql_text)
+        conn.commit()
+
+
+def _connect():
+    try:
+        import psycopg
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("psycopg is required for canonical asset lineage builds.") from exc
+    return psycopg.connect(load_database_url())
+
+
+def lineage_edges(flows: Iterable[CanonicalEventAssetFlow]) -> list[LineageEdge]:
+    # Within one event every asset flowing in becomes every asset flowing out.
+    flows_by_event: dict[str, list[CanonicalEventAssetFlow]] = defaultdict(list)
+    for flow in flows:
+        flows_by_event[flow.event_id].append(flow)
+    edges: set[LineageEdge] = set()
+    for event_id, event_flows in flows_by_event.items():
+        incoming = {flow.asset_id for flow in event_flows if flow.flow_direction == "in"}
+        outgoing = {flow.asset_id for flow in event_flows if flow.flow_direction == "out"}
+        edges.update((ancestor, descendant, event_id) for ancestor in incoming for descendant in outgoing if ancestor != descendant)
+    return sorted(edges)
+
+
+def _path_key(path: _LineagePath) -> tuple[int, tuple[str, ...], tuple[str, ...]]:
+    return (len(path[1]), path[1], path[0])
+
+
+@dataclass
+class _Closure:
+    paths: dict[tuple[str, str], _LineagePath] = field(default_factory=dict)
+    ancestors: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    descendants: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[CanonicalAssetLineage]) -> _Closure:
+        closure = cls()
+        for row in rows:
+            closure._set(row.ancestor_asset_id, row.descendant_asset_id, (tuple(row.path_asset_ids), tuple(row.path_event_ids)))
+        return closure
+
+    def _set(self, ancestor: str, descendant: str, path: _LineagePath) -> None:
+        self.paths[(ancestor, descendant)] = path
+        self.ancestors[descendant].add(ancestor)
+        self.descendants[ancestor].add(descendant)
+
+    def add_edge(self, ancestor: str, descendant: str, event_id: str) -> set[tuple[str, str]]:
+        # Every pair that can newly reach through this edge is (ancestors of u) x (descendants of v),
+        # so an insert only touches the affected neighbourhood instead of recomputing the closure.
+        sources = [(ancestor, ((ancestor,), ()))] + [
+            (node, self.paths[(node, ancestor)]) for node in sorted(self.ancestors.get(ancestor, ()))
+        ]
+        targets = [(descendant, ((descendant,), ()))] + [
+            (node, self.paths[(descendant, node)]) for node in sorted(self.descendants.get(descendant, ()))
+        ]
+        changed: set[tuple[str, str]] = set()
+        for source, (source_assets, source_events) in sources:
+            for target, (target_assets, target_events) in targets:
+                if source == target:
+                    continue
+                candidate = (source_assets + target_assets, source_events + (event_id,) + target_events)
+                current = self.paths.get((source, target))
+                if current is None or _path_key(candidate) < _path_key(current):
+                    self._set(source, target, candidate)
+                    changed.add((source, target))
+        return changed
+
+
+def _lineage_row(ancestor: str, descendant: str, path: _LineagePath, *, built_at: datetime) -> CanonicalAssetLineage:
+    return CanonicalAssetLineage(
+        asset_lineage_id=stable_id("asset_lineage", ancestor, descendant),
+        ancestor_asset_id=ancestor,
+        descendant_asset_id=descendant,
+        depth=len(path[1]),
+        path_asset_ids=list(path[0]),
+        path_event_ids=list(path[1]),
+        created_at=built_at,
+    )
+
+
+@traced("build")
+def build_asset_lineage(
+    flows: Iterable[CanonicalEventAssetFlow],
+    *,
+    existing_rows: Iterable[CanonicalAssetLineage] = (),
+    existing_edges: Iterable[LineageEdge] = (),
+    builder_version: str = "stage5-asset-lineage-v1",
+    built_at: datetime | None = None,
+) -> CanonicalAssetLineageBuildResult:
+    built_at_value = built_at or datetime.utcnow()
+    edges = lineage_edges(flows)
+    existing_list = list(existing_rows)
+    existing_edge_set = set(existing_edges)
+    edge_set = set(edges)
+
+    # Flows only ever add edges between rebuilds unless an upstream stage rewrote history;
+    # any removed edge can shorten or break existing paths, so that case falls back to a full rebuild.
+    # A closure stored without its edge set cannot be checked for removals and is rebuilt too.
+    if existing_list and existing_edge_set and existing_edge_set <= edge_set:
+        refresh_mode = "incremental"
+        closure = _Closure.from_rows(existing_list)
+        existing_by_pair = {(row.ancestor_asset_id, row.descendant_asset_id): row for row in existing_list}
+        new_edges = [edge for edge in edges if edge not in existing_edge_set]
+    else:
+        refresh_mode = "full"
+        closure = _Closure()
+        existing_by_pair = {}
+        new_edges = edges
+
+    changed_pairs: set[tuple[str, str]] = set()
+    for ancestor, descendant, event_id in new_edges:
+        changed_pairs |= closure.add_edge(ancestor, descendant, event_id)
+
+    rows_by_pair = dict(existing_by_pair)
+    for ancestor, descendant in changed_pairs:
+        rows_by_pair[(ancestor, descendant)] = _lineage_row(ancestor, descendant, closure.paths[(ancestor, descendant)], built_at=built_at_value)
+
+    def sort_key(row: CanonicalAssetLineage) -> tuple[str, int, str]:
+        return (row.ancestor_asset_id, row.depth, row.descendant_asset_id)
+
+    return CanonicalAssetLineageBuildResult(
+        builder_version=builder_version,
+        refresh_mode=refresh_mode,
+        edges=edges,
+        added_edges=new_edges,
+        lineage_rows=sorted(rows_by_pair.values(), key=sort_key),
+        changed_rows=sorted((rows_by_pair[pair] for pair in changed_pairs), key=sort_key),
+    )
+
+
+def select_asset_lineage(
+    rows: Iterable[CanonicalAssetLineage],
+    asset_id: str,
+    *,
+    direction: str = "descendants",
+) -> list[CanonicalAssetLineage]:
+    if direction not in LINEAGE_DIRECTIONS:
+        raise ValueError(f"unknown lineage direction: {direction}")
+    column = "ancestor_asset_id" if direction == "descendants" else "descendant_asset_id"
+    other = "descendant_asset_id" if direction == "descendants" else "ancestor_asset_id"
+    return sorted(
+        (row for row in rows if getattr(row, column) == asset_id),
+        key=lambda row: (row.depth, getattr(row, other)),
+    )
+
+
+def _lineage_from_row(row: tuple[Any, ...]) -> CanonicalAssetLineage:
+    return CanonicalAssetLineage(
+        asset_lineage_id=row[0],
+        ancestor_asset_id=row[1],
+        descendant_asset_id=row[2],
+        depth=row[3],
+        path_asset_ids=list(row[4]),
+        path_event_ids=list(row[5]),
+        created_at=row[6],
+    )
+
+
+_LINEAGE_COLUMNS = """
+                asset_lineage_id,
+                ancestor_asset_id,
+                descendant_asset_id,
+                depth,
+                path_asset_ids,
+                path_event_ids,
+                created_at
+"""
+
+
+def fetch_asset_lineage_build_inputs(
+    conn: Any,
+) -> tuple[list[CanonicalEventAssetFlow], list[CanonicalAssetLineage], list[LineageEdge]]:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            select
+                event_asset_flow_id,
+                event_id,
+                asset_id,
+                flow_direction,
+                flow_role,
+                flow_order,
+                effective_date,
+                created_at
+            from canonical.event_asset_flow
+            order by event_id, flow_order, event_asset_flow_id
+            """
+        )
+        flow_rows = cur.fetchall()
+        cur.execute(f"select {_LINEAGE_COLUMNS} from canonical.asset_lineage order by ancestor_asset_id, depth, descendant_asset_id")
+        lineage_rows = cur.fetchall()
+        cur.execute(
+            """
+            select ancestor_asset_id, descendant_asset_id, event_id
+            from canonical.asset_lineage_edge
+            order by ancestor_asset_id, descendant_asset_id, event_id
+            """
+        )
+        edge_rows = cur.fetchall()
+
+    flows = [
+        CanonicalEventAssetFlow(
+            event_asset_flow_id=row[0],
+            event_id=row[1],
+            asset_id=row[2],
+            flow_direction=row[3],
+            flow_role=row[4],
+            flow_order=row[5],
+            effective_date=row[6],
+            created_at=row[7],
+        )
+        for row in flow_rows
+    ]
+    return flows, [_lineage_from_row(row) for row in lineage_rows], [(row[0], row[1], row[2]) for row in edge_rows]
+
+
+def fetch_asset_lineage(conn: Any, asset_id: str, *, direction: str = "descendants") -> list[CanonicalAssetLineage]:
+    if direction not in LINEAGE_DIRECTIONS:
+        raise ValueError(f"unknown lineage direction: {direction}")
+    column, other = (
+        ("ancestor_asset_id", "descendant_asset_id")
+        if direction == "descendants"
+        else ("descendant_asset_id", "ancestor_asset_id")
+    )
+    with conn.cursor() as cur:
+        cur.execute(
+            f"select {_LINEAGE_COLUMNS} from canonical.asset_lineage where {column} = %s order by depth, {other}",
+            (asset_id,),
+        )
+        return [_lineage_from_row(row) for row in cur.fetchall()]
+
+
+def persist_canonical_asset_lineage_build(conn: Any, result: CanonicalAssetLineageBuildResult) -> dict[str, int]:
+    rows = result.changed_rows
+    edges = result.added_edges
+    with conn.cursor() as cur:
+        if result.refresh_mode == "full":
+            cur.execute("delete from canonical.asset_lineage")
+            cur.execute("delete from canonical.asset_lineage_edge")
+            rows = result.lineage_rows
+            edges = result.edges
+        if edges:
+            cur.executemany(
+                """
+                insert into canonical.asset_lineage_edge (ancestor_asset_id, descendant_asset_id, event_id)
+                values (%s, %s, %s)
+                on conflict do nothing
+                """,
+                edges,
+            )
+        for row in rows:
+            cur.execute(
+                """
+                insert into canonical.asset_lineage (
+                    asset_lineage_id,
+                    ancestor_asset_id,
+                    descendant_asset_id,
+                    depth,
+                    path_asset_ids,
+                    path_event_ids,
+                    created_at
+                )
+                values (%s, %s, %s, %s, %s::jsonb, %s::jsonb, %s)
+                on conflict (asset_lineage_id) do update set
+                    depth = excluded.depth,
+                    path_asset_ids = excluded.path_asset_ids,
+                    path_event_ids = excluded.path_event_ids,
+                    created_at = excluded.created_at
+                """,
+                (
+                    row.asset_lineage_id,
+                    row.ancestor_asset_id,
+                    row.descendant_asset_id,
+                    row.depth,
+                    json.dumps(row.path_asset_ids),
+                    json.dumps(row.path_event_ids),
+                    row.created_at,
+                ),
+            )
+    return result.counts()
+
+
+def build_and_persist_canonical_asset_lineage(*, builder_version: str = "stage5-asset-lineage-v1") -> dict[str, int]:
+    with _connect() as conn:
+        flows, existing_rows, existing_edges = fetch_asset_lineage_build_inputs(conn)
+        result = build_asset_lineage(
+            flows,
+            existing_rows=existing_rows,
+            existing_edges=existing_edges,
+            builder_version=builder_version,
+        )
+        counts = persist_canonical_asset_lineage_build(conn, result)
+        conn.commit()
+    return counts
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+import yaml
+
+from canonical.events import (
+    EventCluster,
+    build_event_clusters,
+    description_from_claims,
+    event_type_from_claims,
+    merge_override_keys,
+)
+from evidence.models import NormalizedClaim, OverrideRecord
+from shared.ids import stable_id
+
+
+JsonDict = dict[str, Any]
+
+MERGEABLE_EVENT_TYPES = {"trade"}
+DEFAULT_MIN_MERGE_SCORE = 0.4
+SUGGESTION_AUTHOR = "merge-suggester"
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class _ClusterProfile:
+    cluster_key: str
+    claim_date: date
+    counterparty: str
+    event_type: str
+    description: str
+    tokens: frozenset[str]
+
+
+@dataclass(frozen=True)
+class MergeSuggestion:
+    target_cluster_key: str
+    source_cluster_keys: list[str]
+    claim_date: date
+    counterparty: str
+    score: float
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+    def to_override_entry(self, *, authored_at: datetime) -> JsonDict:
+        counterparty_text = f" with {self.counterparty}" if self.counterparty else ""
+        return {
+            "override_id": stable_id(
+                "override_merge_event_suggested",
+                self.claim_date.isoformat(),
+                self.target_cluster_key,
+                self.source_cluster_keys,
+            ),
+            "override_type": "merge_event_cluster",
+            "target_type": "event_cluster",
+            "target_key": self.target_cluster_key,
+            "payload": {
+                "source_cluster_keys": list(self.source_cluster_keys),
+                "target_cluster_key": self.target_cluster_key,
+            },
+            "reason": (
+                f"Suggested merge: {len(self.source_cluster_keys)} trade clusters on {self.claim_date.isoformat()}"
+                f"{counterparty_text} look like one compound trade (score {self.score:.2f}). Review before activating."
+            ),
+            "authored_by": SUGGESTION_AUTHOR,
+            "authored_at": authored_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "is_active": True,
+        }
+
+
+@dataclass(frozen=True)
+class MergeSuggestionResult:
+    suggestions: list[MergeSuggestion]
+    cluster_count: int
+    block_count: int
+    compared_pair_count: int
+    already_merged_count: int = 0
+
+    def counts(self) -> JsonDict:
+        return {
+            "suggestion_count": len(self.suggestions),
+            "suggested_cluster_count": sum(len(row.source_cluster_keys) for row in self.suggestions),
+            "cluster_count": self.cluster_count,
+            "block_count": self.block_count,
+            "compared_pair_count": self.compared_pair_count,
+            "already_merged_count": self.already_merged_count,
+            "all_pairs_count": self.cluster_count * (self.cluster_count - 1) // 2,
+        }
+
+
+def _counterparty_from_claims(claims: list[NormalizedClaim]) -> str:
+    for claim in claims:
+        if claim.claim_type != "transaction_counterparty":
+            continue
+        value = claim.claim_payload.get("counterparty_team") or claim.claim_payload.get("transaction_counterparty")
+        if value:
+            return " ".join(str(value).strip().lower().split())
+    return ""
+
+
+def _cluster_profile(cluster: EventCluster) -> _ClusterProfile | None:
+    event_type = event_type_from_claims(cluster.claims)
+    if event_type not in MERGEABLE_EVENT_TYPES:
+        return None
+    dates = sorted(claim.claim_date for claim in cluster.claims if claim.claim_date is not None)
+    if not dates:
+        return None
+    description = description_from_claims(cluster.claims) or ""
+    return _ClusterProfile(
+        cluster_key=cluster.cluster_key,
+        claim_date=dates[0],
+        counterparty=_counterparty_from_claims(cluster.claims),
+        event_type=event_type,
+        description=description,
+        tokens=frozenset(_TOKEN_PATTERN.findall(description.lower())),
+    )
+
+
+def _pair_score(left: _ClusterProfile, right: _ClusterProfile) -> float:
+    # Blocking only narrows the candidates; a pair scores on its description overlap alone, so two
+    # unrelated trades with the same partner on the same day stay apart.
+    union = left.tokens | right.tokens
+    return len(left.tokens & right.tokens) / len(union) if union else 0.0
+
+
+def _find(parents: dict[str, str], key: str) -> str:
+    while parents[key] != key:
+        parents[key] = parents[parents[key]]
+        key = parents[key]
+    return key
+
+
+def suggest_event_merges(
+    claims: Iterable[NormalizedClaim],
+    overrides: Iterable[OverrideRecord],
+    *,
+    min_score: float = DEFAULT_MIN_MERGE_SCORE,
+) -> MergeSuggestionResult:
+    overrides_list = list(overrides)
+    clusters = build_event_clusters(claims, overrides_list)
+    merged_keys: set[str] = set()
+    for override in overrides_list:
+        merge_keys = merge_override_keys(override) if override.is_active else None
+        if merge_keys is not None:
+            merged_keys.update([merge_keys[0], *merge_keys[1]])
+    blocks: dict[tuple[date, str], list[_ClusterProfile]] = defaultdict(list)
+    for cluster in clusters:
+        profile = _cluster_profile(cluster)
+        if profile is not None:
+            blocks[(profile.claim_date, profile.counterparty)].append(profile)
+
+    suggestions: list[MergeSuggestion] = []
+    compared_pair_count = 0
+    already_merged_count = 0
+    for (claim_date, counterparty), profiles in sorted(blocks.items()):
+        if len(profiles) < 2:
+            continue
+        parents = {profile.cluster_key: profile.cluster_key for profile in profiles}
+        best_scores: dict[str, float] = {}
+        for index, left in enumerate(profiles):
+            for right in profiles[index + 1 :]:
+                compared_pair_count += 1
+                score = _pair_score(left, right)
+                if score < min_score:
+                    continue
+                left_root, right_root = _find(parents, left.cluster_key), _find(parents, right.cluster_key)
+                root = min(left_root, right_root)
+                parents[left_root] = parents[right_root] = root
+                best_scores[root] = max(score, best_scores.get(left_root, 0.0), best_scores.get(right_root, 0.0))
+
+        components: dict[str, list[str]] = defaultdict(list)
+        for profile in profiles:
+            components[_find(parents, profile.cluster_key)].append(profile.cluster_key)
+        for root, cluster_keys in sorted(components.items()):
+            if len(cluster_keys) < 2:
+                continue
+            if merged_keys.intersection(cluster_keys):
+                # A second merge naming the same cluster would fight the curated one over its rewrite.
+                already_merged_count += 1
+                continue
+            ordered_keys = sorted(cluster_keys)
+            suggestions.append(
+                MergeSuggestion(
+                    target_cluster_key=ordered_keys[0],
+                    source_cluster_keys=ordered_keys,
+                    claim_date=claim_date,
+                    counterparty=counterparty,
+                    score=round(best_scores.get(root, min_score), 4),
+                )
+            )
+
+    return MergeSuggestionResult(
+        suggestions=suggestions,
+        cluster_count=len(clusters),
+        block_count=len(blocks),
+        compared_pair_count=compared_pair_count,
+        already_merged_count=already_merged_count,
+    )
+
+
+def merge_suggestions_to_yaml(result: MergeSuggestionResult, *, authored_at: datetime | None = None) -> str:
+    authored_at_value = authored_at or datetime.utcnow()
+    entries = [suggestion.to_override_entry(authored_at=authored_at_value) for suggestion in result.suggestions]
+    return yaml.safe_dump(entries, sort_keys=False, allow_unicode=True, width=1000)
+
+
+def write_merge_suggestions(result: MergeSuggestionResult, output_path: Path | str, *, authored_at: datetime | None = None) -> Path:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(merge_suggestions_to_yaml(result, authored_at=authored_at), encoding="utf-8")
+    return path
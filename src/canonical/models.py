@@ -256,6 +256,20 @@ class CanonicalEventAssetFlow:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class CanonicalAssetLineage:
+    asset_lineage_id: str
+    ancestor_asset_id: str
+    descendant_asset_id: str
+    depth: int
+    path_asset_ids: list[str]
+    path_event_ids: list[str]
+    created_at: datetime
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
 @dataclass(frozen=True)
 class EventAssetFlowProvenance:
     event_asset_flow_provenance_id: str
@@ -329,3 +343,24 @@ class CanonicalPickLifecycleBuildResult:
             "asset_count": len(self.assets),
             "asset_provenance_count": len(self.asset_provenance_rows),
         }
+
+
+@dataclass(frozen=True)
+class CanonicalAssetLineageBuildResult:
+    builder_version: str
+    refresh_mode: str
+    # Direct (ancestor, descendant, event) edges; persisted as their own set so a removed edge is
+    # detected even when no closure row records it.
+    edges: list[tuple[str, str, str]]
+    added_edges: list[tuple[str, str, str]]
+    lineage_rows: list[CanonicalAssetLineage]
+    changed_rows: list[CanonicalAssetLineage]
+
+    def counts(self) -> JsonDict:
+        return {
+            "refresh_mode": self.refresh_mode,
+            "lineage_edge_count": len(self.edges),
+            "added_lineage_edge_count": len(self.added_edges),
+            "asset_lineage_count": len(self.lineage_rows),
+            "changed_asset_lineage_count": len(self.changed_rows),
+        }
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import json
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import date, datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from canonical.models import (
     AssetProvenance,
@@ -21,7 +23,10 @@ from canonical.models import (
 )
 from db_config import load_database_url
 from evidence.models import NormalizedClaim, OverrideRecord
+from shared.franchise import DEFAULT_FRANCHISE, Franchise
 from shared.ids import stable_id, stable_payload_hash
+from shared.profiling import traced
+from shared.streaming import DEFAULT_PAGE_SIZE, keyset_rows
 
 
 PICK_RELEVANT_CLAIM_TYPES = {
@@ -41,6 +46,16 @@ PICK_STAGE_ORDER = {
 }
 
 
+@dataclass(frozen=True)
+class _PickBuildRows:
+    pick_assets: list[CanonicalPickAsset]
+    pick_asset_provenance_rows: list[PickAssetProvenance]
+    pick_resolutions: list[CanonicalPickResolution]
+    pick_resolution_provenance_rows: list[PickResolutionProvenance]
+    assets: list[CanonicalAsset]
+    asset_provenance_rows: list[AssetProvenance]
+
+
 @dataclass(frozen=True)
 class _PickStageCandidate:
     state_type: str
@@ -132,24 +147,11 @@ def _pick_round_from_key(pick_key: str) -> int | None:
     return None
 
 
-def _pick_trade_direction(description: str | None) -> str:
-    text = (description or "").lower()
-    if any(marker in text for marker in ("to memphis", "to the grizzlies", "joins memphis", "acquired by memphis", "memphis acquires")):
-        return "incoming"
-    if any(
-        marker in text
-        for marker in (
-            "from memphis",
-            "sent to",
-            "traded away",
-            "trades",
-            "trading",
-            "released by memphis",
-            "waived by memphis",
-        )
-    ):
-        return "outgoing"
-    return "unknown"
+PICK_TRADE_OUTGOING_MARKERS = ("sent to", "traded away", "trades", "trading")
+
+
+def _pick_trade_direction(description: str | None, franchise: Franchise) -> str:
+    return franchise.trade_direction(description, outgoing_markers=PICK_TRADE_OUTGOING_MARKERS)
 
 
 def _group_claims_by_source_record(claims: Iterable[NormalizedClaim]) -> dict[str, list[NormalizedClaim]]:
@@ -250,6 +252,7 @@ def _build_pick_stage_candidates(
     related_claims: list[NormalizedClaim],
     related_events: list[CanonicalEvent],
     overrides: list[OverrideRecord],
+    franchise: Franchise,
 ) -> list[_PickStageCandidate]:
     identity_claim = _pick_identity_claim(pick_claims)
     pick_start_claim = min(
@@ -370,7 +373,7 @@ def _build_pick_stage_candidates(
             )
         )
 
-    conveyed_event = next((event for event in related_events if event.event_type == "trade" and _pick_trade_direction(event.description) == "outgoing"), None)
+    conveyed_event = next((event for event in related_events if event.event_type == "trade" and _pick_trade_direction(event.description, franchise) == "outgoing"), None)
     if conveyed_event is not None:
         convey_override = next((override for override in overrides if override.is_active and override.target_key == pick_key and override.target_type in {"pick_asset", "pick_stage"}), None)
         stage_candidates.append(
@@ -410,6 +413,288 @@ def _build_pick_stage_candidates(
     ]
 
 
+def _build_pick_rows(
+    pick_key: str,
+    pick_claims: list[NormalizedClaim],
+    related_claims: list[NormalizedClaim],
+    related_events: list[CanonicalEvent],
+    overrides: list[OverrideRecord],
+    *,
+    built_at: datetime,
+    franchise: Franchise,
+) -> _PickBuildRows | None:
+    pick_assets: list[CanonicalPickAsset] = []
+    pick_asset_provenance_rows: list[PickAssetProvenance] = []
+    pick_resolutions: list[CanonicalPickResolution] = []
+    pick_resolution_provenance_rows: list[PickResolutionProvenance] = []
+    assets: list[CanonicalAsset] = []
+    asset_provenance_rows: list[AssetProvenance] = []
+
+    identity_claim = _pick_identity_claim(pick_claims)
+    if identity_claim is None:
+        return None
+
+    pick_asset_id = _most_common_pick_identity(pick_claims)
+    origin_team_code = _normalize_team_code(
+        _most_common(
+            [
+                _claim_text(claim, "origin_team", "pick_origin_team")
+                for claim in pick_claims
+                if claim.claim_type in {"pick_identity", "pick_origin_team"}
+            ]
+        )
+    )
+    if origin_team_code is None:
+        origin_team_code = _pick_origin_from_key(pick_key) or "UNK"
+    draft_year = _as_int(
+        _most_common([_claim_text(claim, "draft_year", "pick_draft_year") for claim in pick_claims if claim.claim_type in {"pick_identity", "pick_draft_year"}])
+    ) or _pick_draft_year_from_key(pick_key)
+    draft_round = _as_int(
+        _most_common([_claim_text(claim, "round_number", "pick_round") for claim in pick_claims if claim.claim_type in {"pick_identity", "pick_round"}])
+    ) or _pick_round_from_key(pick_key)
+    if draft_year is None or draft_round is None:
+        raise ValueError(f"canonical pick build requires draft year and round support for {pick_key}.")
+
+    player_identity_claims = [claim for claim in related_claims if claim.claim_subject_type == "player" and claim.claim_type == "player_identity"]
+    drafted_player_id = _most_common(
+        [
+            _claim_text(claim, "player_identity", "player_id") or claim.claim_subject_key
+            for claim in player_identity_claims
+        ]
+    )
+
+    protection_claims = [claim for claim in pick_claims if claim.claim_type == "pick_protection_metadata"]
+    protection_payload = _claim_payload(protection_claims[0]) if protection_claims else {}
+    protection_summary = None
+    if protection_claims:
+        protection_summary = (
+            _claim_text(protection_claims[0], "protection_summary", "summary", "language")
+            or protection_payload.get("protection_summary")
+            or protection_payload.get("summary")
+            or protection_payload.get("language")
+        )
+
+    stage_candidates = _build_pick_stage_candidates(
+        pick_key,
+        pick_claims,
+        related_claims,
+        related_events,
+        overrides,
+        franchise,
+    )
+    current_stage = stage_candidates[-1].state_type if stage_candidates else "future_pick"
+    if stage_candidates and stage_candidates[-1].state_type == "drafted_player":
+        drafted_player_id = drafted_player_id or stage_candidates[-1].drafted_player_id
+
+    if stage_candidates and stage_candidates[-1].state_type == "conveyed_away" and stage_candidates[-1].drafted_player_id:
+        drafted_player_id = stage_candidates[-1].drafted_player_id
+
+    asset_id = stable_id("asset", pick_asset_id, "pick_continuity")
+    pick_assets.append(
+        CanonicalPickAsset(
+            pick_asset_id=pick_asset_id,
+            origin_team_code=origin_team_code,
+            draft_year=draft_year,
+            draft_round=draft_round,
+            protection_summary=protection_summary,
+            protection_payload=protection_payload,
+            drafted_player_id=drafted_player_id,
+            current_pick_stage=current_stage,
+            created_at=built_at,
+            updated_at=built_at,
+        )
+    )
+    assets.append(
+        CanonicalAsset(
+            asset_id=asset_id,
+            asset_kind="pick_continuity",
+            player_tenure_id=None,
+            pick_asset_id=pick_asset_id,
+            asset_label=f"{origin_team_code} {draft_year} round {draft_round} pick",
+            created_at=built_at,
+            updated_at=built_at,
+        )
+    )
+
+    identity_support_claim = identity_claim
+    pick_asset_provenance_rows.append(
+        PickAssetProvenance(
+            pick_asset_provenance_id=stable_id(
+                "pick_asset_prov",
+                pick_asset_id,
+                "pick_identity_support",
+                identity_support_claim.claim_id if identity_support_claim else pick_key,
+            ),
+            pick_asset_id=pick_asset_id,
+            source_record_id=identity_support_claim.source_record_id if identity_support_claim else None,
+            claim_id=identity_support_claim.claim_id if identity_support_claim else None,
+            override_id=None,
+            provenance_role="pick_identity_support",
+            fallback_reason=None if identity_support_claim else "subject_key_derivation",
+            created_at=built_at,
+        )
+    )
+    if protection_claims:
+        protection_claim = protection_claims[0]
+        pick_asset_provenance_rows.append(
+            PickAssetProvenance(
+                pick_asset_provenance_id=stable_id("pick_asset_prov", pick_asset_id, "pick_protection_support", protection_claim.claim_id),
+                pick_asset_id=pick_asset_id,
+                source_record_id=protection_claim.source_record_id,
+                claim_id=protection_claim.claim_id,
+                override_id=None,
+                provenance_role="pick_protection_support",
+                fallback_reason=None,
+                created_at=built_at,
+            )
+        )
+    if protection_summary is not None or protection_payload:
+        pass
+    if drafted_player_id is not None:
+        drafted_claim = player_identity_claims[0] if player_identity_claims else None
+        if drafted_claim is not None:
+            pick_asset_provenance_rows.append(
+                PickAssetProvenance(
+                    pick_asset_provenance_id=stable_id("pick_asset_prov", pick_asset_id, "drafted_player_linkage_support", drafted_claim.claim_id),
+                    pick_asset_id=pick_asset_id,
+                    source_record_id=drafted_claim.source_record_id,
+                    claim_id=drafted_claim.claim_id,
+                    override_id=None,
+                    provenance_role="drafted_player_linkage_support",
+                    fallback_reason=None,
+                    created_at=built_at,
+                )
+            )
+
+    asset_provenance_rows.append(
+        AssetProvenance(
+            asset_provenance_id=stable_id("asset_prov", asset_id, "asset_identity_support", identity_support_claim.claim_id if identity_support_claim else pick_key),
+            asset_id=asset_id,
+            player_tenure_id=None,
+            pick_asset_id=pick_asset_id,
+            source_record_id=identity_support_claim.source_record_id if identity_support_claim else None,
+            claim_id=identity_support_claim.claim_id if identity_support_claim else None,
+            override_id=None,
+            provenance_role="asset_identity_support",
+            fallback_reason=None if identity_support_claim else "subject_key_derivation",
+            created_at=built_at,
+        )
+    )
+    asset_provenance_rows.append(
+        AssetProvenance(
+            asset_provenance_id=stable_id("asset_prov", asset_id, "pick_identity_support", identity_support_claim.claim_id if identity_support_claim else pick_key),
+            asset_id=asset_id,
+            player_tenure_id=None,
+            pick_asset_id=pick_asset_id,
+            source_record_id=identity_support_claim.source_record_id if identity_support_claim else None,
+            claim_id=identity_support_claim.claim_id if identity_support_claim else None,
+            override_id=None,
+            provenance_role="pick_identity_support",
+            fallback_reason=None if identity_support_claim else "subject_key_derivation",
+            created_at=built_at,
+        )
+    )
+
+    for candidate in stage_candidates:
+        current_override = candidate.support_override
+        pick_resolution = CanonicalPickResolution(
+            pick_resolution_id=stable_id(
+                "pick_resolution",
+                pick_asset_id,
+                candidate.state_type,
+                candidate.effective_start_date.isoformat(),
+                candidate.state_payload,
+            ),
+            pick_asset_id=pick_asset_id,
+            state_type=candidate.state_type,
+            effective_start_date=candidate.effective_start_date,
+            effective_end_date=candidate.effective_end_date,
+            overall_pick_number=candidate.overall_pick_number,
+            lottery_context=candidate.lottery_context,
+            drafted_player_id=candidate.drafted_player_id,
+            source_event_id=candidate.source_event_id,
+            state_payload=candidate.state_payload,
+            created_at=built_at,
+            updated_at=built_at,
+        )
+        pick_resolutions.append(pick_resolution)
+
+        roles = ["asset_state_support"]
+        if candidate.state_type == "resolved_pick":
+            roles.append("pick_resolution_support")
+        elif candidate.state_type == "drafted_player":
+            roles.append("drafted_player_linkage_support")
+        elif candidate.state_type == "future_pick":
+            roles.append("pick_identity_support")
+        elif candidate.state_type == "conveyed_away":
+            roles.append("pick_conveyance_support")
+
+        support_claim = candidate.support_claims[0] if candidate.support_claims else None
+        if support_claim is not None:
+            pick_resolution_provenance_rows.append(
+                PickResolutionProvenance(
+                    pick_resolution_provenance_id=stable_id(
+                        "pick_resolution_prov",
+                        pick_resolution.pick_resolution_id,
+                        roles[0],
+                        support_claim.claim_id,
+                    ),
+                    pick_resolution_id=pick_resolution.pick_resolution_id,
+                    source_record_id=support_claim.source_record_id,
+                    claim_id=support_claim.claim_id,
+                    override_id=current_override.override_id if current_override else None,
+                    provenance_role=roles[0],
+                    fallback_reason=candidate.fallback_reason,
+                    created_at=built_at,
+                )
+            )
+        for role in roles[1:]:
+            pick_resolution_provenance_rows.append(
+                PickResolutionProvenance(
+                    pick_resolution_provenance_id=stable_id(
+                        "pick_resolution_prov",
+                        pick_resolution.pick_resolution_id,
+                        role,
+                        support_claim.claim_id if support_claim else candidate.state_type,
+                    ),
+                    pick_resolution_id=pick_resolution.pick_resolution_id,
+                    source_record_id=support_claim.source_record_id if support_claim else None,
+                    claim_id=support_claim.claim_id if support_claim else None,
+                    override_id=current_override.override_id if current_override else None,
+                    provenance_role=role,
+                    fallback_reason=candidate.fallback_reason,
+                    created_at=built_at,
+                )
+            )
+
+    return _PickBuildRows(
+        pick_assets=pick_assets,
+        pick_asset_provenance_rows=pick_asset_provenance_rows,
+        pick_resolutions=pick_resolutions,
+        pick_resolution_provenance_rows=pick_resolution_provenance_rows,
+        assets=assets,
+        asset_provenance_rows=asset_provenance_rows,
+    )
+
+
+def _build_pick_shard(
+    shard: list[tuple[str, list[NormalizedClaim], list[NormalizedClaim], list[CanonicalEvent]]],
+    overrides: list[OverrideRecord],
+    built_at: datetime,
+    franchise: Franchise,
+) -> list[_PickBuildRows | None]:
+    return [
+        _build_pick_rows(pick_key, pick_claims, related_claims, related_events, overrides, built_at=built_at, franchise=franchise)
+        for pick_key, pick_claims, related_claims, related_events in shard
+    ]
+
+
+def _shard_pick_inputs(pick_inputs: list[Any], workers: int) -> list[list[Any]]:
+    shard_size = -(-len(pick_inputs) // workers)
+    return [pick_inputs[index : index + shard_size] for index in range(0, len(pick_inputs), shard_size)]
+
+
+@traced("build")
 def build_pick_lifecycle(
     events: Iterable[CanonicalEvent],
     event_provenance: Iterable[EventProvenance],
@@ -418,6 +703,8 @@ def build_pick_lifecycle(
     *,
     builder_version: str = "stage4-pick-lifecycle-v1",
     built_at: datetime | None = None,
+    workers: int = 1,
+    franchise: Franchise = DEFAULT_FRANCHISE,
 ) -> CanonicalPickLifecycleBuildResult:
     built_at_value = built_at or datetime.utcnow()
     events_list = sorted(list(events), key=lambda event: (event.event_date, event.event_order, event.event_id))
@@ -439,13 +726,7 @@ def build_pick_lifecycle(
     if not pick_claims_by_key:
         raise ValueError("canonical pick build requires at least one pick claim.")
 
-    pick_assets: list[CanonicalPickAsset] = []
-    pick_asset_provenance_rows: list[PickAssetProvenance] = []
-    pick_resolutions: list[CanonicalPickResolution] = []
-    pick_resolution_provenance_rows: list[PickResolutionProvenance] = []
-    assets: list[CanonicalAsset] = []
-    asset_provenance_rows: list[AssetProvenance] = []
-
+    pick_inputs: list[tuple[str, list[NormalizedClaim], list[NormalizedClaim], list[CanonicalEvent]]] = []
     for pick_key, pick_claims in sorted(pick_claims_by_key.items()):
         related_claims = _related_claims_for_pick(pick_claims, claims_by_group_hint)
         related_source_record_ids = {claim.source_record_id for claim in related_claims}
@@ -453,246 +734,44 @@ def build_pick_lifecycle(
         for source_record_id in sorted(related_source_record_ids):
             related_events.extend(related_events_by_source_record.get(source_record_id, []))
         related_events = sorted({event.event_id: event for event in related_events}.values(), key=lambda event: (event.event_date, event.event_order, event.event_id))
-
-        identity_claim = _pick_identity_claim(pick_claims)
-        if identity_claim is None:
-            continue
-
-        pick_asset_id = _most_common_pick_identity(pick_claims)
-        origin_team_code = _normalize_team_code(
-            _most_common(
-                [
-                    _claim_text(claim, "origin_team", "pick_origin_team")
-                    for claim in pick_claims
-                    if claim.claim_type in {"pick_identity", "pick_origin_team"}
-                ]
-            )
-        )
-        if origin_team_code is None:
-            origin_team_code = _pick_origin_from_key(pick_key) or "UNK"
-        draft_year = _as_int(
-            _most_common([_claim_text(claim, "draft_year", "pick_draft_year") for claim in pick_claims if claim.claim_type in {"pick_identity", "pick_draft_year"}])
-        ) or _pick_draft_year_from_key(pick_key)
-        draft_round = _as_int(
-            _most_common([_claim_text(claim, "round_number", "pick_round") for claim in pick_claims if claim.claim_type in {"pick_identity", "pick_round"}])
-        ) or _pick_round_from_key(pick_key)
-        if draft_year is None or draft_round is None:
-            raise ValueError(f"canonical pick build requires draft year and round support for {pick_key}.")
-
-        player_identity_claims = [claim for claim in related_claims if claim.claim_subject_type == "player" and claim.claim_type == "player_identity"]
-        drafted_player_id = _most_common(
-            [
-                _claim_text(claim, "player_identity", "player_id") or claim.claim_subject_key
-                for claim in player_identity_claims
-            ]
-        )
-
-        protection_claims = [claim for claim in pick_claims if claim.claim_type == "pick_protection_metadata"]
-        protection_payload = _claim_payload(protection_claims[0]) if protection_claims else {}
-        protection_summary = None
-        if protection_claims:
-            protection_summary = (
-                _claim_text(protection_claims[0], "protection_summary", "summary", "language")
-                or protection_payload.get("protection_summary")
-                or protection_payload.get("summary")
-                or protection_payload.get("language")
-            )
-
-        stage_candidates = _build_pick_stage_candidates(
-            pick_key,
-            pick_claims,
-            related_claims,
-            related_events,
-            overrides_list,
-        )
-        current_stage = stage_candidates[-1].state_type if stage_candidates else "future_pick"
-        if stage_candidates and stage_candidates[-1].state_type == "drafted_player":
-            drafted_player_id = drafted_player_id or stage_candidates[-1].drafted_player_id
-
-        if stage_candidates and stage_candidates[-1].state_type == "conveyed_away" and stage_candidates[-1].drafted_player_id:
-            drafted_player_id = stage_candidates[-1].drafted_player_id
-
-        asset_id = stable_id("asset", pick_asset_id, "pick_continuity")
-        pick_assets.append(
-            CanonicalPickAsset(
-                pick_asset_id=pick_asset_id,
-                origin_team_code=origin_team_code,
-                draft_year=draft_year,
-                draft_round=draft_round,
-                protection_summary=protection_summary,
-                protection_payload=protection_payload,
-                drafted_player_id=drafted_player_id,
-                current_pick_stage=current_stage,
-                created_at=built_at_value,
-                updated_at=built_at_value,
-            )
-        )
-        assets.append(
-            CanonicalAsset(
-                asset_id=asset_id,
-                asset_kind="pick_continuity",
-                player_tenure_id=None,
-                pick_asset_id=pick_asset_id,
-                asset_label=f"{origin_team_code} {draft_year} round {draft_round} pick",
-                created_at=built_at_value,
-                updated_at=built_at_value,
-            )
-        )
-
-        identity_support_claim = identity_claim
-        pick_asset_provenance_rows.append(
-            PickAssetProvenance(
-                pick_asset_provenance_id=stable_id(
-                    "pick_asset_prov",
-                    pick_asset_id,
-                    "pick_identity_support",
-                    identity_support_claim.claim_id if identity_support_claim else pick_key,
-                ),
-                pick_asset_id=pick_asset_id,
-                source_record_id=identity_support_claim.source_record_id if identity_support_claim else None,
-                claim_id=identity_support_claim.claim_id if identity_support_claim else None,
-                override_id=None,
-                provenance_role="pick_identity_support",
-                fallback_reason=None if identity_support_claim else "subject_key_derivation",
-                created_at=built_at_value,
-            )
-        )
-        if protection_claims:
-            protection_claim = protection_claims[0]
-            pick_asset_provenance_rows.append(
-                PickAssetProvenance(
-                    pick_asset_provenance_id=stable_id("pick_asset_prov", pick_asset_id, "pick_protection_support", protection_claim.claim_id),
-                    pick_asset_id=pick_asset_id,
-                    source_record_id=protection_claim.source_record_id,
-                    claim_id=protection_claim.claim_id,
-                    override_id=None,
-                    provenance_role="pick_protection_support",
-                    fallback_reason=None,
-                    created_at=built_at_value,
+        pick_inputs.append((pick_key, pick_claims, related_claims, related_events))
+
+    if workers > 1 and len(pick_inputs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_rows = list(
+                executor.map(
+                    _build_pick_shard,
+                    _shard_pick_inputs(pick_inputs, workers),
+                    repeat(overrides_list),
+                    repeat(built_at_value),
+                    repeat(franchise),
                 )
             )
-        if protection_summary is not None or protection_payload:
-            pass
-        if drafted_player_id is not None:
-            drafted_claim = player_identity_claims[0] if player_identity_claims else None
-            if drafted_claim is not None:
-                pick_asset_provenance_rows.append(
-                    PickAssetProvenance(
-                        pick_asset_provenance_id=stable_id("pick_asset_prov", pick_asset_id, "drafted_player_linkage_support", drafted_claim.claim_id),
-                        pick_asset_id=pick_asset_id,
-                        source_record_id=drafted_claim.source_record_id,
-                        claim_id=drafted_claim.claim_id,
-                        override_id=None,
-                        provenance_role="drafted_player_linkage_support",
-                        fallback_reason=None,
-                        created_at=built_at_value,
-                    )
-                )
+        pick_rows = [rows for shard in shard_rows for rows in shard]
+    else:
+        pick_rows = _build_pick_shard(pick_inputs, overrides_list, built_at_value, franchise)
 
-        asset_provenance_rows.append(
-            AssetProvenance(
-                asset_provenance_id=stable_id("asset_prov", asset_id, "asset_identity_support", identity_support_claim.claim_id if identity_support_claim else pick_key),
-                asset_id=asset_id,
-                player_tenure_id=None,
-                pick_asset_id=pick_asset_id,
-                source_record_id=identity_support_claim.source_record_id if identity_support_claim else None,
-                claim_id=identity_support_claim.claim_id if identity_support_claim else None,
-                override_id=None,
-                provenance_role="asset_identity_support",
-                fallback_reason=None if identity_support_claim else "subject_key_derivation",
-                created_at=built_at_value,
-            )
-        )
-        asset_provenance_rows.append(
-            AssetProvenance(
-                asset_provenance_id=stable_id("asset_prov", asset_id, "pick_identity_support", identity_support_claim.claim_id if identity_support_claim else pick_key),
-                asset_id=asset_id,
-                player_tenure_id=None,
-                pick_asset_id=pick_asset_id,
-                source_record_id=identity_support_claim.source_record_id if identity_support_claim else None,
-                claim_id=identity_support_claim.claim_id if identity_support_claim else None,
-                override_id=None,
-                provenance_role="pick_identity_support",
-                fallback_reason=None if identity_support_claim else "subject_key_derivation",
-                created_at=built_at_value,
-            )
-        )
-
-        for candidate in stage_candidates:
-            current_override = candidate.support_override
-            pick_resolution = CanonicalPickResolution(
-                pick_resolution_id=stable_id(
-                    "pick_resolution",
-                    pick_asset_id,
-                    candidate.state_type,
-                    candidate.effective_start_date.isoformat(),
-                    candidate.state_payload,
-                ),
-                pick_asset_id=pick_asset_id,
-                state_type=candidate.state_type,
-                effective_start_date=candidate.effective_start_date,
-                effective_end_date=candidate.effective_end_date,
-                overall_pick_number=candidate.overall_pick_number,
-                lottery_context=candidate.lottery_context,
-                drafted_player_id=candidate.drafted_player_id,
-                source_event_id=candidate.source_event_id,
-                state_payload=candidate.state_payload,
-                created_at=built_at_value,
-                updated_at=built_at_value,
-            )
-            pick_resolutions.append(pick_resolution)
-
-            roles = ["asset_state_support"]
-            if candidate.state_type == "resolved_pick":
-                roles.append("pick_resolution_support")
-            elif candidate.state_type == "drafted_player":
-                roles.append("drafted_player_linkage_support")
-            elif candidate.state_type == "future_pick":
-                roles.append("pick_identity_support")
-            elif candidate.state_type == "conveyed_away":
-                roles.append("pick_conveyance_support")
-
-            support_claim = candidate.support_claims[0] if candidate.support_claims else None
-            if support_claim is not None:
-                pick_resolution_provenance_rows.append(
-                    PickResolutionProvenance(
-                        pick_resolution_provenance_id=stable_id(
-                            "pick_resolution_prov",
-                            pick_resolution.pick_resolution_id,
-                            roles[0],
-                            support_claim.claim_id,
-                        ),
-                        pick_resolution_id=pick_resolution.pick_resolution_id,
-                        source_record_id=support_claim.source_record_id,
-                        claim_id=support_claim.claim_id,
-                        override_id=current_override.override_id if current_override else None,
-                        provenance_role=roles[0],
-                        fallback_reason=candidate.fallback_reason,
-                        created_at=built_at_value,
-                    )
-                )
-            for role in roles[1:]:
-                pick_resolution_provenance_rows.append(
-                    PickResolutionProvenance(
-                        pick_resolution_provenance_id=stable_id(
-                            "pick_resolution_prov",
-                            pick_resolution.pick_resolution_id,
-                            role,
-                            support_claim.claim_id if support_claim else candidate.state_type,
-                        ),
-                        pick_resolution_id=pick_resolution.pick_resolution_id,
-                        source_record_id=support_claim.source_record_id if support_claim else None,
-                        claim_id=support_claim.claim_id if support_claim else None,
-                        override_id=current_override.override_id if current_override else None,
-                        provenance_role=role,
-                        fallback_reason=candidate.fallback_reason,
-                        created_at=built_at_value,
-                    )
-                )
+    pick_assets: list[CanonicalPickAsset] = []
+    pick_asset_provenance_rows: list[PickAssetProvenance] = []
+    pick_resolutions: list[CanonicalPickResolution] = []
+    pick_resolution_provenance_rows: list[PickResolutionProvenance] = []
+    assets: list[CanonicalAsset] = []
+    asset_provenance_rows: list[AssetProvenance] = []
+    for rows in pick_rows:
+        if rows is None:
+            continue
+        pick_assets.extend(rows.pick_assets)
+        pick_asset_provenance_rows.extend(rows.pick_asset_provenance_rows)
+        pick_resolutions.extend(rows.pick_resolutions)
+        pick_resolution_provenance_rows.extend(rows.pick_resolution_provenance_rows)
+        assets.extend(rows.assets)
+        asset_provenance_rows.extend(rows.asset_provenance_rows)
 
     resolutions_by_asset: dict[str, list[CanonicalPickResolution]] = defaultdict(list)
-    for row in pick_resolutions:
+    resolution_index_by_id: dict[str, int] = {}
+    for index, row in enumerate(pick_resolutions):
         resolutions_by_asset[row.pick_asset_id].append(row)
+        resolution_index_by_id.setdefault(row.pick_resolution_id, index)
     for rows in resolutions_by_asset.values():
         rows.sort(key=lambda row: (row.effective_start_date, PICK_STAGE_ORDER[row.state_type], row.pick_resolution_id))
         for index, row in enumerate(rows):
@@ -712,10 +791,7 @@ def build_pick_lifecycle(
                     created_at=row.created_at,
                     updated_at=row.updated_at,
                 )
-                for replace_index, existing in enumerate(pick_resolutions):
-                    if existing.pick_resolution_id == row.pick_resolution_id:
-                        pick_resolutions[replace_index] = updated
-                        break
+                pick_resolutions[resolution_index_by_id[row.pick_resolution_id]] = updated
 
     evidence_build_hash = stable_payload_hash(
         {
@@ -894,6 +970,122 @@ def fetch_pick_lifecycle_build_inputs(conn: Any) -> tuple[list[CanonicalEvent],
     return events, event_provenance, claims, overrides
 
 
+def iter_pick_asset_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[CanonicalPickAsset]:
+    sql = """
+        select
+            pick_asset_id,
+            origin_team_code,
+            draft_year,
+            draft_round,
+            protection_summary,
+            protection_payload,
+            drafted_player_id,
+            current_pick_stage,
+            created_at,
+            updated_at
+        from canonical.pick_asset
+    """
+    for row in keyset_rows(conn, sql, key_columns=("pick_asset_id",), page_size=page_size):
+        yield CanonicalPickAsset(
+            pick_asset_id=row[0],
+            origin_team_code=row[1],
+            draft_year=row[2],
+            draft_round=row[3],
+            protection_summary=row[4],
+            protection_payload=row[5],
+            drafted_player_id=row[6],
+            current_pick_stage=row[7],
+            created_at=row[8],
+            updated_at=row[9],
+        )
+
+
+def iter_pick_asset_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[PickAssetProvenance]:
+    sql = """
+        select
+            pick_asset_provenance_id,
+            pick_asset_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.pick_asset_provenance
+    """
+    for row in keyset_rows(conn, sql, key_columns=("pick_asset_provenance_id",), page_size=page_size):
+        yield PickAssetProvenance(
+            pick_asset_provenance_id=row[0],
+            pick_asset_id=row[1],
+            source_record_id=row[2],
+            claim_id=row[3],
+            override_id=row[4],
+            provenance_role=row[5],
+            fallback_reason=row[6],
+            created_at=row[7],
+        )
+
+
+def iter_pick_resolution_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[CanonicalPickResolution]:
+    sql = """
+        select
+            pick_resolution_id,
+            pick_asset_id,
+            state_type,
+            effective_start_date,
+            effective_end_date,
+            overall_pick_number,
+            lottery_context,
+            drafted_player_id,
+            source_event_id,
+            state_payload,
+            created_at,
+            updated_at
+        from canonical.pick_resolution
+    """
+    for row in keyset_rows(conn, sql, key_columns=("pick_resolution_id",), page_size=page_size):
+        yield CanonicalPickResolution(
+            pick_resolution_id=row[0],
+            pick_asset_id=row[1],
+            state_type=row[2],
+            effective_start_date=row[3],
+            effective_end_date=row[4],
+            overall_pick_number=row[5],
+            lottery_context=row[6],
+            drafted_player_id=row[7],
+            source_event_id=row[8],
+            state_payload=row[9],
+            created_at=row[10],
+            updated_at=row[11],
+        )
+
+
+def iter_pick_resolution_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[PickResolutionProvenance]:
+    sql = """
+        select
+            pick_resolution_provenance_id,
+            pick_resolution_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.pick_resolution_provenance
+    """
+    for row in keyset_rows(conn, sql, key_columns=("pick_resolution_provenance_id",), page_size=page_size):
+        yield PickResolutionProvenance(
+            pick_resolution_provenance_id=row[0],
+            pick_resolution_id=row[1],
+            source_record_id=row[2],
+            claim_id=row[3],
+            override_id=row[4],
+            provenance_role=row[5],
+            fallback_reason=row[6],
+            created_at=row[7],
+        )
+
+
 def persist_canonical_pick_lifecycle_build(conn: Any, result: CanonicalPickLifecycleBuildResult) -> dict[str, int]:
     pick_asset_ids = {row.pick_asset_id for row in result.pick_assets}
     with conn.cursor() as cur:
@@ -1103,7 +1295,12 @@ def persist_canonical_pick_lifecycle_build(conn: Any, result: CanonicalPickLifec
     return result.counts()
 
 
-def build_and_persist_canonical_pick_lifecycle(*, builder_version: str = "stage4-pick-lifecycle-v1") -> dict[str, int]:
+def build_and_persist_canonical_pick_lifecycle(
+    *,
+    builder_version: str = "stage4-pick-lifecycle-v1",
+    workers: int = 1,
+    franchise: Franchise = DEFAULT_FRANCHISE,
+) -> dict[str, int]:
     with _connect() as conn:
         events, event_provenance, claims, overrides = fetch_pick_lifecycle_build_inputs(conn)
         result = build_pick_lifecycle(
@@ -1112,6 +1309,8 @@ def build_and_persist_canonical_pick_lifecycle(*, builder_version: str = "stage4
             claims,
             overrides,
             builder_version=builder_version,
+            workers=workers,
+            franchise=franchise,
         )
         counts = persist_canonical_pick_lifecycle_build(conn, result)
         conn.commit()
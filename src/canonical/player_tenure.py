@@ -4,7 +4,7 @@ import json
 from collections import Counter, defaultdict
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from canonical.events import CanonicalEvent, EventProvenance
 from canonical.models import (
@@ -21,7 +21,10 @@ from canonical.models import (
 from db_config import load_database_url
 from evidence.models import NormalizedClaim, OverrideRecord
 from evidence.normalize import normalize_name
+from shared.franchise import DEFAULT_FRANCHISE, Franchise
 from shared.ids import stable_id, stable_payload_hash
+from shared.profiling import traced
+from shared.streaming import DEFAULT_PAGE_SIZE, keyset_rows
 
 
 def bootstrap_canonical_player_tenure_schema(sql_path: Path | str) -> None:
@@ -126,20 +129,18 @@ def _event_description(event: CanonicalEvent, claims: Iterable[NormalizedClaim])
     return event.description or ""
 
 
-def _trade_direction(description: str) -> str:
-    text = description.lower()
-    if any(marker in text for marker in ("to memphis", "to the grizzlies", "joins memphis", "acquired by memphis", "memphis acquires")):
-        return "incoming"
-    if any(marker in text for marker in ("from memphis", "sent to", "traded away", "released by memphis", "waived by memphis", "buyout")):
-        return "outgoing"
-    return "unknown"
+TRADE_OUTGOING_MARKERS = ("sent to", "traded away", "buyout")
 
 
-def _is_entry_event(event: CanonicalEvent, description: str, tenure_open: bool) -> bool:
+def _trade_direction(description: str, franchise: Franchise) -> str:
+    return franchise.trade_direction(description, outgoing_markers=TRADE_OUTGOING_MARKERS)
+
+
+def _is_entry_event(event: CanonicalEvent, description: str, tenure_open: bool, franchise: Franchise) -> bool:
     if event.event_type in {"signing", "re_signing", "draft"}:
         return True
     if event.event_type == "trade":
-        direction = _trade_direction(description)
+        direction = _trade_direction(description, franchise)
         if direction == "incoming":
             return True
         if direction == "outgoing":
@@ -148,11 +149,11 @@ def _is_entry_event(event: CanonicalEvent, description: str, tenure_open: bool)
     return False
 
 
-def _is_exit_event(event: CanonicalEvent, description: str, tenure_open: bool) -> bool:
+def _is_exit_event(event: CanonicalEvent, description: str, tenure_open: bool, franchise: Franchise) -> bool:
     if event.event_type in {"waiver", "buyout"}:
         return True
     if event.event_type == "trade":
-        direction = _trade_direction(description)
+        direction = _trade_direction(description, franchise)
         if direction == "outgoing":
             return True
         if direction == "incoming":
@@ -161,13 +162,13 @@ def _is_exit_event(event: CanonicalEvent, description: str, tenure_open: bool) -
     return False
 
 
-def _opening_tenure_type(event: CanonicalEvent, description: str) -> tuple[str, str | None]:
+def _opening_tenure_type(event: CanonicalEvent, description: str, franchise: Franchise) -> tuple[str, str | None]:
     if event.event_type == "draft":
         return "draft", "draft"
     if event.event_type in {"signing", "re_signing"}:
         return event.event_type, "free_agency"
     if event.event_type == "trade":
-        if _trade_direction(description) == "incoming":
+        if _trade_direction(description, franchise) == "incoming":
             return "trade_acquisition", "trade"
         return "trade", "trade"
     return event.event_type, None
@@ -245,6 +246,7 @@ def _build_player_tenures(
     claims: Iterable[NormalizedClaim],
     *,
     built_at: datetime,
+    franchise: Franchise,
 ) -> tuple[
     list[CanonicalPlayerTenure],
     list[CanonicalAsset],
@@ -282,8 +284,8 @@ def _build_player_tenures(
             support_claim = support_claims[0] if support_claims else player_rows[0]
             tenure_open = player_id in open_tenure_by_player
 
-            if _is_entry_event(event, description, tenure_open) and not tenure_open:
-                tenure_type, roster_path_type = _opening_tenure_type(event, description)
+            if _is_entry_event(event, description, tenure_open, franchise) and not tenure_open:
+                tenure_type, roster_path_type = _opening_tenure_type(event, description, franchise)
                 tenure_id = stable_id("player_tenure", player_id, event.event_date.isoformat(), event.event_id, tenure_type)
                 tenure = CanonicalPlayerTenure(
                     player_tenure_id=tenure_id,
@@ -307,7 +309,7 @@ def _build_player_tenures(
                         asset_kind="player_tenure",
                         player_tenure_id=tenure_id,
                         pick_asset_id=None,
-                        asset_label=f"{display_name} Memphis tenure {sum(1 for row in tenure_rows if row.player_id == player_id)}",
+                        asset_label=f"{display_name} {franchise.display_place} tenure {sum(1 for row in tenure_rows if row.player_id == player_id)}",
                         created_at=built_at,
                         updated_at=built_at,
                     )
@@ -342,7 +344,7 @@ def _build_player_tenures(
                         ),
                     ]
                 )
-            elif _is_exit_event(event, description, tenure_open) and tenure_open:
+            elif _is_exit_event(event, description, tenure_open, franchise) and tenure_open:
                 tenure = open_tenure_by_player[player_id]
                 updated_tenure = CanonicalPlayerTenure(
                     player_tenure_id=tenure.player_tenure_id,
@@ -434,6 +436,7 @@ def _build_player_tenures(
     return tenure_rows, asset_rows, asset_provenance_rows, asset_states, asset_state_provenance_rows
 
 
+@traced("build")
 def build_player_tenures(
     events: Iterable[CanonicalEvent],
     event_provenance: Iterable[EventProvenance],
@@ -442,6 +445,7 @@ def build_player_tenures(
     *,
     builder_version: str = "stage3-player-tenure-v1",
     built_at: datetime | None = None,
+    franchise: Franchise = DEFAULT_FRANCHISE,
 ) -> CanonicalPlayerTenureBuildResult:
     built_at_value = built_at or datetime.utcnow()
     events_list = list(events)
@@ -455,6 +459,7 @@ def build_player_tenures(
         event_provenance_list,
         claims_list,
         built_at=built_at_value,
+        franchise=franchise,
     )
 
     evidence_build_hash = stable_payload_hash(
@@ -636,6 +641,196 @@ def fetch_player_tenure_build_inputs(
     return events, event_provenance, claims, overrides
 
 
+def iter_player_identity_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[CanonicalPlayerIdentity]:
+    sql = """
+        select
+            player_id,
+            display_name,
+            normalized_name,
+            nba_person_id,
+            created_at,
+            updated_at
+        from canonical.player_identity
+    """
+    for row in keyset_rows(conn, sql, key_columns=("player_id",), page_size=page_size):
+        yield CanonicalPlayerIdentity(
+            player_id=row[0],
+            display_name=row[1],
+            normalized_name=row[2],
+            nba_person_id=row[3],
+            created_at=row[4],
+            updated_at=row[5],
+        )
+
+
+def iter_player_identity_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[PlayerIdentityProvenance]:
+    sql = """
+        select
+            player_identity_provenance_id,
+            player_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.player_identity_provenance
+    """
+    for row in keyset_rows(conn, sql, key_columns=("player_identity_provenance_id",), page_size=page_size):
+        yield PlayerIdentityProvenance(
+            player_identity_provenance_id=row[0],
+            player_id=row[1],
+            source_record_id=row[2],
+            claim_id=row[3],
+            override_id=row[4],
+            provenance_role=row[5],
+            fallback_reason=row[6],
+            created_at=row[7],
+        )
+
+
+def iter_player_tenure_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[CanonicalPlayerTenure]:
+    sql = """
+        select
+            player_tenure_id,
+            player_id,
+            tenure_start_date,
+            tenure_end_date,
+            entry_event_id,
+            exit_event_id,
+            tenure_type,
+            roster_path_type,
+            created_at,
+            updated_at
+        from canonical.player_tenure
+    """
+    for row in keyset_rows(conn, sql, key_columns=("player_tenure_id",), page_size=page_size):
+        yield CanonicalPlayerTenure(
+            player_tenure_id=row[0],
+            player_id=row[1],
+            tenure_start_date=row[2],
+            tenure_end_date=row[3],
+            entry_event_id=row[4],
+            exit_event_id=row[5],
+            tenure_type=row[6],
+            roster_path_type=row[7],
+            created_at=row[8],
+            updated_at=row[9],
+        )
+
+
+def iter_asset_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE, pick_assets_only: bool = False) -> Iterator[CanonicalAsset]:
+    where_sql = "where pick_asset_id is not null" if pick_assets_only else ""
+    sql = f"""
+        select
+            asset_id,
+            asset_kind,
+            player_tenure_id,
+            pick_asset_id,
+            asset_label,
+            created_at,
+            updated_at
+        from canonical.asset
+        {where_sql}
+    """
+    for row in keyset_rows(conn, sql, key_columns=("asset_id",), page_size=page_size):
+        yield CanonicalAsset(
+            asset_id=row[0],
+            asset_kind=row[1],
+            player_tenure_id=row[2],
+            pick_asset_id=row[3],
+            asset_label=row[4],
+            created_at=row[5],
+            updated_at=row[6],
+        )
+
+
+def iter_asset_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE, pick_assets_only: bool = False) -> Iterator[AssetProvenance]:
+    where_sql = "where pick_asset_id is not null" if pick_assets_only else ""
+    sql = f"""
+        select
+            asset_provenance_id,
+            asset_id,
+            player_tenure_id,
+            pick_asset_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.asset_provenance
+        {where_sql}
+    """
+    for row in keyset_rows(conn, sql, key_columns=("asset_provenance_id",), page_size=page_size):
+        yield AssetProvenance(
+            asset_provenance_id=row[0],
+            asset_id=row[1],
+            player_tenure_id=row[2],
+            pick_asset_id=row[3],
+            source_record_id=row[4],
+            claim_id=row[5],
+            override_id=row[6],
+            provenance_role=row[7],
+            fallback_reason=row[8],
+            created_at=row[9],
+        )
+
+
+def iter_asset_state_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[AssetState]:
+    sql = """
+        select
+            asset_state_id,
+            asset_id,
+            state_type,
+            effective_start_date,
+            effective_end_date,
+            state_payload,
+            source_event_id,
+            created_at,
+            updated_at
+        from canonical.asset_state
+    """
+    for row in keyset_rows(conn, sql, key_columns=("asset_state_id",), page_size=page_size):
+        yield AssetState(
+            asset_state_id=row[0],
+            asset_id=row[1],
+            state_type=row[2],
+            effective_start_date=row[3],
+            effective_end_date=row[4],
+            state_payload=row[5],
+            source_event_id=row[6],
+            created_at=row[7],
+            updated_at=row[8],
+        )
+
+
+def iter_asset_state_provenance_rows(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[AssetStateProvenance]:
+    sql = """
+        select
+            asset_state_provenance_id,
+            asset_state_id,
+            source_record_id,
+            claim_id,
+            override_id,
+            provenance_role,
+            fallback_reason,
+            created_at
+        from canonical.asset_state_provenance
+    """
+    for row in keyset_rows(conn, sql, key_columns=("asset_state_provenance_id",), page_size=page_size):
+        yield AssetStateProvenance(
+            asset_state_provenance_id=row[0],
+            asset_state_id=row[1],
+            source_record_id=row[2],
+            claim_id=row[3],
+            override_id=row[4],
+            provenance_role=row[5],
+            fallback_reason=row[6],
+            created_at=row[7],
+        )
+
+
 def persist_canonical_player_tenure_build(conn: Any, result: CanonicalPlayerTenureBuildResult) -> dict[str, int]:
     with conn.cursor() as cur:
         cur.execute("delete from canonical.asset_state_provenance")
@@ -855,7 +1050,11 @@ def persist_canonical_player_tenure_build(conn: Any, result: CanonicalPlayerTenu
     return result.counts()
 
 
-def build_and_persist_canonical_player_tenures(*, builder_version: str = "stage3-player-tenure-v1") -> dict[str, int]:
+def build_and_persist_canonical_player_tenures(
+    *,
+    builder_version: str = "stage3-player-tenure-v1",
+    franchise: Franchise = DEFAULT_FRANCHISE,
+) -> dict[str, int]:
     with _connect() as conn:
         events, event_provenance, claims, overrides = fetch_player_tenure_build_inputs(conn)
         result = build_player_tenures(
@@ -864,6 +1063,7 @@ def build_and_persist_canonical_player_tenures(*, builder_version: str = "stage3
             claims,
             overrides,
             builder_version=builder_version,
+            franchise=franchise,
         )
         counts = persist_canonical_player_tenure_build(conn, result)
         conn.commit()
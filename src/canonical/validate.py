@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from canonical.models import CanonicalEvent, EventProvenance
+from shared.profiling import traced
 
 
 @dataclass(frozen=True)
@@ -19,13 +20,14 @@ class CanonicalEventValidationReport:
         return not self.errors
 
 
+@traced("validate")
 def validate_canonical_events(
     *,
     events: Iterable[CanonicalEvent],
     provenance_rows: Iterable[EventProvenance],
 ) -> CanonicalEventValidationReport:
+    # Provenance is consumed once, page by page, keeping only the role set of each event.
     events_list = list(events)
-    provenance_list = list(provenance_rows)
     errors: list[str] = []
     warnings: list[str] = []
 
@@ -52,9 +54,11 @@ def validate_canonical_events(
             warnings.append(f"non-dense same-day ordering on {event_date}")
 
     event_ids_set = set(event_ids)
-    provenance_by_event: dict[str, list[EventProvenance]] = defaultdict(list)
-    for row in provenance_list:
-        provenance_by_event[row.event_id].append(row)
+    roles_by_event: dict[str, set[str]] = defaultdict(set)
+    provenance_count = 0
+    for row in provenance_rows:
+        provenance_count += 1
+        roles_by_event[row.event_id].add(row.provenance_role)
         if row.event_id not in event_ids_set:
             errors.append(f"provenance references unknown event_id: {row.event_id}")
 
@@ -65,11 +69,10 @@ def validate_canonical_events(
         "event_order_deterministic_fallback",
     }
     for event in events_list:
-        rows = provenance_by_event.get(event.event_id, [])
-        if not rows:
+        roles = roles_by_event.get(event.event_id)
+        if not roles:
             errors.append(f"missing provenance for {event.event_id}")
             continue
-        roles = {row.provenance_role for row in rows}
         missing_roles = sorted(required_roles - roles)
         if missing_roles:
             errors.append(f"missing required provenance roles for {event.event_id}: {', '.join(missing_roles)}")
@@ -78,7 +81,7 @@ def validate_canonical_events(
 
     return CanonicalEventValidationReport(
         event_count=len(events_list),
-        provenance_count=len(provenance_list),
+        provenance_count=provenance_count,
         errors=errors,
         warnings=warnings,
     )
@@ -5,8 +5,11 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from canonical.models import CanonicalAsset, CanonicalEvent, CanonicalEventAssetFlow, EventAssetFlowProvenance
+from shared.franchise import DEFAULT_FRANCHISE, Franchise
+from shared.profiling import traced
 
 
+TRADE_OUTGOING_MARKERS = ("sent to", "traded away", "trades", "trading", "buyout")
 FLOW_DIRECTIONS = {"in", "out"}
 FLOW_ROLES = {
     "incoming_player",
@@ -35,38 +38,23 @@ class CanonicalEventAssetFlowValidationReport:
         return not self.errors
 
 
-def _trade_direction(description: str | None) -> str:
-    text = (description or "").lower()
-    if any(marker in text for marker in ("to memphis", "to the grizzlies", "joins memphis", "acquired by memphis", "memphis acquires")):
-        return "incoming"
-    if any(
-        marker in text
-        for marker in (
-            "from memphis",
-            "sent to",
-            "traded away",
-            "trades",
-            "trading",
-            "released by memphis",
-            "waived by memphis",
-            "buyout",
-        )
-    ):
-        return "outgoing"
-    return "unknown"
+def _trade_direction(description: str | None, franchise: Franchise) -> str:
+    return franchise.trade_direction(description, outgoing_markers=TRADE_OUTGOING_MARKERS)
 
 
+@traced("validate")
 def validate_canonical_event_asset_flows(
     *,
     events: Iterable[CanonicalEvent],
     assets: Iterable[CanonicalAsset],
     flows: Iterable[CanonicalEventAssetFlow],
     provenance_rows: Iterable[EventAssetFlowProvenance],
+    franchise: Franchise = DEFAULT_FRANCHISE,
 ) -> CanonicalEventAssetFlowValidationReport:
+    # Provenance rows are consumed once, page by page, keeping only the role set of each flow.
     events_list = list(events)
     assets_list = list(assets)
     flows_list = list(flows)
-    provenance_list = list(provenance_rows)
 
     errors: list[str] = []
     warnings: list[str] = []
@@ -120,17 +108,20 @@ def validate_canonical_event_asset_flows(
         if sorted(orders) != expected:
             errors.append(f"non-dense same-event flow_order on {event_id}")
 
-    provenance_by_flow: dict[str, list[EventAssetFlowProvenance]] = defaultdict(list)
-    for row in provenance_list:
-        provenance_by_flow[row.event_asset_flow_id].append(row)
-        if row.event_asset_flow_id not in {flow.event_asset_flow_id for flow in flows_list}:
+    flow_roles = {flow.event_asset_flow_id: flow.flow_role for flow in flows_list}
+    supported_flow_ids: set[str] = set()
+    provenance_count = 0
+    for row in provenance_rows:
+        provenance_count += 1
+        supported_flow_ids.add(row.event_asset_flow_id)
+        if row.event_asset_flow_id not in flow_roles:
             errors.append(f"flow provenance references unknown event_asset_flow_id: {row.event_asset_flow_id}")
-        expected_role = next((flow.flow_role for flow in flows_list if flow.event_asset_flow_id == row.event_asset_flow_id), None)
+        expected_role = flow_roles.get(row.event_asset_flow_id)
         if expected_role is not None and row.provenance_role != f"{expected_role}_support":
             errors.append(f"unexpected flow provenance role for {row.event_asset_flow_id}: {row.provenance_role}")
 
     for row in flows_list:
-        if not provenance_by_flow.get(row.event_asset_flow_id):
+        if row.event_asset_flow_id not in supported_flow_ids:
             errors.append(f"missing provenance for {row.event_asset_flow_id}")
 
     draft_events = [event for event in events_list if event.event_type == "draft"]
@@ -169,10 +160,10 @@ def validate_canonical_event_asset_flows(
     for event in events_list:
         if event.event_type != "trade":
             continue
-        if _trade_direction(event.description) == "unknown":
+        if _trade_direction(event.description, franchise) == "unknown":
             continue
         if not flows_by_event.get(event.event_id):
-            warnings.append(f"trade event with Memphis activity has no modeled asset flow rows: {event.event_id}")
+            warnings.append(f"trade event with {franchise.code} activity has no modeled asset flow rows: {event.event_id}")
 
     for event in events_list:
         if event.event_type == "draft":
@@ -190,7 +181,7 @@ def validate_canonical_event_asset_flows(
         event_count=len(events_list),
         asset_count=len(assets_list),
         flow_count=len(flows_list),
-        provenance_count=len(provenance_list),
+        provenance_count=provenance_count,
         errors=errors,
         warnings=warnings,
     )
@@ -15,8 +15,11 @@ from canonical.models import (
     PickAssetProvenance,
     PickResolutionProvenance,
 )
+from shared.franchise import DEFAULT_FRANCHISE, Franchise
+from shared.profiling import traced
 
 
+TRADE_OUTGOING_MARKERS = ("sent to", "traded away", "trades", "trading")
 PICK_STAGE_ORDER = {
     "future_pick": 0,
     "resolved_pick": 1,
@@ -41,26 +44,11 @@ class CanonicalPickLifecycleValidationReport:
         return not self.errors
 
 
-def _trade_direction(description: str | None) -> str:
-    text = (description or "").lower()
-    if any(marker in text for marker in ("to memphis", "to the grizzlies", "joins memphis", "acquired by memphis", "memphis acquires")):
-        return "incoming"
-    if any(
-        marker in text
-        for marker in (
-            "from memphis",
-            "sent to",
-            "traded away",
-            "trades",
-            "trading",
-            "released by memphis",
-            "waived by memphis",
-        )
-    ):
-        return "outgoing"
-    return "unknown"
+def _trade_direction(description: str | None, franchise: Franchise) -> str:
+    return franchise.trade_direction(description, outgoing_markers=TRADE_OUTGOING_MARKERS)
 
 
+@traced("validate")
 def validate_canonical_pick_lifecycle(
     *,
     player_identities: Iterable[CanonicalPlayerIdentity] | None = None,
@@ -71,21 +59,22 @@ def validate_canonical_pick_lifecycle(
     assets: Iterable[CanonicalAsset],
     asset_provenance_rows: Iterable[AssetProvenance],
     events: Iterable[CanonicalEvent] | None = None,
+    franchise: Franchise = DEFAULT_FRANCHISE,
 ) -> CanonicalPickLifecycleValidationReport:
     player_identities_list = list(player_identities or [])
     player_ids = {row.player_id for row in player_identities_list}
+    # Provenance rows are consumed once, page by page, keeping only the role set of each row they support.
     pick_assets_list = list(pick_assets)
-    pick_asset_provenance_list = list(pick_asset_provenance_rows)
     pick_resolutions_list = list(pick_resolutions)
-    pick_resolution_provenance_list = list(pick_resolution_provenance_rows)
     assets_list = list(assets)
-    asset_provenance_list = list(asset_provenance_rows)
     events_list = list(events or [])
 
     errors: list[str] = []
     warnings: list[str] = []
 
     pick_ids = [row.pick_asset_id for row in pick_assets_list]
+    pick_id_set = set(pick_ids)
+    pick_assets_by_id = {row.pick_asset_id: row for row in pick_assets_list}
     duplicate_pick_ids = [pick_id for pick_id, count in Counter(pick_ids).items() if count > 1]
     if duplicate_pick_ids:
         errors.append(f"duplicate pick_asset_ids: {', '.join(sorted(duplicate_pick_ids))}")
@@ -115,16 +104,18 @@ def validate_canonical_pick_lifecycle(
         if len(assets_by_pick.get(row.pick_asset_id, [])) != 1:
             errors.append(f"expected exactly one graph asset for pick {row.pick_asset_id}")
 
-    provenance_by_pick: dict[str, list[PickAssetProvenance]] = defaultdict(list)
-    for row in pick_asset_provenance_list:
-        provenance_by_pick[row.pick_asset_id].append(row)
-        if row.pick_asset_id not in pick_ids:
+    roles_by_pick: dict[str, set[str]] = defaultdict(set)
+    pick_asset_provenance_count = 0
+    for row in pick_asset_provenance_rows:
+        pick_asset_provenance_count += 1
+        roles_by_pick[row.pick_asset_id].add(row.provenance_role)
+        if row.pick_asset_id not in pick_id_set:
             errors.append(f"pick asset provenance references unknown pick_asset_id: {row.pick_asset_id}")
         if row.provenance_role not in {"pick_identity_support", "pick_protection_support", "drafted_player_linkage_support"}:
             errors.append(f"unexpected pick asset provenance role for {row.pick_asset_id}: {row.provenance_role}")
 
     for row in pick_assets_list:
-        roles = {item.provenance_role for item in provenance_by_pick.get(row.pick_asset_id, [])}
+        roles = roles_by_pick.get(row.pick_asset_id, set())
         if "pick_identity_support" not in roles:
             errors.append(f"missing pick_identity_support provenance for {row.pick_asset_id}")
         if row.current_pick_stage in {"resolved_pick", "drafted_player", "conveyed_away"} and "pick_resolution_support" not in roles:
@@ -134,6 +125,7 @@ def validate_canonical_pick_lifecycle(
             errors.append(f"missing drafted_player_linkage_support provenance for {row.pick_asset_id}")
 
     state_ids = [row.pick_resolution_id for row in pick_resolutions_list]
+    state_id_set = set(state_ids)
     duplicate_state_ids = [state_id for state_id, count in Counter(state_ids).items() if count > 1]
     if duplicate_state_ids:
         errors.append(f"duplicate pick_resolution_ids: {', '.join(sorted(duplicate_state_ids))}")
@@ -142,7 +134,7 @@ def validate_canonical_pick_lifecycle(
     events_by_id = {event.event_id: event for event in events_list}
     for row in pick_resolutions_list:
         states_by_pick[row.pick_asset_id].append(row)
-        if row.pick_asset_id not in pick_ids:
+        if row.pick_asset_id not in pick_id_set:
             errors.append(f"pick resolution references unknown pick_asset_id: {row.pick_asset_id}")
         if row.state_type not in PICK_STAGE_ORDER:
             errors.append(f"invalid pick resolution state_type for {row.pick_resolution_id}: {row.state_type}")
@@ -162,15 +154,17 @@ def validate_canonical_pick_lifecycle(
             if event is not None:
                 if event.event_type != "trade":
                     errors.append(f"conveyed_away state does not point to a trade event for {row.pick_resolution_id}")
-                elif _trade_direction(event.description) != "outgoing":
+                elif _trade_direction(event.description, franchise) != "outgoing":
                     errors.append(f"conveyed_away state is not an outgoing trade for {row.pick_resolution_id}")
         if row.state_type == "conveyed_away" and not row.source_event_id:
             errors.append(f"missing source_event_id for {row.pick_resolution_id}")
 
-    provenance_by_state: dict[str, list[PickResolutionProvenance]] = defaultdict(list)
-    for row in pick_resolution_provenance_list:
-        provenance_by_state[row.pick_resolution_id].append(row)
-        if row.pick_resolution_id not in state_ids:
+    roles_by_state: dict[str, set[str]] = defaultdict(set)
+    pick_resolution_provenance_count = 0
+    for row in pick_resolution_provenance_rows:
+        pick_resolution_provenance_count += 1
+        roles_by_state[row.pick_resolution_id].add(row.provenance_role)
+        if row.pick_resolution_id not in state_id_set:
             errors.append(f"pick resolution provenance references unknown pick_resolution_id: {row.pick_resolution_id}")
         if row.provenance_role not in {
             "asset_state_support",
@@ -181,9 +175,11 @@ def validate_canonical_pick_lifecycle(
         }:
             errors.append(f"unexpected pick resolution provenance role for {row.pick_resolution_id}: {row.provenance_role}")
 
-    provenance_by_asset: dict[str, list[AssetProvenance]] = defaultdict(list)
-    for row in asset_provenance_list:
-        provenance_by_asset[row.asset_id].append(row)
+    roles_by_asset: dict[str, set[str]] = defaultdict(set)
+    asset_provenance_count = 0
+    for row in asset_provenance_rows:
+        asset_provenance_count += 1
+        roles_by_asset[row.asset_id].add(row.provenance_role)
         if row.asset_id not in assets_by_id:
             errors.append(f"asset provenance references unknown asset_id: {row.asset_id}")
         asset = assets_by_id.get(row.asset_id)
@@ -191,14 +187,14 @@ def validate_canonical_pick_lifecycle(
             errors.append(f"asset provenance pick mismatch for {row.asset_id}")
 
     for row in assets_list:
-        roles = {item.provenance_role for item in provenance_by_asset.get(row.asset_id, [])}
+        roles = roles_by_asset.get(row.asset_id, set())
         if row.pick_asset_id and "asset_identity_support" not in roles:
             errors.append(f"missing asset_identity_support provenance for {row.asset_id}")
         if row.pick_asset_id and "pick_identity_support" not in roles:
             errors.append(f"missing pick_identity_support provenance for {row.asset_id}")
 
     for row in pick_resolutions_list:
-        roles = {item.provenance_role for item in provenance_by_state.get(row.pick_resolution_id, [])}
+        roles = roles_by_state.get(row.pick_resolution_id, set())
         if "asset_state_support" not in roles:
             errors.append(f"missing asset_state_support provenance for {row.pick_resolution_id}")
         if row.state_type == "future_pick" and "pick_identity_support" not in roles:
@@ -218,7 +214,7 @@ def validate_canonical_pick_lifecycle(
             if PICK_STAGE_ORDER[right.state_type] < PICK_STAGE_ORDER[left.state_type]:
                 errors.append(f"out-of-order pick states for {pick_asset_id}: {left.state_type} then {right.state_type}")
         last_state = ordered[-1]
-        pick_asset = next((row for row in pick_assets_list if row.pick_asset_id == pick_asset_id), None)
+        pick_asset = pick_assets_by_id.get(pick_asset_id)
         if pick_asset is not None and pick_asset.current_pick_stage != last_state.state_type:
             errors.append(f"current_pick_stage mismatch for {pick_asset_id}")
         if last_state.state_type == "conveyed_away":
@@ -228,11 +224,11 @@ def validate_canonical_pick_lifecycle(
 
     return CanonicalPickLifecycleValidationReport(
         pick_asset_count=len(pick_assets_list),
-        pick_asset_provenance_count=len(pick_asset_provenance_list),
+        pick_asset_provenance_count=pick_asset_provenance_count,
         pick_resolution_count=len(pick_resolutions_list),
-        pick_resolution_provenance_count=len(pick_resolution_provenance_list),
+        pick_resolution_provenance_count=pick_resolution_provenance_count,
         asset_count=len(assets_list),
-        asset_provenance_count=len(asset_provenance_list),
+        asset_provenance_count=asset_provenance_count,
         errors=errors,
         warnings=warnings,
     )
@@ -14,6 +14,7 @@ from canonical.models import (
     CanonicalPlayerTenure,
     PlayerIdentityProvenance,
 )
+from shared.profiling import traced
 
 
 @dataclass(frozen=True)
@@ -33,6 +34,7 @@ class CanonicalPlayerTenureValidationReport:
         return not self.errors
 
 
+@traced("validate")
 def validate_canonical_player_tenures(
     *,
     player_identities: Iterable[CanonicalPlayerIdentity],
@@ -43,13 +45,11 @@ def validate_canonical_player_tenures(
     asset_states: Iterable[AssetState],
     asset_state_provenance_rows: Iterable[AssetStateProvenance],
 ) -> CanonicalPlayerTenureValidationReport:
+    # Provenance rows are consumed once, page by page, keeping only the role set of each row they support.
     player_identities_list = list(player_identities)
-    player_identity_provenance_list = list(player_identity_provenance_rows)
     tenures_list = list(player_tenures)
     assets_list = list(assets)
-    asset_provenance_list = list(asset_provenance_rows)
     asset_states_list = list(asset_states)
-    asset_state_provenance_list = list(asset_state_provenance_rows)
 
     errors: list[str] = []
     warnings: list[str] = []
@@ -66,16 +66,18 @@ def validate_canonical_player_tenures(
         if not row.normalized_name:
             errors.append(f"missing normalized_name for {row.player_id}")
 
-    provenance_by_player: dict[str, list[PlayerIdentityProvenance]] = defaultdict(list)
-    for row in player_identity_provenance_list:
-        provenance_by_player[row.player_id].append(row)
+    roles_by_player: dict[str, set[str]] = defaultdict(set)
+    player_identity_provenance_count = 0
+    for row in player_identity_provenance_rows:
+        player_identity_provenance_count += 1
+        roles_by_player[row.player_id].add(row.provenance_role)
         if row.player_id not in player_id_set:
             errors.append(f"player identity provenance references unknown player_id: {row.player_id}")
         if row.provenance_role != "player_identity_resolution_support":
             errors.append(f"unexpected player identity provenance role for {row.player_id}: {row.provenance_role}")
 
     for row in player_identities_list:
-        if not provenance_by_player.get(row.player_id):
+        if not roles_by_player.get(row.player_id):
             errors.append(f"missing player identity provenance for {row.player_id}")
 
     tenures_by_player: dict[str, list[CanonicalPlayerTenure]] = defaultdict(list)
@@ -129,9 +131,11 @@ def validate_canonical_player_tenures(
         if len(assets_by_tenure.get(row.player_tenure_id, [])) != 1:
             errors.append(f"expected exactly one asset for tenure {row.player_tenure_id}")
 
-    provenance_by_asset: dict[str, list[AssetProvenance]] = defaultdict(list)
-    for row in asset_provenance_list:
-        provenance_by_asset[row.asset_id].append(row)
+    roles_by_asset: dict[str, set[str]] = defaultdict(set)
+    asset_provenance_count = 0
+    for row in asset_provenance_rows:
+        asset_provenance_count += 1
+        roles_by_asset[row.asset_id].add(row.provenance_role)
         if row.asset_id not in asset_id_set:
             errors.append(f"asset provenance references unknown asset_id: {row.asset_id}")
         asset = assets_by_id.get(row.asset_id)
@@ -139,7 +143,7 @@ def validate_canonical_player_tenures(
             errors.append(f"asset provenance tenure mismatch for {row.asset_id}")
 
     for row in assets_list:
-        roles = {item.provenance_role for item in provenance_by_asset.get(row.asset_id, [])}
+        roles = roles_by_asset.get(row.asset_id, set())
         if "asset_identity_support" not in roles:
             errors.append(f"missing asset_identity_support provenance for {row.asset_id}")
         if row.player_tenure_id and "player_identity_resolution_support" not in roles:
@@ -159,25 +163,27 @@ def validate_canonical_player_tenures(
         if not row.state_type:
             errors.append(f"missing state_type for {row.asset_state_id}")
 
-    provenance_by_state: dict[str, list[AssetStateProvenance]] = defaultdict(list)
-    for row in asset_state_provenance_list:
-        provenance_by_state[row.asset_state_id].append(row)
+    roles_by_state: dict[str, set[str]] = defaultdict(set)
+    asset_state_provenance_count = 0
+    for row in asset_state_provenance_rows:
+        asset_state_provenance_count += 1
+        roles_by_state[row.asset_state_id].add(row.provenance_role)
         if row.asset_state_id not in state_id_set:
             errors.append(f"asset state provenance references unknown asset_state_id: {row.asset_state_id}")
 
     for row in asset_states_list:
-        roles = {item.provenance_role for item in provenance_by_state.get(row.asset_state_id, [])}
+        roles = roles_by_state.get(row.asset_state_id, set())
         if "asset_state_support" not in roles:
             errors.append(f"missing asset_state_support provenance for {row.asset_state_id}")
 
     return CanonicalPlayerTenureValidationReport(
         player_identity_count=len(player_identities_list),
-        player_identity_provenance_count=len(player_identity_provenance_list),
+        player_identity_provenance_count=player_identity_provenance_count,
         player_tenure_count=len(tenures_list),
         asset_count=len(assets_list),
-        asset_provenance_count=len(asset_provenance_list),
+        asset_provenance_count=asset_provenance_count,
         asset_state_count=len(asset_states_list),
-        asset_state_provenance_count=len(asset_state_provenance_list),
+        asset_state_provenance_count=asset_state_provenance_count,
         errors=errors,
         warnings=warnings,
     )
@@ -64,11 +64,13 @@ def load_db_config() -> DbConfig:
     )
 
 
-def load_database_url() -> str:
+def load_database_url(franchise_code: str | None = None) -> str:
+    # Franchise partitions each live in their own database, named by DATABASE_URL_<CODE>.
     _load_local_env_file()
-    value = os.getenv("DATABASE_URL", "").strip()
+    name = "DATABASE_URL" if franchise_code is None else f"DATABASE_URL_{franchise_code.upper()}"
+    value = os.getenv(name, "").strip()
     if not value:
         raise RuntimeError(
-            "Missing DATABASE_URL. Set it in your local .env (gitignored) or shell environment."
+            f"Missing {name}. Set it in your local .env (gitignored) or shell environment."
         )
     return value
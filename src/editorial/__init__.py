@@ -5,6 +5,7 @@ from editorial.contract import (
     editorial_overlays_to_json,
     export_editorial_overlays_json,
     fetch_editorial_overlays,
+    fetch_latest_editorial_build_id,
     load_editorial_bundle,
     persist_editorial_overlay_build,
     validate_editorial_overlay_bundle,
@@ -37,6 +38,7 @@ __all__ = [
     "editorial_overlays_to_json",
     "export_editorial_overlays_json",
     "fetch_editorial_overlays",
+    "fetch_latest_editorial_build_id",
     "load_editorial_bundle",
     "persist_editorial_overlay_build",
     "validate_editorial_overlay_bundle",
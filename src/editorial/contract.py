@@ -6,8 +6,6 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Iterable
 
-import yaml
-
 from canonical.models import CanonicalAsset, CanonicalEvent
 from db_config import load_database_url
 from editorial.models import (
@@ -21,7 +19,11 @@ from editorial.models import (
     EditorialStoryChapter,
 )
 from editorial.validate import validate_editorial_overlays
+from shared.config_cache import load_cached_file, parse_structured_text
 from shared.ids import stable_id, stable_payload_hash
+from shared.profiling import traced
+
+EDITORIAL_CACHE_NAMESPACE = "editorial-bundle-v1"
 
 
 def bootstrap_editorial_overlay_schema(sql_path: Path | str) -> None:
@@ -67,12 +69,8 @@ def _iter_editorial_files(root: Path) -> list[Path]:
     return files
 
 
-def _load_structured_file(path: Path) -> dict[str, Any]:
-    raw_text = path.read_text(encoding="utf-8")
-    if path.suffix.lower() == ".json":
-        data = json.loads(raw_text)
-    else:
-        data = yaml.safe_load(raw_text)
+def _parse_structured_file(path: Path, raw_text: str) -> dict[str, Any]:
+    data = parse_structured_text(path, raw_text)
     if data is None:
         return {}
     if not isinstance(data, dict):
@@ -82,6 +80,10 @@ def _load_structured_file(path: Path) -> dict[str, Any]:
     return data
 
 
+def _load_structured_file(path: Path) -> dict[str, Any]:
+    return load_cached_file(path, EDITORIAL_CACHE_NAMESPACE, lambda raw_text: _parse_structured_file(path, raw_text))
+
+
 def _string_or_none(value: Any) -> str | None:
     if value is None:
         return None
@@ -289,6 +291,7 @@ def _sorted_bundle(bundle: EditorialOverlayBundle) -> EditorialOverlayBundle:
     )
 
 
+@traced("build")
 def build_editorial_overlays(
     bundle: EditorialOverlayBundle,
     *,
@@ -329,20 +332,6 @@ def build_editorial_overlays(
     )
 
 
-def _fetch_latest_presentation_build_id(conn: Any) -> str | None:
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            select presentation_build_id
-            from presentation.builds
-            order by built_at desc, presentation_build_id desc
-            limit 1
-            """
-        )
-        row = cur.fetchone()
-    return row[0] if row else None
-
-
 def persist_editorial_overlay_build(conn: Any, result: EditorialOverlayBuildResult) -> dict[str, int]:
     with conn.cursor() as cur:
         cur.execute(
@@ -576,9 +565,12 @@ def build_and_persist_editorial_overlays(
     builder_version: str = "stage7-editorial-overlay-v1",
     presentation_build_id: str | None = None,
 ) -> dict[str, int]:
+    # presentation.contract imports editorial.models, so this import stays local to avoid a cycle.
+    from presentation.contract import fetch_current_presentation_build_id
+
     bundle = load_editorial_bundle(input_path)
     with _connect() as conn:
-        presentation_build_id_value = presentation_build_id or _fetch_latest_presentation_build_id(conn)
+        presentation_build_id_value = presentation_build_id or fetch_current_presentation_build_id(conn)
         result = build_editorial_overlays(
             bundle,
             builder_version=builder_version,
@@ -589,6 +581,20 @@ def build_and_persist_editorial_overlays(
     return counts
 
 
+def fetch_latest_editorial_build_id(conn: Any) -> str | None:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            select editorial_build_id
+            from editorial.builds
+            order by built_at desc, editorial_build_id desc
+            limit 1
+            """
+        )
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
 def fetch_editorial_overlays(conn: Any, editorial_build_id: str | None = None) -> EditorialOverlayBuildResult:
     with conn.cursor() as cur:
         if editorial_build_id is None:
@@ -13,6 +13,7 @@ from editorial.models import (
     EditorialGameOverlay,
     EditorialStoryChapter,
 )
+from shared.profiling import traced
 
 
 ALLOWED_LANE_GROUPS = {"main_roster", "two_way", "future_picks"}
@@ -67,6 +68,7 @@ def _focus_list(payload: dict[str, object], key: str) -> list[str]:
     return result
 
 
+@traced("validate")
 def validate_editorial_overlays(
     *,
     annotations: Iterable[EditorialAnnotation],
@@ -1,26 +1,36 @@
+from evidence.draft_history import DraftHistorySeason, DraftHistoryStore
 from evidence.ingest import (
     bootstrap_evidence_schema,
+    build_league_source_records,
     build_live_source_records,
     ingest_live_source_records,
     insert_normalized_claims,
     normalize_source_records,
+    partition_draft_history,
+    record_normalized_source_records,
 )
 from evidence.models import NormalizedClaim, OverrideLink, OverrideRecord, SourceRecord
-from evidence.overrides import insert_override_bundle, load_override_bundle
+from evidence.overrides import insert_override_bundle, load_override_bundle, replace_override_bundle
 from evidence.validate import ValidationReport, validate_stage1_rows
 
 __all__ = [
+    "DraftHistorySeason",
+    "DraftHistoryStore",
     "NormalizedClaim",
     "OverrideLink",
     "OverrideRecord",
     "SourceRecord",
     "ValidationReport",
     "bootstrap_evidence_schema",
+    "build_league_source_records",
     "build_live_source_records",
     "ingest_live_source_records",
     "insert_normalized_claims",
     "insert_override_bundle",
     "load_override_bundle",
     "normalize_source_records",
+    "partition_draft_history",
+    "record_normalized_source_records",
+    "replace_override_bundle",
     "validate_stage1_rows",
 ]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+DEFAULT_DRAFT_HISTORY_DIR = Path(".local/draft-history")
+DRAFT_HISTORY_FORMAT_VERSION = 1
+DRAFT_HISTORY_FETCH_ATTEMPTS = 3
+DRAFT_HISTORY_RETRY_DELAY_SECONDS = 2.0
+TEAM_ABBREVIATION_COLUMN = "TEAM_ABBREVIATION"
+
+
+def _team_abbrev(value: Any) -> str:
+    return str(value or "").strip().upper()
+
+
+@dataclass(frozen=True)
+class DraftHistorySeason:
+    season: int
+    columns: dict[str, list[Any]]
+    team_index: dict[str, list[int]]
+    fetched_at: datetime
+
+    @classmethod
+    def from_columns(cls, season: int, columns: dict[str, list[Any]], *, fetched_at: datetime) -> DraftHistorySeason:
+        team_index: dict[str, list[int]] = {}
+        for position, value in enumerate(columns.get(TEAM_ABBREVIATION_COLUMN, [])):
+            team_index.setdefault(_team_abbrev(value), []).append(position)
+        return cls(season=season, columns=columns, team_index=team_index, fetched_at=fetched_at)
+
+    @property
+    def row_count(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    @property
+    def is_final(self) -> bool:
+        # The draft runs in late June; a capture taken after July is the season's final board.
+        return self.fetched_at.date() > date(self.season, 7, 31)
+
+    def rows(self, team_abbrevs: Iterable[str] = ()) -> list[dict[str, Any]]:
+        wanted = {_team_abbrev(abbrev) for abbrev in team_abbrevs}
+        if wanted:
+            positions = sorted(position for abbrev in wanted for position in self.team_index.get(abbrev, []))
+        else:
+            positions = list(range(self.row_count))
+        return [{name: values[position] for name, values in self.columns.items()} for position in positions]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "format_version": DRAFT_HISTORY_FORMAT_VERSION,
+            "season": self.season,
+            "fetched_at": self.fetched_at.isoformat(),
+            "columns": self.columns,
+            "team_index": self.team_index,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> DraftHistorySeason:
+        return cls(
+            season=int(payload["season"]),
+            columns=payload["columns"],
+            team_index=payload["team_index"],
+            fetched_at=datetime.fromisoformat(payload["fetched_at"]),
+        )
+
+
+def fetch_draft_history_columns(season: int) -> dict[str, list[Any]]:
+    from nba_api.stats.endpoints import drafthistory
+
+    try:
+        endpoint = drafthistory.DraftHistory(season_year_nullable=str(season))
+    except TypeError:
+        endpoint = drafthistory.DraftHistory(str(season))
+    frames = endpoint.get_data_frames()
+    if not frames:
+        return {}
+    return frames[0].to_dict(orient="list")
+
+
+class DraftHistoryStore:
+    # One league-wide file per season; team views read the abbreviation index instead of
+    # re-fetching or scanning, so repeated and multi-team runs never call the API twice.
+    def __init__(
+        self,
+        root: Path | str = DEFAULT_DRAFT_HISTORY_DIR,
+        *,
+        fetch_columns: Callable[[int], dict[str, list[Any]]] = fetch_draft_history_columns,
+        attempts: int = DRAFT_HISTORY_FETCH_ATTEMPTS,
+        retry_delay_seconds: float = DRAFT_HISTORY_RETRY_DELAY_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        now: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.root = Path(root)
+        self.fetch_columns = fetch_columns
+        self.attempts = attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.sleep = sleep
+        self.now = now
+        self.request_count = 0
+        self._seasons: dict[int, DraftHistorySeason] = {}
+
+    def _season_path(self, season: int) -> Path:
+        return self.root / f"draft-history-{season}.json"
+
+    def _read(self, season: int) -> DraftHistorySeason | None:
+        try:
+            payload = json.loads(self._season_path(season).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if payload.get("format_version") != DRAFT_HISTORY_FORMAT_VERSION:
+            return None
+        return DraftHistorySeason.from_dict(payload)
+
+    def _write(self, entry: DraftHistorySeason) -> None:
+        path = self._season_path(entry.season)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        staging_path.write_text(json.dumps(entry.as_dict(), separators=(",", ":"), default=str), encoding="utf-8")
+        os.replace(staging_path, path)
+
+    def _fetch(self, season: int) -> DraftHistorySeason:
+        attempt = 1
+        while True:
+            self.request_count += 1
+            try:
+                columns = self.fetch_columns(season)
+            except Exception as exc:
+                if attempt >= self.attempts:
+                    raise RuntimeError(f"draft history fetch for {season} failed after {attempt} attempts: {exc}") from exc
+                self.sleep(self.retry_delay_seconds * 2 ** (attempt - 1))
+                attempt += 1
+                continue
+            return DraftHistorySeason.from_columns(season, columns, fetched_at=self.now())
+
+    def season(self, season: int) -> DraftHistorySeason:
+        entry = self._seasons.get(season)
+        if entry is not None:
+            return entry
+        entry = self._read(season)
+        if entry is None or not entry.is_final:
+            entry = self._fetch(season)
+            self._write(entry)
+        self._seasons[season] = entry
+        return entry
+
+    def seasons(self, start_year: int, end_year: int) -> list[DraftHistorySeason]:
+        # Every season is attempted so the successful ones are stored even when another fails.
+        entries: list[DraftHistorySeason] = []
+        failures: list[str] = []
+        for year in range(start_year, end_year + 1):
+            try:
+                entries.append(self.season(year))
+            except RuntimeError as exc:
+                failures.append(str(exc))
+        if failures:
+            raise RuntimeError("; ".join(failures))
+        return entries
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import html
+import importlib.util
 import json
 import re
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from db_config import load_database_url
-from evidence.models import NormalizedClaim, SourceRecord
+from evidence.draft_history import DraftHistoryStore
+from evidence.models import NormalizedClaim, OverrideRecord, SourceRecord
 from evidence.normalize import normalize_source_record
+from shared.franchise import Franchise, franchise_by_abbrev
 from shared.ids import stable_id, stable_payload_hash
+from shared.streaming import DEFAULT_PAGE_SIZE, keyset_pages
 
 SPOTRAC_USER_AGENT = (
     "nba-asset-lineage/0.1 (+https://github.com/wentrekin/nba-asset-lineage; contact=local)"
@@ -257,37 +262,38 @@ def fetch_nba_api_draft_history(
     start_year: int,
     end_year: int,
     team_abbrevs: set[str],
+    *,
+    store: DraftHistoryStore | None = None,
 ) -> list[dict[str, Any]]:
-    try:
-        from nba_api.stats.endpoints import drafthistory
-    except ModuleNotFoundError:
-        return []
+    if store is None:
+        if importlib.util.find_spec("nba_api") is None:
+            return []
+        store = DraftHistoryStore()
 
     records: list[dict[str, Any]] = []
-    overall_sequence = 0
-    for year in range(start_year, end_year + 1):
-        try:
-            try:
-                endpoint = drafthistory.DraftHistory(season_year_nullable=str(year))
-            except TypeError:
-                endpoint = drafthistory.DraftHistory(str(year))
-            frames = endpoint.get_data_frames()
-            if not frames:
-                continue
-            for row in frames[0].to_dict(orient="records"):
-                team_abbrev = str(row.get("TEAM_ABBREVIATION") or "").strip().upper()
-                if team_abbrevs and team_abbrev not in team_abbrevs:
-                    continue
-                overall_sequence += 1
-                payload = dict(row)
-                payload["event_date"] = date(int(str(payload["SEASON"])), 6, 30).isoformat()
-                payload["source_sequence"] = overall_sequence
-                records.append(payload)
-        except Exception:
-            continue
+    for season in store.seasons(start_year, end_year):
+        for row in season.rows(team_abbrevs):
+            payload = dict(row)
+            payload["event_date"] = date(int(str(payload["SEASON"])), 6, 30).isoformat()
+            payload["source_sequence"] = len(records) + 1
+            records.append(payload)
     return records
 
 
+def partition_draft_history(rows: Iterable[dict[str, Any]], franchises: Iterable[Franchise]) -> dict[str, list[dict[str, Any]]]:
+    # Renumbering per franchise keeps each partition identical to a fetch filtered to that team.
+    franchises_list = list(franchises)
+    franchise_lookup = franchise_by_abbrev(franchises_list)
+    partitions: dict[str, list[dict[str, Any]]] = {franchise.code: [] for franchise in franchises_list}
+    for row in rows:
+        franchise = franchise_lookup.get(str(row.get("TEAM_ABBREVIATION") or "").strip().upper())
+        if franchise is None:
+            continue
+        partition = partitions[franchise.code]
+        partition.append({**row, "source_sequence": len(partition) + 1})
+    return partitions
+
+
 def build_live_source_records(
     *,
     sources: set[str],
@@ -298,6 +304,8 @@ def build_live_source_records(
     end_date: date,
     captured_at: datetime | None = None,
     parser_version: str = "stage1-live-v1",
+    draft_history_rows: list[dict[str, Any]] | None = None,
+    draft_history_store: DraftHistoryStore | None = None,
 ) -> list[SourceRecord]:
     captured_at_value = captured_at or datetime.utcnow()
     created_at = captured_at_value
@@ -332,7 +340,14 @@ def build_live_source_records(
             )
 
     if "nba_api" in sources:
-        for row in fetch_nba_api_draft_history(start_date.year, end_date.year, team_abbrevs):
+        if draft_history_rows is None:
+            draft_history_rows = fetch_nba_api_draft_history(
+                start_date.year,
+                end_date.year,
+                team_abbrevs,
+                store=draft_history_store,
+            )
+        for row in draft_history_rows:
             row_date = date.fromisoformat(str(row["event_date"]))
             if not _within_range(row_date, start_date, end_date):
                 continue
@@ -352,6 +367,48 @@ def build_live_source_records(
     return source_records
 
 
+def build_league_source_records(
+    *,
+    sources: set[str],
+    franchises: Iterable[Franchise],
+    start_date: date,
+    end_date: date,
+    captured_at: datetime | None = None,
+    parser_version: str = "stage1-live-v1",
+    max_workers: int | None = None,
+    draft_history_store: DraftHistoryStore | None = None,
+) -> dict[str, list[SourceRecord]]:
+    # League-wide draft history is fetched once and fanned out; the per-team Spotrac pages are
+    # network bound, so one thread per franchise fetches them concurrently.
+    franchises_list = list(franchises)
+    captured_at_value = captured_at or datetime.utcnow()
+    draft_history = (
+        partition_draft_history(
+            fetch_nba_api_draft_history(start_date.year, end_date.year, set(), store=draft_history_store),
+            franchises_list,
+        )
+        if "nba_api" in sources
+        else {}
+    )
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(franchises_list), 1)) as executor:
+        futures = {
+            franchise.code: executor.submit(
+                build_live_source_records,
+                sources=sources,
+                team_slug=franchise.slug,
+                team_code=franchise.spotrac_code,
+                team_abbrevs=set(franchise.abbrevs),
+                start_date=start_date,
+                end_date=end_date,
+                captured_at=captured_at_value,
+                parser_version=parser_version,
+                draft_history_rows=draft_history.get(franchise.code, []),
+            )
+            for franchise in franchises_list
+        }
+    return {code: future.result() for code, future in futures.items()}
+
+
 def _coerce_datetime(value: str | datetime) -> datetime:
     if isinstance(value, datetime):
         return value
@@ -526,7 +583,57 @@ def insert_normalized_claims(conn: Any, claims: Iterable[NormalizedClaim]) -> in
     return inserted
 
 
-def fetch_source_records(conn: Any, *, source_record_id: str | None = None) -> list[SourceRecord]:
+def record_normalized_source_records(conn: Any, source_record_ids: Iterable[str], normalizer_version: str) -> int:
+    ledger_rows = [(source_record_id, normalizer_version) for source_record_id in sorted(set(source_record_ids))]
+    if not ledger_rows:
+        return 0
+    with conn.cursor() as cur:
+        cur.executemany(
+            """
+            insert into evidence.normalization_ledger (source_record_id, normalizer_version)
+            values (%s, %s)
+            on conflict do nothing
+            """,
+            ledger_rows,
+        )
+    return len(ledger_rows)
+
+
+def _source_record_filters(
+    *,
+    source_record_id: str | None,
+    pending_normalizer_version: str | None,
+) -> tuple[str, tuple[Any, ...]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    if source_record_id:
+        clauses.append("source_records.source_record_id = %s")
+        params.append(source_record_id)
+    if pending_normalizer_version:
+        # Anti-join on the ledger rather than on claims: a re-versioned record whose claims are
+        # unchanged keeps its old claim rows, so only the ledger says it was processed at this version.
+        clauses.append(
+            """
+            not exists (
+                select 1
+                from evidence.normalization_ledger
+                where normalization_ledger.source_record_id = source_records.source_record_id
+                  and normalization_ledger.normalizer_version = %s
+            )
+            """
+        )
+        params.append(pending_normalizer_version)
+    if not clauses:
+        return "", ()
+    return " where " + " and ".join(clauses), tuple(params)
+
+
+def fetch_source_records(
+    conn: Any,
+    *,
+    source_record_id: str | None = None,
+    pending_normalizer_version: str | None = None,
+) -> list[SourceRecord]:
     sql = """
         select
             source_record_id,
@@ -541,11 +648,11 @@ def fetch_source_records(conn: Any, *, source_record_id: str | None = None) -> l
             created_at
         from evidence.source_records
     """
-    params: tuple[Any, ...] = ()
-    if source_record_id:
-        sql += " where source_record_id = %s"
-        params = (source_record_id,)
-    sql += " order by created_at, source_record_id"
+    where_sql, params = _source_record_filters(
+        source_record_id=source_record_id,
+        pending_normalizer_version=pending_normalizer_version,
+    )
+    sql += where_sql + " order by created_at, source_record_id"
 
     with conn.cursor() as cur:
         cur.execute(sql, params)
@@ -569,6 +676,122 @@ def fetch_source_records(conn: Any, *, source_record_id: str | None = None) -> l
     ]
 
 
+def count_source_records(conn: Any, *, source_record_id: str | None = None) -> int:
+    where_sql, params = _source_record_filters(source_record_id=source_record_id, pending_normalizer_version=None)
+    with conn.cursor() as cur:
+        cur.execute("select count(*) from evidence.source_records" + where_sql, params)
+        return cur.fetchone()[0]
+
+
+def iter_source_record_pages(
+    conn: Any,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    include_payload: bool = False,
+) -> Iterator[list[SourceRecord]]:
+    # Validation never reads raw payloads, so by default they stay in the database.
+    payload_column = "raw_payload" if include_payload else "'{}'::jsonb as raw_payload"
+    sql = f"""
+        select
+            source_record_id,
+            source_system,
+            source_type,
+            source_locator,
+            source_url,
+            captured_at,
+            {payload_column},
+            payload_hash,
+            parser_version,
+            created_at
+        from evidence.source_records
+    """
+    for rows in keyset_pages(conn, sql, key_columns=("source_record_id",), page_size=page_size):
+        yield [
+            SourceRecord(
+                source_record_id=row[0],
+                source_system=row[1],
+                source_type=row[2],
+                source_locator=row[3],
+                source_url=row[4],
+                captured_at=row[5],
+                raw_payload=row[6],
+                payload_hash=row[7],
+                parser_version=row[8],
+                created_at=row[9],
+                duplicate_count=1,
+            )
+            for row in rows
+        ]
+
+
+def iter_normalized_claim_pages(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[NormalizedClaim]]:
+    sql = """
+        select
+            claim_id,
+            source_record_id,
+            claim_type,
+            claim_subject_type,
+            claim_subject_key,
+            claim_group_hint,
+            claim_date,
+            source_sequence,
+            claim_payload,
+            confidence_flag,
+            normalizer_version,
+            created_at
+        from evidence.normalized_claims
+    """
+    for rows in keyset_pages(conn, sql, key_columns=("claim_id",), page_size=page_size):
+        yield [
+            NormalizedClaim(
+                claim_id=row[0],
+                source_record_id=row[1],
+                claim_type=row[2],
+                claim_subject_type=row[3],
+                claim_subject_key=row[4],
+                claim_group_hint=row[5],
+                claim_date=row[6],
+                source_sequence=row[7],
+                claim_payload=row[8],
+                confidence_flag=row[9],
+                normalizer_version=row[10],
+                created_at=row[11],
+            )
+            for row in rows
+        ]
+
+
+def iter_override_pages(conn: Any, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[OverrideRecord]]:
+    sql = """
+        select
+            override_id,
+            override_type,
+            target_type,
+            target_key,
+            payload,
+            reason,
+            authored_by,
+            authored_at,
+            is_active
+        from evidence.overrides
+    """
+    for rows in keyset_pages(conn, sql, key_columns=("override_id",), page_size=page_size):
+        yield [
+            OverrideRecord(
+                override_id=row[0],
+                override_type=row[1],
+                target_type=row[2],
+                target_key=row[3],
+                payload=row[4],
+                reason=row[5],
+                authored_by=row[6],
+                authored_at=row[7],
+                is_active=row[8],
+            )
+            for row in rows
+        ]
+
+
 def normalize_source_records(
     conn: Any,
     *,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Callable
 
 from evidence.models import NormalizedClaim, SourceRecord
 from shared.ids import stable_id
@@ -59,675 +60,401 @@ def _pick_subject_key(payload: dict[str, Any]) -> str:
     return f"pick::{draft_year}::{origin_team}::{round_number}"
 
 
-def _build_claim(
-    *,
-    source_record: SourceRecord,
-    claim_type: str,
-    subject_type: str,
-    subject_key: str,
-    claim_group_hint: str | None,
-    claim_date: date | None,
-    source_sequence: int | None,
-    claim_payload: dict[str, Any],
-    confidence_flag: str,
-    normalizer_version: str,
-    created_at: datetime,
-) -> NormalizedClaim:
-    claim_id = stable_id(
-        "claim",
-        source_record.source_record_id,
-        claim_type,
-        subject_type,
-        subject_key,
-        source_sequence,
-        claim_payload,
+PayloadSource = str | Callable[["ClaimContext"], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimContext:
+    payload: dict[str, Any]
+    subject_keys: dict[str, str]
+    claim_group_hint: str | None
+    claim_date: date | None
+    source_sequence: Any
+    extras: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ClaimTemplate:
+    claim_type: str
+    subject_type: str
+    payload: Callable[[ClaimContext], dict[str, Any]]
+    confidence_flag: str | Callable[[ClaimContext], str] = "high"
+    when: Callable[[ClaimContext], bool] | None = None
+
+
+@dataclass(frozen=True)
+class NormalizerVariant:
+    context: Callable[[dict[str, Any]], ClaimContext]
+    templates: tuple[ClaimTemplate, ...]
+    applies: Callable[[dict[str, Any]], bool] | None = None
+
+
+@dataclass(frozen=True)
+class SourceNormalizer:
+    name: str
+    source_types: frozenset[str]
+    variants: tuple[NormalizerVariant, ...]
+
+    def variant_for(self, payload: dict[str, Any]) -> NormalizerVariant | None:
+        for variant in self.variants:
+            if variant.applies is None or variant.applies(payload):
+                return variant
+        return None
+
+
+def payload_fields(**sources: PayloadSource) -> Callable[[ClaimContext], dict[str, Any]]:
+    # String sources read the raw payload key; callables receive the per-record context.
+    getters = tuple(
+        (key, source if callable(source) else (lambda context, name=source: context.payload.get(name)))
+        for key, source in sources.items()
+    )
+
+    def build(context: ClaimContext) -> dict[str, Any]:
+        return {key: getter(context) for key, getter in getters}
+
+    return build
+
+
+def _extra(name: str) -> Callable[[ClaimContext], Any]:
+    return lambda context: context.extras[name]
+
+
+def _confidence_if(payload_key: str) -> Callable[[ClaimContext], str]:
+    return lambda context: "high" if context.payload.get(payload_key) else "medium"
+
+
+def _has_event_ref(payload: dict[str, Any]) -> bool:
+    return bool(payload.get("source_event_ref"))
+
+
+NORMALIZER_REGISTRY: dict[str, SourceNormalizer] = {}
+
+
+def register_normalizer(normalizer: SourceNormalizer) -> SourceNormalizer:
+    for source_type in normalizer.source_types:
+        existing = NORMALIZER_REGISTRY.get(source_type)
+        if existing is not None and existing.name != normalizer.name:
+            raise ValueError(f"source_type {source_type} is already handled by normalizer {existing.name}")
+    for source_type in normalizer.source_types:
+        NORMALIZER_REGISTRY[source_type] = normalizer
+    return normalizer
+
+
+def _transaction_ref_context(payload: dict[str, Any]) -> ClaimContext:
+    event_key = str(payload["source_event_ref"])
+    return ClaimContext(
+        payload=payload,
+        subject_keys={"event": event_key, "player": str(payload.get("player_identity") or _player_subject_key(payload))},
+        claim_group_hint=event_key,
+        claim_date=_parse_iso_date(payload.get("event_date")),
+        source_sequence=payload.get("source_sequence"),
     )
-    return NormalizedClaim(
-        claim_id=claim_id,
-        source_record_id=source_record.source_record_id,
-        claim_type=claim_type,
-        claim_subject_type=subject_type,
-        claim_subject_key=subject_key,
-        claim_group_hint=claim_group_hint,
-        claim_date=claim_date,
-        source_sequence=source_sequence,
-        claim_payload=claim_payload,
-        confidence_flag=confidence_flag,
-        normalizer_version=normalizer_version,
-        created_at=created_at,
+
+
+def _spotrac_transaction_context(payload: dict[str, Any]) -> ClaimContext:
+    event_key = _spotrac_transaction_event_key(payload)
+    return ClaimContext(
+        payload=payload,
+        subject_keys={"event": event_key, "player": _player_subject_key(payload)},
+        claim_group_hint=event_key,
+        claim_date=_parse_iso_date(payload.get("event_date")),
+        source_sequence=payload.get("source_sequence"),
+        extras={"description": str(payload.get("description") or "")},
     )
 
 
-def normalize_source_record(
-    source_record: SourceRecord,
-    *,
-    normalizer_version: str = "stage1-normalizer-v1",
-    created_at: datetime | None = None,
-) -> list[NormalizedClaim]:
-    created_at_value = created_at or datetime.utcnow()
-    payload = source_record.raw_payload
-    claims: list[NormalizedClaim] = []
-    source_sequence = payload.get("source_sequence")
-
-    if source_record.source_type in {"spotrac_transaction", "transaction"}:
-        if payload.get("source_event_ref"):
-            claim_date = _parse_iso_date(payload.get("event_date"))
-            event_key = str(payload["source_event_ref"])
-            player_key = str(payload.get("player_identity") or _player_subject_key(payload))
-            claim_group_hint = event_key
-            claims.extend(
-                [
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="event_date",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"event_date": payload.get("event_date")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
-                    ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="event_type",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"event_type": payload.get("event_type")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
-                    ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="event_description",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"description": payload.get("event_description")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+def _contract_ref_context(payload: dict[str, Any]) -> ClaimContext:
+    contract_metadata = payload.get("contract_metadata") or {}
+    return ClaimContext(
+        payload=payload,
+        subject_keys={"player": str(payload.get("player_identity") or _player_subject_key(payload))},
+        claim_group_hint=str(payload["source_event_ref"]),
+        claim_date=_parse_iso_date(contract_metadata.get("start_date")),
+        source_sequence=payload.get("source_sequence"),
+        extras={"contract_metadata": contract_metadata},
+    )
+
+
+def _spotrac_contract_context(payload: dict[str, Any]) -> ClaimContext:
+    start_year = payload.get("start_year")
+    return ClaimContext(
+        payload=payload,
+        subject_keys={"player": _player_subject_key(payload)},
+        claim_group_hint=_spotrac_contract_subject_key(payload),
+        claim_date=date(int(start_year), 1, 1) if start_year else None,
+        source_sequence=payload.get("source_sequence"),
+    )
+
+
+def _draft_ref_context(payload: dict[str, Any]) -> ClaimContext:
+    event_key = str(payload["source_event_ref"])
+    return ClaimContext(
+        payload=payload,
+        subject_keys={
+            "event": event_key,
+            "pick": str(payload.get("pick_identity") or _pick_subject_key(payload)),
+            "player": str(payload.get("player_identity") or _player_subject_key(payload)),
+        },
+        claim_group_hint=event_key,
+        claim_date=_parse_iso_date(payload.get("event_date")),
+        source_sequence=payload.get("source_sequence"),
+    )
+
+
+def _nba_draft_context(payload: dict[str, Any]) -> ClaimContext:
+    return ClaimContext(
+        payload=payload,
+        subject_keys={
+            "event": _nba_draft_event_key(payload),
+            "pick": _pick_subject_key(payload),
+            "player": _player_subject_key(payload),
+        },
+        claim_group_hint=(
+            f"draft::{payload.get('SEASON', 'unknown')}::{payload.get('TEAM_ABBREVIATION', 'unknown')}::"
+            f"{payload.get('OVERALL_PICK', 'unknown')}"
+        ),
+        claim_date=_parse_iso_date(payload.get("event_date")),
+        source_sequence=payload.get("source_sequence"),
+    )
+
+
+register_normalizer(
+    SourceNormalizer(
+        name="transaction",
+        source_types=frozenset({"spotrac_transaction", "transaction"}),
+        variants=(
+            NormalizerVariant(
+                applies=_has_event_ref,
+                context=_transaction_ref_context,
+                templates=(
+                    ClaimTemplate("event_date", "event", payload_fields(event_date="event_date")),
+                    ClaimTemplate("event_type", "event", payload_fields(event_type="event_type")),
+                    ClaimTemplate("event_description", "event", payload_fields(description="event_description")),
+                    ClaimTemplate("player_identity", "player", payload_fields(player_identity="player_identity")),
+                    ClaimTemplate("player_name", "player", payload_fields(player_name="player_name")),
+                    ClaimTemplate(
+                        "transaction_counterparty",
+                        "event",
+                        payload_fields(transaction_counterparty="transaction_counterparty"),
+                        confidence_flag="medium",
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="player_identity",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"player_identity": payload.get("player_identity")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                ),
+            ),
+            NormalizerVariant(
+                context=_spotrac_transaction_context,
+                templates=(
+                    ClaimTemplate("event_date", "event", payload_fields(event_date="event_date")),
+                    ClaimTemplate("event_type", "event", payload_fields(event_type="event_type")),
+                    ClaimTemplate("event_description", "event", payload_fields(description=_extra("description"))),
+                    ClaimTemplate(
+                        "player_identity",
+                        "player",
+                        payload_fields(player_id="player_id", player_href="player_href"),
+                        confidence_flag=_confidence_if("player_id"),
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="player_name",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"player_name": payload.get("player_name")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                    ClaimTemplate("player_name", "player", payload_fields(player_name="player_name")),
+                    ClaimTemplate(
+                        "transaction_counterparty",
+                        "event",
+                        payload_fields(counterparty_team="counterparty_team"),
+                        confidence_flag="medium",
+                        when=lambda context: bool(context.payload.get("counterparty_team")),
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="transaction_counterparty",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"transaction_counterparty": payload.get("transaction_counterparty")},
+                    ClaimTemplate(
+                        "event_order_hint",
+                        "event",
+                        payload_fields(source_sequence="source_sequence"),
                         confidence_flag="medium",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                        when=lambda context: context.source_sequence is not None,
                     ),
-                ]
-            )
-            return claims
-
-        claim_date = _parse_iso_date(payload.get("event_date"))
-        event_key = _spotrac_transaction_event_key(payload)
-        player_key = _player_subject_key(payload)
-        claim_group_hint = event_key
-        description = str(payload.get("description") or "")
-        counterparty = payload.get("counterparty_team")
-
-        claims.extend(
-            [
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="event_date",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"event_date": payload.get("event_date")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="event_type",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"event_type": payload.get("event_type")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="event_description",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"description": description},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="player_identity",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "player_id": payload.get("player_id"),
-                        "player_href": payload.get("player_href"),
-                    },
-                    confidence_flag="high" if payload.get("player_id") else "medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="player_name",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"player_name": payload.get("player_name")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-            ]
-        )
-
-        if counterparty:
-            claims.append(
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="transaction_counterparty",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"counterparty_team": counterparty},
-                    confidence_flag="medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                )
-            )
-
-        if payload.get("source_sequence") is not None:
-            claims.append(
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="event_order_hint",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"source_sequence": source_sequence},
-                    confidence_flag="medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                )
-            )
-
-        if payload.get("event_type") in {"signing", "re_signing", "extension"}:
-            claims.append(
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="contract_metadata",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "contract_expiry_year": payload.get("contract_expiry_year"),
-                        "average_annual_salary": payload.get("average_annual_salary"),
-                    },
-                    confidence_flag="medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                )
-            )
-
-        if payload.get("event_type") == "waiver":
-            claims.append(
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="waiver_metadata",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"description": description},
-                    confidence_flag="medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                )
-            )
-            if "buyout" in description.lower():
-                claims.append(
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="buyout_metadata",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=source_sequence,
-                        claim_payload={"description": description},
+                    ClaimTemplate(
+                        "contract_metadata",
+                        "event",
+                        payload_fields(
+                            contract_expiry_year="contract_expiry_year",
+                            average_annual_salary="average_annual_salary",
+                        ),
                         confidence_flag="medium",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
-                    )
-                )
-
-        return claims
-
-    if source_record.source_type in {"spotrac_contract", "contract"}:
-        if payload.get("source_event_ref"):
-            player_key = str(payload.get("player_identity") or _player_subject_key(payload))
-            contract_metadata = payload.get("contract_metadata") or {}
-            claim_date = _parse_iso_date(contract_metadata.get("start_date"))
-            claim_group_hint = str(payload["source_event_ref"])
-            claims.extend(
-                [
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="player_identity",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"player_identity": payload.get("player_identity")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                        when=lambda context: context.payload.get("event_type") in {"signing", "re_signing", "extension"},
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="player_name",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"player_name": payload.get("player_name")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                    ClaimTemplate(
+                        "waiver_metadata",
+                        "event",
+                        payload_fields(description=_extra("description")),
+                        confidence_flag="medium",
+                        when=lambda context: context.payload.get("event_type") == "waiver",
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="contract_metadata",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload=contract_metadata,
+                    ClaimTemplate(
+                        "buyout_metadata",
+                        "event",
+                        payload_fields(description=_extra("description")),
                         confidence_flag="medium",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                        when=lambda context: (
+                            context.payload.get("event_type") == "waiver"
+                            and "buyout" in context.extras["description"].lower()
+                        ),
                     ),
-                ]
-            )
-            return claims
-
-        player_key = _player_subject_key(payload)
-        claim_group_hint = _spotrac_contract_subject_key(payload)
-        start_year = payload.get("start_year")
-        claim_date = date(int(start_year), 1, 1) if start_year else None
-
-        claims.extend(
-            [
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="player_identity",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "player_id": payload.get("player_id"),
-                        "player_href": payload.get("player_href"),
-                    },
-                    confidence_flag="high" if payload.get("player_id") else "medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="player_name",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"player_name": payload.get("player_name")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
                 ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="contract_metadata",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "position": payload.get("position"),
-                        "contract_type": payload.get("contract_type"),
-                        "start_year": payload.get("start_year"),
-                        "end_year": payload.get("end_year"),
-                        "years": payload.get("years"),
-                        "value": payload.get("value"),
-                        "aav": payload.get("aav"),
-                        "gtd_at_sign": payload.get("gtd_at_sign"),
-                        "practical_gtd": payload.get("practical_gtd"),
-                    },
-                    confidence_flag="medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
+            ),
+        ),
+    )
+)
+
+register_normalizer(
+    SourceNormalizer(
+        name="contract",
+        source_types=frozenset({"spotrac_contract", "contract"}),
+        variants=(
+            NormalizerVariant(
+                applies=_has_event_ref,
+                context=_contract_ref_context,
+                templates=(
+                    ClaimTemplate("player_identity", "player", payload_fields(player_identity="player_identity")),
+                    ClaimTemplate("player_name", "player", payload_fields(player_name="player_name")),
+                    ClaimTemplate("contract_metadata", "player", _extra("contract_metadata"), confidence_flag="medium"),
                 ),
-            ]
-        )
-        return claims
-
-    if source_record.source_type in {"nba_api_draft_history", "draft_history"}:
-        if payload.get("source_event_ref"):
-            claim_date = _parse_iso_date(payload.get("event_date"))
-            event_key = str(payload["source_event_ref"])
-            pick_key = str(payload.get("pick_identity") or _pick_subject_key(payload))
-            player_key = str(payload.get("player_identity") or _player_subject_key(payload))
-            claim_group_hint = event_key
-            claims.extend(
-                [
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="event_date",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"event_date": payload.get("event_date")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
-                    ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="event_type",
-                        subject_type="event",
-                        subject_key=event_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"event_type": "draft"},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
-                    ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="pick_identity",
-                        subject_type="pick",
-                        subject_key=pick_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"pick_identity": payload.get("pick_identity")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+            ),
+            NormalizerVariant(
+                context=_spotrac_contract_context,
+                templates=(
+                    ClaimTemplate(
+                        "player_identity",
+                        "player",
+                        payload_fields(player_id="player_id", player_href="player_href"),
+                        confidence_flag=_confidence_if("player_id"),
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="pick_draft_year",
-                        subject_type="pick",
-                        subject_key=pick_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"pick_draft_year": payload.get("pick_draft_year")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                    ClaimTemplate("player_name", "player", payload_fields(player_name="player_name")),
+                    ClaimTemplate(
+                        "contract_metadata",
+                        "player",
+                        payload_fields(
+                            position="position",
+                            contract_type="contract_type",
+                            start_year="start_year",
+                            end_year="end_year",
+                            years="years",
+                            value="value",
+                            aav="aav",
+                            gtd_at_sign="gtd_at_sign",
+                            practical_gtd="practical_gtd",
+                        ),
+                        confidence_flag="medium",
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="pick_round",
-                        subject_type="pick",
-                        subject_key=pick_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"pick_round": payload.get("pick_round")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                ),
+            ),
+        ),
+    )
+)
+
+register_normalizer(
+    SourceNormalizer(
+        name="draft_history",
+        source_types=frozenset({"nba_api_draft_history", "draft_history"}),
+        variants=(
+            NormalizerVariant(
+                applies=_has_event_ref,
+                context=_draft_ref_context,
+                templates=(
+                    ClaimTemplate("event_date", "event", payload_fields(event_date="event_date")),
+                    ClaimTemplate("event_type", "event", payload_fields(event_type=lambda context: "draft")),
+                    ClaimTemplate("pick_identity", "pick", payload_fields(pick_identity="pick_identity")),
+                    ClaimTemplate("pick_draft_year", "pick", payload_fields(pick_draft_year="pick_draft_year")),
+                    ClaimTemplate("pick_round", "pick", payload_fields(pick_round="pick_round")),
+                    ClaimTemplate("player_identity", "player", payload_fields(player_identity="player_identity")),
+                    ClaimTemplate("player_name", "player", payload_fields(player_name="player_name")),
+                ),
+            ),
+            NormalizerVariant(
+                context=_nba_draft_context,
+                templates=(
+                    ClaimTemplate("event_date", "event", payload_fields(event_date="event_date")),
+                    ClaimTemplate("event_type", "event", payload_fields(event_type=lambda context: "draft")),
+                    ClaimTemplate(
+                        "player_identity",
+                        "player",
+                        payload_fields(player_id="PERSON_ID", team_abbreviation="TEAM_ABBREVIATION"),
+                        confidence_flag=_confidence_if("PERSON_ID"),
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="player_identity",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"player_identity": payload.get("player_identity")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                    ClaimTemplate("player_name", "player", payload_fields(player_name="PLAYER_NAME")),
+                    ClaimTemplate(
+                        "pick_identity",
+                        "pick",
+                        payload_fields(
+                            draft_year="SEASON",
+                            origin_team="TEAM_ABBREVIATION",
+                            round_number="ROUND_NUMBER",
+                            overall_pick="OVERALL_PICK",
+                        ),
                     ),
-                    _build_claim(
-                        source_record=source_record,
-                        claim_type="player_name",
-                        subject_type="player",
-                        subject_key=player_key,
-                        claim_group_hint=claim_group_hint,
-                        claim_date=claim_date,
-                        source_sequence=payload.get("source_sequence"),
-                        claim_payload={"player_name": payload.get("player_name")},
-                        confidence_flag="high",
-                        normalizer_version=normalizer_version,
-                        created_at=created_at_value,
+                    ClaimTemplate("pick_origin_team", "pick", payload_fields(origin_team="TEAM_ABBREVIATION")),
+                    ClaimTemplate("pick_draft_year", "pick", payload_fields(draft_year="SEASON")),
+                    ClaimTemplate("pick_round", "pick", payload_fields(round_number="ROUND_NUMBER")),
+                    ClaimTemplate(
+                        "pick_resolution_metadata",
+                        "pick",
+                        payload_fields(
+                            overall_pick="OVERALL_PICK",
+                            draft_type="DRAFT_TYPE",
+                            organization="ORGANIZATION",
+                        ),
                     ),
-                ]
-            )
-            return claims
+                ),
+            ),
+        ),
+    )
+)
 
-        claim_date = _parse_iso_date(payload.get("event_date"))
-        event_key = _nba_draft_event_key(payload)
-        pick_key = _pick_subject_key(payload)
-        player_key = _player_subject_key(payload)
-        claim_group_hint = (
-            f"draft::{payload.get('SEASON', 'unknown')}::{payload.get('TEAM_ABBREVIATION', 'unknown')}::"
-            f"{payload.get('OVERALL_PICK', 'unknown')}"
-        )
 
-        claims.extend(
-            [
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="event_date",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"event_date": payload.get("event_date")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="event_type",
-                    subject_type="event",
-                    subject_key=event_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"event_type": "draft"},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="player_identity",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "player_id": payload.get("PERSON_ID"),
-                        "team_abbreviation": payload.get("TEAM_ABBREVIATION"),
-                    },
-                    confidence_flag="high" if payload.get("PERSON_ID") else "medium",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="player_name",
-                    subject_type="player",
-                    subject_key=player_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"player_name": payload.get("PLAYER_NAME")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="pick_identity",
-                    subject_type="pick",
-                    subject_key=pick_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "draft_year": payload.get("SEASON"),
-                        "origin_team": payload.get("TEAM_ABBREVIATION"),
-                        "round_number": payload.get("ROUND_NUMBER"),
-                        "overall_pick": payload.get("OVERALL_PICK"),
-                    },
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="pick_origin_team",
-                    subject_type="pick",
-                    subject_key=pick_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"origin_team": payload.get("TEAM_ABBREVIATION")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="pick_draft_year",
-                    subject_type="pick",
-                    subject_key=pick_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"draft_year": payload.get("SEASON")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="pick_round",
-                    subject_type="pick",
-                    subject_key=pick_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={"round_number": payload.get("ROUND_NUMBER")},
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
-                ),
-                _build_claim(
-                    source_record=source_record,
-                    claim_type="pick_resolution_metadata",
-                    subject_type="pick",
-                    subject_key=pick_key,
-                    claim_group_hint=claim_group_hint,
-                    claim_date=claim_date,
-                    source_sequence=source_sequence,
-                    claim_payload={
-                        "overall_pick": payload.get("OVERALL_PICK"),
-                        "draft_type": payload.get("DRAFT_TYPE"),
-                        "organization": payload.get("ORGANIZATION"),
-                    },
-                    confidence_flag="high",
-                    normalizer_version=normalizer_version,
-                    created_at=created_at_value,
+def normalize_source_record(
+    source_record: SourceRecord,
+    *,
+    normalizer_version: str = "stage1-normalizer-v1",
+    created_at: datetime | None = None,
+) -> list[NormalizedClaim]:
+    normalizer = NORMALIZER_REGISTRY.get(source_record.source_type)
+    if normalizer is None:
+        return []
+    payload = source_record.raw_payload
+    variant = normalizer.variant_for(payload)
+    if variant is None:
+        return []
+
+    context = variant.context(payload)
+    created_at_value = created_at or datetime.utcnow()
+    source_record_id = source_record.source_record_id
+    claim_group_hint = context.claim_group_hint
+    claim_date = context.claim_date
+    source_sequence = context.source_sequence
+    subject_keys = context.subject_keys
+    claims: list[NormalizedClaim] = []
+    for template in variant.templates:
+        if template.when is not None and not template.when(context):
+            continue
+        subject_key = subject_keys[template.subject_type]
+        claim_payload = template.payload(context)
+        confidence_flag = template.confidence_flag
+        claims.append(
+            NormalizedClaim(
+                claim_id=stable_id(
+                    "claim",
+                    source_record_id,
+                    template.claim_type,
+                    template.subject_type,
+                    subject_key,
+                    source_sequence,
+                    claim_payload,
                 ),
-            ]
+                source_record_id=source_record_id,
+                claim_type=template.claim_type,
+                claim_subject_type=template.subject_type,
+                claim_subject_key=subject_key,
+                claim_group_hint=claim_group_hint,
+                claim_date=claim_date,
+                source_sequence=source_sequence,
+                claim_payload=claim_payload,
+                confidence_flag=confidence_flag if isinstance(confidence_flag, str) else confidence_flag(context),
+                normalizer_version=normalizer_version,
+                created_at=created_at_value,
+            )
         )
-        return claims
-
     return claims
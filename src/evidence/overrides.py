@@ -5,12 +5,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from evidence.models import OverrideBundle, OverrideLink, OverrideRecord
-from evidence.override_schema import validate_override_bundle_payload
+from evidence.override_schema import OverrideBundleSchema, validate_override_bundle_payload
+from shared.config_cache import load_cached_file, parse_structured_text, schema_fingerprint
 from shared.ids import stable_id
 
+OVERRIDE_CACHE_NAMESPACE = f"override-bundle-v1-{schema_fingerprint(OverrideBundleSchema)}"
+
 
 def _iter_override_files(root: Path) -> list[Path]:
     if not root.exists():
@@ -24,12 +25,8 @@ def _iter_override_files(root: Path) -> list[Path]:
     return files
 
 
-def _load_structured_file(path: Path) -> dict[str, Any]:
-    raw_text = path.read_text(encoding="utf-8")
-    if path.suffix.lower() == ".json":
-        data = json.loads(raw_text)
-    else:
-        data = yaml.safe_load(raw_text)
+def _parse_structured_file(path: Path, raw_text: str) -> dict[str, Any]:
+    data = parse_structured_text(path, raw_text)
     if data is None:
         return {}
     if isinstance(data, list):
@@ -39,14 +36,21 @@ def _load_structured_file(path: Path) -> dict[str, Any]:
     return data
 
 
+def _load_validated_file(path: Path) -> OverrideBundleSchema:
+    return load_cached_file(
+        path,
+        OVERRIDE_CACHE_NAMESPACE,
+        lambda raw_text: validate_override_bundle_payload(_parse_structured_file(path, raw_text), source=str(path)),
+    )
+
+
 def load_override_bundle(root: Path | str, *, default_authored_by: str = "local") -> OverrideBundle:
     root_path = Path(root)
     overrides: list[OverrideRecord] = []
     override_links: list[OverrideLink] = []
 
     for path in _iter_override_files(root_path):
-        payload = _load_structured_file(path)
-        validated_bundle = validate_override_bundle_payload(payload, source=str(path))
+        validated_bundle = _load_validated_file(path)
         created_at = datetime.utcnow()
         for entry in validated_bundle.overrides:
             override_id = entry.override_id or stable_id(
@@ -167,3 +171,20 @@ def insert_override_bundle(conn: Any, bundle: OverrideBundle) -> dict[str, int]:
         "override_count": inserted_overrides,
         "override_link_count": inserted_links,
     }
+
+
+def replace_override_bundle(conn: Any, bundle: OverrideBundle) -> dict[str, int]:
+    # The bundle is the whole curated set, so overrides and links missing from it are deleted
+    # before the upsert; dropping an override's links goes through the on-delete cascade.
+    override_ids = [override.override_id for override in bundle.overrides]
+    link_ids = [link.override_link_id for link in bundle.override_links]
+    with conn.cursor() as cur:
+        cur.execute("delete from evidence.overrides where not (override_id = any(%s))", (override_ids,))
+        removed_overrides = cur.rowcount
+        cur.execute("delete from evidence.override_links where not (override_link_id = any(%s))", (link_ids,))
+        removed_links = cur.rowcount
+    return {
+        **insert_override_bundle(conn, bundle),
+        "removed_override_count": removed_overrides,
+        "removed_override_link_count": removed_links,
+    }
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from collections import Counter
-from typing import Iterable
+from typing import Any, Iterable
 
 from evidence.models import NormalizedClaim, OverrideRecord, SourceRecord
+from shared.profiling import traced
 
 
 @dataclass(frozen=True)
@@ -22,63 +23,98 @@ class ValidationReport:
         return not self.errors
 
 
+class Stage1Validator:
+    # Accepts rows page by page: every source record must be added before claims that reference it,
+    # and only the id set and counters are kept between pages.
+    def __init__(self, source_record_ids: Any | None = None) -> None:
+        self.source_record_ids = source_record_ids if source_record_ids is not None else set()
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+        self.normalized_claim_count = 0
+        self.override_count = 0
+        self.duplicate_count_skipped = 0
+        self.duplicate_ids_seen = 0
+        self.claim_count_by_type: Counter[str] = Counter()
+
+    def add_source_records(self, source_records: Iterable[SourceRecord]) -> None:
+        for record in source_records:
+            if record.source_record_id in self.source_record_ids:
+                self.duplicate_ids_seen += 1
+            else:
+                self.source_record_ids.add(record.source_record_id)
+            if not record.payload_hash:
+                self.errors.append(f"source_record missing payload_hash: {record.source_record_id}")
+            if not record.source_locator:
+                self.errors.append(f"source_record missing source_locator: {record.source_record_id}")
+            if not record.parser_version:
+                self.errors.append(f"source_record missing parser_version: {record.source_record_id}")
+            duplicate_count = getattr(record, "duplicate_count", 1) or 1
+            if duplicate_count > 1:
+                self.duplicate_count_skipped += duplicate_count - 1
+
+    def add_claims(self, normalized_claims: Iterable[NormalizedClaim]) -> None:
+        for claim in normalized_claims:
+            self.normalized_claim_count += 1
+            self.claim_count_by_type[claim.claim_type] += 1
+            if claim.source_record_id not in self.source_record_ids:
+                self.errors.append(f"claim references unknown source_record_id: {claim.claim_id}")
+            if not claim.claim_group_hint:
+                self.warnings.append(f"claim missing claim_group_hint: {claim.claim_id}")
+            if claim.source_sequence is None:
+                self.warnings.append(f"claim missing source_sequence: {claim.claim_id}")
+            if not claim.normalizer_version:
+                self.errors.append(f"claim missing normalizer_version: {claim.claim_id}")
+
+    def add_overrides(self, overrides: Iterable[OverrideRecord]) -> None:
+        for override in overrides:
+            self.override_count += 1
+            if not override.reason:
+                self.errors.append(f"override missing reason: {override.override_id}")
+            if not override.target_key:
+                self.errors.append(f"override missing target_key: {override.override_id}")
+
+    def report(self) -> ValidationReport:
+        return ValidationReport(
+            source_record_count=len(self.source_record_ids),
+            normalized_claim_count=self.normalized_claim_count,
+            override_count=self.override_count,
+            duplicate_source_records_skipped=self.duplicate_count_skipped or self.duplicate_ids_seen,
+            claim_count_by_type=dict(self.claim_count_by_type),
+            errors=list(self.errors),
+            warnings=list(self.warnings),
+        )
+
+
+@traced("validate")
 def validate_stage1_rows(
     *,
     source_records: Iterable[SourceRecord],
     normalized_claims: Iterable[NormalizedClaim],
     overrides: Iterable[OverrideRecord],
 ) -> ValidationReport:
-    source_records_list = list(source_records)
-    normalized_claims_list = list(normalized_claims)
-    overrides_list = list(overrides)
-    errors: list[str] = []
-    warnings: list[str] = []
-
-    source_record_id_counts = Counter(record.source_record_id for record in source_records_list)
-    source_record_ids = set(source_record_id_counts)
-
-    for record in source_records_list:
-        if not record.payload_hash:
-            errors.append(f"source_record missing payload_hash: {record.source_record_id}")
-        if not record.source_locator:
-            errors.append(f"source_record missing source_locator: {record.source_record_id}")
-        if not record.parser_version:
-            errors.append(f"source_record missing parser_version: {record.source_record_id}")
-
-    for claim in normalized_claims_list:
-        if claim.source_record_id not in source_record_ids:
-            errors.append(f"claim references unknown source_record_id: {claim.claim_id}")
-        if not claim.claim_group_hint:
-            warnings.append(f"claim missing claim_group_hint: {claim.claim_id}")
-        if claim.source_sequence is None:
-            warnings.append(f"claim missing source_sequence: {claim.claim_id}")
-        if not claim.normalizer_version:
-            errors.append(f"claim missing normalizer_version: {claim.claim_id}")
-
-    for override in overrides_list:
-        if not override.reason:
-            errors.append(f"override missing reason: {override.override_id}")
-        if not override.target_key:
-            errors.append(f"override missing target_key: {override.override_id}")
-
-    duplicate_source_records_skipped = 0
-    for record in source_records_list:
-        duplicate_count = getattr(record, "duplicate_count", 1) or 1
-        if duplicate_count > 1:
-            duplicate_source_records_skipped += duplicate_count - 1
-    if duplicate_source_records_skipped == 0:
-        duplicate_source_records_skipped = sum(count - 1 for count in source_record_id_counts.values() if count > 1)
-    claim_count_by_type = dict(Counter(claim.claim_type for claim in normalized_claims_list))
-
-    return ValidationReport(
-        source_record_count=len(source_record_ids),
-        normalized_claim_count=len(normalized_claims_list),
-        override_count=len(overrides_list),
-        duplicate_source_records_skipped=duplicate_source_records_skipped,
-        claim_count_by_type=claim_count_by_type,
-        errors=errors,
-        warnings=warnings,
-    )
+    validator = Stage1Validator()
+    validator.add_source_records(source_records)
+    validator.add_claims(normalized_claims)
+    validator.add_overrides(overrides)
+    return validator.report()
+
+
+@traced("validate")
+def validate_stage1_pages(
+    *,
+    source_record_pages: Iterable[Iterable[SourceRecord]],
+    claim_pages: Iterable[Iterable[NormalizedClaim]],
+    override_pages: Iterable[Iterable[OverrideRecord]],
+    source_record_ids: Any | None = None,
+) -> ValidationReport:
+    validator = Stage1Validator(source_record_ids)
+    for page in source_record_pages:
+        validator.add_source_records(page)
+    for page in claim_pages:
+        validator.add_claims(page)
+    for page in override_pages:
+        validator.add_overrides(page)
+    return validator.report()
 
 
 validate_evidence = validate_stage1_rows
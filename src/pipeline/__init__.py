@@ -0,0 +1,50 @@
+from pipeline.franchises import (
+    FranchisePartition,
+    FranchiseRunJob,
+    FranchiseRunResult,
+    franchise_partition,
+    run_franchise,
+    run_franchises,
+)
+from pipeline.scheduler import (
+    PipelineRunResult,
+    StageSpec,
+    StageTiming,
+    critical_path,
+    run_stage_graph,
+    topological_order,
+)
+from pipeline.stages import default_stage_graph, persist_stage, run_editorial_stage, run_stage
+from pipeline.watch import (
+    ConfigWatcher,
+    WatchRebuildResult,
+    WatchTargets,
+    affected_stages,
+    rebuild_affected,
+    watch_configs,
+)
+
+__all__ = [
+    "ConfigWatcher",
+    "FranchisePartition",
+    "FranchiseRunJob",
+    "FranchiseRunResult",
+    "PipelineRunResult",
+    "StageSpec",
+    "StageTiming",
+    "WatchRebuildResult",
+    "WatchTargets",
+    "affected_stages",
+    "critical_path",
+    "default_stage_graph",
+    "franchise_partition",
+    "persist_stage",
+    "run_editorial_stage",
+    "run_franchise",
+    "run_franchises",
+    "run_stage",
+    "run_stage_graph",
+    "rebuild_affected",
+    "topological_order",
+    "watch_configs",
+]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable
+
+from db_config import load_database_url
+from evidence.models import SourceRecord
+from evidence.normalize import normalize_source_record
+from evidence.overrides import load_override_bundle
+from pipeline.scheduler import JsonDict, PipelineRunResult, run_stage_graph
+from pipeline.stages import default_stage_graph
+from shared.franchise import Franchise, franchise_partition_path
+from storage.repository import DEFAULT_MEMORY_STORE_PATH, StageRepository, open_repository
+
+
+@dataclass(frozen=True)
+class FranchisePartition:
+    franchise: Franchise
+    storage: str
+    storage_path: Path | None = None
+    database_url: str | None = None
+
+    def repository_factory(self, *, read_only: bool = False) -> Callable[[], StageRepository]:
+        if self.storage == "memory":
+            return partial(open_repository, "memory", self.storage_path, read_only=read_only)
+        return partial(open_repository, self.storage, database_url=self.database_url, read_only=read_only)
+
+
+def franchise_partition(franchise: Franchise, *, storage: str, storage_path: Path | str | None = None) -> FranchisePartition:
+    if storage == "memory":
+        return FranchisePartition(
+            franchise=franchise,
+            storage=storage,
+            storage_path=franchise_partition_path(storage_path or DEFAULT_MEMORY_STORE_PATH, franchise),
+        )
+    return FranchisePartition(franchise=franchise, storage=storage, database_url=load_database_url(franchise.code))
+
+
+@dataclass(frozen=True)
+class FranchiseRunJob:
+    partition: FranchisePartition
+    source_records: list[SourceRecord]
+    normalizer_version: str
+    overrides_path: Path | None = None
+    builder_versions: dict[str, str] | None = None
+
+
+@dataclass(frozen=True)
+class FranchiseRunResult:
+    franchise_code: str
+    source_record_count: int
+    inserted_source_record_count: int
+    normalized_claim_count: int
+    inserted_claim_count: int
+    override_counts: dict[str, int]
+    pipeline: PipelineRunResult
+    wall_seconds: float
+
+    def counts(self) -> JsonDict:
+        return {
+            "franchise_code": self.franchise_code,
+            "source_record_count": self.source_record_count,
+            "inserted_source_record_count": self.inserted_source_record_count,
+            "normalized_claim_count": self.normalized_claim_count,
+            "inserted_claim_count": self.inserted_claim_count,
+            **self.override_counts,
+            "pipeline": self.pipeline.counts(),
+            "wall_seconds": round(self.wall_seconds, 6),
+        }
+
+
+def run_franchise(job: FranchiseRunJob) -> FranchiseRunResult:
+    started = time.perf_counter()
+    repository_factory = job.partition.repository_factory()
+    claims = [
+        claim
+        for record in job.source_records
+        for claim in normalize_source_record(record, normalizer_version=job.normalizer_version)
+    ]
+    override_counts: dict[str, int] = {}
+    with repository_factory() as repository:
+        inserted_source_records = repository.insert_source_records(job.source_records)
+        inserted_claims = repository.insert_normalized_claims(claims)
+        repository.record_normalized_source_records(
+            (record.source_record_id for record in job.source_records), job.normalizer_version
+        )
+        if job.overrides_path is not None:
+            override_counts = repository.insert_override_bundle(load_override_bundle(job.overrides_path))
+        repository.commit()
+
+    # Franchises are the unit of parallelism, so each worker walks its own stage graph serially.
+    # Editorial overlays are curated per story and stay with the single-franchise run-pipeline.
+    stages = [
+        stage
+        for stage in default_stage_graph(
+            repository_factory=job.partition.repository_factory(read_only=True),
+            builder_versions=job.builder_versions,
+            franchise=job.partition.franchise,
+        )
+        if stage.name != "editorial-overlays"
+    ]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pipeline = run_stage_graph(stages, connect=repository_factory, executor=executor)
+    return FranchiseRunResult(
+        franchise_code=job.partition.franchise.code,
+        source_record_count=len(job.source_records),
+        inserted_source_record_count=inserted_source_records,
+        normalized_claim_count=len(claims),
+        inserted_claim_count=inserted_claims,
+        override_counts=override_counts,
+        pipeline=pipeline,
+        wall_seconds=time.perf_counter() - started,
+    )
+
+
+def run_franchises(jobs: Iterable[FranchiseRunJob], *, max_workers: int | None = None) -> list[FranchiseRunResult]:
+    jobs_list = list(jobs)
+    codes = [job.partition.franchise.code for job in jobs_list]
+    if len(set(codes)) != len(codes):
+        raise ValueError("franchise runs must target distinct franchises")
+    if not jobs_list:
+        return []
+    with ProcessPoolExecutor(max_workers=max_workers or len(jobs_list)) as executor:
+        return list(executor.map(run_franchise, jobs_list))
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+
+JsonDict = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    name: str
+    run: Callable[[], Any]
+    persist: Callable[[Any, Any], JsonDict]
+    depends_on: tuple[str, ...] = ()
+    persist_after: tuple[str, ...] = ()
+
+    def persist_dependencies(self) -> tuple[str, ...]:
+        return self.depends_on + tuple(name for name in self.persist_after if name not in self.depends_on)
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    name: str
+    started_at: float
+    run_seconds: float
+    persist_seconds: float
+    finished_at: float
+
+    @property
+    def total_seconds(self) -> float:
+        return self.run_seconds + self.persist_seconds
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "name": self.name,
+            "started_at": round(self.started_at, 6),
+            "run_seconds": round(self.run_seconds, 6),
+            "persist_seconds": round(self.persist_seconds, 6),
+            "total_seconds": round(self.total_seconds, 6),
+            "finished_at": round(self.finished_at, 6),
+        }
+
+
+@dataclass(frozen=True)
+class PipelineRunResult:
+    stage_order: list[str]
+    persist_order: list[str]
+    counts_by_stage: dict[str, JsonDict]
+    timings: list[StageTiming]
+    critical_path: list[str]
+    critical_path_seconds: float
+    wall_seconds: float
+    serial_seconds: float
+
+    def counts(self) -> JsonDict:
+        return {
+            "stage_order": self.stage_order,
+            "persist_order": self.persist_order,
+            "stages": self.counts_by_stage,
+            "timings": [row.as_dict() for row in self.timings],
+            "critical_path": self.critical_path,
+            "critical_path_seconds": round(self.critical_path_seconds, 6),
+            "serial_seconds": round(self.serial_seconds, 6),
+            "wall_seconds": round(self.wall_seconds, 6),
+        }
+
+
+def topological_order(stages: Iterable[StageSpec]) -> list[str]:
+    stages_list = list(stages)
+    declared_index = {stage.name: index for index, stage in enumerate(stages_list)}
+    if len(declared_index) != len(stages_list):
+        raise ValueError("pipeline stage names must be unique")
+    for stage in stages_list:
+        for dependency in stage.persist_dependencies():
+            if dependency not in declared_index:
+                raise ValueError(f"stage {stage.name} depends on unknown stage {dependency}")
+
+    remaining = {stage.name: set(stage.persist_dependencies()) for stage in stages_list}
+    ordered: list[str] = []
+    while remaining:
+        ready = sorted((name for name, deps in remaining.items() if not deps), key=declared_index.__getitem__)
+        if not ready:
+            raise ValueError(f"pipeline stage graph has a cycle: {', '.join(sorted(remaining))}")
+        name = ready[0]
+        ordered.append(name)
+        del remaining[name]
+        for deps in remaining.values():
+            deps.discard(name)
+    return ordered
+
+
+def critical_path(
+    stages: Iterable[StageSpec],
+    run_seconds: dict[str, float],
+    persist_seconds: dict[str, float] | None = None,
+) -> tuple[list[str], float]:
+    stages_by_name = {stage.name: stage for stage in stages}
+    persist_seconds_by_name = persist_seconds or {}
+    finish_by_name: dict[str, float] = {}
+    previous_by_name: dict[str, str | None] = {}
+    for name in topological_order(stages_by_name.values()):
+        stage = stages_by_name[name]
+        previous: str | None = None
+        run_start = 0.0
+        for dependency in stage.depends_on:
+            if previous is None or finish_by_name[dependency] > run_start:
+                run_start = finish_by_name[dependency]
+                previous = dependency
+        persist_start = run_start + run_seconds.get(name, 0.0)
+        for dependency in stage.persist_after:
+            if finish_by_name[dependency] > persist_start:
+                persist_start = finish_by_name[dependency]
+                previous = dependency
+        finish_by_name[name] = persist_start + persist_seconds_by_name.get(name, 0.0)
+        previous_by_name[name] = previous
+
+    if not finish_by_name:
+        return [], 0.0
+    order_index = {name: index for index, name in enumerate(finish_by_name)}
+    tail = max(finish_by_name, key=lambda name: (finish_by_name[name], order_index[name]))
+    path: list[str] = []
+    cursor: str | None = tail
+    while cursor is not None:
+        path.append(cursor)
+        cursor = previous_by_name[cursor]
+    return list(reversed(path)), finish_by_name[tail]
+
+
+def run_stage_graph(
+    stages: Iterable[StageSpec],
+    *,
+    connect: Callable[[], Any],
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> PipelineRunResult:
+    stages_list = list(stages)
+    stages_by_name = {stage.name: stage for stage in stages_list}
+    persist_order = topological_order(stages_list)
+
+    owns_executor = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    started_at_by_name: dict[str, float] = {}
+    run_seconds_by_name: dict[str, float] = {}
+    persist_seconds_by_name: dict[str, float] = {}
+    finished_at_by_name: dict[str, float] = {}
+    results_by_name: dict[str, Any] = {}
+    counts_by_stage: dict[str, JsonDict] = {}
+    persisted: set[str] = set()
+    submitted: dict[Future, str] = {}
+    stage_order: list[str] = []
+    pipeline_started = time.perf_counter()
+
+    def submit_ready() -> None:
+        for name in persist_order:
+            if name in started_at_by_name:
+                continue
+            if all(dependency in persisted for dependency in stages_by_name[name].depends_on):
+                started_at_by_name[name] = time.perf_counter() - pipeline_started
+                stage_order.append(name)
+                submitted[pool.submit(_timed_run, stages_by_name[name].run)] = name
+
+    try:
+        with connect() as conn:
+            submit_ready()
+            while len(persisted) < len(persist_order):
+                done, _ = wait(list(submitted), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = submitted.pop(future)
+                    result, elapsed = future.result()
+                    results_by_name[name] = result
+                    run_seconds_by_name[name] = elapsed
+
+                for name in persist_order:
+                    if name in persisted:
+                        continue
+                    if name not in results_by_name:
+                        break
+                    persist_started = time.perf_counter()
+                    counts_by_stage[name] = stages_by_name[name].persist(conn, results_by_name.pop(name))
+                    conn.commit()
+                    persist_seconds_by_name[name] = time.perf_counter() - persist_started
+                    finished_at_by_name[name] = time.perf_counter() - pipeline_started
+                    persisted.add(name)
+                submit_ready()
+    finally:
+        if owns_executor:
+            pool.shutdown(cancel_futures=True)
+
+    timings = [
+        StageTiming(
+            name=name,
+            started_at=started_at_by_name[name],
+            run_seconds=run_seconds_by_name[name],
+            persist_seconds=persist_seconds_by_name[name],
+            finished_at=finished_at_by_name[name],
+        )
+        for name in persist_order
+    ]
+    path, path_seconds = critical_path(stages_list, run_seconds_by_name, persist_seconds_by_name)
+    return PipelineRunResult(
+        stage_order=stage_order,
+        persist_order=persist_order,
+        counts_by_stage=counts_by_stage,
+        timings=timings,
+        critical_path=path,
+        critical_path_seconds=path_seconds,
+        wall_seconds=time.perf_counter() - pipeline_started,
+        serial_seconds=sum(row.total_seconds for row in timings),
+    )
+
+
+def _timed_run(run: Callable[[], Any]) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - started
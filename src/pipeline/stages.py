@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from canonical.event_asset_flow import build_event_asset_flows
+from canonical.events import build_canonical_events
+from canonical.lineage import build_asset_lineage
+from canonical.pick_lifecycle import build_pick_lifecycle
+from canonical.player_tenure import build_player_tenures
+from editorial.contract import build_editorial_overlays, load_editorial_bundle
+from editorial.models import EditorialOverlayBundle
+from pipeline.scheduler import JsonDict, StageSpec
+from presentation.contract import build_presentation_contract
+from shared.franchise import DEFAULT_FRANCHISE, Franchise
+from shared.ids import id_dictionary_session
+from shared.profiling import span
+from storage.repository import StageRepository, open_repository
+
+
+STAGE_BUILDER_VERSIONS = {
+    "canonical-events": "stage2-events-v1",
+    "canonical-player-tenures": "stage3-player-tenure-v1",
+    "canonical-pick-lifecycle": "stage4-pick-lifecycle-v1",
+    "canonical-event-asset-flows": "stage5-event-asset-flow-v1",
+    "canonical-asset-lineage": "stage5-asset-lineage-v1",
+    "presentation-contract": "stage6-presentation-contract-v1",
+    "editorial-overlays": "stage7-editorial-overlay-v1",
+}
+# Stages whose trade-direction heuristics read descriptions from one franchise's side.
+FRANCHISE_SCOPED_STAGES = frozenset({"canonical-player-tenures", "canonical-pick-lifecycle"})
+
+
+def _build_canonical_events(repository: StageRepository, *, builder_version: str):
+    claims, overrides = repository.fetch_event_build_inputs()
+    return build_canonical_events(claims, overrides, builder_version=builder_version)
+
+
+def _build_player_tenures(repository: StageRepository, *, builder_version: str, franchise: Franchise = DEFAULT_FRANCHISE):
+    events, event_provenance, claims, overrides = repository.fetch_player_tenure_build_inputs()
+    return build_player_tenures(events, event_provenance, claims, overrides, builder_version=builder_version, franchise=franchise)
+
+
+def _build_pick_lifecycle(
+    repository: StageRepository,
+    *,
+    builder_version: str,
+    workers: int = 1,
+    franchise: Franchise = DEFAULT_FRANCHISE,
+):
+    events, event_provenance, claims, overrides = repository.fetch_pick_lifecycle_build_inputs()
+    return build_pick_lifecycle(
+        events,
+        event_provenance,
+        claims,
+        overrides,
+        builder_version=builder_version,
+        workers=workers,
+        franchise=franchise,
+    )
+
+
+def _build_event_asset_flows(repository: StageRepository, *, builder_version: str):
+    events, event_provenance, assets, player_tenures, pick_resolutions = repository.fetch_event_asset_flow_build_inputs()
+    return build_event_asset_flows(
+        events,
+        event_provenance,
+        assets,
+        player_tenures,
+        pick_resolutions,
+        builder_version=builder_version,
+    )
+
+
+def _build_asset_lineage(repository: StageRepository, *, builder_version: str):
+    flows, existing_rows, existing_edges = repository.fetch_asset_lineage_build_inputs()
+    return build_asset_lineage(
+        flows,
+        existing_rows=existing_rows,
+        existing_edges=existing_edges,
+        builder_version=builder_version,
+    )
+
+
+def _build_presentation_contract(repository: StageRepository, *, builder_version: str):
+    (
+        events,
+        assets,
+        player_identities,
+        player_tenures,
+        pick_assets,
+        pick_resolutions,
+        asset_states,
+        event_asset_flows,
+        canonical_build_id,
+    ) = repository.fetch_presentation_contract_build_inputs()
+    return build_presentation_contract(
+        events=events,
+        assets=assets,
+        player_identities=player_identities,
+        player_tenures=player_tenures,
+        pick_assets=pick_assets,
+        pick_resolutions=pick_resolutions,
+        asset_states=asset_states,
+        event_asset_flows=event_asset_flows,
+        builder_version=builder_version,
+        canonical_build_id=canonical_build_id,
+    )
+
+
+def _persist_editorial_overlays(repository: StageRepository, bundle: EditorialOverlayBundle, *, builder_version: str) -> JsonDict:
+    result = build_editorial_overlays(
+        bundle,
+        builder_version=builder_version,
+        presentation_build_id=repository.fetch_current_presentation_build_id(),
+    )
+    return repository.persist_editorial_overlay_build(result)
+
+
+STAGE_BUILDERS: dict[str, Callable[..., Any]] = {
+    "canonical-events": _build_canonical_events,
+    "canonical-player-tenures": _build_player_tenures,
+    "canonical-pick-lifecycle": _build_pick_lifecycle,
+    "canonical-event-asset-flows": _build_event_asset_flows,
+    "canonical-asset-lineage": _build_asset_lineage,
+    "presentation-contract": _build_presentation_contract,
+}
+
+
+def persist_stage(stage_name: str, repository: StageRepository, result: Any) -> JsonDict:
+    if stage_name == "canonical-events":
+        return repository.persist_canonical_event_build(result)
+    if stage_name == "canonical-player-tenures":
+        return repository.persist_canonical_player_tenure_build(result)
+    if stage_name == "canonical-pick-lifecycle":
+        return repository.persist_canonical_pick_lifecycle_build(result)
+    if stage_name == "canonical-event-asset-flows":
+        return repository.persist_canonical_event_asset_flow_build(result)
+    if stage_name == "canonical-asset-lineage":
+        return repository.persist_canonical_asset_lineage_build(result)
+    if stage_name == "presentation-contract":
+        return repository.persist_presentation_contract_build(result)
+    raise ValueError(f"unknown pipeline stage: {stage_name}")
+
+
+def run_stage(
+    stage_name: str,
+    repository: StageRepository,
+    *,
+    builder_version: str | None = None,
+    **options: Any,
+) -> JsonDict:
+    builder = STAGE_BUILDERS.get(stage_name)
+    if builder is None:
+        raise ValueError(f"unknown pipeline stage: {stage_name}")
+    with span(stage_name, "stage"), id_dictionary_session():
+        result = builder(repository, builder_version=builder_version or STAGE_BUILDER_VERSIONS[stage_name], **options)
+        return persist_stage(stage_name, repository, result)
+
+
+def run_editorial_stage(
+    repository: StageRepository,
+    *,
+    input_path: Path | str = Path("configs/data"),
+    builder_version: str = STAGE_BUILDER_VERSIONS["editorial-overlays"],
+) -> JsonDict:
+    return _persist_editorial_overlays(repository, load_editorial_bundle(input_path), builder_version=builder_version)
+
+
+def _run_in_repository(
+    stage_name: str,
+    repository_factory: Callable[[], StageRepository],
+    builder_version: str,
+    **options: Any,
+):
+    # Workers only fetch inputs, so the factory hands out read-only handles; the scheduler's
+    # connect handle is the only writer. Interned IDs also pickle once per result when a worker
+    # process hands the build back.
+    with id_dictionary_session(), repository_factory() as repository:
+        return STAGE_BUILDERS[stage_name](repository, builder_version=builder_version, **options)
+
+
+def default_stage_graph(
+    *,
+    repository_factory: Callable[[], StageRepository] = partial(open_repository, read_only=True),
+    builder_versions: dict[str, str] | None = None,
+    editorial_input_path: Path | str = Path("configs/data"),
+    franchise: Franchise = DEFAULT_FRANCHISE,
+) -> list[StageSpec]:
+    versions = {**STAGE_BUILDER_VERSIONS, **(builder_versions or {})}
+
+    def stage(name: str, depends_on: tuple[str, ...] = (), persist_after: tuple[str, ...] = ()) -> StageSpec:
+        options = {"franchise": franchise} if name in FRANCHISE_SCOPED_STAGES else {}
+        return StageSpec(
+            name=name,
+            run=partial(_run_in_repository, name, repository_factory, versions[name], **options),
+            persist=partial(persist_stage, name),
+            depends_on=depends_on,
+            persist_after=persist_after,
+        )
+
+    return [
+        stage("canonical-events"),
+        stage("canonical-player-tenures", ("canonical-events",)),
+        # Stage 3 persistence clears every canonical.asset row, so pick assets must land after it.
+        stage("canonical-pick-lifecycle", ("canonical-events",), ("canonical-player-tenures",)),
+        stage("canonical-event-asset-flows", ("canonical-player-tenures", "canonical-pick-lifecycle")),
+        stage("canonical-asset-lineage", ("canonical-event-asset-flows",)),
+        stage("presentation-contract", ("canonical-event-asset-flows",)),
+        # Editorial files load without Stage 6; only the build binding needs the current presentation build.
+        StageSpec(
+            name="editorial-overlays",
+            run=partial(load_editorial_bundle, editorial_input_path),
+            persist=partial(_persist_editorial_overlays, builder_version=versions["editorial-overlays"]),
+            persist_after=("presentation-contract",),
+        ),
+    ]
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from editorial.contract import editorial_overlays_to_json
+from evidence.overrides import load_override_bundle
+from pipeline.scheduler import JsonDict, StageSpec, topological_order
+from pipeline.stages import (
+    FRANCHISE_SCOPED_STAGES,
+    STAGE_BUILDER_VERSIONS,
+    default_stage_graph,
+    run_editorial_stage,
+    run_stage,
+)
+from presentation.contract import (
+    FRONTEND_PUBLIC_ROOT,
+    HEADSHOT_MANIFEST_PATH,
+    build_layout_contract,
+    layout_contract_to_json,
+    presentation_contract_to_json,
+)
+from shared.franchise import DEFAULT_FRANCHISE, Franchise
+from storage.repository import StageRepository
+
+
+DEFAULT_WATCH_POLL_SECONDS = 0.5
+DEFAULT_LAYOUT_BUILDER_VERSION = "stage8-layout-contract-v1"
+LAYOUT_TARGET = "layout-contract"
+CONFIG_FILE_PATTERNS = ("*.yaml", "*.yml", "*.json")
+EDITORIAL_FILE_PATTERN = "stage7_editorial_*"
+
+# Each kind of curated file invalidates the subgraph rooted at these stages; the layout contract
+# sits below everything and is rebuilt for every change.
+WATCH_ROOT_STAGES: dict[str, tuple[str, ...]] = {
+    "overrides": ("canonical-events",),
+    "editorial": ("editorial-overlays",),
+    "headshots": (),
+}
+WATCH_EXPORT_NAMES = {
+    "presentation-contract": "presentation-contract.json",
+    "editorial-overlays": "editorial-overlays.json",
+    LAYOUT_TARGET: "layout-contract.json",
+}
+
+
+@dataclass(frozen=True)
+class WatchTargets:
+    overrides_path: Path = Path("configs/data")
+    editorial_input_path: Path = Path("configs/data")
+    headshot_manifest_path: Path = HEADSHOT_MANIFEST_PATH
+
+    def _files(self, root: Path) -> list[Path]:
+        if root.is_file():
+            return [root]
+        if not root.exists():
+            return []
+        return sorted(path for pattern in CONFIG_FILE_PATTERNS for path in root.rglob(pattern))
+
+    def watched_files(self) -> dict[Path, str]:
+        headshot_manifest = self.headshot_manifest_path.resolve()
+        kinds: dict[Path, str] = {headshot_manifest: "headshots"}
+        for path in self._files(self.editorial_input_path):
+            if fnmatch(path.name, EDITORIAL_FILE_PATTERN):
+                kinds.setdefault(path.resolve(), "editorial")
+        for path in self._files(self.overrides_path):
+            kinds.setdefault(path.resolve(), "overrides")
+        return kinds
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ConfigWatcher:
+    # Polls mtime and size, so no platform file-event dependency; created and deleted files count as edits.
+    def __init__(self, targets: WatchTargets) -> None:
+        self.targets = targets
+        self._signatures = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[str, tuple[int, int] | None]]:
+        return {path: (kind, _file_signature(path)) for path, kind in self.targets.watched_files().items()}
+
+    def poll(self) -> set[str]:
+        signatures = self._snapshot()
+        changed = {
+            kind
+            for path, (kind, signature) in signatures.items()
+            if self._signatures.get(path, (kind, None))[1] != signature
+        }
+        changed.update(kind for path, (kind, _) in self._signatures.items() if path not in signatures)
+        self._signatures = signatures
+        return changed
+
+
+def affected_stages(kinds: Iterable[str], stages: Iterable[StageSpec]) -> list[str]:
+    stages_list = list(stages)
+    kinds_set = set(kinds)
+    unknown = kinds_set - set(WATCH_ROOT_STAGES)
+    if unknown:
+        raise ValueError(f"unknown watch change kind: {', '.join(sorted(unknown))}")
+    dirty = {name for kind in kinds_set for name in WATCH_ROOT_STAGES[kind]}
+    order = topological_order(stages_list)
+    stages_by_name = {stage.name: stage for stage in stages_list}
+    for name in order:
+        if any(dependency in dirty for dependency in stages_by_name[name].persist_dependencies()):
+            dirty.add(name)
+    affected = [name for name in order if name in dirty]
+    return [*affected, LAYOUT_TARGET] if kinds_set else affected
+
+
+@dataclass(frozen=True)
+class WatchRebuildResult:
+    kinds: list[str]
+    stages: list[str]
+    counts_by_stage: dict[str, JsonDict]
+    written_paths: list[Path]
+    wall_seconds: float
+
+    def counts(self) -> JsonDict:
+        return {
+            "kinds": self.kinds,
+            "stages": self.stages,
+            "counts_by_stage": self.counts_by_stage,
+            "written_paths": [str(path) for path in self.written_paths],
+            "wall_seconds": round(self.wall_seconds, 6),
+        }
+
+
+def rebuild_affected(
+    repository: StageRepository,
+    kinds: Iterable[str],
+    *,
+    targets: WatchTargets = WatchTargets(),
+    builder_versions: dict[str, str] | None = None,
+    franchise: Franchise = DEFAULT_FRANCHISE,
+    layout_builder_version: str = DEFAULT_LAYOUT_BUILDER_VERSION,
+    frontend_public_root: Path | str = FRONTEND_PUBLIC_ROOT,
+    output_dir: Path | None = None,
+) -> WatchRebuildResult:
+    started = time.perf_counter()
+    kinds_list = sorted(set(kinds))
+    versions = {**STAGE_BUILDER_VERSIONS, **(builder_versions or {})}
+    stages = affected_stages(kinds_list, default_stage_graph(builder_versions=versions, franchise=franchise))
+    counts_by_stage: dict[str, JsonDict] = {}
+    exports: dict[str, str] = {}
+    try:
+        if "overrides" in kinds_list:
+            # The watched directory is the whole curated set, so deleting an override file or entry takes effect.
+            counts_by_stage["overrides"] = repository.replace_override_bundle(load_override_bundle(targets.overrides_path))
+
+        for name in stages:
+            if name == "editorial-overlays":
+                counts_by_stage[name] = run_editorial_stage(
+                    repository,
+                    input_path=targets.editorial_input_path,
+                    builder_version=versions[name],
+                )
+                if output_dir is not None:
+                    exports[name] = editorial_overlays_to_json(repository.fetch_editorial_overlays())
+            elif name == LAYOUT_TARGET:
+                try:
+                    editorial_result = repository.fetch_editorial_overlays()
+                except RuntimeError:
+                    editorial_result = None
+                layout_result = build_layout_contract(
+                    presentation_result=repository.fetch_presentation_contract(),
+                    editorial_overlays=editorial_result,
+                    builder_version=layout_builder_version,
+                    headshot_manifest_path=targets.headshot_manifest_path,
+                    frontend_public_root=frontend_public_root,
+                )
+                counts_by_stage[name] = layout_result.counts()
+                if output_dir is not None:
+                    exports[name] = layout_contract_to_json(layout_result)
+            else:
+                options = {"franchise": franchise} if name in FRANCHISE_SCOPED_STAGES else {}
+                counts_by_stage[name] = run_stage(name, repository, builder_version=versions[name], **options)
+                if name == "presentation-contract" and output_dir is not None:
+                    exports[name] = presentation_contract_to_json(repository.fetch_presentation_contract())
+    except BaseException:
+        # A stage that failed part-way must not leave its writes, or an aborted Postgres transaction,
+        # in the session's warm handle.
+        repository.rollback()
+        raise
+    repository.commit()
+
+    written_paths: list[Path] = []
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, payload in exports.items():
+            path = output_dir / WATCH_EXPORT_NAMES[name]
+            path.write_text(payload + "\n", encoding="utf-8")
+            written_paths.append(path)
+    return WatchRebuildResult(
+        kinds=kinds_list,
+        stages=stages,
+        counts_by_stage=counts_by_stage,
+        written_paths=written_paths,
+        wall_seconds=time.perf_counter() - started,
+    )
+
+
+def watch_configs(
+    repository: StageRepository,
+    *,
+    targets: WatchTargets = WatchTargets(),
+    poll_seconds: float = DEFAULT_WATCH_POLL_SECONDS,
+    max_rebuilds: int | None = None,
+    on_rebuild: Callable[[WatchRebuildResult], None] | None = None,
+    on_error: Callable[[Exception], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    **rebuild_options: Any,
+) -> int:
+    # The repository stays open for the whole session, so each rebuild starts from warm state
+    # instead of reloading the store.
+    # A failed rebuild is rolled back and its kinds stay pending, so the next edit rebuilds the
+    # whole invalidated subgraph again. Any error is reported rather than ending the session: a
+    # half-saved file can fail in the YAML parser as easily as in a stage.
+    watcher = ConfigWatcher(targets)
+    pending: set[str] = set()
+    rebuilds = 0
+    while max_rebuilds is None or rebuilds < max_rebuilds:
+        sleep(poll_seconds)
+        kinds = watcher.poll()
+        if not kinds:
+            continue
+        kinds |= pending
+        rebuilds += 1
+        try:
+            result = rebuild_affected(repository, kinds, targets=targets, **rebuild_options)
+        except Exception as exc:
+            if on_error is None:
+                raise
+            pending = kinds
+            on_error(exc)
+            continue
+        pending = set()
+        if on_rebuild is not None:
+            on_rebuild(result)
+    return rebuilds
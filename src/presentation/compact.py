@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import re
+import struct
+import sys
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from shared.ids import IdDictionary
+
+
+JsonDict = dict[str, Any]
+
+COMPACT_CONTRACT_FORMAT = "compact-contract-v1"
+COMPACT_MAGIC = b"NBAC"
+COMPACT_VERSION = 1
+COMPACT_ALIGNMENT = 8
+INT32_NULL = -(2**31)
+INT32_MAX = 2**31 - 1
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_COMPACT_PREFIX = struct.Struct("<4sII")
+
+
+def _is_iso_date(value: str) -> bool:
+    if not _ISO_DATE.match(value):
+        return False
+    try:
+        return date.fromisoformat(value).isoformat() == value
+    except ValueError:
+        return False
+
+
+def _origin_date(payload: JsonDict) -> date:
+    layout_meta = payload.get("layout_meta")
+    if isinstance(layout_meta, dict) and isinstance(layout_meta.get("start_date"), str) and _is_iso_date(layout_meta["start_date"]):
+        return date.fromisoformat(layout_meta["start_date"])
+    found: list[str] = []
+    stack: list[Any] = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and _is_iso_date(value):
+            found.append(value)
+    return date.fromisoformat(min(found)) if found else date(1970, 1, 1)
+
+
+class _Encoder:
+    def __init__(self, origin: date) -> None:
+        self.origin_ordinal = origin.toordinal()
+        self.strings = IdDictionary()
+        self.buffers: list[array] = []
+
+    def intern(self, value: str) -> int:
+        return self.strings.encode(value)
+
+    def buffer(self, typecode: str, values: list[Any]) -> int:
+        self.buffers.append(array(typecode, values))
+        return len(self.buffers) - 1
+
+    def value(self, value: Any) -> JsonDict:
+        if isinstance(value, dict):
+            return {"kind": "object", "fields": {key: self.value(item) for key, item in value.items()}}
+        if isinstance(value, list):
+            return {"kind": "column", "length": len(value), "column": self.column(value)}
+        return {"kind": "literal", "value": value}
+
+    def column(self, values: list[Any]) -> JsonDict:
+        # Each row type becomes typed arrays per field; anything irregular falls back to interned JSON text.
+        present = [value for value in values if value is not None]
+        if not present:
+            return {"type": "null"}
+        if all(isinstance(value, bool) for value in present):
+            return {"type": "bool", "buffer": self.buffer("b", [-1 if value is None else int(value) for value in values])}
+        if all(isinstance(value, int) and not isinstance(value, bool) and INT32_NULL < value <= INT32_MAX for value in present):
+            return {"type": "int", "buffer": self.buffer("i", [INT32_NULL if value is None else value for value in values])}
+        if all(isinstance(value, float) for value in present):
+            return {"type": "float", "buffer": self.buffer("d", [float("nan") if value is None else value for value in values])}
+        if all(isinstance(value, str) for value in present):
+            if all(_is_iso_date(value) for value in present):
+                offsets = [INT32_NULL if value is None else date.fromisoformat(value).toordinal() - self.origin_ordinal for value in values]
+                return {"type": "date", "buffer": self.buffer("i", offsets)}
+            return {"type": "string", "buffer": self.buffer("i", [-1 if value is None else self.intern(value) for value in values])}
+        if len(present) == len(values) and all(isinstance(value, list) for value in values):
+            ends: list[int] = []
+            items: list[Any] = []
+            for value in values:
+                items.extend(value)
+                ends.append(len(items))
+            return {"type": "list", "ends": self.buffer("i", ends), "items": self.column(items)}
+        if len(present) == len(values) and all(isinstance(value, dict) for value in values):
+            keys = list(values[0])
+            if all(list(value) == keys for value in values):
+                return {"type": "struct", "fields": {key: self.column([value[key] for value in values]) for key in keys}}
+        return {
+            "type": "json",
+            "buffer": self.buffer(
+                "i",
+                [-1 if value is None else self.intern(json.dumps(value, sort_keys=True, separators=(",", ":"))) for value in values],
+            ),
+        }
+
+
+def _little_endian_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_compact_contract(payload: JsonDict) -> bytes:
+    origin = _origin_date(payload)
+    encoder = _Encoder(origin)
+    root = encoder.value(payload)
+
+    body = bytearray()
+    buffer_specs: list[JsonDict] = []
+    for values in encoder.buffers:
+        body.extend(b"\0" * (-len(body) % COMPACT_ALIGNMENT))
+        buffer_specs.append({"typecode": values.typecode, "offset": len(body), "count": len(values)})
+        body.extend(_little_endian_bytes(values))
+
+    header = json.dumps(
+        {
+            "format": COMPACT_CONTRACT_FORMAT,
+            "origin_date": origin.isoformat(),
+            "strings": encoder.strings.values(),
+            "buffers": buffer_specs,
+            "root": root,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    header += b" " * (-(len(header) + _COMPACT_PREFIX.size) % COMPACT_ALIGNMENT)
+    return _COMPACT_PREFIX.pack(COMPACT_MAGIC, COMPACT_VERSION, len(header)) + header + bytes(body)
+
+
+class _Decoder:
+    def __init__(self, header: JsonDict, body: bytes) -> None:
+        self.origin_ordinal = date.fromisoformat(header["origin_date"]).toordinal()
+        self.strings: list[str] = header["strings"]
+        self.buffers: list[array] = []
+        for spec in header["buffers"]:
+            values = array(spec["typecode"])
+            values.frombytes(body[spec["offset"] : spec["offset"] + spec["count"] * values.itemsize])
+            if sys.byteorder == "big":
+                values.byteswap()
+            self.buffers.append(values)
+
+    def value(self, node: JsonDict) -> Any:
+        if node["kind"] == "object":
+            return {key: self.value(item) for key, item in node["fields"].items()}
+        if node["kind"] == "column":
+            return self.column(node["column"], node["length"])
+        return node["value"]
+
+    def column(self, node: JsonDict, length: int) -> list[Any]:
+        column_type = node["type"]
+        if column_type == "null":
+            return [None] * length
+        if column_type == "struct":
+            fields = {key: self.column(child, length) for key, child in node["fields"].items()}
+            return [{key: values[index] for key, values in fields.items()} for index in range(length)]
+        if column_type == "list":
+            ends = self.buffers[node["ends"]]
+            items = self.column(node["items"], ends[-1] if ends else 0)
+            starts = [0, *ends[:-1]]
+            return [items[start:end] for start, end in zip(starts, ends)]
+        values = self.buffers[node["buffer"]]
+        if column_type == "bool":
+            return [None if value < 0 else bool(value) for value in values]
+        if column_type == "int":
+            return [None if value == INT32_NULL else value for value in values]
+        if column_type == "float":
+            return [None if value != value else value for value in values]
+        if column_type == "date":
+            return [None if value == INT32_NULL else date.fromordinal(self.origin_ordinal + value).isoformat() for value in values]
+        if column_type == "string":
+            return [None if value < 0 else self.strings[value] for value in values]
+        if column_type == "json":
+            return [None if value < 0 else json.loads(self.strings[value]) for value in values]
+        raise ValueError(f"unknown compact column type: {column_type}")
+
+
+def decode_compact_contract(data: bytes) -> JsonDict:
+    if len(data) < _COMPACT_PREFIX.size:
+        raise ValueError("compact contract is truncated")
+    magic, version, header_length = _COMPACT_PREFIX.unpack_from(data)
+    if magic != COMPACT_MAGIC or version != COMPACT_VERSION:
+        raise ValueError(f"unsupported compact contract: {magic!r} v{version}")
+    header_end = _COMPACT_PREFIX.size + header_length
+    header = json.loads(data[_COMPACT_PREFIX.size : header_end].decode("utf-8"))
+    if header.get("format") != COMPACT_CONTRACT_FORMAT:
+        raise ValueError(f"unsupported compact contract format: {header.get('format')}")
+    return _Decoder(header, data[header_end:]).value(header["root"])
+
+
+def write_compact_contract(payload: JsonDict, output_path: Path | str) -> Path:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_compact_contract(payload))
+    return path
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import json
+import math
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Iterable
 
-import yaml
-
 from canonical.models import (
     AssetState,
     CanonicalAsset,
@@ -26,19 +26,28 @@ from presentation.models import (
     EventLayoutRow,
     IdentityMarker,
     LabelLayoutRow,
+    LabelPlacement,
     LaneLayoutRow,
     LayoutBuild,
     LayoutContractBuildResult,
+    LayoutLodTier,
     LayoutMeta,
+    LayoutSpatialIndex,
+    LodEventCluster,
+    LodSegment,
     MinimapSegment,
     PresentationBuild,
     PresentationContractBuildResult,
+    SpatialIndexEntry,
+    SpatialIndexLane,
     TimelineEdge,
     TimelineNode,
     TransitionAnchor,
     TransitionLink,
 )
+from shared.config_cache import load_cached_file, load_yaml_text
 from shared.ids import stable_id, stable_payload_hash
+from shared.profiling import traced
 
 
 PICK_STAGE_ORDER = {
@@ -58,7 +67,22 @@ EXPLICIT_STATUS_KEYS = ("contract_type", "roster_status")
 DEFAULT_LAYOUT_WINDOW_DAYS = 180
 DEFAULT_LAYOUT_MIN_ZOOM_DAYS = 30
 DEFAULT_LAYOUT_DAY_WIDTH = 6.0
+LAYOUT_LOD_ZOOM_FACTOR = 4
+LAYOUT_LOD_MIN_SEGMENT_PIXELS = 2.0
+LAYOUT_LOD_MIN_LABEL_PIXELS = 48.0
+# Label geometry mirrors the frontend estimate in frontend/src/lib/timeline.ts.
+LAYOUT_LABEL_FONT_SIZE = 12
+LAYOUT_LABEL_CHAR_WIDTH_RATIO = 0.58
+LAYOUT_INLINE_LABEL_PADDING_PIXELS = 12
+LAYOUT_INLINE_LABEL_CLEARANCE_PIXELS = 28
+LAYOUT_MARKER_PADDING_PIXELS = 12
+LAYOUT_MARKER_HEADSHOT_PIXELS = 28
+LAYOUT_MARKER_OFFSET_PIXELS = 14
+LAYOUT_SPATIAL_BUCKET_DAYS = DEFAULT_LAYOUT_MIN_ZOOM_DAYS
+SPATIAL_EVENT_LANE_KEY = "events"
 HEADSHOT_MANIFEST_PATH = Path("configs/data/stage8_headshot_manifest.yaml")
+HEADSHOT_MANIFEST_CACHE_NAMESPACE = "headshot-manifest-v1"
+PRESENTATION_BUILDS_RETAINED = 5
 FRONTEND_PUBLIC_ROOT = Path("frontend/public")
 
 
@@ -249,6 +273,7 @@ def _assign_lanes(edges: list[TimelineEdge], *, built_at: datetime) -> tuple[lis
     )
 
 
+@traced("build")
 def build_presentation_contract(
     *,
     events: Iterable[CanonicalEvent],
@@ -449,11 +474,8 @@ def _segment_label(edge: TimelineEdge) -> str:
     )
 
 
-def _load_headshot_manifest(manifest_path: Path | str) -> dict[str, str]:
-    path = Path(manifest_path)
-    if not path.exists():
-        return {}
-    payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+def _parse_headshot_manifest(path: Path, raw_text: str) -> dict[str, str]:
+    payload = load_yaml_text(raw_text)
     if payload is None:
         return {}
     if isinstance(payload, dict) and isinstance(payload.get("headshots"), dict):
@@ -469,6 +491,13 @@ def _load_headshot_manifest(manifest_path: Path | str) -> dict[str, str]:
     return manifest
 
 
+def _load_headshot_manifest(manifest_path: Path | str) -> dict[str, str]:
+    path = Path(manifest_path)
+    if not path.exists():
+        return {}
+    return load_cached_file(path, HEADSHOT_MANIFEST_CACHE_NAMESPACE, lambda raw_text: _parse_headshot_manifest(path, raw_text))
+
+
 def _resolved_identity_marker(
     *,
     asset_id: str,
@@ -666,6 +695,407 @@ def _expected_transition_link_specs(
     return specs
 
 
+def _lod_zoom_ranges(total_days: int) -> list[tuple[int, int]]:
+    ranges = [(DEFAULT_LAYOUT_MIN_ZOOM_DAYS, DEFAULT_LAYOUT_WINDOW_DAYS)]
+    while ranges[-1][1] < total_days:
+        min_zoom_days = ranges[-1][1]
+        ranges.append((min_zoom_days, min(min_zoom_days * LAYOUT_LOD_ZOOM_FACTOR, total_days)))
+    return ranges
+
+
+def _days_for_pixels(pixels: float, zoom_days: int) -> int:
+    viewport_pixels = DEFAULT_LAYOUT_WINDOW_DAYS * DEFAULT_LAYOUT_DAY_WIDTH
+    return max(1, math.ceil(pixels * zoom_days / viewport_pixels))
+
+
+def _lod_segments(
+    lane_layout: list[LaneLayoutRow],
+    label_by_segment_id: dict[str, LabelLayoutRow],
+    *,
+    min_zoom_days: int,
+    min_segment_days: int,
+    min_label_days: int,
+) -> list[LodSegment]:
+    rows_by_lane: dict[tuple[str, int], list[LaneLayoutRow]] = defaultdict(list)
+    for row in lane_layout:
+        rows_by_lane[(row.lane_group, row.band_slot)].append(row)
+
+    segments: list[LodSegment] = []
+    for (lane_group, band_slot), lane_rows in sorted(rows_by_lane.items()):
+        groups: list[list[LaneLayoutRow]] = []
+        group_end: date | None = None
+        for row in sorted(lane_rows, key=lambda item: (item.date_start, item.date_end, item.segment_id)):
+            if groups and group_end is not None and (row.date_start - group_end).days <= min_segment_days and (
+                _segment_duration_days(groups[-1][0].date_start, group_end) < min_segment_days
+                or _segment_duration_days(row.date_start, row.date_end) < min_segment_days
+            ):
+                groups[-1].append(row)
+                group_end = max(group_end, row.date_end)
+                continue
+            groups.append([row])
+            group_end = row.date_end
+
+        for group in groups:
+            date_start = min(row.date_start for row in group)
+            date_end = max(row.date_end for row in group)
+            primary = min(
+                group,
+                key=lambda row: (-_segment_duration_days(row.date_start, row.date_end), row.display_rank, row.segment_id),
+            )
+            label_allowed = _segment_duration_days(date_start, date_end) >= min_label_days and any(
+                label_by_segment_id[row.segment_id].inline_label_allowed for row in group
+            )
+            member_segment_ids = [row.segment_id for row in group]
+            segments.append(
+                LodSegment(
+                    lod_segment_id=stable_id("layout_lod_segment", min_zoom_days, *member_segment_ids),
+                    lane_group=lane_group,
+                    band_slot=band_slot,
+                    date_start=date_start,
+                    date_end=date_end,
+                    primary_asset_id=primary.asset_id,
+                    member_segment_ids=member_segment_ids,
+                    asset_ids=sorted({row.asset_id for row in group}),
+                    label_text=primary.identity_marker.label_text if label_allowed else None,
+                    label_priority=min(row.display_rank for row in group),
+                )
+            )
+    return segments
+
+
+def _lod_event_clusters(event_layout: list[EventLayoutRow], *, min_zoom_days: int, bucket_days: int) -> list[LodEventCluster]:
+    buckets: list[list[EventLayoutRow]] = []
+    for row in sorted(event_layout, key=lambda item: (item.cluster_date, item.cluster_order, item.cluster_id)):
+        if buckets and (row.cluster_date - buckets[-1][0].cluster_date).days < bucket_days:
+            buckets[-1].append(row)
+        else:
+            buckets.append([row])
+    return [
+        LodEventCluster(
+            lod_cluster_id=stable_id("layout_lod_cluster", min_zoom_days, *(row.cluster_id for row in bucket)),
+            date_start=bucket[0].cluster_date,
+            date_end=bucket[-1].cluster_date,
+            anchor_date=max(bucket, key=lambda row: (len(row.member_event_ids), -row.cluster_date.toordinal())).cluster_date,
+            member_cluster_ids=[row.cluster_id for row in bucket],
+            event_count=sum(len(row.member_event_ids) for row in bucket),
+        )
+        for bucket in buckets
+    ]
+
+
+def _estimate_label_pixels(text: str) -> int:
+    font_size = LAYOUT_LABEL_FONT_SIZE
+    return max(font_size * 3, math.floor(len(text) * font_size * LAYOUT_LABEL_CHAR_WIDTH_RATIO + 0.5))
+
+
+@dataclass(frozen=True)
+class _LabelCandidate:
+    segment_id: str
+    lane_group: str
+    band_slot: int
+    start: int
+    label_priority: int
+    kind: str
+    width: int
+    preferred: int
+    latest: int
+
+
+def _label_candidate(
+    *,
+    segment_id: str,
+    lane_group: str,
+    band_slot: int,
+    date_start: date,
+    date_end: date,
+    marker: IdentityMarker,
+    inline_allowed: bool,
+    marker_allowed: bool,
+    label_priority: int,
+    max_zoom_days: int,
+) -> _LabelCandidate:
+    # Widths are converted at the tier's widest zoom, so a placement stays clear as the client zooms in.
+    duration_days = _segment_duration_days(date_start, date_end)
+    text_pixels = _estimate_label_pixels(marker.label_text)
+    inline_days = _days_for_pixels(text_pixels + LAYOUT_INLINE_LABEL_PADDING_PIXELS * 2, max_zoom_days)
+    clearance_days = _days_for_pixels(LAYOUT_INLINE_LABEL_CLEARANCE_PIXELS, max_zoom_days)
+    if inline_allowed and duration_days >= inline_days + clearance_days:
+        slack = duration_days - inline_days
+        kind, width, preferred, latest = "inline", inline_days, slack // 2, slack
+    elif marker_allowed:
+        marker_pixels = text_pixels + LAYOUT_MARKER_PADDING_PIXELS * 2
+        if marker.marker_variant == "headshot_text" and marker.image_path:
+            marker_pixels += LAYOUT_MARKER_HEADSHOT_PIXELS + LAYOUT_MARKER_PADDING_PIXELS
+        offset_days = _days_for_pixels(LAYOUT_MARKER_OFFSET_PIXELS, max_zoom_days)
+        kind, width = "marker", _days_for_pixels(marker_pixels, max_zoom_days)
+        preferred, latest = offset_days, max(offset_days, duration_days - 1)
+    else:
+        kind, width, preferred, latest = "none", 0, 0, -1
+    return _LabelCandidate(
+        segment_id=segment_id,
+        lane_group=lane_group,
+        band_slot=band_slot,
+        start=date_start.toordinal(),
+        label_priority=label_priority,
+        kind=kind,
+        width=width,
+        preferred=preferred,
+        latest=latest,
+    )
+
+
+def _label_placement(candidate: _LabelCandidate, *, offset_days: int | None, suppressed_reason: str | None) -> LabelPlacement:
+    return LabelPlacement(
+        segment_id=candidate.segment_id,
+        lane_group=candidate.lane_group,
+        band_slot=candidate.band_slot,
+        placement_kind=candidate.kind,
+        placed=offset_days is not None,
+        suppressed_reason=suppressed_reason,
+        offset_days=candidate.preferred if offset_days is None else offset_days,
+        width_days=candidate.width,
+        label_priority=candidate.label_priority,
+    )
+
+
+def _place_labels(candidates: list[_LabelCandidate]) -> list[LabelPlacement]:
+    lanes: dict[tuple[str, int], list[_LabelCandidate]] = defaultdict(list)
+    for candidate in candidates:
+        lanes[(candidate.lane_group, candidate.band_slot)].append(candidate)
+
+    placements: list[LabelPlacement] = []
+    for lane_key in sorted(lanes):
+        # One left-to-right sweep per lane: each label slides right within its segment to clear the
+        # previous box, and only when it cannot does the lower-priority of the two colliding labels drop.
+        placed: list[tuple[_LabelCandidate, int]] = []
+        suppressed: list[_LabelCandidate] = []
+        for candidate in sorted(lanes[lane_key], key=lambda row: (row.start + row.preferred, row.label_priority, row.segment_id)):
+            if candidate.kind == "none":
+                suppressed.append(candidate)
+                continue
+
+            def fit(stack_depth: int) -> int | None:
+                floor = placed[stack_depth - 1][1] + placed[stack_depth - 1][0].width if stack_depth else candidate.start
+                offset = max(candidate.preferred, floor - candidate.start)
+                return offset if offset <= candidate.latest else None
+
+            offset = fit(len(placed))
+            if offset is None and placed and candidate.label_priority < placed[-1][0].label_priority:
+                offset = fit(len(placed) - 1)
+                if offset is not None:
+                    suppressed.append(placed.pop()[0])
+            if offset is None:
+                suppressed.append(candidate)
+                continue
+            placed.append((candidate, candidate.start + offset))
+
+        placements.extend(
+            _label_placement(candidate, offset_days=start - candidate.start, suppressed_reason=None) for candidate, start in placed
+        )
+        placements.extend(
+            _label_placement(
+                candidate,
+                offset_days=None,
+                suppressed_reason="collision" if candidate.kind != "none" else "no_label",
+            )
+            for candidate in suppressed
+        )
+    return sorted(placements, key=lambda row: (row.lane_group, row.band_slot, row.segment_id))
+
+
+def _full_tier_label_placements(
+    lane_layout: list[LaneLayoutRow],
+    label_by_segment_id: dict[str, LabelLayoutRow],
+    *,
+    max_zoom_days: int,
+) -> list[LabelPlacement]:
+    return _place_labels(
+        [
+            _label_candidate(
+                segment_id=row.segment_id,
+                lane_group=row.lane_group,
+                band_slot=row.band_slot,
+                date_start=row.date_start,
+                date_end=row.date_end,
+                marker=row.identity_marker,
+                inline_allowed=label_by_segment_id[row.segment_id].inline_label_allowed,
+                marker_allowed=label_by_segment_id[row.segment_id].marker_side == "left",
+                label_priority=label_by_segment_id[row.segment_id].label_priority,
+                max_zoom_days=max_zoom_days,
+            )
+            for row in lane_layout
+        ]
+    )
+
+
+def _lod_label_placements(
+    segments: list[LodSegment],
+    lane_by_segment_id: dict[str, LaneLayoutRow],
+    *,
+    max_zoom_days: int,
+) -> list[LabelPlacement]:
+    candidates = []
+    for segment in segments:
+        primary = next(
+            lane_by_segment_id[segment_id]
+            for segment_id in segment.member_segment_ids
+            if lane_by_segment_id[segment_id].asset_id == segment.primary_asset_id
+        )
+        candidates.append(
+            _label_candidate(
+                segment_id=segment.lod_segment_id,
+                lane_group=segment.lane_group,
+                band_slot=segment.band_slot,
+                date_start=segment.date_start,
+                date_end=segment.date_end,
+                marker=primary.identity_marker,
+                inline_allowed=segment.label_text is not None,
+                marker_allowed=True,
+                label_priority=segment.label_priority,
+                max_zoom_days=max_zoom_days,
+            )
+        )
+    return _place_labels(candidates)
+
+
+def _build_lod_tiers(
+    *,
+    start_date: date,
+    end_date: date,
+    lane_layout: list[LaneLayoutRow],
+    event_layout: list[EventLayoutRow],
+    label_layout: list[LabelLayoutRow],
+) -> list[LayoutLodTier]:
+    label_by_segment_id = {row.segment_id: row for row in label_layout}
+    lane_by_segment_id = {row.segment_id: row for row in lane_layout}
+    tiers: list[LayoutLodTier] = []
+    for tier_index, (min_zoom_days, max_zoom_days) in enumerate(_lod_zoom_ranges(_segment_duration_days(start_date, end_date))):
+        tier_id = stable_id("layout_lod_tier", min_zoom_days, max_zoom_days)
+        if tier_index == 0:
+            # The finest tier is the full-resolution lane_layout/event_layout itself.
+            tiers.append(
+                LayoutLodTier(
+                    tier_id=tier_id,
+                    tier_index=tier_index,
+                    detail_level="full",
+                    min_zoom_days=min_zoom_days,
+                    max_zoom_days=max_zoom_days,
+                    min_segment_days=1,
+                    min_label_days=1,
+                    segments=[],
+                    event_clusters=[],
+                    label_placements=_full_tier_label_placements(lane_layout, label_by_segment_id, max_zoom_days=max_zoom_days),
+                )
+            )
+            continue
+        min_segment_days = _days_for_pixels(LAYOUT_LOD_MIN_SEGMENT_PIXELS, max_zoom_days)
+        min_label_days = _days_for_pixels(LAYOUT_LOD_MIN_LABEL_PIXELS, max_zoom_days)
+        segments = _lod_segments(
+            lane_layout,
+            label_by_segment_id,
+            min_zoom_days=min_zoom_days,
+            min_segment_days=min_segment_days,
+            min_label_days=min_label_days,
+        )
+        tiers.append(
+            LayoutLodTier(
+                tier_id=tier_id,
+                tier_index=tier_index,
+                detail_level="aggregated",
+                min_zoom_days=min_zoom_days,
+                max_zoom_days=max_zoom_days,
+                min_segment_days=min_segment_days,
+                min_label_days=min_label_days,
+                segments=segments,
+                event_clusters=_lod_event_clusters(event_layout, min_zoom_days=min_zoom_days, bucket_days=min_segment_days),
+                label_placements=_lod_label_placements(segments, lane_by_segment_id, max_zoom_days=max_zoom_days),
+            )
+        )
+    return tiers
+
+
+def spatial_lane_key(lane_group: str, band_slot: int) -> str:
+    return f"{lane_group}:{band_slot}"
+
+
+def spatial_bucket_range(origin_date: date, bucket_days: int, bucket_count: int, date_start: date, date_end: date) -> range:
+    first = (date_start - origin_date).days // bucket_days
+    last = (date_end - origin_date).days // bucket_days
+    return range(max(0, first), min(bucket_count - 1, last) + 1)
+
+
+def spatial_entry(
+    origin_date: date, bucket_days: int, bucket_count: int, row_index: int, date_start: date, date_end: date
+) -> SpatialIndexEntry | None:
+    buckets = spatial_bucket_range(origin_date, bucket_days, bucket_count, date_start, date_end)
+    return (buckets.start, len(buckets), row_index) if buckets else None
+
+
+def _build_spatial_index(
+    *,
+    start_date: date,
+    end_date: date,
+    lane_layout: list[LaneLayoutRow],
+    event_layout: list[EventLayoutRow],
+    label_placements: list[LabelPlacement],
+    bucket_days: int = LAYOUT_SPATIAL_BUCKET_DAYS,
+) -> LayoutSpatialIndex:
+    # One (start_bucket, bucket_span, row_index) entry per row per lane, sorted by start, so a viewport
+    # query bisects each lane instead of reading a cell per bucket a long segment covers.
+    bucket_count = _segment_duration_days(start_date, end_date) // bucket_days + 1
+    entries: dict[str, dict[str, list[SpatialIndexEntry]]] = defaultdict(
+        lambda: {"segment_entries": [], "event_cluster_entries": [], "label_entries": []}
+    )
+
+    def add(kind: str, lane_key: str, row_index: int, date_start: date, date_end: date) -> None:
+        entry = spatial_entry(start_date, bucket_days, bucket_count, row_index, date_start, date_end)
+        if entry is not None:
+            entries[lane_key][kind].append(entry)
+
+    segments_by_asset_id: dict[str, list[LaneLayoutRow]] = defaultdict(list)
+    lane_by_segment_id: dict[str, LaneLayoutRow] = {}
+    for row_index, row in enumerate(lane_layout):
+        segments_by_asset_id[row.asset_id].append(row)
+        lane_by_segment_id[row.segment_id] = row
+        add("segment_entries", spatial_lane_key(row.lane_group, row.band_slot), row_index, row.date_start, row.date_end)
+
+    for row_index, row in enumerate(label_placements):
+        segment = lane_by_segment_id.get(row.segment_id)
+        if not row.placed or segment is None:
+            continue
+        label_start = segment.date_start + timedelta(days=row.offset_days)
+        add(
+            "label_entries",
+            spatial_lane_key(row.lane_group, row.band_slot),
+            row_index,
+            label_start,
+            label_start + timedelta(days=max(0, row.width_days - 1)),
+        )
+
+    # A cluster is hit-tested in every lane whose segment touches it on the cluster date.
+    for row_index, row in enumerate(event_layout):
+        lane_keys = {
+            spatial_lane_key(segment.lane_group, segment.band_slot)
+            for asset_id in row.connected_asset_ids
+            for segment in segments_by_asset_id.get(asset_id, [])
+            if segment.date_start <= row.cluster_date <= segment.date_end
+        } or {SPATIAL_EVENT_LANE_KEY}
+        for lane_key in sorted(lane_keys):
+            add("event_cluster_entries", lane_key, row_index, row.cluster_date, row.cluster_date)
+
+    lanes: list[SpatialIndexLane] = []
+    for lane_key in sorted(entries, key=lambda key: (key == SPATIAL_EVENT_LANE_KEY, key)):
+        members = {kind: sorted(rows) for kind, rows in entries[lane_key].items()}
+        lanes.append(
+            SpatialIndexLane(
+                lane_key=lane_key,
+                max_bucket_span=max(span for rows in members.values() for _, span, _ in rows),
+                **members,
+            )
+        )
+    return LayoutSpatialIndex(origin_date=start_date, bucket_days=bucket_days, bucket_count=bucket_count, lanes=lanes)
+
+
 def _chapter_window(value: Any, *, fallback_start: date, fallback_end: date) -> tuple[date, date]:
     if isinstance(value, dict):
         start_text = str(value.get("start_date") or "").strip()
@@ -699,6 +1129,7 @@ def _chapter_default_zoom(value: Any) -> int | None:
     return min(zoom, DEFAULT_LAYOUT_WINDOW_DAYS)
 
 
+@traced("build")
 def build_layout_contract(
     *,
     presentation_result: PresentationContractBuildResult,
@@ -1012,6 +1443,13 @@ def build_layout_contract(
         editorial_build_id=editorial_overlays.build.editorial_build_id if editorial_overlays is not None else None,
         notes="Stage 8 layout contract build",
     )
+    lod_tiers = _build_lod_tiers(
+        start_date=start_date,
+        end_date=end_date,
+        lane_layout=lane_layout,
+        event_layout=event_layout,
+        label_layout=label_layout,
+    )
     return LayoutContractBuildResult(
         build=build,
         layout_meta=layout_meta,
@@ -1019,6 +1457,14 @@ def build_layout_contract(
         event_layout=event_layout,
         label_layout=label_layout,
         chapter_layout=chapter_layout,
+        lod_tiers=lod_tiers,
+        spatial_index=_build_spatial_index(
+            start_date=start_date,
+            end_date=end_date,
+            lane_layout=lane_layout,
+            event_layout=event_layout,
+            label_placements=lod_tiers[0].label_placements,
+        ),
     )
 
 
@@ -1177,15 +1623,6 @@ def fetch_presentation_contract_build_inputs(
             """
         )
         flow_rows = cur.fetchall()
-        cur.execute(
-            """
-            select canonical_build_id
-            from canonical.builds
-            order by built_at desc, canonical_build_id desc
-            limit 1
-            """
-        )
-        build_row = cur.fetchone()
 
     events = [
         CanonicalEvent(
@@ -1309,15 +1746,30 @@ def fetch_presentation_contract_build_inputs(
         pick_resolutions,
         asset_states,
         event_asset_flows,
-        build_row[0] if build_row else None,
+        fetch_latest_canonical_build_id(conn),
+    )
+
+
+def _swap_current_presentation_build(cur: Any, presentation_build_id: str) -> None:
+    cur.execute(
+        """
+        insert into presentation.current_build (singleton, presentation_build_id, previous_presentation_build_id, swapped_at)
+        values (true, %s, null, now())
+        on conflict (singleton) do update
+        set previous_presentation_build_id = presentation.current_build.presentation_build_id,
+            presentation_build_id = excluded.presentation_build_id,
+            swapped_at = excluded.swapped_at
+        where presentation.current_build.presentation_build_id <> excluded.presentation_build_id
+        """,
+        (presentation_build_id,),
     )
 
 
 def persist_presentation_contract_build(conn: Any, result: PresentationContractBuildResult) -> dict[str, int]:
+    # Rows land under the new build ID next to the current build; readers keep the old
+    # build until the pointer swap commits with them.
+    build_id = result.build.presentation_build_id
     with conn.cursor() as cur:
-        cur.execute("delete from presentation.timeline_edges")
-        cur.execute("delete from presentation.asset_lanes")
-        cur.execute("delete from presentation.timeline_nodes")
         cur.execute(
             """
             insert into presentation.builds (
@@ -1340,7 +1792,8 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
         for row in result.nodes:
             cur.execute(
                 """
-                insert into presentation.timeline_nodes (
+                insert into presentation.build_timeline_nodes (
+                    presentation_build_id,
                     node_id,
                     event_id,
                     event_date,
@@ -1350,9 +1803,10 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
                     payload,
                     created_at
                 )
-                values (%s, %s, %s, %s, %s, %s, %s::jsonb, %s)
+                values (%s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s)
                 """,
                 (
+                    build_id,
                     row.node_id,
                     row.event_id,
                     row.event_date,
@@ -1366,7 +1820,8 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
         for row in result.lanes:
             cur.execute(
                 """
-                insert into presentation.asset_lanes (
+                insert into presentation.build_asset_lanes (
+                    presentation_build_id,
                     asset_lane_id,
                     asset_id,
                     lane_group,
@@ -1376,9 +1831,10 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
                     assignment_method,
                     created_at
                 )
-                values (%s, %s, %s, %s, %s, %s, %s, %s)
+                values (%s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
+                    build_id,
                     row.asset_lane_id,
                     row.asset_id,
                     row.lane_group,
@@ -1392,7 +1848,8 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
         for row in result.edges:
             cur.execute(
                 """
-                insert into presentation.timeline_edges (
+                insert into presentation.build_timeline_edges (
+                    presentation_build_id,
                     edge_id,
                     asset_id,
                     source_node_id,
@@ -1405,9 +1862,10 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
                     payload,
                     created_at
                 )
-                values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s)
+                values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s)
                 """,
                 (
+                    build_id,
                     row.edge_id,
                     row.asset_id,
                     row.source_node_id,
@@ -1421,9 +1879,77 @@ def persist_presentation_contract_build(conn: Any, result: PresentationContractB
                     row.created_at,
                 ),
             )
+        _swap_current_presentation_build(cur, build_id)
     return result.counts()
 
 
+def fetch_latest_canonical_build_id(conn: Any) -> str | None:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            select canonical_build_id
+            from canonical.builds
+            order by built_at desc, canonical_build_id desc
+            limit 1
+            """
+        )
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def fetch_current_presentation_build_id(conn: Any) -> str | None:
+    with conn.cursor() as cur:
+        cur.execute("select presentation_build_id from presentation.current_build")
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def fetch_previous_presentation_build_id(conn: Any) -> str | None:
+    with conn.cursor() as cur:
+        cur.execute("select previous_presentation_build_id from presentation.current_build")
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def activate_presentation_build(conn: Any, presentation_build_id: str) -> dict[str, str | None]:
+    with conn.cursor() as cur:
+        cur.execute("select 1 from presentation.builds where presentation_build_id = %s", (presentation_build_id,))
+        if cur.fetchone() is None:
+            raise ValueError(f"unknown presentation build: {presentation_build_id}")
+        previous_build_id = fetch_current_presentation_build_id(conn)
+        _swap_current_presentation_build(cur, presentation_build_id)
+    return {"presentation_build_id": presentation_build_id, "previous_presentation_build_id": previous_build_id}
+
+
+def prune_presentation_builds(conn: Any, *, keep: int = PRESENTATION_BUILDS_RETAINED) -> dict[str, int]:
+    # The current and previous builds always survive so a rollback stays one pointer swap away.
+    if keep < 1:
+        raise ValueError("keep must be at least 1")
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            with retained as (
+                select presentation_build_id
+                from presentation.builds
+                order by built_at desc, presentation_build_id desc
+                limit %s
+            )
+            delete from presentation.builds
+            where presentation_build_id not in (select presentation_build_id from retained)
+              and presentation_build_id not in (
+                  select presentation_build_id from presentation.current_build
+                  union all
+                  select previous_presentation_build_id
+                  from presentation.current_build
+                  where previous_presentation_build_id is not null
+              )
+            """,
+            (keep,),
+        )
+        pruned = cur.rowcount
+    return {"pruned_presentation_build_count": pruned}
+
+
 def build_and_persist_presentation_contract(*, builder_version: str = "stage6-presentation-contract-v1") -> dict[str, int]:
     with _connect() as conn:
         (
@@ -1454,7 +1980,11 @@ def build_and_persist_presentation_contract(*, builder_version: str = "stage6-pr
     return counts
 
 
-def fetch_presentation_contract(conn: Any) -> PresentationContractBuildResult:
+def fetch_presentation_contract(conn: Any, *, presentation_build_id: str | None = None) -> PresentationContractBuildResult:
+    # Rows are read by explicit build ID so a pointer swap between statements cannot mix builds.
+    build_id = presentation_build_id or fetch_current_presentation_build_id(conn)
+    if build_id is None:
+        raise RuntimeError("no presentation build found")
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -1465,13 +1995,13 @@ def fetch_presentation_contract(conn: Any) -> PresentationContractBuildResult:
                 canonical_build_id,
                 notes
             from presentation.builds
-            order by built_at desc, presentation_build_id desc
-            limit 1
-            """
+            where presentation_build_id = %s
+            """,
+            (build_id,),
         )
         build_row = cur.fetchone()
         if build_row is None:
-            raise RuntimeError("no presentation build found")
+            raise RuntimeError(f"no presentation build found: {build_id}")
         cur.execute(
             """
             select
@@ -1483,9 +2013,11 @@ def fetch_presentation_contract(conn: Any) -> PresentationContractBuildResult:
                 label,
                 payload,
                 created_at
-            from presentation.timeline_nodes
+            from presentation.build_timeline_nodes
+            where presentation_build_id = %s
             order by event_date, event_order, coalesce(event_id, ''), node_id
-            """
+            """,
+            (build_id,),
         )
         node_rows = cur.fetchall()
         cur.execute(
@@ -1502,9 +2034,11 @@ def fetch_presentation_contract(conn: Any) -> PresentationContractBuildResult:
                 lane_index,
                 payload,
                 created_at
-            from presentation.timeline_edges
+            from presentation.build_timeline_edges
+            where presentation_build_id = %s
             order by start_date, end_date, lane_group, lane_index, asset_id, edge_id
-            """
+            """,
+            (build_id,),
         )
         edge_rows = cur.fetchall()
         cur.execute(
@@ -1518,9 +2052,11 @@ def fetch_presentation_contract(conn: Any) -> PresentationContractBuildResult:
                 effective_end_date,
                 assignment_method,
                 created_at
-            from presentation.asset_lanes
+            from presentation.build_asset_lanes
+            where presentation_build_id = %s
             order by lane_group, lane_index, effective_start_date, asset_id, asset_lane_id
-            """
+            """,
+            (build_id,),
         )
         lane_rows = cur.fetchall()
 
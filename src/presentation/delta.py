@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from shared.ids import stable_payload_hash
+
+
+JsonDict = dict[str, Any]
+
+CONTRACT_DELTA_FORMAT = "contract-delta-v2"
+# Row identity per exported collection, keyed by dotted path from the contract root; every ID here is a
+# deterministic stable_id. Nested paths let a changed LOD tier or spatial-index lane ship as a row patch.
+CONTRACT_ROW_ID_FIELDS = {
+    "nodes": "node_id",
+    "edges": "edge_id",
+    "lanes": "asset_lane_id",
+    "lane_layout": "segment_id",
+    "event_layout": "event_id",
+    "label_layout": "segment_id",
+    "chapter_layout": "story_chapter_id",
+    "lod_tiers": "tier_id",
+    "lod_tiers.segments": "lod_segment_id",
+    "lod_tiers.event_clusters": "lod_cluster_id",
+    "lod_tiers.label_placements": "segment_id",
+    "spatial_index.lanes": "lane_key",
+}
+
+
+def contract_content_hash(payload: JsonDict) -> str:
+    return stable_payload_hash(payload)
+
+
+@dataclass(frozen=True)
+class ObjectPatch:
+    replaced: JsonDict = field(default_factory=dict)
+    collections: dict[str, CollectionDelta] = field(default_factory=dict)
+    patched: dict[str, ObjectPatch] = field(default_factory=dict)
+    dropped_keys: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.replaced or self.collections or self.patched or self.dropped_keys)
+
+    def row_counts(self) -> tuple[int, int, int]:
+        counts = [row.row_counts() for row in (*self.collections.values(), *self.patched.values())]
+        return (
+            sum(row[0] for row in counts),
+            sum(row[1] for row in counts),
+            sum(row[2] for row in counts),
+        )
+
+    def as_dict(self) -> JsonDict:
+        payload: JsonDict = {}
+        if self.replaced:
+            payload["replaced"] = self.replaced
+        if self.collections:
+            payload["collections"] = {name: row.as_dict() for name, row in sorted(self.collections.items())}
+        if self.patched:
+            payload["patched"] = {name: row.as_dict() for name, row in sorted(self.patched.items())}
+        if self.dropped_keys:
+            payload["dropped_keys"] = self.dropped_keys
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: JsonDict) -> ObjectPatch:
+        return cls(
+            replaced=dict(payload.get("replaced", {})),
+            collections={name: CollectionDelta.from_dict(row) for name, row in payload.get("collections", {}).items()},
+            patched={name: cls.from_dict(row) for name, row in payload.get("patched", {}).items()},
+            dropped_keys=list(payload.get("dropped_keys", [])),
+        )
+
+
+@dataclass(frozen=True)
+class CollectionDelta:
+    id_field: str
+    added: list[JsonDict] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: dict[str, ObjectPatch] = field(default_factory=dict)
+    order: list[str] | None = None
+
+    def row_counts(self) -> tuple[int, int, int]:
+        nested = [patch.row_counts() for patch in self.changed.values()]
+        return (
+            len(self.added) + sum(row[0] for row in nested),
+            len(self.removed) + sum(row[1] for row in nested),
+            len(self.changed) + sum(row[2] for row in nested),
+        )
+
+    def as_dict(self) -> JsonDict:
+        payload: JsonDict = {
+            "id_field": self.id_field,
+            "added": self.added,
+            "removed": self.removed,
+            "changed": [{"id": row_id, **patch.as_dict()} for row_id, patch in self.changed.items()],
+        }
+        if self.order is not None:
+            payload["order"] = self.order
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: JsonDict) -> CollectionDelta:
+        return cls(
+            id_field=payload["id_field"],
+            added=list(payload.get("added", [])),
+            removed=list(payload.get("removed", [])),
+            changed={row["id"]: ObjectPatch.from_dict(row) for row in payload.get("changed", [])},
+            order=list(payload["order"]) if payload.get("order") is not None else None,
+        )
+
+
+@dataclass(frozen=True)
+class ContractDelta:
+    base_content_hash: str
+    target_content_hash: str
+    patch: ObjectPatch
+
+    @property
+    def empty(self) -> bool:
+        return self.base_content_hash == self.target_content_hash
+
+    @property
+    def collections(self) -> dict[str, CollectionDelta]:
+        return self.patch.collections
+
+    @property
+    def replaced(self) -> JsonDict:
+        return self.patch.replaced
+
+    @property
+    def patched(self) -> dict[str, ObjectPatch]:
+        return self.patch.patched
+
+    @property
+    def dropped_keys(self) -> list[str]:
+        return self.patch.dropped_keys
+
+    def counts(self) -> JsonDict:
+        added, removed, changed = self.patch.row_counts()
+        return {
+            "added_row_count": added,
+            "removed_row_count": removed,
+            "changed_row_count": changed,
+            "replaced_key_count": len(self.replaced),
+            "patched_key_count": len(self.patched),
+            "dropped_key_count": len(self.dropped_keys),
+        }
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "format": CONTRACT_DELTA_FORMAT,
+            "base_content_hash": self.base_content_hash,
+            "target_content_hash": self.target_content_hash,
+            **self.patch.as_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: JsonDict) -> ContractDelta:
+        if payload.get("format") != CONTRACT_DELTA_FORMAT:
+            raise ValueError(f"unsupported contract delta format: {payload.get('format')}")
+        return cls(
+            base_content_hash=payload["base_content_hash"],
+            target_content_hash=payload["target_content_hash"],
+            patch=ObjectPatch.from_dict(payload),
+        )
+
+
+def _row_ids(rows: Any, id_field: str) -> list[str] | None:
+    if not isinstance(rows, list) or not all(isinstance(row, dict) and id_field in row for row in rows):
+        return None
+    ids = [row[id_field] for row in rows]
+    return ids if len(ids) == len(set(ids)) else None
+
+
+def _merge_rows(base_rows: list[JsonDict], delta: CollectionDelta) -> list[JsonDict]:
+    id_field = delta.id_field
+    removed = set(delta.removed)
+    # Each added row is anchored after its predecessor in the target, so anchors are unique.
+    follower_by_anchor = {entry["after_id"]: entry["row"] for entry in delta.added}
+
+    rows: list[JsonDict] = []
+
+    def emit_followers(anchor: str | None) -> None:
+        while anchor in follower_by_anchor:
+            row = follower_by_anchor.pop(anchor)
+            rows.append(row)
+            anchor = row[id_field]
+
+    emit_followers(None)
+    for row in base_rows:
+        row_id = row[id_field]
+        if row_id in removed:
+            continue
+        patch = delta.changed.get(row_id)
+        rows.append(row if patch is None else _apply_patch(row, patch))
+        emit_followers(row_id)
+    if follower_by_anchor:
+        raise ValueError(f"contract delta adds rows after unknown anchors: {sorted(map(str, follower_by_anchor))}")
+    if delta.order is not None:
+        row_by_id = {row[id_field]: row for row in rows}
+        rows = [row_by_id[row_id] for row_id in delta.order]
+    return rows
+
+
+def _collection_delta(base_rows: list[JsonDict], target_rows: list[JsonDict], id_field: str, path: str) -> CollectionDelta:
+    base_by_id = {row[id_field]: row for row in base_rows}
+    target_ids = {row[id_field] for row in target_rows}
+    added: list[JsonDict] = []
+    changed: dict[str, ObjectPatch] = {}
+    previous_id: str | None = None
+    for row in target_rows:
+        row_id = row[id_field]
+        base_row = base_by_id.get(row_id)
+        if base_row is None:
+            added.append({"after_id": previous_id, "row": row})
+        elif stable_payload_hash(base_row) != stable_payload_hash(row):
+            changed[row_id] = _object_patch(base_row, row, path)
+        previous_id = row_id
+    delta = CollectionDelta(
+        id_field=id_field,
+        added=added,
+        removed=[row[id_field] for row in base_rows if row[id_field] not in target_ids],
+        changed=changed,
+    )
+    merged_ids = [row[id_field] for row in _merge_rows(base_rows, delta)]
+    target_order = [row[id_field] for row in target_rows]
+    if merged_ids != target_order:
+        return CollectionDelta(id_field=id_field, added=added, removed=delta.removed, changed=changed, order=target_order)
+    return delta
+
+
+def _object_patch(base: JsonDict, target: JsonDict, path: str = "") -> ObjectPatch:
+    # Rows and nested objects ship only the keys that changed, so one edited field does not resend
+    # a whole LOD tier or spatial-index lane.
+    collections: dict[str, CollectionDelta] = {}
+    patched: dict[str, ObjectPatch] = {}
+    replaced: JsonDict = {}
+    for key, target_value in target.items():
+        base_value = base.get(key)
+        key_path = f"{path}.{key}" if path else key
+        id_field = CONTRACT_ROW_ID_FIELDS.get(key_path)
+        if key in base and stable_payload_hash({"value": base_value}) == stable_payload_hash({"value": target_value}):
+            continue
+        if (
+            id_field is not None
+            and _row_ids(base_value, id_field) is not None
+            and _row_ids(target_value, id_field) is not None
+        ):
+            collections[key] = _collection_delta(base_value, target_value, id_field, key_path)
+        elif isinstance(base_value, dict) and isinstance(target_value, dict):
+            patched[key] = _object_patch(base_value, target_value, key_path)
+        else:
+            replaced[key] = target_value
+    return ObjectPatch(
+        replaced=replaced,
+        collections=collections,
+        patched=patched,
+        dropped_keys=sorted(key for key in base if key not in target),
+    )
+
+
+def _apply_patch(base: JsonDict, patch: ObjectPatch) -> JsonDict:
+    payload = {key: value for key, value in base.items() if key not in patch.dropped_keys}
+    for key, collection in patch.collections.items():
+        payload[key] = _merge_rows(list(payload.get(key) or []), collection)
+    for key, nested in patch.patched.items():
+        payload[key] = _apply_patch(payload.get(key) or {}, nested)
+    payload.update(patch.replaced)
+    return payload
+
+
+def build_contract_delta(base: JsonDict, target: JsonDict) -> ContractDelta:
+    return ContractDelta(
+        base_content_hash=contract_content_hash(base),
+        target_content_hash=contract_content_hash(target),
+        patch=_object_patch(base, target),
+    )
+
+
+def apply_contract_delta(base: JsonDict, delta: ContractDelta) -> JsonDict:
+    if contract_content_hash(base) != delta.base_content_hash:
+        raise ValueError("contract delta does not apply to this base contract")
+    payload = _apply_patch(base, delta.patch)
+    if contract_content_hash(payload) != delta.target_content_hash:
+        raise ValueError("applied contract delta does not match the target content hash")
+    return payload
+
+
+def contract_delta_to_json(delta: ContractDelta) -> str:
+    return json.dumps(delta.as_dict(), sort_keys=True, indent=2)
+
+
+def load_contract_payload(input_path: Path | str) -> JsonDict:
+    return json.loads(Path(input_path).read_text(encoding="utf-8"))
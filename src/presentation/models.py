@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import date, datetime
 from typing import Any
 
@@ -259,6 +259,114 @@ class ChapterLayoutRow:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class LodSegment:
+    lod_segment_id: str
+    lane_group: str
+    band_slot: int
+    date_start: date
+    date_end: date
+    primary_asset_id: str
+    member_segment_ids: list[str]
+    asset_ids: list[str]
+    label_text: str | None
+    label_priority: int
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class LodEventCluster:
+    lod_cluster_id: str
+    date_start: date
+    date_end: date
+    anchor_date: date
+    member_cluster_ids: list[str]
+    event_count: int
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class LabelPlacement:
+    segment_id: str
+    lane_group: str
+    band_slot: int
+    placement_kind: str
+    placed: bool
+    suppressed_reason: str | None
+    offset_days: int
+    width_days: int
+    label_priority: int
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class LayoutLodTier:
+    tier_id: str
+    tier_index: int
+    detail_level: str
+    min_zoom_days: int
+    max_zoom_days: int
+    min_segment_days: int
+    min_label_days: int
+    segments: list[LodSegment]
+    event_clusters: list[LodEventCluster]
+    label_placements: list[LabelPlacement] = field(default_factory=list)
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "tier_id": self.tier_id,
+            "tier_index": self.tier_index,
+            "detail_level": self.detail_level,
+            "min_zoom_days": self.min_zoom_days,
+            "max_zoom_days": self.max_zoom_days,
+            "min_segment_days": self.min_segment_days,
+            "min_label_days": self.min_label_days,
+            "segments": [row.as_dict() for row in self.segments],
+            "event_clusters": [row.as_dict() for row in self.event_clusters],
+            "label_placements": [row.as_dict() for row in self.label_placements],
+        }
+
+
+# Each entry is (start_bucket, bucket_span, row_index); row_index points into lane_layout, event_layout,
+# or the full tier's label_placements, so no ID is repeated per bucket.
+SpatialIndexEntry = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class SpatialIndexLane:
+    lane_key: str
+    max_bucket_span: int
+    segment_entries: list[SpatialIndexEntry]
+    event_cluster_entries: list[SpatialIndexEntry]
+    label_entries: list[SpatialIndexEntry]
+
+    def entry_count(self) -> int:
+        return len(self.segment_entries) + len(self.event_cluster_entries) + len(self.label_entries)
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class LayoutSpatialIndex:
+    origin_date: date
+    bucket_days: int
+    bucket_count: int
+    lanes: list[SpatialIndexLane]
+
+    def entry_count(self) -> int:
+        return sum(lane.entry_count() for lane in self.lanes)
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
 @dataclass(frozen=True)
 class LayoutContractBuildResult:
     build: LayoutBuild
@@ -267,6 +375,8 @@ class LayoutContractBuildResult:
     event_layout: list[EventLayoutRow]
     label_layout: list[LabelLayoutRow]
     chapter_layout: list[ChapterLayoutRow]
+    lod_tiers: list[LayoutLodTier] = field(default_factory=list)
+    spatial_index: LayoutSpatialIndex | None = None
 
     def counts(self) -> JsonDict:
         return {
@@ -275,6 +385,8 @@ class LayoutContractBuildResult:
             "event_layout_count": len(self.event_layout),
             "label_layout_count": len(self.label_layout),
             "chapter_layout_count": len(self.chapter_layout),
+            "lod_tier_count": len(self.lod_tiers),
+            "spatial_index_entry_count": self.spatial_index.entry_count() if self.spatial_index else 0,
         }
 
     def as_contract(self) -> JsonDict:
@@ -284,4 +396,6 @@ class LayoutContractBuildResult:
             "event_layout": [row.as_dict() for row in self.event_layout],
             "label_layout": [row.as_dict() for row in self.label_layout],
             "chapter_layout": [row.as_dict() for row in self.chapter_layout],
+            "lod_tiers": [row.as_dict() for row in self.lod_tiers],
+            "spatial_index": self.spatial_index.as_dict() if self.spatial_index else None,
         }
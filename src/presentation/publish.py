@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+JsonDict = dict[str, Any]
+
+PUBLISH_MANIFEST_FORMAT = "contract-manifest-v1"
+PUBLISH_MANIFEST_NAME = "contract-manifest.json"
+PUBLISH_HASH_LENGTH = 16
+PUBLISH_GZIP_LEVEL = 9
+
+
+@dataclass(frozen=True)
+class PublishedArtifact:
+    logical_name: str
+    file_name: str
+    gzip_file_name: str
+    content_hash: str
+    byte_count: int
+    gzip_byte_count: int
+
+    def as_dict(self) -> JsonDict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class PublishResult:
+    output_dir: Path
+    manifest_path: Path
+    artifacts: list[PublishedArtifact]
+    written_file_count: int
+    pruned_file_count: int
+
+    def counts(self) -> JsonDict:
+        return {
+            "artifact_count": len(self.artifacts),
+            "written_file_count": self.written_file_count,
+            "pruned_file_count": self.pruned_file_count,
+        }
+
+
+def _gzip_bytes(content: bytes) -> bytes:
+    # A zero mtime and empty filename keep the gzip header, and so the bytes, identical across runs.
+    return gzip.compress(content, compresslevel=PUBLISH_GZIP_LEVEL, mtime=0)
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    if path.exists() and path.read_bytes() == content:
+        return False
+    path.write_bytes(content)
+    return True
+
+
+def publish_contract_artifacts(
+    payloads: dict[str, str],
+    output_dir: Path | str,
+    *,
+    prune: bool = False,
+) -> PublishResult:
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    artifacts: list[PublishedArtifact] = []
+    written = 0
+    for logical_name, payload in sorted(payloads.items()):
+        content = (payload.rstrip("\n") + "\n").encode("utf-8")
+        content_hash = hashlib.sha256(content).hexdigest()
+        file_name = f"{logical_name}.{content_hash[:PUBLISH_HASH_LENGTH]}.json"
+        compressed = _gzip_bytes(content)
+        written += _write_if_changed(directory / file_name, content)
+        written += _write_if_changed(directory / f"{file_name}.gz", compressed)
+        artifacts.append(
+            PublishedArtifact(
+                logical_name=logical_name,
+                file_name=file_name,
+                gzip_file_name=f"{file_name}.gz",
+                content_hash=content_hash,
+                byte_count=len(content),
+                gzip_byte_count=len(compressed),
+            )
+        )
+
+    manifest = {
+        "format": PUBLISH_MANIFEST_FORMAT,
+        "artifacts": {row.logical_name: row.as_dict() for row in artifacts},
+    }
+    manifest_path = directory / PUBLISH_MANIFEST_NAME
+    written += _write_if_changed(manifest_path, (json.dumps(manifest, sort_keys=True, indent=2) + "\n").encode("utf-8"))
+
+    pruned = 0
+    if prune:
+        current = {name for row in artifacts for name in (row.file_name, row.gzip_file_name)}
+        for row in artifacts:
+            for path in directory.glob(f"{row.logical_name}.*.json*"):
+                if path.name not in current:
+                    path.unlink()
+                    pruned += 1
+    return PublishResult(
+        output_dir=directory,
+        manifest_path=manifest_path,
+        artifacts=artifacts,
+        written_file_count=written,
+        pruned_file_count=pruned,
+    )
+
+
+def load_publish_manifest(manifest_path: Path | str) -> dict[str, PublishedArtifact]:
+    payload = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    if payload.get("format") != PUBLISH_MANIFEST_FORMAT:
+        raise ValueError(f"unsupported contract manifest format: {payload.get('format')}")
+    return {name: PublishedArtifact(**row) for name, row in payload["artifacts"].items()}
@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, ContextManager
+from urllib.parse import parse_qs, urlsplit
+
+from presentation.contract import (
+    FRONTEND_PUBLIC_ROOT,
+    HEADSHOT_MANIFEST_PATH,
+    _json_ready,
+    build_layout_contract,
+)
+from storage.repository import StageRepository
+
+
+JsonDict = dict[str, Any]
+
+DEFAULT_SERVICE_HOST = "127.0.0.1"
+DEFAULT_SERVICE_PORT = 8765
+DEFAULT_CACHE_ENTRIES = 128
+DEFAULT_REFRESH_INTERVAL_SECONDS = 1.0
+DEFAULT_LAYOUT_BUILDER_VERSION = "stage8-layout-contract-v1"
+CONTRACT_NAMES = ("presentation", "layout", "editorial")
+MAX_REQUEST_HEADER_LINES = 100
+
+DATE_SPAN_FIELDS = (
+    ("start_date", "end_date"),
+    ("date_start", "date_end"),
+    ("effective_start_date", "effective_end_date"),
+    ("window_start", "window_end"),
+)
+DATE_POINT_FIELDS = ("event_date", "cluster_date", "marker_date", "game_date", "anchor_date")
+ASSET_ID_FIELDS = ("asset_id", "source_asset_id", "target_asset_id")
+ASSET_LIST_FIELDS = ("connected_asset_ids", "highlight_asset_ids", "asset_ids")
+
+HTTP_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+@dataclass(frozen=True)
+class ContractSlice:
+    start_date: date | None = None
+    end_date: date | None = None
+    asset_ids: frozenset[str] = frozenset()
+
+    @property
+    def is_whole(self) -> bool:
+        return self.start_date is None and self.end_date is None and not self.asset_ids
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "start_date": self.start_date.isoformat() if self.start_date else None,
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "asset_ids": sorted(self.asset_ids),
+        }
+
+
+@dataclass(frozen=True)
+class ContractResponse:
+    status: int
+    body: bytes = b""
+    etag: str | None = None
+
+    def to_http(self, *, include_body: bool = True) -> bytes:
+        headers = [
+            f"HTTP/1.1 {self.status} {HTTP_REASONS.get(self.status, 'OK')}",
+            "Content-Type: application/json",
+            "Cache-Control: no-cache",
+            f"Content-Length: {len(self.body)}",
+            "Connection: close",
+        ]
+        if self.etag is not None:
+            headers.append(f"ETag: {self.etag}")
+        if self.status == 405:
+            headers.append("Allow: GET, HEAD")
+        head = ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1")
+        return head + self.body if include_body and self.status != 304 else head
+
+
+@dataclass
+class ContractServiceStats:
+    requests: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    not_modified: int = 0
+    contract_loads: int = 0
+    invalidations: int = 0
+
+    def counts(self) -> JsonDict:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "not_modified": self.not_modified,
+            "contract_loads": self.contract_loads,
+            "invalidations": self.invalidations,
+        }
+
+
+def _parse_query_date(values: list[str], name: str) -> date | None:
+    if not values:
+        return None
+    try:
+        return date.fromisoformat(values[-1])
+    except ValueError as exc:
+        raise ValueError(f"{name} must be an ISO date") from exc
+
+
+def parse_contract_slice(query: str) -> ContractSlice:
+    params = parse_qs(query, keep_blank_values=False)
+    unknown = sorted(set(params) - {"start", "end", "asset_id"})
+    if unknown:
+        raise ValueError(f"unknown query parameters: {', '.join(unknown)}")
+    start_date = _parse_query_date(params.get("start", []), "start")
+    end_date = _parse_query_date(params.get("end", []), "end")
+    if start_date and end_date and end_date < start_date:
+        raise ValueError("end must not be before start")
+    asset_ids = frozenset(
+        asset_id.strip() for value in params.get("asset_id", []) for asset_id in value.split(",") if asset_id.strip()
+    )
+    return ContractSlice(start_date=start_date, end_date=end_date, asset_ids=asset_ids)
+
+
+def _row_dates(row: JsonDict) -> tuple[str, str] | None:
+    for start_field, end_field in DATE_SPAN_FIELDS:
+        if row.get(start_field) and row.get(end_field):
+            return row[start_field], row[end_field]
+    for point_field in DATE_POINT_FIELDS:
+        if row.get(point_field):
+            return row[point_field], row[point_field]
+    return None
+
+
+def _row_asset_ids(row: JsonDict) -> set[str] | None:
+    asset_ids = {row[name] for name in ASSET_ID_FIELDS if row.get(name)}
+    for name in ASSET_LIST_FIELDS:
+        asset_ids.update(row.get(name) or ())
+    return asset_ids or None
+
+
+def _row_in_slice(row: Any, contract_slice: ContractSlice) -> bool:
+    if not isinstance(row, dict):
+        return True
+    # Contract dates are ISO strings, so lexical comparison is date comparison.
+    dates = _row_dates(row)
+    if dates is not None:
+        row_start, row_end = dates
+        if contract_slice.end_date and row_start[:10] > contract_slice.end_date.isoformat():
+            return False
+        if contract_slice.start_date and row_end[:10] < contract_slice.start_date.isoformat():
+            return False
+    if contract_slice.asset_ids:
+        asset_ids = _row_asset_ids(row)
+        if asset_ids is not None and not asset_ids & contract_slice.asset_ids:
+            return False
+    return True
+
+
+def _slice_lod_tier(tier: JsonDict, contract_slice: ContractSlice, lane_segment_ids: set[str]) -> JsonDict:
+    segments = [row for row in tier.get("segments", []) if _row_in_slice(row, contract_slice)]
+    kept_segment_ids = lane_segment_ids | {row["lod_segment_id"] for row in segments}
+    return {
+        **tier,
+        "segments": segments,
+        "event_clusters": [row for row in tier.get("event_clusters", []) if _row_in_slice(row, contract_slice)],
+        "label_placements": [row for row in tier.get("label_placements", []) if row["segment_id"] in kept_segment_ids],
+    }
+
+
+def slice_contract_payload(payload: JsonDict, contract_slice: ContractSlice) -> JsonDict:
+    # Top-level row collections are filtered by date overlap and asset, and each LOD tier is filtered
+    # the same way. The spatial index addresses rows by position, so sliced responses drop it and the
+    # client filters the already-small slice directly.
+    if contract_slice.is_whole:
+        return payload
+    sliced: JsonDict = {}
+    for key, value in payload.items():
+        if isinstance(value, list) and key != "lod_tiers":
+            sliced[key] = [row for row in value if _row_in_slice(row, contract_slice)]
+        else:
+            sliced[key] = value
+    if "lod_tiers" in sliced:
+        lane_segment_ids = {row["segment_id"] for row in sliced.get("lane_layout", [])}
+        sliced["lod_tiers"] = [_slice_lod_tier(tier, contract_slice, lane_segment_ids) for tier in sliced["lod_tiers"]]
+    if "spatial_index" in sliced:
+        sliced["spatial_index"] = None
+    if contract_slice.asset_ids and "edges" in sliced and "nodes" in sliced:
+        referenced = {node_id for edge in sliced["edges"] for node_id in (edge["source_node_id"], edge["target_node_id"])}
+        sliced["nodes"] = [node for node in sliced["nodes"] if node["node_id"] in referenced]
+    sliced["slice"] = contract_slice.as_dict()
+    return sliced
+
+
+def contract_etag(contract_name: str, build_key: tuple[str | None, ...], contract_slice: ContractSlice) -> str:
+    digest = hashlib.sha256(
+        json.dumps([contract_name, list(build_key), contract_slice.as_dict()], sort_keys=True).encode("utf-8")
+    ).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _error_response(status: int, message: str) -> ContractResponse:
+    return ContractResponse(status=status, body=json.dumps({"error": message}).encode("utf-8"))
+
+
+class ContractService:
+    # Responses are keyed by the current presentation and editorial build ids, so an ETag stays
+    # valid until a new build lands and the serialized LRU is dropped wholesale when one does.
+    # One read-only repository handle is opened for the life of the service and refreshed in place.
+    def __init__(
+        self,
+        repository_factory: Callable[[], ContextManager[StageRepository]],
+        *,
+        builder_version: str = DEFAULT_LAYOUT_BUILDER_VERSION,
+        headshot_manifest_path: Path | str = HEADSHOT_MANIFEST_PATH,
+        frontend_public_root: Path | str = FRONTEND_PUBLIC_ROOT,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if cache_entries < 1:
+            raise ValueError("cache_entries must be at least 1")
+        self.repository_factory = repository_factory
+        self.builder_version = builder_version
+        self.headshot_manifest_path = headshot_manifest_path
+        self.frontend_public_root = frontend_public_root
+        self.cache_entries = cache_entries
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.clock = clock
+        self.stats = ContractServiceStats()
+        self._build_key: tuple[str | None, str | None] | None = None
+        self._build_key_checked_at: float | None = None
+        self._payloads: dict[tuple[str, tuple[str | None, ...]], JsonDict] = {}
+        self._responses: OrderedDict[str, bytes] = OrderedDict()
+        self._repository: StageRepository | None = None
+        # Serializes use of the shared handle; a refresh never queues behind a contract load.
+        self._reader_lock = asyncio.Lock()
+
+    def _reader(self) -> StageRepository:
+        if self._repository is None:
+            self._repository = self.repository_factory().__enter__()
+        return self._repository
+
+    def close(self) -> None:
+        if self._repository is not None:
+            repository, self._repository = self._repository, None
+            repository.__exit__(None, None, None)
+
+    def _read_build_key(self) -> tuple[str | None, str | None]:
+        repository = self._reader()
+        repository.refresh()
+        return repository.fetch_current_presentation_build_id(), repository.fetch_latest_editorial_build_id()
+
+    def _load_payload(self, contract_name: str) -> JsonDict:
+        repository = self._reader()
+        if contract_name == "editorial":
+            return _json_ready(repository.fetch_editorial_overlays().as_contract())
+        presentation_result = repository.fetch_presentation_contract()
+        if contract_name == "presentation":
+            return _json_ready(presentation_result.as_contract())
+        try:
+            editorial_result = repository.fetch_editorial_overlays()
+        except RuntimeError:
+            editorial_result = None
+        return _json_ready(
+            build_layout_contract(
+                presentation_result=presentation_result,
+                editorial_overlays=editorial_result,
+                builder_version=self.builder_version,
+                headshot_manifest_path=self.headshot_manifest_path,
+                frontend_public_root=self.frontend_public_root,
+            ).as_contract()
+        )
+
+    def _build_key_is_fresh(self, now: float) -> bool:
+        return (
+            self._build_key is not None
+            and self._build_key_checked_at is not None
+            and now - self._build_key_checked_at < self.refresh_interval_seconds
+        )
+
+    async def build_key(self) -> tuple[str | None, str | None]:
+        if self._build_key_is_fresh(self.clock()):
+            return self._build_key
+        if self._build_key is not None and self._reader_lock.locked():
+            # A contract load holds the reader; answer from the last known build and refresh on a later request.
+            return self._build_key
+        async with self._reader_lock:
+            now = self.clock()
+            if self._build_key_is_fresh(now):
+                return self._build_key
+            build_key = await asyncio.to_thread(self._read_build_key)
+            self._build_key_checked_at = now
+            if build_key != self._build_key:
+                if self._build_key is not None:
+                    self.stats.invalidations += 1
+                self._build_key = build_key
+                self._payloads.clear()
+                self._responses.clear()
+            return build_key
+
+    def _contract_build_key(self, contract_name: str, build_key: tuple[str | None, str | None]) -> tuple[str | None, ...]:
+        presentation_build_id, editorial_build_id = build_key
+        if contract_name == "presentation":
+            return (presentation_build_id,)
+        if contract_name == "editorial":
+            return (editorial_build_id,)
+        return (presentation_build_id, editorial_build_id, self.builder_version)
+
+    async def _payload(self, contract_name: str, contract_build_key: tuple[str | None, ...]) -> JsonDict:
+        # Payloads are keyed by the build they were requested for, so a load that overlaps a new
+        # build is never served under the newer ETag.
+        key = (contract_name, contract_build_key)
+        payload = self._payloads.get(key)
+        if payload is not None:
+            return payload
+        async with self._reader_lock:
+            payload = self._payloads.get(key)
+            if payload is None:
+                payload = await asyncio.to_thread(self._load_payload, contract_name)
+                self.stats.contract_loads += 1
+                if self._build_key is not None and self._contract_build_key(contract_name, self._build_key) == contract_build_key:
+                    self._payloads[key] = payload
+            return payload
+
+    def _cached_body(self, etag: str) -> bytes | None:
+        body = self._responses.get(etag)
+        if body is not None:
+            self._responses.move_to_end(etag)
+        return body
+
+    def _store_body(self, etag: str, body: bytes) -> None:
+        self._responses[etag] = body
+        self._responses.move_to_end(etag)
+        while len(self._responses) > self.cache_entries:
+            self._responses.popitem(last=False)
+
+    async def contract_response(
+        self,
+        contract_name: str,
+        contract_slice: ContractSlice,
+        *,
+        if_none_match: str | None = None,
+    ) -> ContractResponse:
+        build_key = await self.build_key()
+        contract_build_key = self._contract_build_key(contract_name, build_key)
+        if contract_build_key[0] is None:
+            return _error_response(404, f"no {contract_name} build found")
+        etag = contract_etag(contract_name, contract_build_key, contract_slice)
+        if _etag_matches(if_none_match, etag):
+            self.stats.not_modified += 1
+            return ContractResponse(status=304, etag=etag)
+        body = self._cached_body(etag)
+        if body is not None:
+            self.stats.cache_hits += 1
+            return ContractResponse(status=200, body=body, etag=etag)
+        self.stats.cache_misses += 1
+        try:
+            payload = await self._payload(contract_name, contract_build_key)
+        except (RuntimeError, ValueError) as exc:
+            return _error_response(404, str(exc))
+        body = json.dumps(slice_contract_payload(payload, contract_slice), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        self._store_body(etag, body)
+        return ContractResponse(status=200, body=body, etag=etag)
+
+    async def status_response(self) -> ContractResponse:
+        presentation_build_id, editorial_build_id = await self.build_key()
+        payload = {
+            "presentation_build_id": presentation_build_id,
+            "editorial_build_id": editorial_build_id,
+            "cached_response_count": len(self._responses),
+            **self.stats.counts(),
+        }
+        return ContractResponse(status=200, body=json.dumps(payload, sort_keys=True).encode("utf-8"))
+
+    async def handle(self, method: str, target: str, headers: dict[str, str]) -> ContractResponse:
+        self.stats.requests += 1
+        if method not in ("GET", "HEAD"):
+            return _error_response(405, f"method not allowed: {method}")
+        url = urlsplit(target)
+        if url.path == "/status":
+            return await self.status_response()
+        prefix, _, contract_name = url.path.rpartition("/")
+        if prefix != "/contracts" or contract_name not in CONTRACT_NAMES:
+            return _error_response(404, f"unknown path: {url.path}")
+        try:
+            contract_slice = parse_contract_slice(url.query)
+        except ValueError as exc:
+            return _error_response(400, str(exc))
+        return await self.contract_response(contract_name, contract_slice, if_none_match=headers.get("if-none-match"))
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = (await reader.readline()).decode("latin-1").strip()
+            headers: dict[str, str] = {}
+            for _ in range(MAX_REQUEST_HEADER_LINES):
+                line = (await reader.readline()).decode("latin-1")
+                if not line.strip():
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            parts = request_line.split()
+            if len(parts) != 3:
+                response, method = _error_response(400, "malformed request line"), "GET"
+            else:
+                method = parts[0].upper()
+                response = await self.handle(method, parts[1], headers)
+            writer.write(response.to_http(include_body=method != "HEAD"))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host: str = DEFAULT_SERVICE_HOST, port: int = DEFAULT_SERVICE_PORT) -> asyncio.Server:
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def serve_forever(
+        self,
+        host: str = DEFAULT_SERVICE_HOST,
+        port: int = DEFAULT_SERVICE_PORT,
+        *,
+        on_ready: Callable[[str, int], None] | None = None,
+    ) -> None:
+        server = await self.start(host, port)
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        if on_ready is not None:
+            on_ready(bound_host, bound_port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
@@ -6,15 +6,24 @@ from pathlib import Path
 from typing import Iterable
 
 from canonical.models import CanonicalEvent
-from presentation.contract import _expected_transition_link_specs
+from presentation.contract import (
+    DEFAULT_LAYOUT_MIN_ZOOM_DAYS,
+    DEFAULT_LAYOUT_WINDOW_DAYS,
+    _expected_transition_link_specs,
+    spatial_entry,
+    spatial_lane_key,
+)
 from editorial.models import EditorialOverlayBuildResult
 from presentation.models import (
     AssetLane,
     LayoutContractBuildResult,
+    LayoutLodTier,
+    LayoutSpatialIndex,
     PresentationContractBuildResult,
     TimelineEdge,
     TimelineNode,
 )
+from shared.profiling import traced
 
 
 @dataclass(frozen=True)
@@ -36,6 +45,8 @@ class LayoutContractValidationReport:
     event_layout_count: int
     label_layout_count: int
     chapter_layout_count: int
+    lod_tier_count: int
+    spatial_index_entry_count: int
     errors: list[str]
     warnings: list[str]
 
@@ -44,6 +55,78 @@ class LayoutContractValidationReport:
         return not self.errors
 
 
+def _label_placement_errors(tier: LayoutLodTier, segment_start_by_id: dict[str, int]) -> list[str]:
+    errors: list[str] = []
+    placement_ids = [row.segment_id for row in tier.label_placements]
+    if len(placement_ids) != len(set(placement_ids)) or set(placement_ids) != set(segment_start_by_id):
+        errors.append(f"lod_tier label_placements must cover every tier segment exactly once: {tier.tier_id}")
+    boxes_by_lane: dict[tuple[str, int], list[tuple[int, int, str]]] = defaultdict(list)
+    for row in tier.label_placements:
+        if row.placed and row.segment_id in segment_start_by_id:
+            start = segment_start_by_id[row.segment_id] + row.offset_days
+            boxes_by_lane[(row.lane_group, row.band_slot)].append((start, start + row.width_days, row.segment_id))
+        elif not row.placed and row.suppressed_reason is None:
+            errors.append(f"suppressed label_placement is missing a reason: {tier.tier_id}/{row.segment_id}")
+    for boxes in boxes_by_lane.values():
+        boxes.sort()
+        for previous, current in zip(boxes, boxes[1:]):
+            if current[0] < previous[1]:
+                errors.append(f"placed labels overlap: {tier.tier_id}/{previous[2]}/{current[2]}")
+    return errors
+
+
+def _spatial_index_errors(result: LayoutContractBuildResult, index: LayoutSpatialIndex) -> list[str]:
+    errors: list[str] = []
+    meta = result.layout_meta
+    if index.origin_date != meta.start_date or index.bucket_days < 1:
+        errors.append("spatial_index origin must match layout_meta.start_date with a positive bucket size")
+        return errors
+    if index.bucket_count != (meta.end_date - meta.start_date).days // index.bucket_days + 1:
+        errors.append("spatial_index bucket_count does not cover the layout history")
+
+    segment_entries: dict[int, list[tuple[str, tuple[int, int, int]]]] = defaultdict(list)
+    cluster_rows: set[int] = set()
+    label_rows: set[int] = set()
+    lane_keys = [lane.lane_key for lane in index.lanes]
+    if len(lane_keys) != len(set(lane_keys)):
+        errors.append("spatial_index lane_keys must be unique")
+    for lane in index.lanes:
+        for kind, entries, row_count in (
+            ("segment_entries", lane.segment_entries, len(result.lane_layout)),
+            ("event_cluster_entries", lane.event_cluster_entries, len(result.event_layout)),
+            ("label_entries", lane.label_entries, len(result.lod_tiers[0].label_placements) if result.lod_tiers else 0),
+        ):
+            if list(entries) != sorted(entries):
+                errors.append(f"spatial_index {kind} must be sorted by start bucket: {lane.lane_key}")
+            for start_bucket, bucket_span, row_index in entries:
+                if start_bucket < 0 or bucket_span < 1 or start_bucket + bucket_span > index.bucket_count:
+                    errors.append(f"spatial_index entry outside the grid: {lane.lane_key}/{kind}/{row_index}")
+                if bucket_span > lane.max_bucket_span:
+                    errors.append(f"spatial_index max_bucket_span is below an entry span: {lane.lane_key}")
+                if not 0 <= row_index < row_count:
+                    errors.append(f"spatial_index {kind} references an unknown row: {lane.lane_key}/{row_index}")
+        for entry in lane.segment_entries:
+            segment_entries[entry[2]].append((lane.lane_key, tuple(entry)))
+        cluster_rows.update(row_index for _, _, row_index in lane.event_cluster_entries)
+        label_rows.update(row_index for _, _, row_index in lane.label_entries)
+
+    for row_index, row in enumerate(result.lane_layout):
+        expected = spatial_entry(
+            index.origin_date, index.bucket_days, index.bucket_count, row_index, row.date_start, row.date_end
+        )
+        if segment_entries.get(row_index, []) != [(spatial_lane_key(row.lane_group, row.band_slot), expected)]:
+            errors.append(f"spatial_index entries do not match lane segment span: {row.segment_id}")
+    if cluster_rows != set(range(len(result.event_layout))):
+        errors.append("spatial_index event_cluster_entries must cover every event_layout cluster")
+    placed_label_rows = {
+        row_index for row_index, row in enumerate(result.lod_tiers[0].label_placements) if row.placed
+    } if result.lod_tiers else set()
+    if label_rows != placed_label_rows:
+        errors.append("spatial_index label_entries must match the placed full-tier labels")
+    return errors
+
+
+@traced("validate")
 def validate_presentation_contract(
     *,
     nodes: Iterable[TimelineNode],
@@ -152,6 +235,7 @@ def validate_presentation_contract(
     )
 
 
+@traced("validate")
 def validate_layout_contract(
     *,
     result: LayoutContractBuildResult,
@@ -342,8 +426,11 @@ def validate_layout_contract(
             errors.append(f"chapter_layout window is outside layout bounds: {row.story_chapter_id}")
         if row.minimap_anchor_id not in minimap_segment_ids:
             errors.append(f"chapter_layout minimap_anchor_id is unknown: {row.story_chapter_id}")
-        if row.default_zoom is not None and not (30 <= row.default_zoom <= 180):
-            errors.append(f"chapter_layout default_zoom must be between 30 and 180 days: {row.story_chapter_id}")
+        if row.default_zoom is not None and not (DEFAULT_LAYOUT_MIN_ZOOM_DAYS <= row.default_zoom <= DEFAULT_LAYOUT_WINDOW_DAYS):
+            errors.append(
+                f"chapter_layout default_zoom must be between {DEFAULT_LAYOUT_MIN_ZOOM_DAYS} and "
+                f"{DEFAULT_LAYOUT_WINDOW_DAYS} days: {row.story_chapter_id}"
+            )
         if any(asset_id not in {lane.asset_id for lane in lane_layout} for asset_id in row.highlight_asset_ids):
             errors.append(f"chapter_layout highlight_asset_ids reference unknown assets: {row.story_chapter_id}")
         if any(event_id not in presentation_event_ids for event_id in row.highlight_event_ids):
@@ -354,6 +441,44 @@ def validate_layout_contract(
         if {row.story_chapter_id for row in chapter_layout} != expected_chapter_ids:
             errors.append("chapter_layout story_chapter_ids do not match editorial overlays")
 
+    expected_cluster_ids = {row.cluster_id for row in event_layout}
+    previous_max_zoom_days = None
+    for tier in result.lod_tiers:
+        if previous_max_zoom_days is not None and tier.min_zoom_days != previous_max_zoom_days:
+            errors.append(f"lod_tiers zoom ranges must be contiguous: {tier.tier_id}")
+        if tier.max_zoom_days <= tier.min_zoom_days:
+            errors.append(f"lod_tier max_zoom_days must exceed min_zoom_days: {tier.tier_id}")
+        previous_max_zoom_days = tier.max_zoom_days
+        if tier.detail_level == "full":
+            if tier.segments or tier.event_clusters:
+                errors.append(f"full lod_tier must reuse lane_layout and event_layout: {tier.tier_id}")
+            errors.extend(
+                _label_placement_errors(tier, {row.segment_id: row.date_start.toordinal() for row in lane_layout})
+            )
+            continue
+        errors.extend(_label_placement_errors(tier, {row.lod_segment_id: row.date_start.toordinal() for row in tier.segments}))
+        member_segment_ids = [segment_id for row in tier.segments for segment_id in row.member_segment_ids]
+        if len(member_segment_ids) != len(set(member_segment_ids)) or set(member_segment_ids) != set(lane_by_segment_id):
+            errors.append(f"lod_tier segments must cover every lane_layout segment exactly once: {tier.tier_id}")
+        for row in tier.segments:
+            members = [lane_by_segment_id[segment_id] for segment_id in row.member_segment_ids if segment_id in lane_by_segment_id]
+            if any((lane.lane_group, lane.band_slot) != (row.lane_group, row.band_slot) for lane in members):
+                errors.append(f"lod_segment merges segments across lanes: {tier.tier_id}/{row.lod_segment_id}")
+            if members and (row.date_start != min(lane.date_start for lane in members) or row.date_end != max(lane.date_end for lane in members)):
+                errors.append(f"lod_segment date range does not span its members: {tier.tier_id}/{row.lod_segment_id}")
+        member_cluster_ids = [cluster_id for row in tier.event_clusters for cluster_id in row.member_cluster_ids]
+        if len(member_cluster_ids) != len(set(member_cluster_ids)) or set(member_cluster_ids) != expected_cluster_ids:
+            errors.append(f"lod_tier event_clusters must cover every event_layout cluster exactly once: {tier.tier_id}")
+    if result.lod_tiers:
+        if result.lod_tiers[0].min_zoom_days != DEFAULT_LAYOUT_MIN_ZOOM_DAYS:
+            errors.append(f"first lod_tier must start at the minimum zoom of {DEFAULT_LAYOUT_MIN_ZOOM_DAYS} days")
+        total_days = (result.layout_meta.end_date - result.layout_meta.start_date).days + 1
+        if result.lod_tiers[-1].max_zoom_days < total_days:
+            errors.append("last lod_tier must reach the full layout history")
+
+    if result.spatial_index is not None:
+        errors.extend(_spatial_index_errors(result, result.spatial_index))
+
     lane_groups_present = {row.lane_group for row in lane_layout}
     presentation_lane_groups = {row.lane_group for row in presentation_edges}
     if lane_groups_present != presentation_lane_groups:
@@ -364,6 +489,8 @@ def validate_layout_contract(
         event_layout_count=len(event_layout),
         label_layout_count=len(label_layout),
         chapter_layout_count=len(chapter_layout),
+        lod_tier_count=len(result.lod_tiers),
+        spatial_index_entry_count=result.spatial_index.entry_count() if result.spatial_index else 0,
         errors=errors,
         warnings=warnings,
     )
@@ -1,67 +1,186 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from datetime import date
+from functools import partial
 from pathlib import Path
 from typing import Sequence
 
-from canonical.events import bootstrap_canonical_events_schema, build_and_persist_canonical_events
+from benchmarks import SyntheticFranchiseConfig, run_benchmark, write_benchmark_result
+from canonical.events import bootstrap_canonical_events_schema, iter_event_provenance_rows, iter_event_rows
+from canonical.lineage import LINEAGE_DIRECTIONS, bootstrap_canonical_asset_lineage_schema
+from canonical.holdings import INTERVAL_KINDS, build_holdings_index, load_holdings_index, write_holdings_index
+from canonical.merge_suggestions import DEFAULT_MIN_MERGE_SCORE, suggest_event_merges, write_merge_suggestions
 from canonical.event_asset_flow import (
     bootstrap_canonical_event_asset_flow_schema,
-    build_and_persist_canonical_event_asset_flows,
+    iter_event_asset_flow_provenance_rows,
+    iter_event_asset_flow_rows,
 )
 from canonical.pick_lifecycle import (
     bootstrap_canonical_pick_lifecycle_schema,
-    build_and_persist_canonical_pick_lifecycle,
+    iter_pick_asset_provenance_rows,
+    iter_pick_asset_rows,
+    iter_pick_resolution_provenance_rows,
+    iter_pick_resolution_rows,
 )
 from canonical.player_tenure import (
     bootstrap_canonical_player_tenure_schema,
-    build_and_persist_canonical_player_tenures,
+    iter_asset_provenance_rows,
+    iter_asset_rows,
+    iter_asset_state_provenance_rows,
+    iter_asset_state_rows,
+    iter_player_identity_provenance_rows,
+    iter_player_identity_rows,
+    iter_player_tenure_rows,
 )
 from canonical.validate import validate_canonical_events
 from canonical.validate_event_asset_flow import validate_canonical_event_asset_flows
 from canonical.validate_pick_lifecycle import validate_canonical_pick_lifecycle
 from canonical.validate_player_tenure import validate_canonical_player_tenures
 from db_config import load_database_url
+from evidence.draft_history import DEFAULT_DRAFT_HISTORY_DIR, DraftHistoryStore
 from evidence.ingest import (
     bootstrap_evidence_schema,
+    build_league_source_records,
     build_live_source_records,
-    fetch_source_records,
-    insert_normalized_claims,
-    insert_source_records,
-    normalize_source_records,
+    capture_source_records,
+    iter_normalized_claim_pages,
+    iter_override_pages,
+    iter_source_record_pages,
 )
+from evidence.models import NormalizedClaim, SourceRecord
 from evidence.normalize import normalize_source_record
-from evidence.overrides import insert_override_bundle, load_override_bundle
-from evidence.validate import validate_stage1_rows
+from evidence.overrides import load_override_bundle
+from evidence.validate import validate_stage1_pages, validate_stage1_rows
 from editorial.contract import (
-    build_and_persist_editorial_overlays,
     bootstrap_editorial_overlay_schema,
-    export_editorial_overlays_json,
+    editorial_overlays_to_json,
     fetch_editorial_overlays,
     validate_editorial_overlay_bundle,
 )
 from presentation.contract import (
+    PRESENTATION_BUILDS_RETAINED,
     build_layout_contract,
-    build_layout_contract_from_db,
     bootstrap_presentation_contract_schema,
-    build_and_persist_presentation_contract,
-    export_layout_contract_json,
-    export_presentation_contract_json,
     fetch_presentation_contract,
+    layout_contract_to_json,
+    presentation_contract_to_json,
+)
+from pipeline import (
+    FranchiseRunJob,
+    default_stage_graph,
+    franchise_partition,
+    run_editorial_stage,
+    run_franchises,
+    run_stage,
+    run_stage_graph,
+)
+from pipeline.watch import (
+    DEFAULT_WATCH_POLL_SECONDS,
+    WATCH_ROOT_STAGES,
+    WatchRebuildResult,
+    WatchTargets,
+    rebuild_affected,
+    watch_configs,
+)
+from presentation.delta import build_contract_delta, contract_delta_to_json, load_contract_payload
+from presentation.compact import write_compact_contract
+from presentation.publish import publish_contract_artifacts
+from presentation.service import (
+    DEFAULT_CACHE_ENTRIES,
+    DEFAULT_REFRESH_INTERVAL_SECONDS,
+    DEFAULT_SERVICE_HOST,
+    DEFAULT_SERVICE_PORT,
+    ContractService,
 )
 from presentation.validate import validate_layout_contract, validate_presentation_contract
+from shared.config_cache import DEFAULT_CONFIG_CACHE_DIR, config_cache_session
+from shared.franchise import DEFAULT_FRANCHISE, Franchise, franchise_for, parse_franchise_codes
+from shared.profiling import active_profiler, profiling_session, traced
+from shared.streaming import DEFAULT_PAGE_SIZE, open_id_set
+from storage import DEFAULT_MEMORY_STORE_PATH, STORAGE_BACKENDS, StageRepository, open_repository
 
 
 GENERATED_FRONTEND_DATA_DIR = Path("frontend/src/data/generated")
 DEFAULT_PRESENTATION_EXPORT_PATH = GENERATED_FRONTEND_DATA_DIR / "presentation-contract.json"
 DEFAULT_LAYOUT_EXPORT_PATH = GENERATED_FRONTEND_DATA_DIR / "layout-contract.json"
 DEFAULT_EDITORIAL_CHAPTER_EXPORT_PATH = GENERATED_FRONTEND_DATA_DIR / "editorial-chapters.json"
+DEFAULT_PUBLISH_DIR = Path("frontend/public/contracts")
+DEFAULT_FRANCHISE_OVERRIDES_ROOT = Path("configs/data/franchises")
+DEFAULT_HOLDINGS_INDEX_DIR = Path(".local/holdings")
+EXPORT_FORMATS = ("json", "compact")
+POSTGRES_ONLY_COMMANDS = {
+    "validate-evidence",
+    "validate-canonical-events",
+    "validate-canonical-player-tenures",
+    "validate-canonical-pick-lifecycle",
+    "validate-canonical-event-asset-flows",
+    "validate-presentation-contract",
+    "validate-editorial-overlays",
+}
+
+
+def _add_page_size_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--page-size",
+        "--sample-limit",
+        dest="page_size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="Rows fetched per keyset page; every row is validated (--sample-limit is a deprecated alias).",
+    )
+
+
+def _add_draft_history_dir_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--draft-history-dir",
+        type=Path,
+        default=DEFAULT_DRAFT_HISTORY_DIR,
+        help="League-wide draft history store: each season is fetched once and reused by every team and run.",
+    )
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run redesign implementation tasks.")
+    parser.add_argument(
+        "--storage",
+        choices=STORAGE_BACKENDS,
+        default="postgres",
+        help="Storage backend for stage rows. The memory backend keeps a local snapshot file instead of a database.",
+    )
+    parser.add_argument(
+        "--storage-path",
+        type=Path,
+        help=f"Snapshot file for the memory backend (default {DEFAULT_MEMORY_STORE_PATH}).",
+    )
+    parser.add_argument(
+        "--franchise",
+        help=(
+            "Franchise code (e.g. BOS) whose partition to use: memory snapshots live under a per-franchise "
+            "directory and postgres connects to DATABASE_URL_<CODE>. Omit for the unpartitioned Memphis store."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record spans and row/byte counters around fetch, build, validate, and persist calls.",
+    )
+    parser.add_argument(
+        "--config-cache-dir",
+        type=Path,
+        default=DEFAULT_CONFIG_CACHE_DIR,
+        help="Cache parsed and validated override, editorial, and headshot files here, keyed by path, mtime, and content hash.",
+    )
+    parser.add_argument("--no-config-cache", action="store_true", help="Parse config files on every run without the cache.")
+    parser.add_argument("--profile-cprofile", action="store_true", help="Add a cProfile hot-function summary (implies --profile).")
+    parser.add_argument("--profile-memory", action="store_true", help="Track tracemalloc memory deltas (implies --profile).")
+    parser.add_argument(
+        "--profile-trace-path",
+        type=Path,
+        help="Write spans as Chrome trace-event JSON for chrome://tracing or Perfetto (implies --profile).",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     bootstrap_parser = subparsers.add_parser("bootstrap-evidence", help="Apply the Stage 1 evidence bootstrap SQL.")
@@ -86,24 +205,42 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         help="Ingest live evidence, normalize claims, load overrides, and validate Stage 1 rows.",
     )
     build_parser.add_argument("--sources", default="spotrac,nba_api")
-    build_parser.add_argument("--team-slug", default="memphis-grizzlies")
-    build_parser.add_argument("--team-code", default="mem")
-    build_parser.add_argument("--team-abbrevs", default="MEM,VAN")
+    build_parser.add_argument("--team-slug", help="Spotrac team slug (default from --franchise).")
+    build_parser.add_argument("--team-code", help="Spotrac team code (default from --franchise).")
+    build_parser.add_argument("--team-abbrevs", help="Draft history team abbreviations (default from --franchise).")
     build_parser.add_argument("--start-date", default="2016-01-01")
     build_parser.add_argument("--end-date", default=date.today().isoformat())
     build_parser.add_argument("--parser-version", default="stage1-live-v1")
     build_parser.add_argument("--normalizer-version", default="stage1-normalizer-v1")
     build_parser.add_argument("--overrides-path", type=Path, default=Path("configs/data"))
+    _add_draft_history_dir_argument(build_parser)
 
     normalize_parser = subparsers.add_parser("normalize-evidence", help="Normalize source records already loaded in DB.")
     normalize_parser.add_argument("--normalizer-version", default="stage1-normalizer-v1")
     normalize_parser.add_argument("--source-record-id")
+    normalize_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only normalize source records with no claims at --normalizer-version yet.",
+    )
+
+    load_source_records_parser = subparsers.add_parser(
+        "load-source-records",
+        help="Capture raw source records from local JSON files and normalize them without live fetches.",
+    )
+    load_source_records_parser.add_argument("--input-path", type=Path, required=True)
+    load_source_records_parser.add_argument("--normalizer-version", default="stage1-normalizer-v1")
 
     override_parser = subparsers.add_parser("load-overrides", help="Load override files into evidence.overrides.")
     override_parser.add_argument("--overrides-path", type=Path, default=Path("configs/data"))
 
     validate_parser = subparsers.add_parser("validate-evidence", help="Validate Stage 1 evidence rows currently in DB.")
-    validate_parser.add_argument("--sample-limit", type=int, default=5000)
+    _add_page_size_argument(validate_parser)
+    validate_parser.add_argument(
+        "--id-set-path",
+        type=Path,
+        help="Spill the source record ID set to a temporary SQLite file here instead of holding it in memory.",
+    )
 
     canonical_build_parser = subparsers.add_parser(
         "build-canonical-events",
@@ -115,7 +252,7 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         "validate-canonical-events",
         help="Validate canonical events and event provenance currently stored in DB.",
     )
-    canonical_validate_parser.add_argument("--sample-limit", type=int, default=5000)
+    _add_page_size_argument(canonical_validate_parser)
 
     bootstrap_pick_lifecycle_parser = subparsers.add_parser(
         "bootstrap-canonical-pick-lifecycle",
@@ -137,11 +274,27 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=Path("sql/0005_event_asset_flow_bootstrap.sql"),
     )
 
+    bootstrap_asset_lineage_parser = subparsers.add_parser(
+        "bootstrap-canonical-asset-lineage",
+        help="Apply the Stage 5 canonical asset lineage closure bootstrap SQL.",
+    )
+    bootstrap_asset_lineage_parser.add_argument(
+        "--sql-path",
+        type=Path,
+        default=Path("sql/0008_asset_lineage_bootstrap.sql"),
+    )
+
     build_pick_lifecycle_parser = subparsers.add_parser(
         "build-canonical-pick-lifecycle",
         help="Build Stage 4 canonical pick assets, transitions, and provenance from evidence plus Stage 2 events.",
     )
     build_pick_lifecycle_parser.add_argument("--builder-version", default="stage4-pick-lifecycle-v1")
+    build_pick_lifecycle_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Shard pick keys across this many worker processes; output matches the serial build.",
+    )
 
     build_event_asset_flow_parser = subparsers.add_parser(
         "build-canonical-event-asset-flows",
@@ -149,17 +302,30 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     )
     build_event_asset_flow_parser.add_argument("--builder-version", default="stage5-event-asset-flow-v1")
 
+    build_asset_lineage_parser = subparsers.add_parser(
+        "build-canonical-asset-lineage",
+        help="Refresh the Stage 5 asset lineage closure from event asset flows, incrementally when flows were only added.",
+    )
+    build_asset_lineage_parser.add_argument("--builder-version", default="stage5-asset-lineage-v1")
+
+    query_asset_lineage_parser = subparsers.add_parser(
+        "query-asset-lineage",
+        help="List every asset an asset became (descendants) or came from (ancestors), with depth and path.",
+    )
+    query_asset_lineage_parser.add_argument("--asset-id", required=True)
+    query_asset_lineage_parser.add_argument("--direction", choices=LINEAGE_DIRECTIONS, default="descendants")
+
     validate_pick_lifecycle_parser = subparsers.add_parser(
         "validate-canonical-pick-lifecycle",
         help="Validate canonical pick lifecycle tables currently stored in DB.",
     )
-    validate_pick_lifecycle_parser.add_argument("--sample-limit", type=int, default=5000)
+    _add_page_size_argument(validate_pick_lifecycle_parser)
 
     validate_event_asset_flow_parser = subparsers.add_parser(
         "validate-canonical-event-asset-flows",
         help="Validate canonical event asset flow tables currently stored in DB.",
     )
-    validate_event_asset_flow_parser.add_argument("--sample-limit", type=int, default=5000)
+    _add_page_size_argument(validate_event_asset_flow_parser)
 
     bootstrap_presentation_parser = subparsers.add_parser(
         "bootstrap-presentation-contract",
@@ -177,15 +343,29 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     )
     build_presentation_parser.add_argument("--builder-version", default="stage6-presentation-contract-v1")
 
+    activate_presentation_parser = subparsers.add_parser(
+        "activate-presentation-build",
+        help="Point readers at another retained Stage 6 presentation build, e.g. to roll back a bad build.",
+    )
+    activate_target = activate_presentation_parser.add_mutually_exclusive_group(required=True)
+    activate_target.add_argument("--build-id")
+    activate_target.add_argument("--previous", action="store_true", help="Swap back to the build that was current before.")
+
+    prune_presentation_parser = subparsers.add_parser(
+        "prune-presentation-builds",
+        help="Delete old Stage 6 presentation builds, keeping the newest, current, and previous builds.",
+    )
+    prune_presentation_parser.add_argument("--keep", type=int, default=PRESENTATION_BUILDS_RETAINED)
+
     validate_presentation_parser = subparsers.add_parser(
         "validate-presentation-contract",
         help="Validate Stage 6 presentation contract tables currently stored in DB.",
     )
-    validate_presentation_parser.add_argument("--sample-limit", type=int, default=5000)
+    _add_page_size_argument(validate_presentation_parser)
 
     export_presentation_parser = subparsers.add_parser(
         "export-presentation-contract",
-        help="Export the latest Stage 6 presentation contract as JSON.",
+        help="Export the current Stage 6 presentation contract as JSON.",
     )
     export_presentation_parser.add_argument("--output-path", type=Path)
     export_presentation_parser.add_argument(
@@ -193,10 +373,21 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Include Stage 7 editorial overlays in the exported JSON under an editorial key.",
     )
+    export_presentation_parser.add_argument(
+        "--base-path",
+        type=Path,
+        help="Write a delta against this previously exported contract instead of the full contract.",
+    )
+    export_presentation_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="json",
+        help="compact writes the binary columnar encoding (presentation.compact) instead of JSON.",
+    )
 
     build_layout_parser = subparsers.add_parser(
         "build-layout-contract",
-        help="Build the Stage 8 layout contract from the latest Stage 6 presentation and optional Stage 7 editorial data.",
+        help="Build the Stage 8 layout contract from the current Stage 6 presentation and optional Stage 7 editorial data.",
     )
     build_layout_parser.add_argument("--builder-version", default="stage8-layout-contract-v1")
     build_layout_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
@@ -204,12 +395,29 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
     validate_layout_parser = subparsers.add_parser(
         "validate-layout-contract",
-        help="Validate a generated Stage 8 layout contract against the latest Stage 6 presentation and optional Stage 7 editorial data.",
+        help="Validate a generated Stage 8 layout contract against the current Stage 6 presentation and optional Stage 7 editorial data.",
     )
     validate_layout_parser.add_argument("--builder-version", default="stage8-layout-contract-v1")
     validate_layout_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
     validate_layout_parser.add_argument("--frontend-public-root", type=Path, default=Path("frontend/public"))
 
+    serve_contracts_parser = subparsers.add_parser(
+        "serve-contracts",
+        help="Serve the current presentation, layout, and editorial contracts read-only over HTTP with ETags and slice caching.",
+    )
+    serve_contracts_parser.add_argument("--host", default=DEFAULT_SERVICE_HOST)
+    serve_contracts_parser.add_argument("--port", type=int, default=DEFAULT_SERVICE_PORT)
+    serve_contracts_parser.add_argument("--cache-entries", type=int, default=DEFAULT_CACHE_ENTRIES)
+    serve_contracts_parser.add_argument(
+        "--refresh-interval-seconds",
+        type=float,
+        default=DEFAULT_REFRESH_INTERVAL_SECONDS,
+        help="How often the current build ids are re-read to detect a new build.",
+    )
+    serve_contracts_parser.add_argument("--builder-version", default="stage8-layout-contract-v1")
+    serve_contracts_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
+    serve_contracts_parser.add_argument("--frontend-public-root", type=Path, default=Path("frontend/public"))
+
     export_layout_parser = subparsers.add_parser(
         "export-layout-contract",
         help="Export the Stage 8 layout contract as JSON.",
@@ -218,6 +426,17 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     export_layout_parser.add_argument("--builder-version", default="stage8-layout-contract-v1")
     export_layout_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
     export_layout_parser.add_argument("--frontend-public-root", type=Path, default=Path("frontend/public"))
+    export_layout_parser.add_argument(
+        "--base-path",
+        type=Path,
+        help="Write a delta against this previously exported contract instead of the full contract.",
+    )
+    export_layout_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="json",
+        help="compact writes the binary columnar encoding (presentation.compact) instead of JSON.",
+    )
 
     bootstrap_editorial_parser = subparsers.add_parser(
         "bootstrap-editorial-overlays",
@@ -263,6 +482,20 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     export_editorial_chapters_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
     export_editorial_chapters_parser.add_argument("--frontend-public-root", type=Path, default=Path("frontend/public"))
 
+    publish_contracts_parser = subparsers.add_parser(
+        "publish-contracts",
+        help="Publish content-hashed, precompressed presentation/layout/chapter JSON plus a manifest.",
+    )
+    publish_contracts_parser.add_argument("--output-dir", type=Path, default=DEFAULT_PUBLISH_DIR)
+    publish_contracts_parser.add_argument("--builder-version", default="stage8-layout-contract-v1")
+    publish_contracts_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
+    publish_contracts_parser.add_argument("--frontend-public-root", type=Path, default=Path("frontend/public"))
+    publish_contracts_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete previously published hashed files that the new manifest no longer references.",
+    )
+
     bootstrap_player_tenure_parser = subparsers.add_parser(
         "bootstrap-canonical-player-tenure",
         help="Apply the Stage 3 canonical player tenure bootstrap SQL.",
@@ -283,24 +516,209 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         "validate-canonical-player-tenures",
         help="Validate canonical player tenure tables currently stored in DB.",
     )
-    validate_player_tenure_parser.add_argument("--sample-limit", type=int, default=5000)
+    _add_page_size_argument(validate_player_tenure_parser)
+
+    run_pipeline_parser = subparsers.add_parser(
+        "run-pipeline",
+        help="Rebuild Stages 2-7 as a dependency graph, running independent stages in parallel worker processes.",
+    )
+    run_pipeline_parser.add_argument("--max-workers", type=int)
+    run_pipeline_parser.add_argument("--editorial-input-path", type=Path, default=Path("configs/data"))
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Watch the curated override, editorial, and headshot files and rebuild only the stages each edit invalidates.",
+    )
+    watch_parser.add_argument("--overrides-path", type=Path, default=Path("configs/data"))
+    watch_parser.add_argument("--editorial-input-path", type=Path, default=Path("configs/data"))
+    watch_parser.add_argument("--headshot-manifest-path", type=Path, default=Path("configs/data/stage8_headshot_manifest.yaml"))
+    watch_parser.add_argument("--frontend-public-root", type=Path, default=Path("frontend/public"))
+    watch_parser.add_argument("--builder-version", default="stage8-layout-contract-v1")
+    watch_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Rewrite the presentation, editorial, and layout contract JSON that each rebuild touched into this directory.",
+    )
+    watch_parser.add_argument("--poll-seconds", type=float, default=DEFAULT_WATCH_POLL_SECONDS)
+    watch_parser.add_argument("--max-rebuilds", type=int, help="Stop after this many rebuilds instead of watching until interrupted.")
+    watch_parser.add_argument(
+        "--rebuild-on-start",
+        action="store_true",
+        help="Rebuild every watched subgraph once before waiting for edits.",
+    )
+
+    run_franchises_parser = subparsers.add_parser(
+        "run-franchises",
+        help="Capture evidence and rebuild Stages 1-6 for several franchises at once, one worker process per franchise partition.",
+    )
+    run_franchises_parser.add_argument("--franchises", default=DEFAULT_FRANCHISE.code, help="Comma-separated franchise codes, or all.")
+    run_franchises_parser.add_argument("--sources", default="spotrac,nba_api")
+    run_franchises_parser.add_argument(
+        "--input-root",
+        type=Path,
+        help="Load raw source records from <input-root>/<code>/ JSON files instead of fetching live evidence.",
+    )
+    run_franchises_parser.add_argument("--start-date", default="2016-01-01")
+    run_franchises_parser.add_argument("--end-date", default=date.today().isoformat())
+    run_franchises_parser.add_argument("--parser-version", default="stage1-live-v1")
+    run_franchises_parser.add_argument("--normalizer-version", default="stage1-normalizer-v1")
+    run_franchises_parser.add_argument(
+        "--overrides-root",
+        type=Path,
+        default=DEFAULT_FRANCHISE_OVERRIDES_ROOT,
+        help="Load each franchise's overrides from <overrides-root>/<code>/ when that directory exists.",
+    )
+    run_franchises_parser.add_argument("--max-workers", type=int)
+    _add_draft_history_dir_argument(run_franchises_parser)
+
+    suggest_merges_parser = subparsers.add_parser(
+        "suggest-event-merges",
+        help="Suggest merge_event_cluster overrides for trade rows that share a date and counterparty.",
+    )
+    suggest_merges_parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_MERGE_SCORE)
+    suggest_merges_parser.add_argument(
+        "--output-path",
+        type=Path,
+        default=Path(".local/suggestions/stage2_event_merge_suggestions.yaml"),
+    )
+
+    query_holdings_parser = subparsers.add_parser(
+        "query-holdings",
+        help="Answer as-of, date-range and diff queries over tenures, pick stages and asset states.",
+    )
+    holdings_query = query_holdings_parser.add_mutually_exclusive_group(required=True)
+    holdings_query.add_argument("--as-of", type=date.fromisoformat)
+    holdings_query.add_argument("--between", nargs=2, type=date.fromisoformat, metavar=("START", "END"))
+    holdings_query.add_argument("--diff", nargs=2, type=date.fromisoformat, metavar=("FROM", "TO"))
+    query_holdings_parser.add_argument("--kind", action="append", choices=INTERVAL_KINDS)
+    query_holdings_parser.add_argument(
+        "--index-path",
+        type=Path,
+        help="Defaults to one index per storage backend and franchise under .local/holdings/.",
+    )
+    query_holdings_parser.add_argument("--rebuild-index", action="store_true")
+
+    benchmark_parser = subparsers.add_parser(
+        "benchmark-pipeline",
+        help="Time and memory-profile each stage builder against a deterministic synthetic franchise dataset.",
+    )
+    benchmark_parser.add_argument("--teams", type=int, default=2)
+    benchmark_parser.add_argument("--seasons", type=int, default=5)
+    benchmark_parser.add_argument("--trades-per-season", type=int, default=4)
+    benchmark_parser.add_argument("--multi-asset-trade-rate", type=float, default=0.3)
+    benchmark_parser.add_argument("--pick-swaps-per-season", type=int, default=1)
+    benchmark_parser.add_argument("--roster-size", type=int, default=5)
+    benchmark_parser.add_argument("--seed", type=int, default=0)
+    benchmark_parser.add_argument("--repeat", type=int, default=1)
+    benchmark_parser.add_argument("--skip-memory", action="store_true")
+    benchmark_parser.add_argument("--output-path", type=Path, default=Path(".local/benchmarks/pipeline.json"))
 
     return parser.parse_args(argv)
 
 
-def _connect():
+def _connect(franchise_code: str | None = None):
     try:
         import psycopg
     except ModuleNotFoundError as exc:
         raise RuntimeError("psycopg is required for redesign CLI database commands.") from exc
-    return psycopg.connect(load_database_url())
+    return psycopg.connect(load_database_url(franchise_code))
+
+
+def _franchise(args: argparse.Namespace) -> Franchise:
+    return franchise_for(args.franchise) if args.franchise else DEFAULT_FRANCHISE
+
+
+def _repository_factory(args: argparse.Namespace, *, read_only: bool = False):
+    if args.franchise:
+        partition = franchise_partition(_franchise(args), storage=args.storage, storage_path=args.storage_path)
+        return partition.repository_factory(read_only=read_only)
+    if args.storage == "memory":
+        return partial(open_repository, "memory", args.storage_path or DEFAULT_MEMORY_STORE_PATH, read_only=read_only)
+    return partial(open_repository, args.storage, read_only=read_only)
+
+
+def _open_repository(args: argparse.Namespace) -> StageRepository:
+    return _repository_factory(args)()
+
+
+def _default_holdings_index_path(args: argparse.Namespace) -> Path:
+    return DEFAULT_HOLDINGS_INDEX_DIR / f"{args.storage}-{(args.franchise or 'default').lower()}-holdings-index.json"
+
+
+def _load_raw_source_records(input_path: Path) -> list[dict[str, object]]:
+    paths = sorted(input_path.rglob("*.json")) if input_path.is_dir() else [input_path]
+    raw_records: list[dict[str, object]] = []
+    for path in paths:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        raw_records.extend(payload if isinstance(payload, list) else [payload])
+    return raw_records
+
+
+@traced("build")
+def _normalize_records(source_records: Sequence[SourceRecord], *, normalizer_version: str) -> list[NormalizedClaim]:
+    return [
+        claim
+        for record in source_records
+        for claim in normalize_source_record(record, normalizer_version=normalizer_version)
+    ]
+
+
+def _write_payload(output_path: Path | None, payload: str) -> None:
+    if output_path is not None:
+        output_path.write_text(payload + "\n", encoding="utf-8")
+
+
+def _build_layout_contract(args: argparse.Namespace, repository: StageRepository):
+    presentation_result = repository.fetch_presentation_contract()
+    try:
+        editorial_result = repository.fetch_editorial_overlays()
+    except RuntimeError:
+        editorial_result = None
+    return build_layout_contract(
+        presentation_result=presentation_result,
+        editorial_overlays=editorial_result,
+        builder_version=args.builder_version,
+        headshot_manifest_path=args.headshot_manifest_path,
+        frontend_public_root=args.frontend_public_root,
+    )
 
 
 def _emit(payload: dict[str, object]) -> int:
+    profiler = active_profiler()
+    if profiler is not None:
+        profiler.write_trace()
+        payload = {**payload, "profile": profiler.as_dict()}
     print(json.dumps(payload, sort_keys=True, default=str))
     return 0
 
 
+def _export_compact(args: argparse.Namespace, payload: str) -> int:
+    if args.output_path is None or args.base_path is not None:
+        raise ValueError("--format compact requires --output-path and cannot be combined with --base-path")
+    path = write_compact_contract(json.loads(payload), args.output_path)
+    return _emit(
+        {
+            "command": args.command,
+            "status": "success",
+            "output_path": str(path),
+            "format": args.format,
+            "json_byte_count": len(payload.encode("utf-8")),
+            "compact_byte_count": path.stat().st_size,
+        }
+    )
+
+
+def _export_payload(args: argparse.Namespace, payload: str) -> tuple[str, dict[str, object]]:
+    if args.base_path is None:
+        return payload, {}
+    delta = build_contract_delta(load_contract_payload(args.base_path), json.loads(payload))
+    return contract_delta_to_json(delta), {
+        "base_path": str(args.base_path),
+        "target_content_hash": delta.target_content_hash,
+        **delta.counts(),
+    }
+
+
 def _prepare_output_path(output_path: Path | None) -> Path | None:
     if output_path is None:
         return None
@@ -353,10 +771,19 @@ def export_editorial_chapters_json(
     builder_version: str = "stage8-layout-contract-v1",
     headshot_manifest_path: Path | str = Path("configs/data/stage8_headshot_manifest.yaml"),
     frontend_public_root: Path | str = Path("frontend/public"),
+    repository: StageRepository | None = None,
 ) -> str:
-    with _connect() as conn:
-        presentation_result = fetch_presentation_contract(conn)
-        editorial_result = fetch_editorial_overlays(conn)
+    if repository is None:
+        with open_repository() as repository:
+            return export_editorial_chapters_json(
+                output_path,
+                builder_version=builder_version,
+                headshot_manifest_path=headshot_manifest_path,
+                frontend_public_root=frontend_public_root,
+                repository=repository,
+            )
+    presentation_result = repository.fetch_presentation_contract()
+    editorial_result = repository.fetch_editorial_overlays()
     layout_result = build_layout_contract(
         presentation_result=presentation_result,
         editorial_overlays=editorial_result,
@@ -388,6 +815,21 @@ def export_editorial_chapters_json(
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
+    with config_cache_session(None if args.no_config_cache else args.config_cache_dir):
+        if not (args.profile or args.profile_cprofile or args.profile_memory or args.profile_trace_path):
+            return _run_command(args)
+        with profiling_session(
+            args.command,
+            cprofile=args.profile_cprofile,
+            memory=args.profile_memory,
+            trace_path=args.profile_trace_path,
+        ):
+            return _run_command(args)
+
+
+def _run_command(args: argparse.Namespace) -> int:
+    if args.storage != "postgres" and (args.command.startswith("bootstrap-") or args.command in POSTGRES_ONLY_COMMANDS):
+        raise RuntimeError(f"{args.command} requires --storage postgres")
 
     if args.command == "bootstrap-evidence":
         bootstrap_evidence_schema(args.sql_path)
@@ -405,6 +847,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         bootstrap_canonical_event_asset_flow_schema(args.sql_path)
         return _emit({"command": args.command, "sql_path": str(args.sql_path), "status": "success"})
 
+    if args.command == "bootstrap-canonical-asset-lineage":
+        bootstrap_canonical_asset_lineage_schema(args.sql_path)
+        return _emit({"command": args.command, "sql_path": str(args.sql_path), "status": "success"})
+
     if args.command == "bootstrap-presentation-contract":
         bootstrap_presentation_contract_schema(args.sql_path)
         return _emit({"command": args.command, "sql_path": str(args.sql_path), "status": "success"})
@@ -414,32 +860,34 @@ def main(argv: Sequence[str] | None = None) -> int:
         return _emit({"command": args.command, "sql_path": str(args.sql_path), "status": "success"})
 
     if args.command == "build-evidence":
+        franchise = _franchise(args)
         sources = {entry.strip().lower() for entry in args.sources.split(",") if entry.strip()}
-        team_abbrevs = {entry.strip().upper() for entry in args.team_abbrevs.split(",") if entry.strip()}
+        team_abbrevs = (
+            {entry.strip().upper() for entry in args.team_abbrevs.split(",") if entry.strip()}
+            if args.team_abbrevs
+            else set(franchise.abbrevs)
+        )
         source_records = build_live_source_records(
             sources=sources,
-            team_slug=args.team_slug,
-            team_code=args.team_code,
+            team_slug=args.team_slug or franchise.slug,
+            team_code=args.team_code or franchise.spotrac_code,
             team_abbrevs=team_abbrevs,
             start_date=date.fromisoformat(args.start_date),
             end_date=date.fromisoformat(args.end_date),
             parser_version=args.parser_version,
+            draft_history_store=DraftHistoryStore(args.draft_history_dir),
         )
         override_bundle = load_override_bundle(args.overrides_path)
 
-        with _connect() as conn:
-            inserted_source_records = insert_source_records(conn, source_records)
-            normalized_claims = [
-                claim
-                for record in source_records
-                for claim in normalize_source_record(
-                    record,
-                    normalizer_version=args.normalizer_version,
-                )
-            ]
-            inserted_claims = insert_normalized_claims(conn, normalized_claims)
-            override_counts = insert_override_bundle(conn, override_bundle)
-            conn.commit()
+        with _open_repository(args) as repository:
+            inserted_source_records = repository.insert_source_records(source_records)
+            normalized_claims = _normalize_records(source_records, normalizer_version=args.normalizer_version)
+            inserted_claims = repository.insert_normalized_claims(normalized_claims)
+            repository.record_normalized_source_records(
+                (record.source_record_id for record in source_records), args.normalizer_version
+            )
+            override_counts = repository.insert_override_bundle(override_bundle)
+            repository.commit()
 
         report = validate_stage1_rows(
             source_records=source_records,
@@ -461,18 +909,49 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "normalize-evidence":
-        with _connect() as conn:
-            claims = normalize_source_records(
-                conn,
-                normalizer_version=args.normalizer_version,
+        with _open_repository(args) as repository:
+            source_records = repository.fetch_source_records(
                 source_record_id=args.source_record_id,
+                pending_normalizer_version=args.normalizer_version if args.incremental else None,
+            )
+            skipped_source_records = (
+                repository.count_source_records(source_record_id=args.source_record_id) - len(source_records)
+                if args.incremental
+                else 0
+            )
+            claims = _normalize_records(source_records, normalizer_version=args.normalizer_version)
+            inserted_claims = repository.insert_normalized_claims(claims)
+            repository.record_normalized_source_records(
+                (record.source_record_id for record in source_records), args.normalizer_version
+            )
+            repository.commit()
+        return _emit(
+            {
+                "command": args.command,
+                "status": "success",
+                "source_record_count": len(source_records),
+                "skipped_source_record_count": skipped_source_records,
+                "normalized_claim_count": len(claims),
+                "inserted_claim_count": inserted_claims,
+            }
+        )
+
+    if args.command == "load-source-records":
+        source_records = capture_source_records(_load_raw_source_records(args.input_path))
+        with _open_repository(args) as repository:
+            inserted_source_records = repository.insert_source_records(source_records)
+            claims = _normalize_records(source_records, normalizer_version=args.normalizer_version)
+            inserted_claims = repository.insert_normalized_claims(claims)
+            repository.record_normalized_source_records(
+                (record.source_record_id for record in source_records), args.normalizer_version
             )
-            inserted_claims = insert_normalized_claims(conn, claims)
-            conn.commit()
+            repository.commit()
         return _emit(
             {
                 "command": args.command,
                 "status": "success",
+                "source_record_count": len(source_records),
+                "inserted_source_record_count": inserted_source_records,
                 "normalized_claim_count": len(claims),
                 "inserted_claim_count": inserted_claims,
             }
@@ -480,95 +959,23 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.command == "load-overrides":
         bundle = load_override_bundle(args.overrides_path)
-        with _connect() as conn:
-            counts = insert_override_bundle(conn, bundle)
-            conn.commit()
+        with _open_repository(args) as repository:
+            counts = repository.insert_override_bundle(bundle)
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
     if args.command == "validate-evidence":
-        with _connect() as conn:
-            source_records = fetch_source_records(conn)
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    select
-                        claim_id,
-                        source_record_id,
-                        claim_type,
-                        claim_subject_type,
-                        claim_subject_key,
-                        claim_group_hint,
-                        claim_date,
-                        source_sequence,
-                        claim_payload,
-                        confidence_flag,
-                        normalizer_version,
-                        created_at
-                    from evidence.normalized_claims
-                    order by created_at, claim_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                claim_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        override_id,
-                        override_type,
-                        target_type,
-                        target_key,
-                        payload,
-                        reason,
-                        authored_by,
-                        authored_at,
-                        is_active
-                    from evidence.overrides
-                    order by authored_at, override_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
+        source_record_ids = open_id_set(args.id_set_path)
+        try:
+            with _connect(args.franchise) as conn:
+                report = validate_stage1_pages(
+                    source_record_pages=iter_source_record_pages(conn, page_size=args.page_size),
+                    claim_pages=iter_normalized_claim_pages(conn, page_size=args.page_size),
+                    override_pages=iter_override_pages(conn, page_size=args.page_size),
+                    source_record_ids=source_record_ids,
                 )
-                override_rows = cur.fetchall()
-
-        from evidence.models import NormalizedClaim, OverrideRecord
-
-        claims = [
-            NormalizedClaim(
-                claim_id=row[0],
-                source_record_id=row[1],
-                claim_type=row[2],
-                claim_subject_type=row[3],
-                claim_subject_key=row[4],
-                claim_group_hint=row[5],
-                claim_date=row[6],
-                source_sequence=row[7],
-                claim_payload=row[8],
-                confidence_flag=row[9],
-                normalizer_version=row[10],
-                created_at=row[11],
-            )
-            for row in claim_rows
-        ]
-        overrides = [
-            OverrideRecord(
-                override_id=row[0],
-                override_type=row[1],
-                target_type=row[2],
-                target_key=row[3],
-                payload=row[4],
-                reason=row[5],
-                authored_by=row[6],
-                authored_at=row[7],
-                is_active=row[8],
-            )
-            for row in override_rows
-        ]
-        report = validate_stage1_rows(
-            source_records=source_records,
-            normalized_claims=claims,
-            overrides=overrides,
-        )
+        finally:
+            source_record_ids.close()
         return _emit(
             {
                 "command": args.command,
@@ -582,7 +989,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "validate-editorial-overlays":
-        with _connect() as conn:
+        with _connect(args.franchise) as conn:
             editorial_result = fetch_editorial_overlays(conn)
             with conn.cursor() as cur:
                 cur.execute(
@@ -670,34 +1077,85 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "build-canonical-events":
-        counts = build_and_persist_canonical_events(builder_version=args.builder_version)
+        with _open_repository(args) as repository:
+            counts = run_stage("canonical-events", repository, builder_version=args.builder_version)
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
     if args.command == "build-canonical-pick-lifecycle":
-        counts = build_and_persist_canonical_pick_lifecycle(builder_version=args.builder_version)
+        with _open_repository(args) as repository:
+            counts = run_stage(
+                "canonical-pick-lifecycle",
+                repository,
+                builder_version=args.builder_version,
+                workers=args.workers,
+                franchise=_franchise(args),
+            )
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
     if args.command == "build-canonical-event-asset-flows":
-        counts = build_and_persist_canonical_event_asset_flows(builder_version=args.builder_version)
+        with _open_repository(args) as repository:
+            counts = run_stage("canonical-event-asset-flows", repository, builder_version=args.builder_version)
+            repository.commit()
+        return _emit({"command": args.command, "status": "success", **counts})
+
+    if args.command == "build-canonical-asset-lineage":
+        with _open_repository(args) as repository:
+            counts = run_stage("canonical-asset-lineage", repository, builder_version=args.builder_version)
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
+    if args.command == "query-asset-lineage":
+        with _open_repository(args) as repository:
+            rows = repository.fetch_asset_lineage(args.asset_id, direction=args.direction)
+        return _emit(
+            {
+                "command": args.command,
+                "status": "success",
+                "asset_id": args.asset_id,
+                "direction": args.direction,
+                "lineage_count": len(rows),
+                "lineage": [row.as_dict() for row in rows],
+            }
+        )
+
     if args.command == "build-presentation-contract":
-        counts = build_and_persist_presentation_contract(builder_version=args.builder_version)
+        with _open_repository(args) as repository:
+            counts = run_stage("presentation-contract", repository, builder_version=args.builder_version)
+            repository.commit()
+        return _emit({"command": args.command, "status": "success", **counts})
+
+    if args.command == "activate-presentation-build":
+        with _open_repository(args) as repository:
+            build_id = args.build_id
+            if args.previous:
+                build_id = repository.fetch_previous_presentation_build_id()
+                if build_id is None:
+                    raise RuntimeError("no previous presentation build to activate")
+            swap = repository.activate_presentation_build(build_id)
+            repository.commit()
+        return _emit({"command": args.command, "status": "success", **swap})
+
+    if args.command == "prune-presentation-builds":
+        with _open_repository(args) as repository:
+            counts = repository.prune_presentation_builds(keep=args.keep)
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
     if args.command == "build-layout-contract":
-        result = build_layout_contract_from_db(
-            builder_version=args.builder_version,
-            headshot_manifest_path=args.headshot_manifest_path,
-            frontend_public_root=args.frontend_public_root,
-        )
+        with _open_repository(args) as repository:
+            result = _build_layout_contract(args, repository)
         return _emit({"command": args.command, "status": "success", **result.counts()})
 
     if args.command == "load-editorial-overlays":
-        counts = build_and_persist_editorial_overlays(
-            input_path=args.input_path,
-            builder_version=args.builder_version,
-        )
+        with _open_repository(args) as repository:
+            counts = run_editorial_stage(
+                repository,
+                input_path=args.input_path,
+                builder_version=args.builder_version,
+            )
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
     if args.command == "bootstrap-canonical-player-tenure":
@@ -705,82 +1163,172 @@ def main(argv: Sequence[str] | None = None) -> int:
         return _emit({"command": args.command, "sql_path": str(args.sql_path), "status": "success"})
 
     if args.command == "build-canonical-player-tenures":
-        counts = build_and_persist_canonical_player_tenures(builder_version=args.builder_version)
+        with _open_repository(args) as repository:
+            counts = run_stage(
+                "canonical-player-tenures",
+                repository,
+                builder_version=args.builder_version,
+                franchise=_franchise(args),
+            )
+            repository.commit()
         return _emit({"command": args.command, "status": "success", **counts})
 
-    if args.command == "validate-canonical-events":
-        with _connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    select
-                        event_id,
-                        event_type,
-                        event_date,
-                        event_order,
-                        event_label,
-                        description,
-                        transaction_group_key,
-                        is_compound,
-                        notes,
-                        created_at,
-                        updated_at
-                    from canonical.events
-                    order by event_date, event_order, event_id
-                    """,
-                )
-                event_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        event_provenance_id,
-                        event_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.event_provenance
-                    order by created_at, event_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                provenance_rows = cur.fetchall()
+    if args.command == "run-pipeline":
+        result = run_stage_graph(
+            default_stage_graph(
+                repository_factory=_repository_factory(args, read_only=True),
+                editorial_input_path=args.editorial_input_path,
+                franchise=_franchise(args),
+            ),
+            connect=_repository_factory(args),
+            max_workers=args.max_workers,
+        )
+        return _emit({"command": args.command, "status": "success", **result.counts()})
+
+    if args.command == "watch":
+        targets = WatchTargets(
+            overrides_path=args.overrides_path,
+            editorial_input_path=args.editorial_input_path,
+            headshot_manifest_path=args.headshot_manifest_path,
+        )
+        rebuild_options = {
+            "franchise": _franchise(args),
+            "layout_builder_version": args.builder_version,
+            "frontend_public_root": args.frontend_public_root,
+            "output_dir": args.output_dir,
+        }
 
-        from canonical.models import CanonicalEvent, EventProvenance
+        rebuilt: list[WatchRebuildResult] = []
 
-        events = [
-            CanonicalEvent(
-                event_id=row[0],
-                event_type=row[1],
-                event_date=row[2],
-                event_order=row[3],
-                event_label=row[4],
-                description=row[5],
-                transaction_group_key=row[6],
-                is_compound=row[7],
-                notes=row[8],
-                created_at=row[9],
-                updated_at=row[10],
+        def _print_rebuild(result: WatchRebuildResult) -> None:
+            rebuilt.append(result)
+            print(json.dumps({"command": args.command, "status": "rebuilt", **result.counts()}, sort_keys=True, default=str), flush=True)
+
+        def _print_error(exc: Exception) -> None:
+            print(json.dumps({"command": args.command, "status": "rebuild_failed", "error": str(exc)}, sort_keys=True), flush=True)
+
+        with _open_repository(args) as repository:
+            if args.rebuild_on_start:
+                _print_rebuild(rebuild_affected(repository, WATCH_ROOT_STAGES, targets=targets, **rebuild_options))
+            try:
+                watch_configs(
+                    repository,
+                    targets=targets,
+                    poll_seconds=args.poll_seconds,
+                    max_rebuilds=args.max_rebuilds,
+                    on_rebuild=_print_rebuild,
+                    on_error=_print_error,
+                    **rebuild_options,
+                )
+            except KeyboardInterrupt:
+                pass
+        return _emit({"command": args.command, "status": "stopped", "rebuild_count": len(rebuilt)})
+
+    if args.command == "run-franchises":
+        franchises = parse_franchise_codes(args.franchises)
+        if args.input_root is not None:
+            source_records_by_franchise = {
+                franchise.code: capture_source_records(_load_raw_source_records(args.input_root / franchise.code.lower()))
+                if (args.input_root / franchise.code.lower()).is_dir()
+                else []
+                for franchise in franchises
+            }
+        else:
+            source_records_by_franchise = build_league_source_records(
+                sources={entry.strip().lower() for entry in args.sources.split(",") if entry.strip()},
+                franchises=franchises,
+                start_date=date.fromisoformat(args.start_date),
+                end_date=date.fromisoformat(args.end_date),
+                parser_version=args.parser_version,
+                draft_history_store=DraftHistoryStore(args.draft_history_dir),
             )
-            for row in event_rows
-        ]
-        provenance = [
-            EventProvenance(
-                event_provenance_id=row[0],
-                event_id=row[1],
-                source_record_id=row[2],
-                claim_id=row[3],
-                override_id=row[4],
-                provenance_role=row[5],
-                fallback_reason=row[6],
-                created_at=row[7],
+        jobs = [
+            FranchiseRunJob(
+                partition=franchise_partition(franchise, storage=args.storage, storage_path=args.storage_path),
+                source_records=source_records_by_franchise[franchise.code],
+                normalizer_version=args.normalizer_version,
+                overrides_path=(
+                    args.overrides_root / franchise.code.lower()
+                    if (args.overrides_root / franchise.code.lower()).is_dir()
+                    else None
+                ),
             )
-            for row in provenance_rows
+            for franchise in franchises
         ]
-        report = validate_canonical_events(events=events, provenance_rows=provenance)
+        results = run_franchises(jobs, max_workers=args.max_workers)
+        return _emit(
+            {
+                "command": args.command,
+                "status": "success",
+                "franchise_count": len(results),
+                "franchises": {result.franchise_code: result.counts() for result in results},
+            }
+        )
+
+    if args.command == "suggest-event-merges":
+        with _open_repository(args) as repository:
+            claims, overrides = repository.fetch_event_build_inputs()
+        result = suggest_event_merges(claims, overrides, min_score=args.min_score)
+        output_path = write_merge_suggestions(result, args.output_path)
+        return _emit(
+            {
+                "command": args.command,
+                "status": "success",
+                "output_path": str(output_path),
+                **result.counts(),
+            }
+        )
+
+    if args.command == "query-holdings":
+        index_path = args.index_path or _default_holdings_index_path(args)
+        with _repository_factory(args, read_only=True)() as repository:
+            # The cached index is only reused while it was built from the store's latest canonical build.
+            index = None if args.rebuild_index or not index_path.exists() else load_holdings_index(index_path)
+            if index is None or index.canonical_build_id != repository.fetch_latest_canonical_build_id():
+                _, assets, _, player_tenures, _, pick_resolutions, asset_states, _, canonical_build_id = (
+                    repository.fetch_presentation_contract_build_inputs()
+                )
+                index = build_holdings_index(
+                    assets=assets,
+                    player_tenures=player_tenures,
+                    pick_resolutions=pick_resolutions,
+                    asset_states=asset_states,
+                    canonical_build_id=canonical_build_id,
+                )
+                write_holdings_index(index, index_path)
+        payload: dict[str, object] = {
+            "command": args.command,
+            "status": "success",
+            "index_path": str(index_path),
+            "canonical_build_id": index.canonical_build_id,
+        }
+        if args.diff:
+            payload.update(index.diff(*args.diff, kinds=args.kind).as_dict())
+        else:
+            rows = index.as_of(args.as_of, kinds=args.kind) if args.as_of else index.between(*args.between, kinds=args.kind)
+            payload.update({"holding_count": len(rows), "holdings": [row.as_dict() for row in rows]})
+        return _emit(payload)
+
+    if args.command == "benchmark-pipeline":
+        config = SyntheticFranchiseConfig(
+            teams=args.teams,
+            seasons=args.seasons,
+            trades_per_season=args.trades_per_season,
+            multi_asset_trade_rate=args.multi_asset_trade_rate,
+            pick_swaps_per_season=args.pick_swaps_per_season,
+            roster_size=args.roster_size,
+            seed=args.seed,
+        )
+        result = run_benchmark(config, repeat=args.repeat, trace_memory=not args.skip_memory)
+        output_path = write_benchmark_result(result, args.output_path)
+        return _emit({"command": args.command, "status": "success", "output_path": str(output_path), **result.as_dict()})
+
+    if args.command == "validate-canonical-events":
+        with _connect(args.franchise) as conn:
+            report = validate_canonical_events(
+                events=list(iter_event_rows(conn, page_size=args.page_size)),
+                provenance_rows=iter_event_provenance_rows(conn, page_size=args.page_size),
+            )
         return _emit(
             {
                 "command": args.command,
@@ -793,296 +1341,18 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "validate-canonical-pick-lifecycle":
-        with _connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    select
-                        pick_asset_id,
-                        origin_team_code,
-                        draft_year,
-                        draft_round,
-                        protection_summary,
-                        protection_payload,
-                        drafted_player_id,
-                        current_pick_stage,
-                        created_at,
-                        updated_at
-                    from canonical.pick_asset
-                    order by created_at, pick_asset_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                pick_asset_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        pick_asset_provenance_id,
-                        pick_asset_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.pick_asset_provenance
-                    order by created_at, pick_asset_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                pick_asset_provenance_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        pick_resolution_id,
-                        pick_asset_id,
-                        state_type,
-                        effective_start_date,
-                        effective_end_date,
-                        overall_pick_number,
-                        lottery_context,
-                        drafted_player_id,
-                        source_event_id,
-                        state_payload,
-                        created_at,
-                        updated_at
-                    from canonical.pick_resolution
-                    order by created_at, pick_resolution_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                pick_resolution_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        pick_resolution_provenance_id,
-                        pick_resolution_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.pick_resolution_provenance
-                    order by created_at, pick_resolution_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                pick_resolution_provenance_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_id,
-                        asset_kind,
-                        player_tenure_id,
-                        pick_asset_id,
-                        asset_label,
-                        created_at,
-                        updated_at
-                    from canonical.asset
-                    where pick_asset_id is not null
-                    order by created_at, asset_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_provenance_id,
-                        asset_id,
-                        player_tenure_id,
-                        pick_asset_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.asset_provenance
-                    where pick_asset_id is not null
-                    order by created_at, asset_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_provenance_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        player_id,
-                        display_name,
-                        normalized_name,
-                        nba_person_id,
-                        created_at,
-                        updated_at
-                    from canonical.player_identity
-                    order by created_at, player_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                player_identity_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        event_id,
-                        event_type,
-                        event_date,
-                        event_order,
-                        event_label,
-                        description,
-                        transaction_group_key,
-                        is_compound,
-                        notes,
-                        created_at,
-                        updated_at
-                    from canonical.events
-                    order by event_date, event_order, event_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                event_rows = cur.fetchall()
-
-        from canonical.models import (
-            AssetProvenance,
-            CanonicalAsset,
-            CanonicalEvent,
-            CanonicalPickAsset,
-            CanonicalPickResolution,
-            CanonicalPlayerIdentity,
-            PickAssetProvenance,
-            PickResolutionProvenance,
-        )
-
-        pick_assets = [
-            CanonicalPickAsset(
-                pick_asset_id=row[0],
-                origin_team_code=row[1],
-                draft_year=row[2],
-                draft_round=row[3],
-                protection_summary=row[4],
-                protection_payload=row[5],
-                drafted_player_id=row[6],
-                current_pick_stage=row[7],
-                created_at=row[8],
-                updated_at=row[9],
-            )
-            for row in pick_asset_rows
-        ]
-        pick_asset_provenance = [
-            PickAssetProvenance(
-                pick_asset_provenance_id=row[0],
-                pick_asset_id=row[1],
-                source_record_id=row[2],
-                claim_id=row[3],
-                override_id=row[4],
-                provenance_role=row[5],
-                fallback_reason=row[6],
-                created_at=row[7],
-            )
-            for row in pick_asset_provenance_rows
-        ]
-        pick_resolutions = [
-            CanonicalPickResolution(
-                pick_resolution_id=row[0],
-                pick_asset_id=row[1],
-                state_type=row[2],
-                effective_start_date=row[3],
-                effective_end_date=row[4],
-                overall_pick_number=row[5],
-                lottery_context=row[6],
-                drafted_player_id=row[7],
-                source_event_id=row[8],
-                state_payload=row[9],
-                created_at=row[10],
-                updated_at=row[11],
-            )
-            for row in pick_resolution_rows
-        ]
-        pick_resolution_provenance = [
-            PickResolutionProvenance(
-                pick_resolution_provenance_id=row[0],
-                pick_resolution_id=row[1],
-                source_record_id=row[2],
-                claim_id=row[3],
-                override_id=row[4],
-                provenance_role=row[5],
-                fallback_reason=row[6],
-                created_at=row[7],
-            )
-            for row in pick_resolution_provenance_rows
-        ]
-        assets = [
-            CanonicalAsset(
-                asset_id=row[0],
-                asset_kind=row[1],
-                player_tenure_id=row[2],
-                pick_asset_id=row[3],
-                asset_label=row[4],
-                created_at=row[5],
-                updated_at=row[6],
-            )
-            for row in asset_rows
-        ]
-        asset_provenance = [
-            AssetProvenance(
-                asset_provenance_id=row[0],
-                asset_id=row[1],
-                player_tenure_id=row[2],
-                pick_asset_id=row[3],
-                source_record_id=row[4],
-                claim_id=row[5],
-                override_id=row[6],
-                provenance_role=row[7],
-                fallback_reason=row[8],
-                created_at=row[9],
-            )
-            for row in asset_provenance_rows
-        ]
-        player_identities = [
-            CanonicalPlayerIdentity(
-                player_id=row[0],
-                display_name=row[1],
-                normalized_name=row[2],
-                nba_person_id=row[3],
-                created_at=row[4],
-                updated_at=row[5],
-            )
-            for row in player_identity_rows
-        ]
-        events = [
-            CanonicalEvent(
-                event_id=row[0],
-                event_type=row[1],
-                event_date=row[2],
-                event_order=row[3],
-                event_label=row[4],
-                description=row[5],
-                transaction_group_key=row[6],
-                is_compound=row[7],
-                notes=row[8],
-                created_at=row[9],
-                updated_at=row[10],
+        with _connect(args.franchise) as conn:
+            report = validate_canonical_pick_lifecycle(
+                player_identities=list(iter_player_identity_rows(conn, page_size=args.page_size)),
+                pick_assets=list(iter_pick_asset_rows(conn, page_size=args.page_size)),
+                pick_asset_provenance_rows=iter_pick_asset_provenance_rows(conn, page_size=args.page_size),
+                pick_resolutions=list(iter_pick_resolution_rows(conn, page_size=args.page_size)),
+                pick_resolution_provenance_rows=iter_pick_resolution_provenance_rows(conn, page_size=args.page_size),
+                assets=list(iter_asset_rows(conn, page_size=args.page_size, pick_assets_only=True)),
+                asset_provenance_rows=iter_asset_provenance_rows(conn, page_size=args.page_size, pick_assets_only=True),
+                events=list(iter_event_rows(conn, page_size=args.page_size)),
+                franchise=_franchise(args),
             )
-            for row in event_rows
-        ]
-        report = validate_canonical_pick_lifecycle(
-            player_identities=player_identities,
-            pick_assets=pick_assets,
-            pick_asset_provenance_rows=pick_asset_provenance,
-            pick_resolutions=pick_resolutions,
-            pick_resolution_provenance_rows=pick_resolution_provenance,
-            assets=assets,
-            asset_provenance_rows=asset_provenance,
-            events=events,
-        )
         return _emit(
             {
                 "command": args.command,
@@ -1099,140 +1369,14 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "validate-canonical-event-asset-flows":
-        with _connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    select
-                        event_id,
-                        event_type,
-                        event_date,
-                        event_order,
-                        event_label,
-                        description,
-                        transaction_group_key,
-                        is_compound,
-                        notes,
-                        created_at,
-                        updated_at
-                    from canonical.events
-                    order by event_date, event_order, event_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                event_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_id,
-                        asset_kind,
-                        player_tenure_id,
-                        pick_asset_id,
-                        asset_label,
-                        created_at,
-                        updated_at
-                    from canonical.asset
-                    order by asset_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        event_asset_flow_id,
-                        event_id,
-                        asset_id,
-                        flow_direction,
-                        flow_role,
-                        flow_order,
-                        effective_date,
-                        created_at
-                    from canonical.event_asset_flow
-                    order by event_id, flow_order, event_asset_flow_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                flow_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        event_asset_flow_provenance_id,
-                        event_asset_flow_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.event_asset_flow_provenance
-                    order by created_at, event_asset_flow_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                provenance_rows = cur.fetchall()
-
-        from canonical.models import CanonicalAsset, CanonicalEvent, CanonicalEventAssetFlow, EventAssetFlowProvenance
-
-        events = [
-            CanonicalEvent(
-                event_id=row[0],
-                event_type=row[1],
-                event_date=row[2],
-                event_order=row[3],
-                event_label=row[4],
-                description=row[5],
-                transaction_group_key=row[6],
-                is_compound=row[7],
-                notes=row[8],
-                created_at=row[9],
-                updated_at=row[10],
-            )
-            for row in event_rows
-        ]
-        assets = [
-            CanonicalAsset(
-                asset_id=row[0],
-                asset_kind=row[1],
-                player_tenure_id=row[2],
-                pick_asset_id=row[3],
-                asset_label=row[4],
-                created_at=row[5],
-                updated_at=row[6],
-            )
-            for row in asset_rows
-        ]
-        flows = [
-            CanonicalEventAssetFlow(
-                event_asset_flow_id=row[0],
-                event_id=row[1],
-                asset_id=row[2],
-                flow_direction=row[3],
-                flow_role=row[4],
-                flow_order=row[5],
-                effective_date=row[6],
-                created_at=row[7],
+        with _connect(args.franchise) as conn:
+            report = validate_canonical_event_asset_flows(
+                events=list(iter_event_rows(conn, page_size=args.page_size)),
+                assets=list(iter_asset_rows(conn, page_size=args.page_size)),
+                flows=list(iter_event_asset_flow_rows(conn, page_size=args.page_size)),
+                provenance_rows=iter_event_asset_flow_provenance_rows(conn, page_size=args.page_size),
+                franchise=_franchise(args),
             )
-            for row in flow_rows
-        ]
-        provenance = [
-            EventAssetFlowProvenance(
-                event_asset_flow_provenance_id=row[0],
-                event_asset_flow_id=row[1],
-                source_record_id=row[2],
-                claim_id=row[3],
-                override_id=row[4],
-                provenance_role=row[5],
-                fallback_reason=row[6],
-                created_at=row[7],
-            )
-            for row in provenance_rows
-        ]
-        report = validate_canonical_event_asset_flows(events=events, assets=assets, flows=flows, provenance_rows=provenance)
         return _emit(
             {
                 "command": args.command,
@@ -1247,49 +1391,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "validate-presentation-contract":
-        with _connect() as conn:
+        with _connect(args.franchise) as conn:
             result = fetch_presentation_contract(conn)
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    select
-                        event_id,
-                        event_type,
-                        event_date,
-                        event_order,
-                        event_label,
-                        description,
-                        transaction_group_key,
-                        is_compound,
-                        notes,
-                        created_at,
-                        updated_at
-                    from canonical.events
-                    order by event_date, event_order, event_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                event_rows = cur.fetchall()
-
-        from canonical.models import CanonicalEvent
-
-        events = [
-            CanonicalEvent(
-                event_id=row[0],
-                event_type=row[1],
-                event_date=row[2],
-                event_order=row[3],
-                event_label=row[4],
-                description=row[5],
-                transaction_group_key=row[6],
-                is_compound=row[7],
-                notes=row[8],
-                created_at=row[9],
-                updated_at=row[10],
-            )
-            for row in event_rows
-        ]
+            events = list(iter_event_rows(conn, page_size=args.page_size))
         report = validate_presentation_contract(
             nodes=result.nodes,
             edges=result.edges,
@@ -1309,10 +1413,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
 
     if args.command == "validate-layout-contract":
-        with _connect() as conn:
-            presentation_result = fetch_presentation_contract(conn)
+        with _open_repository(args) as repository:
+            presentation_result = repository.fetch_presentation_contract()
             try:
-                editorial_result = fetch_editorial_overlays(conn)
+                editorial_result = repository.fetch_editorial_overlays()
             except RuntimeError:
                 editorial_result = None
         layout_result = build_layout_contract(
@@ -1336,6 +1440,8 @@ def main(argv: Sequence[str] | None = None) -> int:
                 "event_layout_count": report.event_layout_count,
                 "label_layout_count": report.label_layout_count,
                 "chapter_layout_count": report.chapter_layout_count,
+                "lod_tier_count": report.lod_tier_count,
+                "spatial_index_entry_count": report.spatial_index_entry_count,
                 "errors": report.errors,
                 "warnings": report.warnings,
             }
@@ -1343,290 +1449,114 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.command == "export-presentation-contract":
         output_path = _prepare_output_path(args.output_path)
-        payload = export_presentation_contract_json(output_path, include_editorial=args.include_editorial)
+        with _open_repository(args) as repository:
+            editorial_result = repository.fetch_editorial_overlays() if args.include_editorial else None
+            payload = presentation_contract_to_json(repository.fetch_presentation_contract(), editorial_overlays=editorial_result)
+        if args.format == "compact":
+            return _export_compact(args, payload)
+        payload, delta_counts = _export_payload(args, payload)
+        _write_payload(output_path, payload)
         if args.output_path is None:
             print(payload)
             return 0
-        return _emit({"command": args.command, "status": "success", "output_path": str(args.output_path)})
+        return _emit({"command": args.command, "status": "success", "output_path": str(args.output_path), **delta_counts})
 
-    if args.command == "export-layout-contract":
-        output_path = _prepare_output_path(args.output_path)
-        payload = export_layout_contract_json(
-            output_path,
+    if args.command == "serve-contracts":
+        service = ContractService(
+            _repository_factory(args, read_only=True),
             builder_version=args.builder_version,
             headshot_manifest_path=args.headshot_manifest_path,
             frontend_public_root=args.frontend_public_root,
+            cache_entries=args.cache_entries,
+            refresh_interval_seconds=args.refresh_interval_seconds,
         )
+
+        def _announce(host: str, port: int) -> None:
+            print(json.dumps({"command": args.command, "status": "listening", "host": host, "port": port}), flush=True)
+
+        try:
+            asyncio.run(service.serve_forever(args.host, args.port, on_ready=_announce))
+        except KeyboardInterrupt:
+            pass
+        return _emit({"command": args.command, "status": "stopped", **service.stats.counts()})
+
+    if args.command == "export-layout-contract":
+        output_path = _prepare_output_path(args.output_path)
+        with _open_repository(args) as repository:
+            payload = layout_contract_to_json(_build_layout_contract(args, repository))
+        if args.format == "compact":
+            return _export_compact(args, payload)
+        payload, delta_counts = _export_payload(args, payload)
+        _write_payload(output_path, payload)
         if args.output_path is None:
             print(payload)
             return 0
-        return _emit({"command": args.command, "status": "success", "output_path": str(args.output_path)})
+        return _emit({"command": args.command, "status": "success", "output_path": str(args.output_path), **delta_counts})
 
     if args.command == "export-editorial-overlays":
         output_path = _prepare_output_path(args.output_path)
-        payload = export_editorial_overlays_json(output_path)
+        with _open_repository(args) as repository:
+            payload = editorial_overlays_to_json(repository.fetch_editorial_overlays())
+        _write_payload(output_path, payload)
         if args.output_path is None:
             print(payload)
             return 0
         return _emit({"command": args.command, "status": "success", "output_path": str(args.output_path)})
 
+    if args.command == "publish-contracts":
+        with _open_repository(args) as repository:
+            payloads = {
+                "presentation-contract": presentation_contract_to_json(repository.fetch_presentation_contract()),
+                "layout-contract": layout_contract_to_json(_build_layout_contract(args, repository)),
+            }
+            try:
+                repository.fetch_editorial_overlays()
+            except RuntimeError:
+                pass
+            else:
+                payloads["editorial-chapters"] = export_editorial_chapters_json(
+                    builder_version=args.builder_version,
+                    headshot_manifest_path=args.headshot_manifest_path,
+                    frontend_public_root=args.frontend_public_root,
+                    repository=repository,
+                )
+        result = publish_contract_artifacts(payloads, args.output_dir, prune=args.prune)
+        return _emit(
+            {
+                "command": args.command,
+                "status": "success",
+                "manifest_path": str(result.manifest_path),
+                "artifacts": [row.as_dict() for row in result.artifacts],
+                **result.counts(),
+            }
+        )
+
     if args.command == "export-editorial-chapters":
         output_path = _prepare_output_path(args.output_path)
-        payload = export_editorial_chapters_json(
-            output_path,
-            builder_version=args.builder_version,
-            headshot_manifest_path=args.headshot_manifest_path,
-            frontend_public_root=args.frontend_public_root,
-        )
+        with _open_repository(args) as repository:
+            payload = export_editorial_chapters_json(
+                output_path,
+                builder_version=args.builder_version,
+                headshot_manifest_path=args.headshot_manifest_path,
+                frontend_public_root=args.frontend_public_root,
+                repository=repository,
+            )
         if args.output_path is None:
             print(payload)
             return 0
         return _emit({"command": args.command, "status": "success", "output_path": str(args.output_path)})
 
     if args.command == "validate-canonical-player-tenures":
-        with _connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    select
-                        player_id,
-                        display_name,
-                        normalized_name,
-                        nba_person_id,
-                        created_at,
-                        updated_at
-                    from canonical.player_identity
-                    order by player_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                player_identity_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        player_identity_provenance_id,
-                        player_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.player_identity_provenance
-                    order by created_at, player_identity_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                player_identity_provenance_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        player_tenure_id,
-                        player_id,
-                        tenure_start_date,
-                        tenure_end_date,
-                        entry_event_id,
-                        exit_event_id,
-                        tenure_type,
-                        roster_path_type,
-                        created_at,
-                        updated_at
-                    from canonical.player_tenure
-                    order by player_id, tenure_start_date, player_tenure_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                player_tenure_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_id,
-                        asset_kind,
-                        player_tenure_id,
-                        pick_asset_id,
-                        asset_label,
-                        created_at,
-                        updated_at
-                    from canonical.asset
-                    order by asset_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_provenance_id,
-                        asset_id,
-                        player_tenure_id,
-                        pick_asset_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.asset_provenance
-                    order by created_at, asset_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_provenance_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_state_id,
-                        asset_id,
-                        state_type,
-                        effective_start_date,
-                        effective_end_date,
-                        state_payload,
-                        source_event_id,
-                        created_at,
-                        updated_at
-                    from canonical.asset_state
-                    order by created_at, asset_state_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_state_rows = cur.fetchall()
-                cur.execute(
-                    """
-                    select
-                        asset_state_provenance_id,
-                        asset_state_id,
-                        source_record_id,
-                        claim_id,
-                        override_id,
-                        provenance_role,
-                        fallback_reason,
-                        created_at
-                    from canonical.asset_state_provenance
-                    order by created_at, asset_state_provenance_id
-                    limit %s
-                    """,
-                    (args.sample_limit,),
-                )
-                asset_state_provenance_rows = cur.fetchall()
-
-        from canonical.models import (
-            AssetProvenance,
-            AssetState,
-            AssetStateProvenance,
-            CanonicalAsset,
-            CanonicalPlayerIdentity,
-            CanonicalPlayerTenure,
-            PlayerIdentityProvenance,
-        )
-
-        player_identities = [
-            CanonicalPlayerIdentity(
-                player_id=row[0],
-                display_name=row[1],
-                normalized_name=row[2],
-                nba_person_id=row[3],
-                created_at=row[4],
-                updated_at=row[5],
-            )
-            for row in player_identity_rows
-        ]
-        player_identity_provenance = [
-            PlayerIdentityProvenance(
-                player_identity_provenance_id=row[0],
-                player_id=row[1],
-                source_record_id=row[2],
-                claim_id=row[3],
-                override_id=row[4],
-                provenance_role=row[5],
-                fallback_reason=row[6],
-                created_at=row[7],
-            )
-            for row in player_identity_provenance_rows
-        ]
-        tenures = [
-            CanonicalPlayerTenure(
-                player_tenure_id=row[0],
-                player_id=row[1],
-                tenure_start_date=row[2],
-                tenure_end_date=row[3],
-                entry_event_id=row[4],
-                exit_event_id=row[5],
-                tenure_type=row[6],
-                roster_path_type=row[7],
-                created_at=row[8],
-                updated_at=row[9],
+        with _connect(args.franchise) as conn:
+            report = validate_canonical_player_tenures(
+                player_identities=list(iter_player_identity_rows(conn, page_size=args.page_size)),
+                player_identity_provenance_rows=iter_player_identity_provenance_rows(conn, page_size=args.page_size),
+                player_tenures=list(iter_player_tenure_rows(conn, page_size=args.page_size)),
+                assets=list(iter_asset_rows(conn, page_size=args.page_size)),
+                asset_provenance_rows=iter_asset_provenance_rows(conn, page_size=args.page_size),
+                asset_states=list(iter_asset_state_rows(conn, page_size=args.page_size)),
+                asset_state_provenance_rows=iter_asset_state_provenance_rows(conn, page_size=args.page_size),
             )
-            for row in player_tenure_rows
-        ]
-        assets = [
-            CanonicalAsset(
-                asset_id=row[0],
-                asset_kind=row[1],
-                player_tenure_id=row[2],
-                pick_asset_id=row[3],
-                asset_label=row[4],
-                created_at=row[5],
-                updated_at=row[6],
-            )
-            for row in asset_rows
-        ]
-        asset_provenance = [
-            AssetProvenance(
-                asset_provenance_id=row[0],
-                asset_id=row[1],
-                player_tenure_id=row[2],
-                pick_asset_id=row[3],
-                source_record_id=row[4],
-                claim_id=row[5],
-                override_id=row[6],
-                provenance_role=row[7],
-                fallback_reason=row[8],
-                created_at=row[9],
-            )
-            for row in asset_provenance_rows
-        ]
-        asset_states = [
-            AssetState(
-                asset_state_id=row[0],
-                asset_id=row[1],
-                state_type=row[2],
-                effective_start_date=row[3],
-                effective_end_date=row[4],
-                state_payload=row[5],
-                source_event_id=row[6],
-                created_at=row[7],
-                updated_at=row[8],
-            )
-            for row in asset_state_rows
-        ]
-        asset_state_provenance = [
-            AssetStateProvenance(
-                asset_state_provenance_id=row[0],
-                asset_state_id=row[1],
-                source_record_id=row[2],
-                claim_id=row[3],
-                override_id=row[4],
-                provenance_role=row[5],
-                fallback_reason=row[6],
-                created_at=row[7],
-            )
-            for row in asset_state_provenance_rows
-        ]
-        report = validate_canonical_player_tenures(
-            player_identities=player_identities,
-            player_identity_provenance_rows=player_identity_provenance,
-            player_tenures=tenures,
-            assets=assets,
-            asset_provenance_rows=asset_provenance,
-            asset_states=asset_states,
-            asset_state_provenance_rows=asset_state_provenance,
-        )
         return _emit(
             {
                 "command": args.command,
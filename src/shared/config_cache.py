@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+import yaml
+
+
+T = TypeVar("T")
+
+DEFAULT_CONFIG_CACHE_DIR = Path(".local/config-cache")
+CONFIG_CACHE_FORMAT_VERSION = 1
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_ACTIVE_CONFIG_CACHE_DIR: Path | None = None
+
+
+def load_yaml_text(raw_text: str) -> Any:
+    return yaml.load(raw_text, Loader=YAML_LOADER)
+
+
+def parse_structured_text(path: Path, raw_text: str) -> Any:
+    if path.suffix.lower() == ".json":
+        return json.loads(raw_text)
+    return load_yaml_text(raw_text)
+
+
+def schema_fingerprint(model: Any) -> str:
+    # Cached values are pickled validated models, so a field or type change must miss the cache
+    # rather than hand back instances built against the old schema.
+    schema = json.dumps(model.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+def active_config_cache_dir() -> Path | None:
+    return _ACTIVE_CONFIG_CACHE_DIR
+
+
+@contextmanager
+def config_cache_session(cache_dir: Path | str | None) -> Iterator[Path | None]:
+    global _ACTIVE_CONFIG_CACHE_DIR
+    previous = _ACTIVE_CONFIG_CACHE_DIR
+    _ACTIVE_CONFIG_CACHE_DIR = Path(cache_dir) if cache_dir is not None else None
+    try:
+        yield _ACTIVE_CONFIG_CACHE_DIR
+    finally:
+        _ACTIVE_CONFIG_CACHE_DIR = previous
+
+
+def _read_entry(entry_path: Path) -> dict[str, Any] | None:
+    try:
+        entry = pickle.loads(entry_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A stale entry whose classes moved or changed is just a cache miss.
+        return None
+    if not isinstance(entry, dict) or entry.get("format_version") != CONFIG_CACHE_FORMAT_VERSION:
+        return None
+    return entry
+
+
+def _write_entry(entry_path: Path, entry: dict[str, Any]) -> None:
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+    staging_path.write_bytes(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(staging_path, entry_path)
+
+
+def load_cached_file(path: Path | str, namespace: str, load: Callable[[str], T]) -> T:
+    # Entries are keyed by resolved path; an unchanged mtime and size skips the read entirely,
+    # and a matching content hash skips the parse when only the mtime moved.
+    file_path = Path(path)
+    cache_dir = _ACTIVE_CONFIG_CACHE_DIR
+    if cache_dir is None:
+        return load(file_path.read_text(encoding="utf-8"))
+
+    resolved = file_path.resolve()
+    stat = resolved.stat()
+    entry_path = cache_dir / namespace / f"{hashlib.sha1(str(resolved).encode('utf-8')).hexdigest()[:24]}.pickle"
+    entry = _read_entry(entry_path)
+    if entry is not None and entry["path"] != str(resolved):
+        entry = None
+    if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry["value"]
+
+    content = resolved.read_bytes()
+    content_hash = hashlib.sha256(content).hexdigest()
+    if entry is not None and entry["content_hash"] == content_hash:
+        value = entry["value"]
+    else:
+        value = load(content.decode("utf-8"))
+    _write_entry(
+        entry_path,
+        {
+            "format_version": CONFIG_CACHE_FORMAT_VERSION,
+            "path": str(resolved),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "content_hash": content_hash,
+            "value": value,
+        },
+    )
+    return value
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class Franchise:
+    code: str
+    slug: str
+    place_names: tuple[str, ...]
+    nickname: str
+    abbrevs: tuple[str, ...]
+
+    @property
+    def spotrac_code(self) -> str:
+        return self.code.lower()
+
+    @property
+    def display_place(self) -> str:
+        return " ".join(word.upper() if word == "la" else word.capitalize() for word in self.place_names[0].split())
+
+    @property
+    def incoming_markers(self) -> tuple[str, ...]:
+        nickname = self.nickname.lower()
+        return (
+            *(f"to {place}" for place in self.place_names),
+            f"to the {nickname}",
+            *(f"joins {place}" for place in self.place_names),
+            *(f"acquired by {place}" for place in self.place_names),
+            *(f"{place} acquires" for place in self.place_names),
+        )
+
+    @property
+    def outgoing_markers(self) -> tuple[str, ...]:
+        return tuple(
+            marker
+            for place in self.place_names
+            for marker in (f"from {place}", f"released by {place}", f"waived by {place}")
+        )
+
+    def trade_direction(self, description: str | None, *, outgoing_markers: Iterable[str] = ()) -> str:
+        # Description heuristics read from this franchise's side: "to <city>" is incoming,
+        # "from <city>" plus the caller's team-agnostic markers is outgoing.
+        text = (description or "").lower()
+        if any(marker in text for marker in self.incoming_markers):
+            return "incoming"
+        if any(marker in text for marker in (*self.outgoing_markers, *outgoing_markers)):
+            return "outgoing"
+        return "unknown"
+
+
+def _franchise(code: str, slug: str, place_names: tuple[str, ...], nickname: str, *former_abbrevs: str) -> Franchise:
+    return Franchise(code=code, slug=slug, place_names=place_names, nickname=nickname, abbrevs=(code, *former_abbrevs))
+
+
+FRANCHISES: dict[str, Franchise] = {
+    franchise.code: franchise
+    for franchise in (
+        _franchise("ATL", "atlanta-hawks", ("atlanta",), "Hawks"),
+        _franchise("BOS", "boston-celtics", ("boston",), "Celtics"),
+        _franchise("BKN", "brooklyn-nets", ("brooklyn",), "Nets", "NJN"),
+        _franchise("CHA", "charlotte-hornets", ("charlotte",), "Hornets", "CHO"),
+        _franchise("CHI", "chicago-bulls", ("chicago",), "Bulls"),
+        _franchise("CLE", "cleveland-cavaliers", ("cleveland",), "Cavaliers"),
+        _franchise("DAL", "dallas-mavericks", ("dallas",), "Mavericks"),
+        _franchise("DEN", "denver-nuggets", ("denver",), "Nuggets"),
+        _franchise("DET", "detroit-pistons", ("detroit",), "Pistons"),
+        _franchise("GSW", "golden-state-warriors", ("golden state",), "Warriors"),
+        _franchise("HOU", "houston-rockets", ("houston",), "Rockets"),
+        _franchise("IND", "indiana-pacers", ("indiana",), "Pacers"),
+        _franchise("LAC", "la-clippers", ("la clippers", "los angeles clippers"), "Clippers"),
+        _franchise("LAL", "los-angeles-lakers", ("la lakers", "los angeles lakers"), "Lakers"),
+        _franchise("MEM", "memphis-grizzlies", ("memphis",), "Grizzlies", "VAN"),
+        _franchise("MIA", "miami-heat", ("miami",), "Heat"),
+        _franchise("MIL", "milwaukee-bucks", ("milwaukee",), "Bucks"),
+        _franchise("MIN", "minnesota-timberwolves", ("minnesota",), "Timberwolves"),
+        _franchise("NOP", "new-orleans-pelicans", ("new orleans",), "Pelicans", "NOH", "NOK"),
+        _franchise("NYK", "new-york-knicks", ("new york",), "Knicks"),
+        _franchise("OKC", "oklahoma-city-thunder", ("oklahoma city",), "Thunder", "SEA"),
+        _franchise("ORL", "orlando-magic", ("orlando",), "Magic"),
+        _franchise("PHI", "philadelphia-76ers", ("philadelphia",), "76ers"),
+        _franchise("PHX", "phoenix-suns", ("phoenix",), "Suns"),
+        _franchise("POR", "portland-trail-blazers", ("portland",), "Trail Blazers"),
+        _franchise("SAC", "sacramento-kings", ("sacramento",), "Kings"),
+        _franchise("SAS", "san-antonio-spurs", ("san antonio",), "Spurs"),
+        _franchise("TOR", "toronto-raptors", ("toronto",), "Raptors"),
+        _franchise("UTA", "utah-jazz", ("utah",), "Jazz"),
+        _franchise("WAS", "washington-wizards", ("washington",), "Wizards"),
+    )
+}
+DEFAULT_FRANCHISE = FRANCHISES["MEM"]
+
+
+def franchise_for(code: str) -> Franchise:
+    franchise = FRANCHISES.get(code.strip().upper())
+    if franchise is None:
+        raise ValueError(f"unknown franchise code: {code}")
+    return franchise
+
+
+def parse_franchise_codes(value: str) -> list[Franchise]:
+    if value.strip().lower() == "all":
+        return list(FRANCHISES.values())
+    franchises = [franchise_for(entry) for entry in value.split(",") if entry.strip()]
+    if not franchises:
+        raise ValueError("at least one franchise code is required")
+    return list(dict.fromkeys(franchises))
+
+
+def franchise_by_abbrev(franchises: Iterable[Franchise]) -> dict[str, Franchise]:
+    return {abbrev: franchise for franchise in franchises for abbrev in franchise.abbrevs}
+
+
+def franchise_partition_path(path: Path | str, franchise: Franchise) -> Path:
+    base = Path(path)
+    return base.parent / franchise.code.lower() / base.name
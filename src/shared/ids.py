@@ -2,23 +2,85 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+
+# One shared encoder: json.dumps builds a new JSONEncoder per call whenever options are passed.
+_encode_stable_json = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str).encode
 
 
 def _stable_part(value: Any) -> str:
     if value is None:
         return ""
     if isinstance(value, (dict, list, tuple)):
-        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+        return _encode_stable_json(value)
     return str(value)
 
 
+# Long free text (descriptions, notes) is rarely repeated and would only grow the dictionary.
+MAX_INTERNED_LENGTH = 128
+
+
+class IdDictionary:
+    # Build-scoped dictionary encoding: every distinct ID string is kept once and all rows share that
+    # object, with a dense integer surrogate per ID for columnar encodings.
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: str) -> str:
+        if len(value) > MAX_INTERNED_LENGTH:
+            return value
+        code = self._codes.get(value)
+        return self._values[self.encode(value) if code is None else code]
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def decode(self, code: int) -> str:
+        return self._values[code]
+
+    def values(self) -> list[str]:
+        return list(self._values)
+
+
+# A context variable, so concurrent builds on other threads or tasks never share (or swap out)
+# each other's dictionary.
+_ACTIVE_ID_DICTIONARY: ContextVar[IdDictionary | None] = ContextVar("active_id_dictionary", default=None)
+
+
+def active_id_dictionary() -> IdDictionary | None:
+    return _ACTIVE_ID_DICTIONARY.get()
+
+
+@contextmanager
+def id_dictionary_session(ids: IdDictionary | None = None) -> Iterator[IdDictionary]:
+    previous = _ACTIVE_ID_DICTIONARY.get()
+    if ids is None:
+        ids = previous if previous is not None else IdDictionary()
+    token = _ACTIVE_ID_DICTIONARY.set(ids)
+    try:
+        yield ids
+    finally:
+        _ACTIVE_ID_DICTIONARY.reset(token)
+
+
 def stable_id(prefix: str, *parts: Any, length: int = 24) -> str:
     joined = "|".join(_stable_part(value) for value in parts)
     digest = hashlib.sha1(joined.encode("utf-8")).hexdigest()[:length]
-    return f"{prefix}_{digest}"
+    ids = _ACTIVE_ID_DICTIONARY.get()
+    return ids.intern(f"{prefix}_{digest}") if ids is not None else f"{prefix}_{digest}"
 
 
 def stable_payload_hash(payload: dict[str, Any]) -> str:
-    normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    normalized = _encode_stable_json(payload)
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
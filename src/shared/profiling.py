@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, is_dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+
+JsonDict = dict[str, Any]
+F = TypeVar("F", bound=Callable[..., Any])
+
+CPROFILE_TOP_FUNCTIONS = 25
+ID_HASHING_FUNCTIONS = {"stable_id", "stable_payload_hash", "_stable_part"}
+
+
+@dataclass
+class ProfileSpan:
+    name: str
+    category: str
+    start_seconds: float
+    duration_seconds: float = 0.0
+    thread_id: int = 0
+    depth: int = 0
+    attributes: JsonDict = field(default_factory=dict)
+
+    def as_dict(self) -> JsonDict:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "start_seconds": round(self.start_seconds, 6),
+            "duration_seconds": round(self.duration_seconds, 6),
+            "depth": self.depth,
+            **({"attributes": self.attributes} if self.attributes else {}),
+        }
+
+
+@dataclass
+class Profiler:
+    name: str
+    cprofile: bool = False
+    memory: bool = False
+    trace_path: Path | None = None
+    spans: list[ProfileSpan] = field(default_factory=list)
+    counters: Counter[str] = field(default_factory=Counter)
+    started_at: float = field(default_factory=time.perf_counter)
+    measure_seconds: float = 0.0
+    _profile: cProfile.Profile | None = None
+
+    def start(self) -> None:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes: Any) -> Iterator[ProfileSpan]:
+        row = ProfileSpan(
+            name=name,
+            category=category,
+            start_seconds=time.perf_counter() - self.started_at,
+            thread_id=threading.get_ident(),
+            depth=_SPAN_DEPTH.get(),
+            attributes=dict(attributes),
+        )
+        memory_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        depth_token = _SPAN_DEPTH.set(row.depth + 1)
+        try:
+            yield row
+        finally:
+            _SPAN_DEPTH.reset(depth_token)
+            row.duration_seconds = time.perf_counter() - self.started_at - row.start_seconds
+            if memory_before is not None and tracemalloc.is_tracing():
+                row.attributes["memory_delta_bytes"] = tracemalloc.get_traced_memory()[0] - memory_before
+            self.spans.append(row)
+            self.counters[f"{category}.calls"] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    def measure_bytes(self, row: ProfileSpan, payload: Any) -> None:
+        # Measured as the span closes so only the size outlives the call, never the payload. The
+        # serialization lands in the enclosing span, so its total is reported as measure_seconds.
+        started = time.perf_counter()
+        row.attributes["bytes"] = payload_bytes(payload)
+        self.counters[f"{row.category}.bytes"] += row.attributes["bytes"]
+        self.measure_seconds += time.perf_counter() - started
+
+    def _category_totals(self) -> JsonDict:
+        totals: dict[str, float] = {}
+        for row in self.spans:
+            if row.category != "command":
+                totals[row.category] = totals.get(row.category, 0.0) + row.duration_seconds
+        return {category: round(seconds, 6) for category, seconds in sorted(totals.items())}
+
+    def _cprofile_summary(self) -> JsonDict:
+        if self._profile is None:
+            return {}
+        stats = pstats.Stats(self._profile)
+        rows = []
+        id_hashing_calls = 0
+        id_hashing_seconds = 0.0
+        for (filename, line_number, function_name), (_, calls, total_time, cumulative_time, _) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{Path(filename).name}:{line_number}:{function_name}",
+                    "calls": calls,
+                    "total_seconds": round(total_time, 6),
+                    "cumulative_seconds": round(cumulative_time, 6),
+                }
+            )
+            if function_name in ID_HASHING_FUNCTIONS and Path(filename).name == "ids.py":
+                id_hashing_calls += calls
+                id_hashing_seconds += total_time
+        rows.sort(key=lambda row: (-row["cumulative_seconds"], row["function"]))
+        return {
+            "top_functions": rows[:CPROFILE_TOP_FUNCTIONS],
+            "id_hashing": {"calls": id_hashing_calls, "total_seconds": round(id_hashing_seconds, 6)},
+        }
+
+    def as_dict(self) -> JsonDict:
+        payload: JsonDict = {
+            "name": self.name,
+            "wall_seconds": round(time.perf_counter() - self.started_at, 6),
+            "measure_seconds": round(self.measure_seconds, 6),
+            "seconds_by_category": self._category_totals(),
+            "counters": dict(sorted(self.counters.items())),
+            "spans": [row.as_dict() for row in sorted(self.spans, key=lambda row: row.start_seconds)],
+        }
+        if self.memory and tracemalloc.is_tracing():
+            payload["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        if self._profile is not None:
+            payload["cprofile"] = self._cprofile_summary()
+        if self.trace_path is not None:
+            payload["trace_path"] = str(self.trace_path)
+        return payload
+
+    def chrome_trace(self) -> JsonDict:
+        pid = os.getpid()
+        events: list[JsonDict] = [
+            {
+                "name": row.name,
+                "cat": row.category,
+                "ph": "X",
+                "ts": round(row.start_seconds * 1_000_000, 3),
+                "dur": round(row.duration_seconds * 1_000_000, 3),
+                "pid": pid,
+                "tid": row.thread_id,
+                "args": row.attributes,
+            }
+            for row in sorted(self.spans, key=lambda row: row.start_seconds)
+        ]
+        end_ts = round((time.perf_counter() - self.started_at) * 1_000_000, 3)
+        events.extend(
+            {"name": name, "ph": "C", "ts": end_ts, "pid": pid, "tid": 0, "args": {"value": value}}
+            for name, value in sorted(self.counters.items())
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"name": self.name}}
+
+    def write_trace(self) -> Path | None:
+        if self.trace_path is None:
+            return None
+        self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+        self.trace_path.write_text(json.dumps(self.chrome_trace(), default=str) + "\n", encoding="utf-8")
+        return self.trace_path
+
+
+# Context variables rather than globals: a session and its span nesting belong to the thread or
+# task that opened them. Stage workers run in other processes (or threads) with no active session,
+# so run-pipeline profiles cover persistence on the scheduler connection; worker build time is
+# reported by the scheduler's per-stage run_seconds instead.
+_ACTIVE_PROFILER: ContextVar[Profiler | None] = ContextVar("active_profiler", default=None)
+_SPAN_DEPTH: ContextVar[int] = ContextVar("profile_span_depth", default=0)
+
+
+def active_profiler() -> Profiler | None:
+    return _ACTIVE_PROFILER.get()
+
+
+@contextmanager
+def profiling_session(
+    name: str,
+    *,
+    cprofile: bool = False,
+    memory: bool = False,
+    trace_path: Path | str | None = None,
+) -> Iterator[Profiler]:
+    if _ACTIVE_PROFILER.get() is not None:
+        raise RuntimeError("a profiling session is already active")
+    profiler = Profiler(
+        name=name,
+        cprofile=cprofile,
+        memory=memory,
+        trace_path=Path(trace_path) if trace_path is not None else None,
+    )
+    session_token = _ACTIVE_PROFILER.set(profiler)
+    profiler.start()
+    try:
+        with profiler.span(name, "command"):
+            yield profiler
+    finally:
+        profiler.stop()
+        _ACTIVE_PROFILER.reset(session_token)
+
+
+@contextmanager
+def span(name: str, category: str, **attributes: Any) -> Iterator[ProfileSpan | None]:
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.span(name, category, **attributes) as row:
+        yield row
+
+
+def row_count(value: Any) -> int | None:
+    if isinstance(value, (list, set, frozenset)):
+        return len(value)
+    if isinstance(value, tuple):
+        counts = [row_count(item) for item in value]
+        return sum(count for count in counts if count is not None)
+    if isinstance(value, dict):
+        counts = [item for item in value.values() if isinstance(item, int) and not isinstance(item, bool)]
+        return sum(counts) if counts else None
+    counts = getattr(value, "counts", None)
+    if callable(counts):
+        return row_count({key: item for key, item in counts().items() if isinstance(item, int)})
+    return None
+
+
+def _jsonable(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def payload_bytes(value: Any) -> int:
+    return len(json.dumps(value, default=_jsonable).encode("utf-8"))
+
+
+def record_result(
+    row: ProfileSpan | None,
+    result: Any,
+    *,
+    measure_bytes: bool = False,
+    moved: Any = None,
+) -> None:
+    profiler = _ACTIVE_PROFILER.get()
+    if row is None or profiler is None:
+        return
+    rows = row_count(result)
+    if rows is not None:
+        row.attributes["rows"] = rows
+        profiler.count(f"{row.category}.rows", rows)
+    if measure_bytes:
+        profiler.measure_bytes(row, result if moved is None else moved)
+
+
+def traced(category: str) -> Callable[[F], F]:
+    def decorate(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _ACTIVE_PROFILER.get()
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.span(function.__name__, category) as row:
+                result = function(*args, **kwargs)
+            record_result(row, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
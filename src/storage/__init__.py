@@ -0,0 +1,13 @@
+from storage.memory import InMemoryRepository, MemoryState
+from storage.postgres import PostgresRepository
+from storage.repository import DEFAULT_MEMORY_STORE_PATH, STORAGE_BACKENDS, StageRepository, open_repository
+
+__all__ = [
+    "DEFAULT_MEMORY_STORE_PATH",
+    "InMemoryRepository",
+    "MemoryState",
+    "PostgresRepository",
+    "STORAGE_BACKENDS",
+    "StageRepository",
+    "open_repository",
+]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from functools import wraps
+from typing import Any
+
+from shared.profiling import active_profiler, record_result, span
+
+
+INSTRUMENTED_METHOD_PREFIXES = ("fetch_", "persist_", "insert_")
+
+
+class InstrumentedRepository:
+    def __init__(self, repository: Any) -> None:
+        self.repository = repository
+
+    def __enter__(self) -> InstrumentedRepository:
+        self.repository.__enter__()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.repository.__exit__(exc_type, exc, traceback)
+
+    def commit(self) -> None:
+        with span("commit", "persist"):
+            self.repository.commit()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.repository, name)
+        prefix = next((prefix for prefix in INSTRUMENTED_METHOD_PREFIXES if name.startswith(prefix)), None)
+        if prefix is None or not callable(attribute):
+            return attribute
+        category = prefix.rstrip("_")
+
+        @wraps(attribute)
+        def method(*args: Any, **kwargs: Any) -> Any:
+            with span(name, category) as row:
+                result = attribute(*args, **kwargs)
+            if category == "fetch":
+                record_result(row, result, measure_bytes=True)
+            else:
+                record_result(row, _input_rows(args, result), measure_bytes=bool(args), moved=args[0] if args else None)
+            return result
+
+        return method
+
+
+def _input_rows(args: tuple[Any, ...], result: Any) -> Any:
+    if isinstance(result, int) and args and isinstance(args[0], list):
+        return args[0]
+    return result
+
+
+def instrument_repository(repository: Any) -> Any:
+    if active_profiler() is None:
+        return repository
+    return InstrumentedRepository(repository)
@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import pickle
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Iterable
+
+from canonical.lineage import select_asset_lineage
+from canonical.models import (
+    AssetProvenance,
+    AssetState,
+    AssetStateProvenance,
+    CanonicalAsset,
+    CanonicalAssetLineage,
+    CanonicalAssetLineageBuildResult,
+    CanonicalBuild,
+    CanonicalEvent,
+    CanonicalEventAssetFlow,
+    CanonicalEventAssetFlowBuildResult,
+    CanonicalEventBuildResult,
+    CanonicalPickAsset,
+    CanonicalPickLifecycleBuildResult,
+    CanonicalPickResolution,
+    CanonicalPlayerIdentity,
+    CanonicalPlayerTenure,
+    CanonicalPlayerTenureBuildResult,
+    EventAssetFlowProvenance,
+    EventProvenance,
+    PickAssetProvenance,
+    PickResolutionProvenance,
+    PlayerIdentityProvenance,
+)
+from editorial.models import (
+    EditorialAnnotation,
+    EditorialBuild,
+    EditorialCalendarMarker,
+    EditorialEra,
+    EditorialGameOverlay,
+    EditorialOverlayBuildResult,
+    EditorialStoryChapter,
+)
+from evidence.models import NormalizedClaim, OverrideBundle, OverrideLink, OverrideRecord, SourceRecord
+from presentation.models import AssetLane, PresentationBuild, PresentationContractBuildResult, TimelineEdge, TimelineNode
+
+
+def _jsonb(value: Any) -> Any:
+    return json.loads(json.dumps(value, sort_keys=True, default=str))
+
+
+@dataclass
+class MemoryState:
+    source_records: dict[str, SourceRecord] = field(default_factory=dict)
+    normalized_claims: dict[str, NormalizedClaim] = field(default_factory=dict)
+    normalization_ledger: set[tuple[str, str]] = field(default_factory=set)
+    overrides: dict[str, OverrideRecord] = field(default_factory=dict)
+    override_links: dict[str, OverrideLink] = field(default_factory=dict)
+    canonical_builds: list[CanonicalBuild] = field(default_factory=list)
+    events: list[CanonicalEvent] = field(default_factory=list)
+    event_provenance: list[EventProvenance] = field(default_factory=list)
+    player_identities: list[CanonicalPlayerIdentity] = field(default_factory=list)
+    player_identity_provenance: list[PlayerIdentityProvenance] = field(default_factory=list)
+    player_tenures: list[CanonicalPlayerTenure] = field(default_factory=list)
+    assets: list[CanonicalAsset] = field(default_factory=list)
+    asset_provenance: list[AssetProvenance] = field(default_factory=list)
+    asset_states: list[AssetState] = field(default_factory=list)
+    asset_state_provenance: list[AssetStateProvenance] = field(default_factory=list)
+    pick_assets: list[CanonicalPickAsset] = field(default_factory=list)
+    pick_asset_provenance: list[PickAssetProvenance] = field(default_factory=list)
+    pick_resolutions: list[CanonicalPickResolution] = field(default_factory=list)
+    pick_resolution_provenance: list[PickResolutionProvenance] = field(default_factory=list)
+    event_asset_flows: list[CanonicalEventAssetFlow] = field(default_factory=list)
+    event_asset_flow_provenance: list[EventAssetFlowProvenance] = field(default_factory=list)
+    asset_lineage: dict[str, CanonicalAssetLineage] = field(default_factory=dict)
+    asset_lineage_edges: set[tuple[str, str, str]] = field(default_factory=set)
+    presentation_builds: list[PresentationBuild] = field(default_factory=list)
+    presentation_build_rows: dict[str, tuple[list[TimelineNode], list[TimelineEdge], list[AssetLane]]] = field(
+        default_factory=dict
+    )
+    current_presentation_build_id: str | None = None
+    previous_presentation_build_id: str | None = None
+    editorial_builds: dict[str, EditorialBuild] = field(default_factory=dict)
+    editorial_rows: dict[str, dict[str, dict[str, Any]]] = field(default_factory=dict)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Snapshots written before a field existed load with that field's default.
+        self.__dict__.update({**MemoryState().__dict__, **state})
+
+
+def _snapshot_state(state: MemoryState) -> MemoryState:
+    # Rows are frozen, so copying each container is enough to restore a commit point; editorial rows
+    # are the one nested mapping that persists update in place.
+    snapshot = copy.copy(state)
+    for name, value in vars(state).items():
+        if isinstance(value, (dict, list, set)):
+            setattr(snapshot, name, copy.copy(value))
+    snapshot.editorial_rows = {
+        build_id: {kind: dict(rows) for kind, rows in rows_by_kind.items()}
+        for build_id, rows_by_kind in state.editorial_rows.items()
+    }
+    return snapshot
+
+
+class InMemoryRepository:
+    def __init__(self, state: MemoryState | None = None, *, path: Path | str | None = None, read_only: bool = False) -> None:
+        self.path = Path(path) if path is not None else None
+        self.read_only = read_only
+        self._loaded_signature: tuple[int, int] | None = None
+        if state is None and self.path is not None and self.path.exists():
+            state = self._load_state()
+        self.state = state or MemoryState()
+        self._committed_state = _snapshot_state(self.state)
+
+    def __enter__(self) -> InMemoryRepository:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def _store_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_state(self) -> MemoryState:
+        self._loaded_signature = self._store_signature()
+        return pickle.loads(self.path.read_bytes())
+
+    def refresh(self) -> None:
+        # Only read-only handles reload, and only when the snapshot file was replaced since the last load.
+        if self.path is None or not self.read_only:
+            return
+        signature = self._store_signature()
+        if signature is not None and signature != self._loaded_signature:
+            self.state = self._load_state()
+            self._committed_state = _snapshot_state(self.state)
+
+    def commit(self) -> None:
+        # Read-only handles never write back, so a long-lived reader cannot clobber a newer build.
+        if self.read_only:
+            return
+        self._committed_state = _snapshot_state(self.state)
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        staging_path.write_bytes(pickle.dumps(self.state, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(staging_path, self.path)
+
+    def rollback(self) -> None:
+        self.state = _snapshot_state(self._committed_state)
+
+    def insert_source_records(self, source_records: Iterable[SourceRecord]) -> int:
+        inserted = 0
+        for record in source_records:
+            if record.source_record_id in self.state.source_records:
+                continue
+            self.state.source_records[record.source_record_id] = replace(
+                record,
+                raw_payload=_jsonb(record.raw_payload),
+                duplicate_count=1,
+            )
+            inserted += 1
+        return inserted
+
+    def insert_normalized_claims(self, claims: Iterable[NormalizedClaim]) -> int:
+        inserted = 0
+        for claim in claims:
+            if claim.claim_id in self.state.normalized_claims:
+                continue
+            self.state.normalized_claims[claim.claim_id] = replace(claim, claim_payload=_jsonb(claim.claim_payload))
+            inserted += 1
+        return inserted
+
+    def record_normalized_source_records(self, source_record_ids: Iterable[str], normalizer_version: str) -> int:
+        ledger_rows = {(source_record_id, normalizer_version) for source_record_id in source_record_ids}
+        self.state.normalization_ledger |= ledger_rows
+        return len(ledger_rows)
+
+    def fetch_source_records(
+        self,
+        *,
+        source_record_id: str | None = None,
+        pending_normalizer_version: str | None = None,
+    ) -> list[SourceRecord]:
+        normalized_ids = (
+            {
+                ledger_source_record_id
+                for ledger_source_record_id, normalizer_version in self.state.normalization_ledger
+                if normalizer_version == pending_normalizer_version
+            }
+            if pending_normalizer_version
+            else set()
+        )
+        rows = [
+            row
+            for row in self.state.source_records.values()
+            if (not source_record_id or row.source_record_id == source_record_id)
+            and row.source_record_id not in normalized_ids
+        ]
+        return sorted(rows, key=lambda row: (row.created_at, row.source_record_id))
+
+    def count_source_records(self, *, source_record_id: str | None = None) -> int:
+        if source_record_id:
+            return int(source_record_id in self.state.source_records)
+        return len(self.state.source_records)
+
+    def insert_override_bundle(self, bundle: OverrideBundle) -> dict[str, int]:
+        for override in bundle.overrides:
+            self.state.overrides[override.override_id] = replace(override, payload=_jsonb(override.payload))
+        for link in bundle.override_links:
+            self.state.override_links[link.override_link_id] = link
+        return {
+            "override_count": len(bundle.overrides),
+            "override_link_count": len(bundle.override_links),
+        }
+
+    def replace_override_bundle(self, bundle: OverrideBundle) -> dict[str, int]:
+        override_ids = {override.override_id for override in bundle.overrides}
+        link_ids = {link.override_link_id for link in bundle.override_links}
+        removed_overrides = set(self.state.overrides) - override_ids
+        removed_links = {
+            link_id
+            for link_id, link in self.state.override_links.items()
+            if link_id not in link_ids or link.override_id in removed_overrides
+        }
+        for override_id in removed_overrides:
+            del self.state.overrides[override_id]
+        for link_id in removed_links:
+            del self.state.override_links[link_id]
+        return {
+            **self.insert_override_bundle(bundle),
+            "removed_override_count": len(removed_overrides),
+            "removed_override_link_count": len(removed_links),
+        }
+
+    def _claims(self) -> list[NormalizedClaim]:
+        return sorted(self.state.normalized_claims.values(), key=lambda row: (row.created_at, row.claim_id))
+
+    def _overrides(self) -> list[OverrideRecord]:
+        return sorted(self.state.overrides.values(), key=lambda row: (row.authored_at, row.override_id))
+
+    def _events(self) -> list[CanonicalEvent]:
+        return sorted(self.state.events, key=lambda row: (row.event_date, row.event_order, row.event_id))
+
+    def _event_provenance(self) -> list[EventProvenance]:
+        return sorted(self.state.event_provenance, key=lambda row: (row.created_at, row.event_provenance_id))
+
+    def fetch_event_build_inputs(self) -> tuple[list[NormalizedClaim], list[OverrideRecord]]:
+        return self._claims(), self._overrides()
+
+    def persist_canonical_event_build(self, result: CanonicalEventBuildResult) -> dict[str, int]:
+        self.state.canonical_builds.append(result.build)
+        self.state.events = list(result.events)
+        self.state.event_provenance = list(result.provenance_rows)
+        return result.counts()
+
+    def fetch_player_tenure_build_inputs(
+        self,
+    ) -> tuple[list[CanonicalEvent], list[EventProvenance], list[NormalizedClaim], list[OverrideRecord]]:
+        return self._events(), self._event_provenance(), self._claims(), self._overrides()
+
+    def persist_canonical_player_tenure_build(self, result: CanonicalPlayerTenureBuildResult) -> dict[str, int]:
+        self.state.canonical_builds.append(result.build)
+        self.state.player_identities = list(result.player_identities)
+        self.state.player_identity_provenance = list(result.player_identity_provenance_rows)
+        self.state.player_tenures = list(result.player_tenures)
+        self.state.assets = list(result.assets)
+        self.state.asset_provenance = list(result.asset_provenance_rows)
+        self.state.asset_states = [replace(row, state_payload=_jsonb(row.state_payload)) for row in result.asset_states]
+        self.state.asset_state_provenance = list(result.asset_state_provenance_rows)
+        return result.counts()
+
+    def fetch_pick_lifecycle_build_inputs(
+        self,
+    ) -> tuple[list[CanonicalEvent], list[EventProvenance], list[NormalizedClaim], list[OverrideRecord]]:
+        return self._events(), self._event_provenance(), self._claims(), self._overrides()
+
+    def persist_canonical_pick_lifecycle_build(self, result: CanonicalPickLifecycleBuildResult) -> dict[str, int]:
+        pick_asset_ids = {row.pick_asset_id for row in result.pick_assets}
+        removed_asset_ids = {row.asset_id for row in self.state.assets if row.pick_asset_id is not None}
+        self.state.canonical_builds.append(result.build)
+        self.state.asset_provenance = [row for row in self.state.asset_provenance if row.asset_id not in removed_asset_ids]
+        self.state.assets = [row for row in self.state.assets if row.pick_asset_id is None]
+        self.state.pick_assets = [replace(row, protection_payload=_jsonb(row.protection_payload)) for row in result.pick_assets]
+        self.state.assets.extend(row for row in result.assets if row.pick_asset_id in pick_asset_ids)
+        self.state.pick_asset_provenance = list(result.pick_asset_provenance_rows)
+        self.state.asset_provenance.extend(row for row in result.asset_provenance_rows if row.pick_asset_id in pick_asset_ids)
+        self.state.pick_resolutions = [replace(row, state_payload=_jsonb(row.state_payload)) for row in result.pick_resolutions]
+        self.state.pick_resolution_provenance = list(result.pick_resolution_provenance_rows)
+        return result.counts()
+
+    def fetch_event_asset_flow_build_inputs(
+        self,
+    ) -> tuple[
+        list[CanonicalEvent],
+        list[EventProvenance],
+        list[CanonicalAsset],
+        list[CanonicalPlayerTenure],
+        list[CanonicalPickResolution],
+    ]:
+        return (
+            self._events(),
+            self._event_provenance(),
+            sorted(self.state.assets, key=lambda row: row.asset_id),
+            sorted(self.state.player_tenures, key=lambda row: row.player_tenure_id),
+            sorted(self.state.pick_resolutions, key=lambda row: row.pick_resolution_id),
+        )
+
+    def persist_canonical_event_asset_flow_build(self, result: CanonicalEventAssetFlowBuildResult) -> dict[str, int]:
+        self.state.canonical_builds.append(result.build)
+        self.state.event_asset_flows = list(result.flows)
+        self.state.event_asset_flow_provenance = list(result.provenance_rows)
+        return result.counts()
+
+    def fetch_asset_lineage_build_inputs(
+        self,
+    ) -> tuple[list[CanonicalEventAssetFlow], list[CanonicalAssetLineage], list[tuple[str, str, str]]]:
+        return (
+            sorted(self.state.event_asset_flows, key=lambda row: (row.event_id, row.flow_order, row.event_asset_flow_id)),
+            sorted(
+                self.state.asset_lineage.values(),
+                key=lambda row: (row.ancestor_asset_id, row.depth, row.descendant_asset_id),
+            ),
+            sorted(self.state.asset_lineage_edges),
+        )
+
+    def persist_canonical_asset_lineage_build(self, result: CanonicalAssetLineageBuildResult) -> dict[str, int]:
+        if result.refresh_mode == "full":
+            self.state.asset_lineage = {}
+            self.state.asset_lineage_edges = set()
+            rows = result.lineage_rows
+            edges = result.edges
+        else:
+            rows = result.changed_rows
+            edges = result.added_edges
+        self.state.asset_lineage.update({row.asset_lineage_id: row for row in rows})
+        self.state.asset_lineage_edges.update(edges)
+        return result.counts()
+
+    def fetch_asset_lineage(self, asset_id: str, *, direction: str = "descendants") -> list[CanonicalAssetLineage]:
+        return select_asset_lineage(self.state.asset_lineage.values(), asset_id, direction=direction)
+
+    def fetch_latest_canonical_build_id(self) -> str | None:
+        latest_build = max(
+            self.state.canonical_builds,
+            key=lambda row: (row.built_at, row.canonical_build_id),
+            default=None,
+        )
+        return latest_build.canonical_build_id if latest_build else None
+
+    def fetch_presentation_contract_build_inputs(self):
+        return (
+            self._events(),
+            sorted(self.state.assets, key=lambda row: row.asset_id),
+            sorted(self.state.player_identities, key=lambda row: row.player_id),
+            sorted(self.state.player_tenures, key=lambda row: (row.player_id, row.tenure_start_date, row.player_tenure_id)),
+            sorted(self.state.pick_assets, key=lambda row: row.pick_asset_id),
+            sorted(self.state.pick_resolutions, key=lambda row: (row.pick_asset_id, row.effective_start_date, row.pick_resolution_id)),
+            sorted(self.state.asset_states, key=lambda row: (row.asset_id, row.effective_start_date, row.asset_state_id)),
+            sorted(self.state.event_asset_flows, key=lambda row: (row.event_id, row.flow_order, row.event_asset_flow_id)),
+            self.fetch_latest_canonical_build_id(),
+        )
+
+    def persist_presentation_contract_build(self, result: PresentationContractBuildResult) -> dict[str, int]:
+        build_id = result.build.presentation_build_id
+        self.state.presentation_builds.append(result.build)
+        self.state.presentation_build_rows[build_id] = (
+            [replace(row, payload=_jsonb(row.payload)) for row in result.nodes],
+            [replace(row, payload=_jsonb(row.payload)) for row in result.edges],
+            list(result.lanes),
+        )
+        self._swap_current_presentation_build(build_id)
+        return result.counts()
+
+    def _swap_current_presentation_build(self, presentation_build_id: str) -> None:
+        if self.state.current_presentation_build_id != presentation_build_id:
+            self.state.previous_presentation_build_id = self.state.current_presentation_build_id
+            self.state.current_presentation_build_id = presentation_build_id
+
+    def fetch_presentation_contract(self, *, presentation_build_id: str | None = None) -> PresentationContractBuildResult:
+        build_id = presentation_build_id or self.state.current_presentation_build_id
+        build = next((row for row in self.state.presentation_builds if row.presentation_build_id == build_id), None)
+        if build is None:
+            raise RuntimeError("no presentation build found")
+        nodes, edges, lanes = self.state.presentation_build_rows[build_id]
+        return PresentationContractBuildResult(
+            build=build,
+            nodes=sorted(nodes, key=lambda row: (row.event_date, row.event_order, row.event_id or "", row.node_id)),
+            edges=sorted(
+                edges,
+                key=lambda row: (row.start_date, row.end_date, row.lane_group, row.lane_index, row.asset_id, row.edge_id),
+            ),
+            lanes=sorted(
+                lanes,
+                key=lambda row: (row.lane_group, row.lane_index, row.effective_start_date, row.asset_id, row.asset_lane_id),
+            ),
+        )
+
+    def fetch_current_presentation_build_id(self) -> str | None:
+        return self.state.current_presentation_build_id
+
+    def fetch_previous_presentation_build_id(self) -> str | None:
+        return self.state.previous_presentation_build_id
+
+    def activate_presentation_build(self, presentation_build_id: str) -> dict[str, str | None]:
+        if presentation_build_id not in self.state.presentation_build_rows:
+            raise ValueError(f"unknown presentation build: {presentation_build_id}")
+        previous_build_id = self.state.current_presentation_build_id
+        self._swap_current_presentation_build(presentation_build_id)
+        return {"presentation_build_id": presentation_build_id, "previous_presentation_build_id": previous_build_id}
+
+    def prune_presentation_builds(self, *, keep: int) -> dict[str, int]:
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        newest_first = sorted(
+            self.state.presentation_builds,
+            key=lambda row: (row.built_at, row.presentation_build_id),
+            reverse=True,
+        )
+        retained = {row.presentation_build_id for row in newest_first[:keep]}
+        retained.update({self.state.current_presentation_build_id, self.state.previous_presentation_build_id})
+        pruned = [row for row in self.state.presentation_builds if row.presentation_build_id not in retained]
+        self.state.presentation_builds = [row for row in self.state.presentation_builds if row.presentation_build_id in retained]
+        for row in pruned:
+            self.state.presentation_build_rows.pop(row.presentation_build_id, None)
+        for build in list(self.state.editorial_builds.values()):
+            if build.presentation_build_id not in retained:
+                self.state.editorial_builds[build.editorial_build_id] = replace(build, presentation_build_id=None)
+        return {"pruned_presentation_build_count": len(pruned)}
+
+    def persist_editorial_overlay_build(self, result: EditorialOverlayBuildResult) -> dict[str, int]:
+        build_id = result.build.editorial_build_id
+        self.state.editorial_builds[build_id] = result.build
+        rows = self.state.editorial_rows.setdefault(build_id, {})
+        rows.setdefault("annotations", {}).update({row.annotation_id: row for row in result.annotations})
+        rows.setdefault("calendar_markers", {}).update(
+            {row.calendar_marker_id: replace(row, payload=_jsonb(row.payload)) for row in result.calendar_markers}
+        )
+        rows.setdefault("game_overlays", {}).update(
+            {row.game_overlay_id: replace(row, payload=_jsonb(row.payload)) for row in result.game_overlays}
+        )
+        rows.setdefault("eras", {}).update({row.era_id: row for row in result.eras})
+        rows.setdefault("story_chapters", {}).update(
+            {row.story_chapter_id: replace(row, focus_payload=_jsonb(row.focus_payload)) for row in result.story_chapters}
+        )
+        return result.counts()
+
+    def _latest_editorial_build(self) -> EditorialBuild | None:
+        return max(
+            self.state.editorial_builds.values(),
+            key=lambda row: (row.built_at, row.editorial_build_id),
+            default=None,
+        )
+
+    def fetch_latest_editorial_build_id(self) -> str | None:
+        build = self._latest_editorial_build()
+        return build.editorial_build_id if build else None
+
+    def fetch_editorial_overlays(self, editorial_build_id: str | None = None) -> EditorialOverlayBuildResult:
+        if editorial_build_id is None:
+            build = self._latest_editorial_build()
+        else:
+            build = self.state.editorial_builds.get(editorial_build_id)
+        if build is None:
+            raise RuntimeError("no editorial build found")
+        rows = self.state.editorial_rows.get(build.editorial_build_id, {})
+        annotations: list[EditorialAnnotation] = list(rows.get("annotations", {}).values())
+        calendar_markers: list[EditorialCalendarMarker] = list(rows.get("calendar_markers", {}).values())
+        game_overlays: list[EditorialGameOverlay] = list(rows.get("game_overlays", {}).values())
+        eras: list[EditorialEra] = list(rows.get("eras", {}).values())
+        story_chapters: list[EditorialStoryChapter] = list(rows.get("story_chapters", {}).values())
+        return EditorialOverlayBuildResult(
+            build=build,
+            annotations=sorted(annotations, key=lambda row: (row.start_date, row.end_date, -row.priority, row.annotation_id)),
+            calendar_markers=sorted(calendar_markers, key=lambda row: (row.marker_date, row.calendar_marker_id)),
+            game_overlays=sorted(game_overlays, key=lambda row: (row.game_date, row.game_overlay_id)),
+            eras=sorted(eras, key=lambda row: (row.start_date, row.end_date, -row.priority, row.era_id)),
+            story_chapters=sorted(story_chapters, key=lambda row: (row.chapter_order, row.start_date, row.story_chapter_id)),
+        )
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Sequence
+
+from canonical.event_asset_flow import fetch_event_asset_flow_build_inputs, persist_canonical_event_asset_flow_build
+from canonical.events import fetch_event_build_inputs, persist_canonical_event_build
+from canonical.lineage import fetch_asset_lineage, fetch_asset_lineage_build_inputs, persist_canonical_asset_lineage_build
+from canonical.models import (
+    CanonicalAssetLineage,
+    CanonicalAssetLineageBuildResult,
+    CanonicalEventAssetFlowBuildResult,
+    CanonicalEventBuildResult,
+    CanonicalPickLifecycleBuildResult,
+    CanonicalPlayerTenureBuildResult,
+)
+from canonical.pick_lifecycle import fetch_pick_lifecycle_build_inputs, persist_canonical_pick_lifecycle_build
+from canonical.player_tenure import fetch_player_tenure_build_inputs, persist_canonical_player_tenure_build
+from db_config import load_database_url
+from editorial.contract import fetch_editorial_overlays, fetch_latest_editorial_build_id, persist_editorial_overlay_build
+from editorial.models import EditorialOverlayBuildResult
+from evidence.ingest import (
+    count_source_records,
+    fetch_source_records,
+    insert_normalized_claims,
+    record_normalized_source_records,
+    insert_source_records,
+)
+from evidence.models import NormalizedClaim, OverrideBundle, SourceRecord
+from evidence.overrides import insert_override_bundle, replace_override_bundle
+from presentation.contract import (
+    activate_presentation_build,
+    fetch_current_presentation_build_id,
+    fetch_latest_canonical_build_id,
+    fetch_presentation_contract,
+    fetch_presentation_contract_build_inputs,
+    fetch_previous_presentation_build_id,
+    persist_presentation_contract_build,
+    prune_presentation_builds,
+)
+from presentation.models import PresentationContractBuildResult
+from shared.ids import active_id_dictionary
+
+
+def _is_id_column(name: str) -> bool:
+    return name == "id" or name.endswith("_id")
+
+
+def interning_tuple_row(cursor: Any) -> Callable[[Sequence[Any]], tuple[Any, ...]]:
+    # ID columns of a fetch inside a build session go through the build's ID dictionary, so an ID
+    # fetched by several queries (or again inside the stage that rebuilt it) is one shared string.
+    # Every other cell, and every fetch outside a session, keeps psycopg's C loaders and plain tuple
+    # rows: a Python text loader on every cell measured about 3x slower than the C one.
+    ids = active_id_dictionary()
+    positions = [
+        position for position, column in enumerate(cursor.description or ()) if _is_id_column(column.name)
+    ]
+    if ids is None or not positions:
+        return tuple
+
+    def make_row(values: Sequence[Any]) -> tuple[Any, ...]:
+        row = list(values)
+        for position in positions:
+            value = row[position]
+            if isinstance(value, str):
+                row[position] = ids.intern(value)
+        return tuple(row)
+
+    return make_row
+
+
+class PostgresRepository:
+    def __init__(self, conn: Any) -> None:
+        self.conn = conn
+
+    @classmethod
+    def connect(
+        cls,
+        database_url: str | None = None,
+        *,
+        intern_ids: bool = True,
+        read_only: bool = False,
+    ) -> PostgresRepository:
+        try:
+            import psycopg
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("psycopg is required for the postgres storage backend.") from exc
+        repository = cls(psycopg.connect(database_url or load_database_url()))
+        # Worker handles only fetch build inputs; read-only transactions reject a stray write
+        # instead of racing the single writer connection.
+        repository.conn.read_only = read_only
+        if intern_ids:
+            repository.conn.row_factory = interning_tuple_row
+        return repository
+
+    def __enter__(self) -> PostgresRepository:
+        self.conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.conn.__exit__(exc_type, exc, traceback)
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def refresh(self) -> None:
+        # Ending the read transaction drops its snapshot, so the next query sees newer commits.
+        self.conn.rollback()
+
+    def rollback(self) -> None:
+        self.conn.rollback()
+
+    def insert_source_records(self, source_records: Iterable[SourceRecord]) -> int:
+        return insert_source_records(self.conn, source_records)
+
+    def insert_normalized_claims(self, claims: Iterable[NormalizedClaim]) -> int:
+        return insert_normalized_claims(self.conn, claims)
+
+    def record_normalized_source_records(self, source_record_ids: Iterable[str], normalizer_version: str) -> int:
+        return record_normalized_source_records(self.conn, source_record_ids, normalizer_version)
+
+    def fetch_source_records(
+        self,
+        *,
+        source_record_id: str | None = None,
+        pending_normalizer_version: str | None = None,
+    ) -> list[SourceRecord]:
+        return fetch_source_records(
+            self.conn,
+            source_record_id=source_record_id,
+            pending_normalizer_version=pending_normalizer_version,
+        )
+
+    def count_source_records(self, *, source_record_id: str | None = None) -> int:
+        return count_source_records(self.conn, source_record_id=source_record_id)
+
+    def insert_override_bundle(self, bundle: OverrideBundle) -> dict[str, int]:
+        return insert_override_bundle(self.conn, bundle)
+
+    def replace_override_bundle(self, bundle: OverrideBundle) -> dict[str, int]:
+        return replace_override_bundle(self.conn, bundle)
+
+    def fetch_event_build_inputs(self):
+        return fetch_event_build_inputs(self.conn)
+
+    def persist_canonical_event_build(self, result: CanonicalEventBuildResult) -> dict[str, int]:
+        return persist_canonical_event_build(self.conn, result)
+
+    def fetch_player_tenure_build_inputs(self):
+        return fetch_player_tenure_build_inputs(self.conn)
+
+    def persist_canonical_player_tenure_build(self, result: CanonicalPlayerTenureBuildResult) -> dict[str, int]:
+        return persist_canonical_player_tenure_build(self.conn, result)
+
+    def fetch_pick_lifecycle_build_inputs(self):
+        return fetch_pick_lifecycle_build_inputs(self.conn)
+
+    def persist_canonical_pick_lifecycle_build(self, result: CanonicalPickLifecycleBuildResult) -> dict[str, int]:
+        return persist_canonical_pick_lifecycle_build(self.conn, result)
+
+    def fetch_event_asset_flow_build_inputs(self):
+        return fetch_event_asset_flow_build_inputs(self.conn)
+
+    def persist_canonical_event_asset_flow_build(self, result: CanonicalEventAssetFlowBuildResult) -> dict[str, int]:
+        return persist_canonical_event_asset_flow_build(self.conn, result)
+
+    def fetch_asset_lineage_build_inputs(self):
+        return fetch_asset_lineage_build_inputs(self.conn)
+
+    def persist_canonical_asset_lineage_build(self, result: CanonicalAssetLineageBuildResult) -> dict[str, int]:
+        return persist_canonical_asset_lineage_build(self.conn, result)
+
+    def fetch_asset_lineage(self, asset_id: str, *, direction: str = "descendants") -> list[CanonicalAssetLineage]:
+        return fetch_asset_lineage(self.conn, asset_id, direction=direction)
+
+    def fetch_latest_canonical_build_id(self) -> str | None:
+        return fetch_latest_canonical_build_id(self.conn)
+
+    def fetch_presentation_contract_build_inputs(self):
+        return fetch_presentation_contract_build_inputs(self.conn)
+
+    def persist_presentation_contract_build(self, result: PresentationContractBuildResult) -> dict[str, int]:
+        return persist_presentation_contract_build(self.conn, result)
+
+    def fetch_presentation_contract(self) -> PresentationContractBuildResult:
+        return fetch_presentation_contract(self.conn)
+
+    def fetch_current_presentation_build_id(self) -> str | None:
+        return fetch_current_presentation_build_id(self.conn)
+
+    def fetch_previous_presentation_build_id(self) -> str | None:
+        return fetch_previous_presentation_build_id(self.conn)
+
+    def activate_presentation_build(self, presentation_build_id: str) -> dict[str, str | None]:
+        return activate_presentation_build(self.conn, presentation_build_id)
+
+    def prune_presentation_builds(self, *, keep: int) -> dict[str, int]:
+        return prune_presentation_builds(self.conn, keep=keep)
+
+    def persist_editorial_overlay_build(self, result: EditorialOverlayBuildResult) -> dict[str, int]:
+        return persist_editorial_overlay_build(self.conn, result)
+
+    def fetch_editorial_overlays(self, editorial_build_id: str | None = None) -> EditorialOverlayBuildResult:
+        return fetch_editorial_overlays(self.conn, editorial_build_id)
+
+    def fetch_latest_editorial_build_id(self) -> str | None:
+        return fetch_latest_editorial_build_id(self.conn)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Protocol
+
+from canonical.models import (
+    AssetState,
+    CanonicalAsset,
+    CanonicalAssetLineage,
+    CanonicalAssetLineageBuildResult,
+    CanonicalEvent,
+    CanonicalEventAssetFlow,
+    CanonicalEventAssetFlowBuildResult,
+    CanonicalEventBuildResult,
+    CanonicalPickAsset,
+    CanonicalPickLifecycleBuildResult,
+    CanonicalPickResolution,
+    CanonicalPlayerIdentity,
+    CanonicalPlayerTenure,
+    CanonicalPlayerTenureBuildResult,
+    EventProvenance,
+)
+from editorial.models import EditorialOverlayBuildResult
+from evidence.models import NormalizedClaim, OverrideBundle, OverrideRecord, SourceRecord
+from presentation.models import PresentationContractBuildResult
+
+
+STORAGE_BACKENDS = ("postgres", "memory")
+DEFAULT_MEMORY_STORE_PATH = Path(".local/memory-store.pickle")
+
+PresentationBuildInputs = tuple[
+    list[CanonicalEvent],
+    list[CanonicalAsset],
+    list[CanonicalPlayerIdentity],
+    list[CanonicalPlayerTenure],
+    list[CanonicalPickAsset],
+    list[CanonicalPickResolution],
+    list[AssetState],
+    list[CanonicalEventAssetFlow],
+    str | None,
+]
+
+
+class StageRepository(Protocol):
+    def __enter__(self) -> StageRepository: ...
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None: ...
+
+    def commit(self) -> None: ...
+
+    # Lets a long-lived reader see builds committed through other handles since it opened.
+    def refresh(self) -> None: ...
+
+    # Discards writes since the last commit, so a long-lived handle survives a failed stage.
+    def rollback(self) -> None: ...
+
+    def insert_source_records(self, source_records: Iterable[SourceRecord]) -> int: ...
+
+    def insert_normalized_claims(self, claims: Iterable[NormalizedClaim]) -> int: ...
+
+    def record_normalized_source_records(self, source_record_ids: Iterable[str], normalizer_version: str) -> int: ...
+
+    def fetch_source_records(
+        self,
+        *,
+        source_record_id: str | None = None,
+        pending_normalizer_version: str | None = None,
+    ) -> list[SourceRecord]: ...
+
+    def count_source_records(self, *, source_record_id: str | None = None) -> int: ...
+
+    def insert_override_bundle(self, bundle: OverrideBundle) -> dict[str, int]: ...
+
+    def replace_override_bundle(self, bundle: OverrideBundle) -> dict[str, int]: ...
+
+    def fetch_event_build_inputs(self) -> tuple[list[NormalizedClaim], list[OverrideRecord]]: ...
+
+    def persist_canonical_event_build(self, result: CanonicalEventBuildResult) -> dict[str, int]: ...
+
+    def fetch_player_tenure_build_inputs(
+        self,
+    ) -> tuple[list[CanonicalEvent], list[EventProvenance], list[NormalizedClaim], list[OverrideRecord]]: ...
+
+    def persist_canonical_player_tenure_build(self, result: CanonicalPlayerTenureBuildResult) -> dict[str, int]: ...
+
+    def fetch_pick_lifecycle_build_inputs(
+        self,
+    ) -> tuple[list[CanonicalEvent], list[EventProvenance], list[NormalizedClaim], list[OverrideRecord]]: ...
+
+    def persist_canonical_pick_lifecycle_build(self, result: CanonicalPickLifecycleBuildResult) -> dict[str, int]: ...
+
+    def fetch_event_asset_flow_build_inputs(
+        self,
+    ) -> tuple[
+        list[CanonicalEvent],
+        list[EventProvenance],
+        list[CanonicalAsset],
+        list[CanonicalPlayerTenure],
+        list[CanonicalPickResolution],
+    ]: ...
+
+    def persist_canonical_event_asset_flow_build(self, result: CanonicalEventAssetFlowBuildResult) -> dict[str, int]: ...
+
+    def fetch_asset_lineage_build_inputs(
+        self,
+    ) -> tuple[list[CanonicalEventAssetFlow], list[CanonicalAssetLineage], list[tuple[str, str, str]]]: ...
+
+    def persist_canonical_asset_lineage_build(self, result: CanonicalAssetLineageBuildResult) -> dict[str, int]: ...
+
+    def fetch_asset_lineage(self, asset_id: str, *, direction: str = "descendants") -> list[CanonicalAssetLineage]: ...
+
+    def fetch_latest_canonical_build_id(self) -> str | None: ...
+
+    def fetch_presentation_contract_build_inputs(self) -> PresentationBuildInputs: ...
+
+    def persist_presentation_contract_build(self, result: PresentationContractBuildResult) -> dict[str, int]: ...
+
+    def fetch_presentation_contract(self) -> PresentationContractBuildResult: ...
+
+    def fetch_current_presentation_build_id(self) -> str | None: ...
+
+    def fetch_previous_presentation_build_id(self) -> str | None: ...
+
+    def activate_presentation_build(self, presentation_build_id: str) -> dict[str, str | None]: ...
+
+    def prune_presentation_builds(self, *, keep: int) -> dict[str, int]: ...
+
+    def persist_editorial_overlay_build(self, result: EditorialOverlayBuildResult) -> dict[str, int]: ...
+
+    def fetch_editorial_overlays(self, editorial_build_id: str | None = None) -> EditorialOverlayBuildResult: ...
+
+    def fetch_latest_editorial_build_id(self) -> str | None: ...
+
+
+def open_repository(
+    backend: str = "postgres",
+    path: Path | str | None = None,
+    *,
+    database_url: str | None = None,
+    read_only: bool = False,
+) -> StageRepository:
+    from storage.instrumented import instrument_repository
+
+    if backend == "postgres":
+        from storage.postgres import PostgresRepository
+
+        return instrument_repository(PostgresRepository.connect(database_url, read_only=read_only))
+    if backend == "memory":
+        from storage.memory import InMemoryRepository
+
+        return instrument_repository(InMemoryRepository(path=path, read_only=read_only))
+    raise ValueError(f"unknown storage backend: {backend}")
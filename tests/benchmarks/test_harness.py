@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks import (
+    BENCHMARK_STAGES,
+    SyntheticFranchiseConfig,
+    generate_synthetic_dataset,
+    run_benchmark,
+    write_benchmark_result,
+)
+from evidence.normalize import normalize_source_record
+
+
+def test_generate_synthetic_dataset_is_deterministic_per_seed() -> None:
+    config = SyntheticFranchiseConfig(teams=3, seasons=2)
+
+    first = generate_synthetic_dataset(config)
+    second = generate_synthetic_dataset(config)
+    reseeded = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=3, seasons=2, seed=1))
+
+    assert first == second
+    assert [record.source_record_id for record in first.source_records] != [
+        record.source_record_id for record in reseeded.source_records
+    ]
+
+
+def test_generate_synthetic_dataset_scales_with_parameters() -> None:
+    small = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=2, seasons=2))
+    large = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=4, seasons=4, trades_per_season=6))
+    no_swaps = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=2, seasons=2, pick_swaps_per_season=0))
+
+    assert len(large.source_records) > 2 * len(small.source_records)
+    assert small.supplemental_claims
+    assert not no_swaps.supplemental_claims
+    claims = [claim for record in small.source_records for claim in normalize_source_record(record)]
+    assert {claim.claim_type for claim in claims} >= {"event_type", "pick_identity", "player_identity"}
+    assert {claim.claim_group_hint for claim in small.supplemental_claims} <= {claim.claim_group_hint for claim in claims}
+
+
+def test_synthetic_franchise_config_rejects_invalid_parameters() -> None:
+    with pytest.raises(ValueError, match="teams"):
+        SyntheticFranchiseConfig(teams=1)
+    with pytest.raises(ValueError, match="multi_asset_trade_rate"):
+        SyntheticFranchiseConfig(multi_asset_trade_rate=1.5)
+
+
+def test_run_benchmark_measures_every_stage_and_writes_json(tmp_path: Path) -> None:
+    result = run_benchmark(SyntheticFranchiseConfig(teams=2, seasons=2))
+
+    assert [measurement.stage for measurement in result.measurements] == list(BENCHMARK_STAGES)
+    assert all(measurement.peak_memory_bytes for measurement in result.measurements)
+    counts_by_stage = {measurement.stage: measurement.output_counts for measurement in result.measurements}
+    assert counts_by_stage["canonical-pick-lifecycle"]["pick_asset_count"] > 0
+    assert counts_by_stage["canonical-event-asset-flows"]["event_asset_flow_count"] > 0
+    assert counts_by_stage["layout-contract"]["lane_layout_count"] > 0
+
+    output_path = write_benchmark_result(result, tmp_path / "nested" / "benchmark.json")
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert payload["config"]["teams"] == 2
+    assert [stage["stage"] for stage in payload["stages"]] == list(BENCHMARK_STAGES)
+    throughput = {row["normalizer"]: row for row in payload["normalizer_throughput"]}
+    assert set(throughput) == {"contract", "draft_history", "transaction"}
+    assert sum(row["claim_count"] for row in throughput.values()) == counts_by_stage["normalize-source-records"]["claim_count"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 from canonical.models import (
     CanonicalAsset,
@@ -11,6 +11,7 @@ from canonical.models import (
     EventAssetFlowProvenance,
     EventProvenance,
 )
+import canonical.event_asset_flow as event_asset_flow_module
 from canonical.event_asset_flow import build_event_asset_flows
 from canonical.validate_event_asset_flow import validate_canonical_event_asset_flows
 
@@ -233,6 +234,51 @@ def test_build_event_asset_flows_supports_pick_conveyance():
     assert report.ok
 
 
+def _scaled_flow_inputs(flow_count: int):
+    event_count = max(1, flow_count // 4)
+    base_date = date.fromisoformat("2000-01-01")
+    events = [
+        _event(f"event_{index:06d}", "trade", (base_date + timedelta(days=index // 8)).isoformat(), index % 8 + 1, "Scaled trade")
+        for index in range(event_count)
+    ]
+    event_provenance = [_event_prov(event.event_id, f"claim_{event.event_id}") for event in events]
+    player_tenures = [
+        _player_tenure(
+            f"tenure_{index:06d}",
+            f"player_{index:06d}",
+            events[index % event_count].event_id,
+            events[(index + 1) % event_count].event_id,
+            "trade",
+        )
+        for index in range(flow_count // 2)
+    ]
+    assets = [
+        _asset(f"asset_{tenure.player_tenure_id}", "player_tenure", tenure.player_tenure_id, None, f"Player {tenure.player_id}")
+        for tenure in player_tenures
+    ]
+    return events, event_provenance, assets, player_tenures, []
+
+
+def test_build_event_asset_flows_examines_each_candidate_once(monkeypatch):
+    examined: list[tuple[str, int]] = []
+    original = event_asset_flow_module._event_flow_rows
+
+    def recording_event_flow_rows(event_candidates, *args, **kwargs):
+        event_ids = {candidate.event_id for candidate in event_candidates}
+        assert len(event_ids) == 1
+        examined.append((event_ids.pop(), len(event_candidates)))
+        return original(event_candidates, *args, **kwargs)
+
+    monkeypatch.setattr(event_asset_flow_module, "_event_flow_rows", recording_event_flow_rows)
+    result = build_event_asset_flows(*_scaled_flow_inputs(10_000), built_at=NOW)
+
+    # Each event sees only its own bucket, so the work is linear in candidates rather than
+    # events x candidates.
+    assert len(result.flows) == 10_000
+    assert len({event_id for event_id, _ in examined}) == len(examined)
+    assert sum(count for _, count in examined) == len(result.flows)
+
+
 def test_validate_event_asset_flows_flags_illegal_bidirectional_non_draft_flow():
     event = _event("event_trade", "trade", "2024-02-15", 1, "Memphis trade")
     asset = _asset("asset_player", "player_tenure", "tenure_player", None, "Player")
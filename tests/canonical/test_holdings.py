@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from canonical.holdings import (
+    HoldingInterval,
+    HoldingsIndex,
+    build_holdings_index,
+    load_holdings_index,
+    write_holdings_index,
+)
+from canonical.models import AssetState, CanonicalAsset, CanonicalPickResolution, CanonicalPlayerTenure
+
+
+NOW = datetime(2026, 4, 16, 12, 0, 0)
+BASE_DATE = date(2015, 1, 1)
+
+
+def _random_intervals(count: int, seed: int = 7) -> list[HoldingInterval]:
+    rng = random.Random(seed)
+    intervals = []
+    for index in range(count):
+        start_date = BASE_DATE + timedelta(days=rng.randrange(3650))
+        end_date = None if rng.random() < 0.1 else start_date + timedelta(days=rng.randrange(0, 900))
+        intervals.append(
+            HoldingInterval(
+                interval_kind=rng.choice(("player_tenure", "pick_stage", "asset_state")),
+                record_id=f"record_{index:05d}",
+                subject_id=f"subject_{index % 50:03d}",
+                asset_id=None,
+                state_type="test",
+                label=None,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+    return intervals
+
+
+def _covers(interval: HoldingInterval, low: date, high: date) -> bool:
+    end_date = interval.end_date
+    if end_date is not None and end_date == interval.start_date:
+        end_date = end_date + timedelta(days=1)
+    return interval.start_date <= high and (end_date is None or end_date > low)
+
+
+def test_holdings_index_queries_match_linear_scan() -> None:
+    intervals = _random_intervals(2000)
+    index = HoldingsIndex.from_intervals(intervals)
+    rng = random.Random(11)
+
+    for _ in range(100):
+        as_of_date = BASE_DATE + timedelta(days=rng.randrange(-30, 3700))
+        expected = {row.record_id for row in intervals if _covers(row, as_of_date, as_of_date)}
+        assert {row.record_id for row in index.as_of(as_of_date)} == expected
+
+        start_date = BASE_DATE + timedelta(days=rng.randrange(3650))
+        end_date = start_date + timedelta(days=rng.randrange(120))
+        expected = {row.record_id for row in intervals if _covers(row, start_date, end_date)}
+        assert {row.record_id for row in index.between(start_date, end_date)} == expected
+
+    pick_rows = index.as_of(date(2019, 6, 1), kinds=["pick_stage"])
+    assert pick_rows and all(row.interval_kind == "pick_stage" for row in pick_rows)
+    with pytest.raises(ValueError):
+        index.between(date(2020, 1, 2), date(2020, 1, 1))
+
+
+def test_holdings_index_builds_from_canonical_rows_and_round_trips(tmp_path) -> None:
+    assets = [
+        CanonicalAsset("asset_player", "player_tenure", "tenure_1", None, "Marc Gasol", NOW, NOW),
+        CanonicalAsset("asset_pick", "pick_continuity", None, "pick_1", "2019 MEM 1st", NOW, NOW),
+    ]
+    tenures = [
+        CanonicalPlayerTenure("tenure_1", "player_1", date(2008, 7, 1), date(2019, 2, 7), "event_entry", "event_exit", "standard", None, NOW, NOW),
+    ]
+    resolutions = [
+        CanonicalPickResolution("resolution_1", "pick_1", "future_pick", date(2017, 6, 22), date(2019, 5, 14), None, None, None, None, {}, NOW, NOW),
+        CanonicalPickResolution("resolution_2", "pick_1", "resolved_pick", date(2019, 5, 14), date(2019, 6, 20), 2, None, None, None, {}, NOW, NOW),
+        CanonicalPickResolution("resolution_3", "pick_1", "drafted_player", date(2019, 6, 20), None, 2, None, "player_2", None, {}, NOW, NOW),
+    ]
+    states = [
+        AssetState("state_1", "asset_player", "contract", date(2015, 7, 1), date(2020, 6, 30), {}, None, NOW, NOW),
+    ]
+    index = build_holdings_index(
+        assets=assets,
+        player_tenures=tenures,
+        pick_resolutions=resolutions,
+        asset_states=states,
+        canonical_build_id="build_1",
+    )
+
+    assert index.counts() == {"interval_count": 5, "player_tenure_count": 1, "pick_stage_count": 3, "asset_state_count": 1}
+    assert {row.record_id for row in index.as_of(date(2019, 2, 6))} == {"tenure_1", "resolution_1", "state_1"}
+    assert {row.record_id for row in index.as_of(date(2019, 2, 7))} == {"resolution_1", "state_1"}
+    tenure_row = next(row for row in index.intervals if row.interval_kind == "player_tenure")
+    assert (tenure_row.asset_id, tenure_row.label) == ("asset_player", "Marc Gasol")
+
+    diff = index.diff(date(2019, 1, 1), date(2019, 7, 1))
+    assert [row.record_id for row in diff.added] == ["resolution_3"]
+    assert {row.record_id for row in diff.removed} == {"tenure_1", "resolution_1"}
+    assert diff.counts() == {"added_count": 1, "removed_count": 2}
+
+    path = write_holdings_index(index, tmp_path / "holdings" / "index.json")
+    loaded = load_holdings_index(path)
+    assert loaded == index
+    assert loaded.canonical_build_id == "build_1"
+    assert loaded.as_of(date(2019, 5, 14)) == index.as_of(date(2019, 5, 14))
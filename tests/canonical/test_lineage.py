@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta
+
+from canonical.lineage import build_asset_lineage, lineage_edges, select_asset_lineage
+from canonical.models import CanonicalEventAssetFlow
+from storage import InMemoryRepository
+
+
+NOW = datetime(2026, 4, 16, 12, 0, 0)
+
+
+def _flow(event_id: str, asset_id: str, direction: str, order: int, effective_date: date) -> CanonicalEventAssetFlow:
+    return CanonicalEventAssetFlow(
+        event_asset_flow_id=f"flow_{event_id}_{asset_id}_{direction}",
+        event_id=event_id,
+        asset_id=asset_id,
+        flow_direction=direction,
+        flow_role="outgoing_player" if direction == "in" else "incoming_player",
+        flow_order=order,
+        effective_date=effective_date,
+        created_at=NOW,
+    )
+
+
+def _trade(event_id: str, effective_date: date, sent: list[str], received: list[str]) -> list[CanonicalEventAssetFlow]:
+    return [
+        *(_flow(event_id, asset_id, "in", index, effective_date) for index, asset_id in enumerate(sent, start=1)),
+        *(_flow(event_id, asset_id, "out", len(sent) + index, effective_date) for index, asset_id in enumerate(received, start=1)),
+    ]
+
+
+def _chain_flows() -> list[CanonicalEventAssetFlow]:
+    return [
+        *_trade("event_trade_1", date(2017, 2, 1), ["asset_player_a"], ["asset_pick_1"]),
+        # The draft consumes the pick and the drafted player's tenure asset emerges from it.
+        *_trade("event_draft", date(2018, 6, 21), ["asset_pick_1"], ["asset_pick_1", "asset_player_b"]),
+        *_trade("event_trade_2", date(2020, 2, 1), ["asset_player_b"], ["asset_player_c", "asset_pick_2"]),
+    ]
+
+
+def test_asset_lineage_materializes_descendants_with_depth_and_path() -> None:
+    result = build_asset_lineage(_chain_flows(), built_at=NOW)
+
+    assert ("asset_pick_1", "asset_pick_1", "event_draft") not in lineage_edges(_chain_flows())
+    assert result.refresh_mode == "full"
+    assert result.counts()["lineage_edge_count"] == 4
+
+    descendants = select_asset_lineage(result.lineage_rows, "asset_player_a")
+    assert [(row.descendant_asset_id, row.depth) for row in descendants] == [
+        ("asset_pick_1", 1),
+        ("asset_player_b", 2),
+        ("asset_pick_2", 3),
+        ("asset_player_c", 3),
+    ]
+    assert descendants[-1].path_asset_ids == ["asset_player_a", "asset_pick_1", "asset_player_b", "asset_player_c"]
+    assert descendants[-1].path_event_ids == ["event_trade_1", "event_draft", "event_trade_2"]
+
+    ancestors = select_asset_lineage(result.lineage_rows, "asset_pick_2", direction="ancestors")
+    assert [row.ancestor_asset_id for row in ancestors] == ["asset_player_b", "asset_pick_1", "asset_player_a"]
+
+
+def _random_flows(seed: int) -> list[CanonicalEventAssetFlow]:
+    rng = random.Random(seed)
+    held = [f"asset_seed_{index}" for index in range(6)]
+    next_asset = 0
+    flows: list[CanonicalEventAssetFlow] = []
+    for index in range(80):
+        sent = rng.sample(held, k=min(len(held), rng.randint(1, 2)))
+        received = []
+        for _ in range(rng.randint(1, 3)):
+            next_asset += 1
+            received.append(f"asset_{next_asset:04d}")
+        held = [asset_id for asset_id in held if asset_id not in sent] + received
+        flows.extend(_trade(f"event_{index:03d}", date(2010, 1, 1) + timedelta(days=index * 20), sent, received))
+    return flows
+
+
+def test_incremental_refresh_matches_full_rebuild() -> None:
+    flows = _random_flows(3)
+    full = build_asset_lineage(flows, built_at=NOW)
+
+    event_ids = sorted({flow.event_id for flow in flows})
+    cutoff = set(event_ids[: len(event_ids) // 2])
+    initial = build_asset_lineage([flow for flow in flows if flow.event_id in cutoff], built_at=NOW)
+    refreshed = build_asset_lineage(flows, existing_rows=initial.lineage_rows, existing_edges=initial.edges, built_at=NOW)
+
+    assert refreshed.refresh_mode == "incremental"
+    assert len(refreshed.added_edges) < len(refreshed.edges)
+    assert 0 < len(refreshed.changed_rows) < len(refreshed.lineage_rows)
+    assert refreshed.lineage_rows == full.lineage_rows
+
+    unchanged = build_asset_lineage(flows, existing_rows=full.lineage_rows, existing_edges=full.edges, built_at=NOW)
+    assert unchanged.refresh_mode == "incremental"
+    assert unchanged.changed_rows == []
+
+    # A closure stored without its edge set cannot be checked for removed edges.
+    assert build_asset_lineage(flows, existing_rows=full.lineage_rows, built_at=NOW).refresh_mode == "full"
+
+
+def test_removed_flows_force_full_rebuild() -> None:
+    initial = build_asset_lineage(_chain_flows(), built_at=NOW)
+    trimmed = [flow for flow in _chain_flows() if flow.event_id != "event_trade_2"]
+
+    result = build_asset_lineage(trimmed, existing_rows=initial.lineage_rows, existing_edges=initial.edges, built_at=NOW)
+
+    assert result.refresh_mode == "full"
+    assert result.lineage_rows == build_asset_lineage(trimmed, built_at=NOW).lineage_rows
+    assert {row.descendant_asset_id for row in result.lineage_rows} == {"asset_pick_1", "asset_player_b"}
+
+
+def test_removing_an_intermediate_edge_deletes_the_multi_hop_rows_through_it() -> None:
+    repository = InMemoryRepository()
+    flows = _chain_flows()
+    repository.state.event_asset_flows = flows
+    repository.persist_canonical_asset_lineage_build(build_asset_lineage(flows, built_at=NOW))
+    assert ("asset_player_a", "asset_player_c") in {
+        (row.ancestor_asset_id, row.descendant_asset_id) for row in repository.state.asset_lineage.values()
+    }
+
+    # The draft is the intermediate hop between player A's trade and player B's.
+    repository.state.event_asset_flows = [flow for flow in flows if flow.event_id != "event_draft"]
+    trimmed_flows, existing_rows, existing_edges = repository.fetch_asset_lineage_build_inputs()
+    result = build_asset_lineage(trimmed_flows, existing_rows=existing_rows, existing_edges=existing_edges, built_at=NOW)
+    repository.persist_canonical_asset_lineage_build(result)
+
+    assert result.refresh_mode == "full"
+    pairs = {(row.ancestor_asset_id, row.descendant_asset_id) for row in repository.state.asset_lineage.values()}
+    assert pairs == {
+        ("asset_player_a", "asset_pick_1"),
+        ("asset_player_b", "asset_player_c"),
+        ("asset_player_b", "asset_pick_2"),
+    }
+    assert repository.state.asset_lineage_edges == set(result.edges)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+import yaml
+
+from canonical.events import build_canonical_events
+from canonical.merge_suggestions import suggest_event_merges, write_merge_suggestions
+from evidence.models import NormalizedClaim, OverrideRecord
+from evidence.overrides import load_override_bundle
+
+
+NOW = datetime(2026, 4, 16, 12, 0, 0)
+
+
+def _row_claims(cluster_key: str, event_date: str, event_type: str, description: str, counterparty: str | None) -> list[NormalizedClaim]:
+    payloads = [
+        ("event_date", {"event_date": event_date}),
+        ("event_type", {"event_type": event_type}),
+        ("event_description", {"description": description}),
+    ]
+    if counterparty is not None:
+        payloads.append(("transaction_counterparty", {"counterparty_team": counterparty}))
+    return [
+        NormalizedClaim(
+            claim_id=f"claim_{cluster_key}_{claim_type}",
+            source_record_id=f"source_{cluster_key}",
+            claim_type=claim_type,
+            claim_subject_type="event",
+            claim_subject_key=cluster_key,
+            claim_group_hint=cluster_key,
+            claim_date=date.fromisoformat(event_date),
+            source_sequence=None,
+            claim_payload=payload,
+            confidence_flag="high",
+            normalizer_version="test-normalizer-v1",
+            created_at=NOW,
+        )
+        for claim_type, payload in payloads
+    ]
+
+
+def _claims() -> list[NormalizedClaim]:
+    return [
+        *_row_claims("spotrac_tx::1::2019-02-07::a", "2019-02-07", "trade", "Memphis acquires Jonas Valanciunas from Toronto", "Toronto"),
+        *_row_claims("spotrac_tx::2::2019-02-07::b", "2019-02-07", "trade", "Memphis acquires Delon Wright from Toronto", "Toronto"),
+        *_row_claims("spotrac_tx::3::2019-02-07::c", "2019-02-07", "trade", "Memphis acquires C.J. Miles from Toronto", "Toronto"),
+        *_row_claims("spotrac_tx::4::2019-02-07::d", "2019-02-07", "signing", "Memphis signs Tyler Dorsey", "Toronto"),
+        *_row_claims("spotrac_tx::5::2019-02-07::e", "2019-02-07", "trade", "Memphis acquires Avery Bradley from LA Clippers", "LA Clippers"),
+        *_row_claims("spotrac_tx::6::2019-02-08::f", "2019-02-08", "trade", "Memphis acquires Tyler Dorsey from Atlanta", "Toronto"),
+        *_row_claims("spotrac_tx::7::2019-07-06::g", "2019-07-06", "trade", "Memphis acquires Jae Crowder from Utah", "Utah"),
+        *_row_claims("spotrac_tx::8::2019-07-06::h", "2019-07-06", "trade", "Memphis acquires Kyle Korver from Utah", "Utah"),
+        *_row_claims("spotrac_tx::9::2019-07-06::i", "2019-07-06", "trade", "Memphis acquires Grayson Allen from Utah", "Utah"),
+    ]
+
+
+def _existing_merge() -> OverrideRecord:
+    return OverrideRecord(
+        override_id="override_merge_event_2019_07_06_conley_trade",
+        override_type="merge_event_cluster",
+        target_type="event_cluster",
+        target_key="spotrac_tx::7::2019-07-06::g",
+        payload={
+            "source_cluster_keys": ["spotrac_tx::7::2019-07-06::g", "spotrac_tx::8::2019-07-06::h"],
+            "target_cluster_key": "spotrac_tx::7::2019-07-06::g",
+        },
+        reason="curated",
+        authored_by="curator",
+        authored_at=NOW,
+        is_active=True,
+    )
+
+
+def test_suggest_event_merges_blocks_by_date_and_counterparty() -> None:
+    result = suggest_event_merges(_claims(), [_existing_merge()])
+
+    assert [suggestion.source_cluster_keys for suggestion in result.suggestions] == [
+        ["spotrac_tx::1::2019-02-07::a", "spotrac_tx::2::2019-02-07::b", "spotrac_tx::3::2019-02-07::c"]
+    ]
+    suggestion = result.suggestions[0]
+    assert suggestion.target_cluster_key == "spotrac_tx::1::2019-02-07::a"
+    assert suggestion.counterparty == "toronto"
+    assert result.counts()["compared_pair_count"] == 4
+    assert result.counts()["compared_pair_count"] < result.counts()["all_pairs_count"]
+
+
+def test_suggest_event_merges_skips_clusters_already_in_a_merge_override() -> None:
+    result = suggest_event_merges(_claims(), [_existing_merge()])
+
+    assert result.already_merged_count == 1
+    assert all(
+        "spotrac_tx::7::2019-07-06::g" not in suggestion.source_cluster_keys for suggestion in result.suggestions
+    )
+
+
+def test_suggest_event_merges_requires_description_overlap_within_a_block() -> None:
+    claims = [
+        *_row_claims("spotrac_tx::1::2019-02-07::a", "2019-02-07", "trade", "Memphis acquires Jonas Valanciunas from Toronto", "Toronto"),
+        *_row_claims("spotrac_tx::2::2019-02-07::z", "2019-02-07", "trade", "Raptors waive Patrick McCaw", "Toronto"),
+    ]
+
+    result = suggest_event_merges(claims, [])
+
+    assert result.compared_pair_count == 1
+    assert result.suggestions == []
+
+
+def test_suggest_event_merges_respects_min_score() -> None:
+    result = suggest_event_merges(_claims(), [_existing_merge()], min_score=0.99)
+
+    assert result.suggestions == []
+
+
+def test_written_suggestions_load_as_overrides_and_merge_events(tmp_path: Path) -> None:
+    result = suggest_event_merges(_claims(), [_existing_merge()])
+    output_path = write_merge_suggestions(result, tmp_path / "suggestions" / "merges.yaml", authored_at=NOW)
+
+    entries = yaml.safe_load(output_path.read_text(encoding="utf-8"))
+    assert entries[0]["override_type"] == "merge_event_cluster"
+    assert entries[0]["payload"]["target_cluster_key"] == entries[0]["target_key"]
+    assert entries[0]["authored_at"] == "2026-04-16T12:00:00Z"
+
+    bundle = load_override_bundle(output_path.parent)
+    before = build_canonical_events(_claims(), [_existing_merge()], built_at=NOW)
+    after = build_canonical_events(_claims(), [_existing_merge(), *bundle.overrides], built_at=NOW)
+
+    assert len(after.events) == len(before.events) - 2
+    merged = next(event for event in after.events if event.transaction_group_key == "spotrac_tx::1::2019-02-07::a")
+    assert merged.is_compound
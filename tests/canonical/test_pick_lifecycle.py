@@ -280,6 +280,23 @@ def test_build_pick_lifecycle_supports_future_pick_and_conveyed_away_exit():
     assert report.ok
 
 
+def test_build_pick_lifecycle_partitioned_build_matches_serial_build():
+    events = [
+        _event("event_draft", "draft", "2023-06-22", 1, "Memphis drafts GG Jackson", "source_draft"),
+        _event("event_trade", "trade", "2024-02-08", 1, "Memphis trades future pick to Orlando", "source_trade"),
+    ]
+    event_provenance = [
+        _event_provenance("event_draft", "source_draft", "claim_draft_event"),
+        _event_provenance("event_trade", "source_trade", "claim_trade_event"),
+    ]
+    claims = _draft_claims("source_draft", "draft::2023-06-22::gg") + _future_pick_claims("source_trade", "trade::2024-02-08::pick")
+    serial = build_pick_lifecycle(events, event_provenance, claims, [], built_at=datetime(2026, 4, 16, 12, 0, 0))
+    partitioned = build_pick_lifecycle(events, event_provenance, claims, [], built_at=datetime(2026, 4, 16, 12, 0, 0), workers=2)
+
+    assert len(serial.pick_assets) == 2
+    assert partitioned == serial
+
+
 def test_validate_pick_lifecycle_flags_out_of_order_state_dates():
     events = [_event("event_draft", "draft", "2023-06-22", 1, "Memphis drafts GG Jackson", "source_draft")]
     event_provenance = [_event_provenance("event_draft", "source_draft", "claim_draft_event")]
@@ -5,6 +5,7 @@ from datetime import datetime
 from canonical.models import CanonicalEvent, EventProvenance
 from canonical.player_tenure import build_player_tenures
 from evidence.models import NormalizedClaim
+from shared.franchise import franchise_for
 
 
 def _event(event_id: str, event_type: str, event_date: str, order: int, description: str) -> CanonicalEvent:
@@ -132,3 +133,25 @@ def test_build_player_tenures_preserves_identity_separation_for_draft_player():
     assert result.player_tenures[0].tenure_type == "draft"
     assert result.player_identities[0].player_id == "player_gg_jackson"
     assert result.assets[0].asset_id != result.player_identities[0].player_id
+
+
+def test_build_player_tenures_reads_trade_direction_from_the_franchise_side():
+    events = [
+        _event("event_trade_in", "trade", "2024-02-08", 1, "John Doe traded to Boston"),
+        _event("event_trade_out", "trade", "2024-03-08", 1, "John Doe traded from Boston to Dallas"),
+    ]
+    event_provenance = [
+        _event_provenance("event_trade_in", "source_trade_in", "claim_trade_in"),
+        _event_provenance("event_trade_out", "source_trade_out", "claim_trade_out"),
+    ]
+    claims = [
+        _claim("claim_trade_in", "source_trade_in", "player_identity", "player::player_john_doe", {"player_identity": "player_john_doe"}, claim_date="2024-02-08", source_sequence=1),
+        _claim("claim_trade_out", "source_trade_out", "player_identity", "player::player_john_doe", {"player_identity": "player_john_doe"}, claim_date="2024-03-08", source_sequence=1),
+    ]
+    built_at = datetime(2026, 4, 16, 12, 0, 0)
+
+    boston = build_player_tenures(events, event_provenance, claims, [], built_at=built_at, franchise=franchise_for("BOS"))
+    memphis = build_player_tenures(events, event_provenance, claims, [], built_at=built_at)
+
+    assert [(row.tenure_type, row.exit_event_id) for row in boston.player_tenures] == [("trade_acquisition", "event_trade_out")]
+    assert [(row.tenure_type, row.exit_event_id) for row in memphis.player_tenures] == [("trade", "event_trade_out")]
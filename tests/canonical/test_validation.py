@@ -66,3 +66,62 @@ def test_validate_canonical_events_flags_duplicate_same_day_ordering():
     report = validate_canonical_events(events=events, provenance_rows=provenance)
     assert not report.ok
     assert any("duplicate same-day event_order" in error for error in report.errors)
+
+
+def test_validate_canonical_events_consumes_provenance_as_a_single_pass_stream():
+    events = [_event("event_1", "2024-02-08", 1), _event("event_2", "2024-02-08", 2)]
+    roles = ("event_date_support", "event_type_support", "event_order_source_fallback")
+    consumed = []
+
+    def provenance_pages():
+        for role in roles:
+            row = _prov("event_1", role)
+            consumed.append(row)
+            yield row
+
+    report = validate_canonical_events(events=events, provenance_rows=provenance_pages())
+    assert report.provenance_count == len(consumed) == 3
+    assert report.errors == ["missing provenance for event_2"]
+
+
+def test_canonical_row_readers_page_on_the_primary_key_and_map_columns() -> None:
+    from canonical.player_tenure import iter_asset_rows
+
+    created_at = datetime(2026, 4, 1, 12, 0, 0)
+    rows = [
+        ("asset_a", "pick_continuity", None, "pick_a", "Pick A", created_at, created_at),
+        ("asset_b", "pick_continuity", None, "pick_b", "Pick B", created_at, created_at),
+    ]
+    executed = []
+
+    class _Cursor:
+        description = [
+            (name,) for name in ("asset_id", "asset_kind", "player_tenure_id", "pick_asset_id", "asset_label", "created_at", "updated_at")
+        ]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def execute(self, sql, params):
+            executed.append((sql, params))
+            after = params[0] if len(params) > 1 else ""
+            self._page = [row for row in rows if row[0] > after][: params[-1]]
+
+        def fetchall(self):
+            return self._page
+
+    class _Connection:
+        def cursor(self):
+            return _Cursor()
+
+    assets = list(iter_asset_rows(_Connection(), page_size=1, pick_assets_only=True))
+
+    assert [(asset.asset_id, asset.pick_asset_id, asset.asset_label) for asset in assets] == [
+        ("asset_a", "pick_a", "Pick A"),
+        ("asset_b", "pick_b", "Pick B"),
+    ]
+    assert all("where pick_asset_id is not null" in sql and "order by asset_id" in sql for sql, _ in executed)
+    assert executed[1][1] == ("asset_a", 1)
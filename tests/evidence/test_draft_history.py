@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from evidence.draft_history import DraftHistoryStore
+
+
+def _season_columns(season: int) -> dict[str, list[object]]:
+    return {
+        "SEASON": [season, season, season],
+        "TEAM_ABBREVIATION": ["MEM", "BOS", "van"],
+        "PLAYER_NAME": [f"{season} first", f"{season} second", f"{season} third"],
+        "ROUND_PICK": [1, 2, None],
+    }
+
+
+def test_store_fetches_each_season_once_and_serves_indexed_team_views(tmp_path) -> None:
+    requested: list[int] = []
+
+    def fetch_columns(season: int) -> dict[str, list[object]]:
+        requested.append(season)
+        return _season_columns(season)
+
+    store = DraftHistoryStore(tmp_path, fetch_columns=fetch_columns, now=lambda: datetime(2026, 1, 1))
+    entries = store.seasons(2017, 2018)
+
+    assert [row["PLAYER_NAME"] for row in entries[0].rows({"MEM", "VAN"})] == ["2017 first", "2017 third"]
+    assert [row["PLAYER_NAME"] for row in entries[1].rows()] == ["2018 first", "2018 second", "2018 third"]
+    assert entries[0].team_index == {"MEM": [0], "BOS": [1], "VAN": [2]}
+
+    reopened = DraftHistoryStore(tmp_path, fetch_columns=fetch_columns, now=lambda: datetime(2026, 1, 1))
+    assert [entry.rows({"BOS"}) for entry in reopened.seasons(2017, 2018)] == [entry.rows({"BOS"}) for entry in entries]
+    assert requested == [2017, 2018]
+    assert reopened.request_count == 0
+
+
+def test_store_refetches_a_season_captured_before_its_draft_concluded(tmp_path) -> None:
+    requested: list[int] = []
+
+    def fetch_columns(season: int) -> dict[str, list[object]]:
+        requested.append(season)
+        return _season_columns(season)
+
+    DraftHistoryStore(tmp_path, fetch_columns=fetch_columns, now=lambda: datetime(2026, 5, 1)).season(2026)
+    DraftHistoryStore(tmp_path, fetch_columns=fetch_columns, now=lambda: datetime(2026, 9, 1)).season(2026)
+    DraftHistoryStore(tmp_path, fetch_columns=fetch_columns, now=lambda: datetime(2026, 10, 1)).season(2026)
+
+    assert requested == [2026, 2026]
+
+
+def test_store_retries_failed_seasons_and_reports_ones_that_never_succeed(tmp_path) -> None:
+    failures = {2017: 2, 2018: 10}
+    delays: list[float] = []
+
+    def fetch_columns(season: int) -> dict[str, list[object]]:
+        if failures[season]:
+            failures[season] -= 1
+            raise ConnectionError(f"timeout for {season}")
+        return _season_columns(season)
+
+    store = DraftHistoryStore(
+        tmp_path,
+        fetch_columns=fetch_columns,
+        attempts=3,
+        retry_delay_seconds=0.5,
+        sleep=delays.append,
+        now=lambda: datetime(2026, 1, 1),
+    )
+    with pytest.raises(RuntimeError, match="draft history fetch for 2018 failed after 3 attempts"):
+        store.seasons(2017, 2018)
+
+    assert delays == [0.5, 1.0, 0.5, 1.0]
+    assert (tmp_path / "draft-history-2017.json").exists()
+    assert not (tmp_path / "draft-history-2018.json").exists()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from .helpers import (
     as_list,
     call_with_fallbacks,
@@ -85,3 +87,40 @@ def test_draft_normalization_carries_source_sequence_and_pick_claims():
         raw_source["raw_payload"]["source_sequence"]
     }
     assert len({get_value(claim, "normalizer_version") for claim in claims}) == 1
+
+
+def test_normalizer_registry_matches_recorded_claims_for_every_source_variant():
+    from dataclasses import asdict
+    from datetime import datetime
+
+    from evidence.ingest import capture_source_records
+    from evidence.normalize import normalize_source_record
+
+    raw_records = load_json_fixture("normalizer_parity_records.json")
+    raw_records.extend(
+        load_json_fixture(name)
+        for name in ("spotrac_transaction_raw.json", "spotrac_contract_raw.json", "nba_api_draft_raw.json")
+    )
+    claims = [
+        asdict(claim)
+        for record in capture_source_records(raw_records)
+        for claim in normalize_source_record(record, created_at=datetime(2026, 4, 1, 12))
+    ]
+    for claim in claims:
+        claim["claim_date"] = claim["claim_date"].isoformat() if claim["claim_date"] else None
+        claim["created_at"] = claim["created_at"].isoformat()
+
+    assert claims == load_json_fixture("normalizer_parity_claims.json")
+
+
+def test_register_normalizer_rejects_source_types_claimed_by_another_normalizer():
+    from evidence.normalize import NormalizerVariant, SourceNormalizer, register_normalizer
+
+    with pytest.raises(ValueError, match="already handled"):
+        register_normalizer(
+            SourceNormalizer(
+                name="shadow",
+                source_types=frozenset({"transaction"}),
+                variants=(NormalizerVariant(context=lambda payload: None, templates=()),),
+            )
+        )
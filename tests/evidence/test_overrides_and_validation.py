@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -150,3 +151,57 @@ def test_validation_report_counts_stage1_inputs_without_canonical_assumptions():
     claim_counts = get_value(report, "claim_count_by_type", "claims_by_type", "claim_counts")
     assert claim_counts["event_date"] >= 1
     assert claim_counts["pick_identity"] >= 1
+
+
+def test_paged_validation_matches_in_memory_report_with_compact_and_disk_id_sets(tmp_path):
+    from evidence.validate import validate_stage1_pages, validate_stage1_rows
+    from shared.streaming import CompactIdSet, DiskIdSet
+
+    source_records = _capture_source_records()
+    claims = _normalize_all(source_records)
+    overrides_module = evidence_module("overrides")
+    overrides = as_list(
+        get_callable(overrides_module, "load_overrides")(str(FIXTURES_DIR / "event_order_override.json")),
+        "overrides",
+    )
+    missing_claim = claims[0].__class__(**{**claims[0].__dict__, "claim_id": "orphan", "source_record_id": "missing"})
+    claims = [*claims, missing_claim]
+
+    expected = validate_stage1_rows(source_records=source_records, normalized_claims=claims, overrides=overrides)
+    for id_set in (CompactIdSet(), DiskIdSet(tmp_path / "ids.sqlite")):
+        report = validate_stage1_pages(
+            source_record_pages=[source_records[:1], source_records[1:]],
+            claim_pages=[claims[index : index + 2] for index in range(0, len(claims), 2)],
+            override_pages=[overrides],
+            source_record_ids=id_set,
+        )
+        id_set.close()
+        assert report == expected
+    assert "claim references unknown source_record_id: orphan" in expected.errors
+    assert not (tmp_path / "ids.sqlite").exists()
+
+
+def test_insert_override_bundle_serializes_payloads_for_postgres():
+    from evidence.overrides import insert_override_bundle, load_override_bundle
+
+    executed = []
+
+    class _Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def execute(self, sql, params):
+            executed.append(params)
+
+    class _Connection:
+        def cursor(self):
+            return _Cursor()
+
+    bundle = load_override_bundle(FIXTURES_DIR / "event_order_override.json")
+    counts = insert_override_bundle(_Connection(), bundle)
+
+    assert counts == {"override_count": 1, "override_link_count": len(bundle.override_links)}
+    assert json.loads(executed[0][4]) == bundle.overrides[0].payload
@@ -58,3 +58,52 @@ def test_source_record_capture_preserves_source_metadata_and_payload_hash_is_sta
 
     assert get_value(captured, "raw_payload") == raw_source["raw_payload"]
     assert get_value(captured, "payload_hash")
+
+
+def test_league_source_records_fetch_draft_history_once_and_fan_it_out(tmp_path):
+    from datetime import date, datetime
+
+    from evidence import ingest
+    from evidence.draft_history import DraftHistoryStore
+    from shared.franchise import franchise_for
+
+    seasons = {
+        2017: [("MEM", "Ivan Rabb"), ("BOS", "Jayson Tatum")],
+        2018: [("CHI", "Wendell Carter Jr."), ("MEM", "Jaren Jackson Jr.")],
+    }
+    requested = []
+
+    def fetch_columns(season):
+        requested.append(season)
+        return {
+            "SEASON": [season] * len(seasons[season]),
+            "TEAM_ABBREVIATION": [team for team, _ in seasons[season]],
+            "PLAYER_NAME": [name for _, name in seasons[season]],
+        }
+
+    store = DraftHistoryStore(tmp_path / "draft-history", fetch_columns=fetch_columns, now=lambda: datetime(2026, 1, 1))
+    captured_at = ingest._coerce_datetime("2026-01-01T00:00:00Z")
+    league = ingest.build_league_source_records(
+        sources={"nba_api"},
+        franchises=[franchise_for("MEM"), franchise_for("BOS")],
+        start_date=date(2017, 1, 1),
+        end_date=date(2018, 12, 31),
+        captured_at=captured_at,
+        draft_history_store=store,
+    )
+    single = ingest.build_live_source_records(
+        sources={"nba_api"},
+        team_slug="memphis-grizzlies",
+        team_code="mem",
+        team_abbrevs={"MEM", "VAN"},
+        start_date=date(2017, 1, 1),
+        end_date=date(2018, 12, 31),
+        captured_at=captured_at,
+        draft_history_store=store,
+    )
+
+    assert requested == [2017, 2018]
+    assert [record.raw_payload["PLAYER_NAME"] for record in league["MEM"]] == ["Ivan Rabb", "Jaren Jackson Jr."]
+    assert [record.raw_payload["source_sequence"] for record in league["MEM"]] == [1, 2]
+    assert [record.raw_payload["PLAYER_NAME"] for record in league["BOS"]] == ["Jayson Tatum"]
+    assert [record.source_record_id for record in single] == [record.source_record_id for record in league["MEM"]]
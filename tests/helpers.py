@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from redesign_cli import main
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "evidence" / "fixtures"
+RAW_FIXTURES = ("nba_api_draft_raw.json", "spotrac_contract_raw.json", "spotrac_transaction_raw.json")
+
+
+def copy_raw_fixtures(tmp_path: Path) -> Path:
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for name in RAW_FIXTURES:
+        shutil.copy(FIXTURES_DIR / name, input_dir / name)
+    return input_dir
+
+
+def run_memory_cli(capsys: pytest.CaptureFixture[str], store_path: Path, *argv: str) -> dict:
+    cache_dir = store_path.parent / "config-cache"
+    assert main(["--storage", "memory", "--storage-path", str(store_path), "--config-cache-dir", str(cache_dir), *argv]) == 0
+    return json.loads(capsys.readouterr().out)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from storage import InMemoryRepository
+from tests.helpers import copy_raw_fixtures, run_memory_cli
+
+
+@pytest.fixture
+def raw_input_dir(tmp_path: Path) -> Path:
+    return copy_raw_fixtures(tmp_path)
+
+
+def test_run_franchises_builds_each_franchise_in_its_own_partition(tmp_path: Path, raw_input_dir: Path, capsys) -> None:
+    store_path = tmp_path / "store.pickle"
+    input_root = tmp_path / "franchises"
+    shutil.copytree(raw_input_dir, input_root / "mem")
+    shutil.copytree(raw_input_dir, input_root / "bos")
+
+    result = run_memory_cli(capsys, store_path, "run-franchises", "--franchises", "MEM,BOS", "--input-root", str(input_root))
+
+    assert result["franchise_count"] == 2
+    assert set(result["franchises"]) == {"MEM", "BOS"}
+    assert not store_path.exists()
+    for code in ("mem", "bos"):
+        counts = result["franchises"][code.upper()]
+        assert counts["source_record_count"] == 3
+        assert "editorial-overlays" not in counts["pipeline"]["stages"]
+        with InMemoryRepository(path=tmp_path / code / "store.pickle") as repository:
+            assert repository.fetch_current_presentation_build_id() is not None
+    with InMemoryRepository(path=tmp_path / "bos" / "store.pickle") as repository:
+        labels = [row.asset_label for row in repository.state.assets if row.asset_kind == "player_tenure"]
+    assert labels and all(" Boston tenure " in label for label in labels)
+
+    rebuilt = run_memory_cli(capsys, store_path, "--franchise", "BOS", "build-presentation-contract")
+    with InMemoryRepository(path=tmp_path / "bos" / "store.pickle") as repository:
+        assert repository.fetch_current_presentation_build_id() == rebuilt["presentation_build_id"]
+    assert not store_path.exists()
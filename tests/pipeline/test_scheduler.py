@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from pipeline.scheduler import StageSpec, critical_path, run_stage_graph, topological_order
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.persisted: list[str] = []
+        self.commits = 0
+
+    def __enter__(self) -> "_FakeConnection":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def _run(name: str, delay: float, active: list[str], peak: list[int], lock: threading.Lock) -> str:
+    with lock:
+        active.append(name)
+        peak[0] = max(peak[0], len(active))
+    time.sleep(delay)
+    with lock:
+        active.remove(name)
+    return f"{name}-result"
+
+
+def _persist(conn: _FakeConnection, result: str) -> dict[str, object]:
+    conn.persisted.append(result)
+    return {"result": result}
+
+
+def _stage_graph(delays: dict[str, float]) -> tuple[list[StageSpec], list[int]]:
+    active: list[str] = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def stage(name: str, depends_on: tuple[str, ...] = (), persist_after: tuple[str, ...] = ()) -> StageSpec:
+        return StageSpec(
+            name=name,
+            run=partial(_run, name, delays.get(name, 0.0), active, peak, lock),
+            persist=_persist,
+            depends_on=depends_on,
+            persist_after=persist_after,
+        )
+
+    return (
+        [
+            stage("events"),
+            stage("tenures", ("events",)),
+            stage("picks", ("events",), ("tenures",)),
+            stage("flows", ("tenures", "picks")),
+            stage("presentation", ("flows",)),
+            stage("editorial", persist_after=("presentation",)),
+        ],
+        peak,
+    )
+
+
+def test_topological_order_is_deterministic_and_respects_persist_after() -> None:
+    stages, _ = _stage_graph({})
+    assert topological_order(stages) == ["events", "tenures", "picks", "flows", "presentation", "editorial"]
+    assert topological_order(reversed(stages)) == ["events", "tenures", "picks", "flows", "presentation", "editorial"]
+
+
+def test_topological_order_rejects_unknown_dependencies_and_cycles() -> None:
+    with pytest.raises(ValueError, match="unknown stage"):
+        topological_order([StageSpec(name="a", run=str, persist=_persist, depends_on=("missing",))])
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order(
+            [
+                StageSpec(name="a", run=str, persist=_persist, depends_on=("b",)),
+                StageSpec(name="b", run=str, persist=_persist, depends_on=("a",)),
+            ]
+        )
+
+
+def test_critical_path_follows_the_longest_dependency_chain() -> None:
+    stages, _ = _stage_graph({})
+    run_seconds = {"events": 1.0, "tenures": 2.0, "picks": 5.0, "flows": 1.0, "presentation": 1.0, "editorial": 0.5}
+
+    path, seconds = critical_path(stages, run_seconds)
+
+    assert path == ["events", "picks", "flows", "presentation", "editorial"]
+    assert seconds == pytest.approx(8.0)
+
+
+def test_critical_path_counts_persist_after_waits() -> None:
+    stages, _ = _stage_graph({})
+    run_seconds = {"events": 1.0, "tenures": 1.0, "picks": 0.1, "flows": 1.0, "presentation": 1.0, "editorial": 9.0}
+
+    path, seconds = critical_path(stages, run_seconds, {"editorial": 1.0})
+
+    assert path == ["editorial"]
+    assert seconds == pytest.approx(10.0)
+
+
+def test_run_stage_graph_runs_independent_stages_concurrently_and_persists_in_order() -> None:
+    stages, peak = _stage_graph({"tenures": 0.2, "picks": 0.05, "editorial": 0.2})
+    connection = _FakeConnection()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = run_stage_graph(stages, connect=lambda: connection, executor=executor)
+
+    assert connection.persisted == [
+        "events-result",
+        "tenures-result",
+        "picks-result",
+        "flows-result",
+        "presentation-result",
+        "editorial-result",
+    ]
+    assert connection.commits == 6
+    assert peak[0] >= 2
+    assert result.stage_order[:2] == ["events", "editorial"]
+    assert result.persist_order == topological_order(stages)
+    assert result.counts()["stages"]["picks"] == {"result": "picks-result"}
+    assert result.critical_path[0] == "events"
+    assert result.critical_path_seconds <= result.serial_seconds
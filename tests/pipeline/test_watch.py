@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SyntheticFranchiseConfig, generate_synthetic_dataset
+from evidence.models import OverrideBundle
+from evidence.normalize import normalize_source_record
+import pipeline.watch
+from pipeline import default_stage_graph, run_editorial_stage, run_stage
+from pipeline.watch import ConfigWatcher, WatchTargets, affected_stages, rebuild_affected, watch_configs
+from redesign_cli import main
+from storage import InMemoryRepository
+from tests.helpers import copy_raw_fixtures, run_memory_cli
+
+CONFIG_DATA_DIR = Path(__file__).resolve().parents[2] / "configs" / "data"
+
+
+def _targets(tmp_path: Path) -> WatchTargets:
+    overrides_dir = tmp_path / "overrides"
+    overrides_dir.mkdir()
+    (overrides_dir / "stage2_event_merge_overrides.yaml").write_text("overrides: []\n", encoding="utf-8")
+    editorial_dir = tmp_path / "editorial"
+    editorial_dir.mkdir()
+    shutil.copy(CONFIG_DATA_DIR / "stage7_editorial_overlays.yaml", editorial_dir / "stage7_editorial_overlays.yaml")
+    manifest_path = tmp_path / "stage8_headshot_manifest.yaml"
+    manifest_path.write_text("{}\n", encoding="utf-8")
+    return WatchTargets(overrides_path=overrides_dir, editorial_input_path=editorial_dir, headshot_manifest_path=manifest_path)
+
+
+def _touch(path: Path, text: str) -> None:
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _synthetic_repository() -> InMemoryRepository:
+    dataset = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=3, seasons=4, trades_per_season=4, seed=7))
+    repository = InMemoryRepository()
+    repository.insert_source_records(dataset.source_records)
+    repository.insert_override_bundle(OverrideBundle(overrides=[], override_links=[]))
+    repository.insert_normalized_claims(
+        [*(claim for record in dataset.source_records for claim in normalize_source_record(record)), *dataset.supplemental_claims]
+    )
+    for stage_name in (
+        "canonical-events",
+        "canonical-player-tenures",
+        "canonical-pick-lifecycle",
+        "canonical-event-asset-flows",
+        "presentation-contract",
+    ):
+        run_stage(stage_name, repository)
+    repository.commit()
+    return repository
+
+
+def test_affected_stages_follow_the_stage_graph_from_each_kind_of_edit() -> None:
+    stages = default_stage_graph()
+
+    assert affected_stages({"headshots"}, stages) == ["layout-contract"]
+    assert affected_stages({"editorial"}, stages) == ["editorial-overlays", "layout-contract"]
+    assert affected_stages({"overrides"}, stages) == [
+        "canonical-events",
+        "canonical-player-tenures",
+        "canonical-pick-lifecycle",
+        "canonical-event-asset-flows",
+        "canonical-asset-lineage",
+        "presentation-contract",
+        "editorial-overlays",
+        "layout-contract",
+    ]
+    assert affected_stages(set(), stages) == []
+
+
+def test_config_watcher_reports_the_kind_of_each_edited_file(tmp_path: Path) -> None:
+    targets = _targets(tmp_path)
+    watcher = ConfigWatcher(targets)
+    assert watcher.poll() == set()
+
+    _touch(targets.headshot_manifest_path, "asset_a: headshots/a.png\n")
+    assert watcher.poll() == {"headshots"}
+
+    _touch(targets.editorial_input_path / "stage7_editorial_overlays.yaml", "editorial: {}\n")
+    (targets.overrides_path / "extra_overrides.yaml").write_text("overrides: []\n", encoding="utf-8")
+    assert watcher.poll() == {"editorial", "overrides"}
+
+    (targets.overrides_path / "extra_overrides.yaml").unlink()
+    assert watcher.poll() == {"overrides"}
+
+
+def test_rebuild_affected_reruns_only_the_invalidated_subgraph(tmp_path: Path) -> None:
+    targets = _targets(tmp_path)
+    repository = _synthetic_repository()
+    presentation_build_id = repository.fetch_current_presentation_build_id()
+    options = {"targets": targets, "frontend_public_root": tmp_path, "output_dir": tmp_path / "out"}
+
+    headshots = rebuild_affected(repository, {"headshots"}, **options)
+    assert headshots.stages == ["layout-contract"]
+    assert [path.name for path in headshots.written_paths] == ["layout-contract.json"]
+    assert repository.fetch_current_presentation_build_id() == presentation_build_id
+
+    editorial = rebuild_affected(repository, {"editorial"}, **options)
+    assert editorial.stages == ["editorial-overlays", "layout-contract"]
+    assert repository.fetch_editorial_overlays().build.presentation_build_id == presentation_build_id
+    assert repository.fetch_current_presentation_build_id() == presentation_build_id
+
+    overrides = rebuild_affected(repository, {"overrides"}, **options)
+    assert overrides.stages[0] == "canonical-events"
+    assert "overrides" in overrides.counts_by_stage
+    assert repository.fetch_current_presentation_build_id() != presentation_build_id
+    assert {path.name for path in overrides.written_paths} == {
+        "presentation-contract.json",
+        "editorial-overlays.json",
+        "layout-contract.json",
+    }
+
+
+def test_rebuild_affected_replaces_the_override_set_so_deletions_take_effect(tmp_path: Path) -> None:
+    targets = _targets(tmp_path)
+    repository = _synthetic_repository()
+    overrides_path = targets.overrides_path / "stage2_event_merge_overrides.yaml"
+    curated = (CONFIG_DATA_DIR / "stage2_event_merge_overrides.yaml").read_text(encoding="utf-8")
+    options = {"targets": targets, "frontend_public_root": tmp_path}
+
+    _touch(overrides_path, curated)
+    added = rebuild_affected(repository, {"overrides"}, **options)
+    assert added.counts_by_stage["overrides"]["override_count"] == len(repository.state.overrides) > 0
+
+    _touch(overrides_path, "overrides: []\n")
+    removed = rebuild_affected(repository, {"overrides"}, **options)
+    assert removed.counts_by_stage["overrides"]["removed_override_count"] == added.counts_by_stage["overrides"]["override_count"]
+    assert repository.state.overrides == {} and repository.state.override_links == {}
+
+
+def test_watch_configs_reports_a_broken_edit_and_rebuilds_once_it_is_fixed(tmp_path: Path) -> None:
+    targets = _targets(tmp_path)
+    repository = _synthetic_repository()
+    editorial_path = targets.editorial_input_path / "stage7_editorial_overlays.yaml"
+    valid_text = editorial_path.read_text(encoding="utf-8")
+    edits = iter(
+        [
+            lambda: _touch(editorial_path, "- not a mapping\n"),
+            lambda: None,
+            lambda: _touch(editorial_path, valid_text),
+        ]
+    )
+    results = []
+    errors = []
+
+    def sleep(_: float) -> None:
+        next(edits, lambda: None)()
+
+    rebuilds = watch_configs(
+        repository,
+        targets=targets,
+        max_rebuilds=2,
+        sleep=sleep,
+        on_rebuild=results.append,
+        on_error=errors.append,
+        frontend_public_root=tmp_path,
+    )
+
+    assert rebuilds == 2
+    assert len(errors) == 1 and "mapping" in str(errors[0])
+    assert [result.stages for result in results] == [["editorial-overlays", "layout-contract"]]
+
+
+def test_watch_configs_keeps_a_yaml_syntax_error_pending_and_continues(tmp_path: Path) -> None:
+    targets = _targets(tmp_path)
+    repository = _synthetic_repository()
+    overrides_path = targets.overrides_path / "stage2_event_merge_overrides.yaml"
+    edits = iter(
+        [
+            lambda: _touch(overrides_path, "overrides: [\n"),
+            lambda: _touch(targets.headshot_manifest_path, "{}\n# touched\n"),
+            lambda: _touch(overrides_path, "overrides: []\n"),
+        ]
+    )
+    results = []
+    errors = []
+
+    def sleep(_: float) -> None:
+        next(edits, lambda: None)()
+
+    rebuilds = watch_configs(
+        repository,
+        targets=targets,
+        max_rebuilds=3,
+        sleep=sleep,
+        on_rebuild=results.append,
+        on_error=errors.append,
+        frontend_public_root=tmp_path,
+    )
+
+    assert rebuilds == 3
+    assert len(errors) == 2 and all(type(error).__module__.startswith("yaml") for error in errors)
+    assert [result.kinds for result in results] == [["headshots", "overrides"]]
+    assert results[0].stages[0] == "canonical-events"
+
+
+def test_watch_configs_rolls_back_a_failed_rebuild_and_recovers_on_the_next_edit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    targets = _targets(tmp_path)
+    repository = _synthetic_repository()
+    editorial_path = targets.editorial_input_path / "stage7_editorial_overlays.yaml"
+    valid_text = editorial_path.read_text(encoding="utf-8")
+    calls = []
+
+    def failing_once(*args, **kwargs):
+        counts = run_editorial_stage(*args, **kwargs)
+        calls.append(counts)
+        if len(calls) == 1:
+            raise RuntimeError("stage failed after writing")
+        return counts
+
+    monkeypatch.setattr(pipeline.watch, "run_editorial_stage", failing_once)
+    edits = iter([lambda: _touch(editorial_path, valid_text + "\n"), lambda: _touch(editorial_path, valid_text)])
+    results = []
+    errors = []
+
+    def sleep(_: float) -> None:
+        next(edits, lambda: None)()
+        if errors and not results:
+            with pytest.raises(RuntimeError, match="no editorial build found"):
+                repository.fetch_editorial_overlays()
+
+    rebuilds = watch_configs(
+        repository,
+        targets=targets,
+        max_rebuilds=2,
+        sleep=sleep,
+        on_rebuild=results.append,
+        on_error=errors.append,
+        frontend_public_root=tmp_path,
+    )
+
+    assert rebuilds == 2
+    assert [str(error) for error in errors] == ["stage failed after writing"]
+    assert [result.stages for result in results] == [["editorial-overlays", "layout-contract"]]
+    assert repository.fetch_editorial_overlays().build.editorial_build_id == results[0].counts_by_stage["editorial-overlays"]["editorial_build_id"]
+
+
+def test_watch_rebuild_on_start_writes_previews_into_the_warm_store(tmp_path: Path, capsys) -> None:
+    raw_input_dir = copy_raw_fixtures(tmp_path)
+    store_path = tmp_path / "store.pickle"
+    output_dir = tmp_path / "preview"
+    run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+    run_memory_cli(capsys, store_path, "run-pipeline")
+    with InMemoryRepository(path=store_path) as repository:
+        previous_build_id = repository.fetch_current_presentation_build_id()
+
+    assert main(
+        [
+            "--storage",
+            "memory",
+            "--storage-path",
+            str(store_path),
+            "--no-config-cache",
+            "watch",
+            "--rebuild-on-start",
+            "--max-rebuilds",
+            "0",
+            "--output-dir",
+            str(output_dir),
+        ]
+    ) == 0
+    rebuilt, stopped = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert rebuilt["status"] == "rebuilt" and rebuilt["kinds"] == ["editorial", "headshots", "overrides"]
+    assert rebuilt["stages"][-1] == "layout-contract"
+    assert stopped == {"command": "watch", "rebuild_count": 1, "status": "stopped"}
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "editorial-overlays.json",
+        "layout-contract.json",
+        "presentation-contract.json",
+    ]
+    with InMemoryRepository(path=store_path) as repository:
+        assert repository.fetch_current_presentation_build_id() != previous_build_id
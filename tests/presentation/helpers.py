@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from benchmarks.synthetic import SyntheticFranchiseConfig, generate_synthetic_dataset
+from evidence.models import OverrideBundle
+from evidence.normalize import normalize_source_record
+from pipeline import run_stage
+from presentation.models import PresentationContractBuildResult
+from storage import InMemoryRepository
+
+
+def synthetic_presentation_result() -> PresentationContractBuildResult:
+    dataset = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=3, seasons=6, trades_per_season=6, seed=5))
+    repository = InMemoryRepository()
+    repository.insert_source_records(dataset.source_records)
+    repository.insert_override_bundle(OverrideBundle(overrides=[], override_links=[]))
+    repository.insert_normalized_claims(
+        [*(claim for record in dataset.source_records for claim in normalize_source_record(record)), *dataset.supplemental_claims]
+    )
+    for stage_name in (
+        "canonical-events",
+        "canonical-player-tenures",
+        "canonical-pick-lifecycle",
+        "canonical-event-asset-flows",
+        "presentation-contract",
+    ):
+        run_stage(stage_name, repository)
+    return repository.fetch_presentation_contract()
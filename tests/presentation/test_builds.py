@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from storage import InMemoryRepository
+from tests.helpers import copy_raw_fixtures, run_memory_cli
+
+
+@pytest.fixture
+def raw_input_dir(tmp_path: Path) -> Path:
+    return copy_raw_fixtures(tmp_path)
+
+
+def test_presentation_builds_swap_roll_back_and_prune(tmp_path: Path, raw_input_dir: Path, capsys) -> None:
+    store_path = tmp_path / "store.pickle"
+    run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+    run_memory_cli(capsys, store_path, "run-pipeline")
+    build_ids = [run_memory_cli(capsys, store_path, "build-presentation-contract")["presentation_build_id"] for _ in range(3)]
+
+    with InMemoryRepository(path=store_path) as repository:
+        assert repository.fetch_current_presentation_build_id() == build_ids[-1]
+        assert repository.fetch_presentation_contract().build.presentation_build_id == build_ids[-1]
+
+    rolled_back = run_memory_cli(capsys, store_path, "activate-presentation-build", "--previous")
+    assert rolled_back["presentation_build_id"] == build_ids[1]
+    assert rolled_back["previous_presentation_build_id"] == build_ids[2]
+
+    pruned = run_memory_cli(capsys, store_path, "prune-presentation-builds", "--keep", "1")
+    with InMemoryRepository(path=store_path) as repository:
+        retained = {row.presentation_build_id for row in repository.state.presentation_builds}
+        assert repository.fetch_presentation_contract().build.presentation_build_id == build_ids[1]
+        with pytest.raises(ValueError, match="unknown presentation build"):
+            repository.activate_presentation_build(build_ids[0])
+    assert build_ids[0] not in retained and {build_ids[1], build_ids[2]} <= retained
+    assert pruned["pruned_presentation_build_count"] >= 1
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+
+from presentation.compact import decode_compact_contract, encode_compact_contract
+from presentation.contract import build_layout_contract, layout_contract_to_json, presentation_contract_to_json
+from tests.presentation.helpers import synthetic_presentation_result
+
+
+def test_compact_encoding_round_trips_layout_and_presentation_contracts():
+    presentation_result = synthetic_presentation_result()
+    layout_result = build_layout_contract(presentation_result=presentation_result, built_at=datetime(2026, 4, 20, 12, 0, 0))
+
+    for text in (layout_contract_to_json(layout_result), presentation_contract_to_json(presentation_result)):
+        payload = json.loads(text)
+        encoded = encode_compact_contract(payload)
+        assert decode_compact_contract(encoded) == payload
+        assert len(encoded) < len(json.dumps(payload, separators=(",", ":")))
+
+    layout_payload = json.loads(layout_contract_to_json(layout_result))
+    assert len(encode_compact_contract(layout_payload)) * 3 < len(json.dumps(layout_payload, separators=(",", ":")))
+
+
+def test_compact_encoding_preserves_nulls_types_and_irregular_rows():
+    payload = {
+        "meta": {"start_date": "2020-01-01", "built_at": "2020-01-01T00:00:00", "count": 3},
+        "rows": [
+            {"id": "a", "day": "2019-12-31", "flag": True, "weight": 1.0, "tags": ["x", "y"], "slots": {"a": 1}, "note": None},
+            {"id": "b", "day": None, "flag": None, "weight": None, "tags": [], "slots": {}, "note": 7},
+            {"id": "c", "day": "2021-02-28", "flag": False, "weight": 2.5, "tags": ["z"], "slots": {"b": 2, "c": 3}, "note": "n"},
+        ],
+        "empty": [],
+        "nested": [[{"k": 1}], [], [{"k": 2}, {"k": 3}]],
+    }
+    decoded = decode_compact_contract(encode_compact_contract(payload))
+    assert decoded == payload
+    assert isinstance(decoded["rows"][0]["weight"], float)
+    assert decoded["rows"][0]["flag"] is True
+
+
+def test_compact_decoder_rejects_foreign_payloads():
+    with pytest.raises(ValueError, match="unsupported compact contract"):
+        decode_compact_contract(b"JSON" + bytes(16))
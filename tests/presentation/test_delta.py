@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import copy
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from presentation.contract import build_layout_contract, layout_contract_to_json
+from presentation.delta import (
+    ContractDelta,
+    apply_contract_delta,
+    build_contract_delta,
+    contract_content_hash,
+    contract_delta_to_json,
+)
+from tests.presentation.helpers import synthetic_presentation_result
+
+
+def _layout_payload(presentation_result=None) -> dict:
+    result = build_layout_contract(
+        presentation_result=presentation_result or synthetic_presentation_result(), built_at=datetime(2026, 4, 20, 12, 0, 0)
+    )
+    return json.loads(layout_contract_to_json(result))
+
+
+def test_contract_delta_round_trips_added_removed_changed_and_reordered_rows():
+    base = _layout_payload()
+    target = copy.deepcopy(base)
+    lane_layout = target["lane_layout"]
+    removed = lane_layout.pop(3)
+    lane_layout[0]["display_rank"] += 100
+    lane_layout.insert(5, {**lane_layout[5], "segment_id": "layout_segment_new"})
+    lane_layout.append({**lane_layout[1], "segment_id": "layout_segment_tail"})
+    target["event_layout"].reverse()
+    target["layout_meta"]["default_day_width"] = 8.0
+
+    delta = build_contract_delta(base, target)
+    assert delta.collections["lane_layout"].removed == [removed["segment_id"]]
+    assert [row["row"]["segment_id"] for row in delta.collections["lane_layout"].added] == [
+        "layout_segment_new",
+        "layout_segment_tail",
+    ]
+    assert len(delta.collections["lane_layout"].changed) == 1
+    assert delta.collections["lane_layout"].order is None
+    assert delta.collections["event_layout"].order is not None
+    assert delta.replaced == {}
+    assert delta.patched["layout_meta"].replaced == {"default_day_width": 8.0}
+    assert delta.target_content_hash == contract_content_hash(target)
+
+    restored = ContractDelta.from_dict(json.loads(contract_delta_to_json(delta)))
+    assert apply_contract_delta(base, restored) == target
+    assert len(contract_delta_to_json(delta)) < len(json.dumps(target)) // 4
+
+
+def test_contract_delta_is_empty_for_identical_builds_and_rejects_wrong_base():
+    base = _layout_payload()
+    delta = build_contract_delta(base, _layout_payload())
+    assert delta.empty
+    assert delta.collections == {} and delta.replaced == {}
+    assert apply_contract_delta(base, delta) == base
+
+    other_base = copy.deepcopy(base)
+    other_base["lane_layout"].pop()
+    with pytest.raises(ValueError, match="does not apply"):
+        apply_contract_delta(other_base, delta)
+
+
+def test_contract_delta_for_one_upstream_edge_change_patches_nested_tiers_and_lanes():
+    presentation_result = synthetic_presentation_result()
+    base = _layout_payload(presentation_result)
+    edges = list(presentation_result.edges)
+    position = len(edges) // 2
+    edges[position] = replace(edges[position], end_date=edges[position].end_date - timedelta(days=40))
+    target = _layout_payload(replace(presentation_result, edges=edges))
+
+    delta = build_contract_delta(base, target)
+    assert "lod_tiers" in delta.collections and "spatial_index" not in delta.replaced
+    assert all(
+        set(patch.collections) <= {"segments", "event_clusters", "label_placements"} and "segments" not in patch.replaced
+        for patch in delta.collections["lod_tiers"].changed.values()
+    )
+    text = contract_delta_to_json(delta)
+    assert len(text) < len(json.dumps(target, indent=2, sort_keys=True)) // 20
+    assert apply_contract_delta(base, ContractDelta.from_dict(json.loads(text))) == target
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+import json
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from canonical.models import (
@@ -13,9 +15,19 @@ from canonical.models import (
     CanonicalPlayerTenure,
 )
 from editorial.models import EditorialBuild, EditorialOverlayBuildResult, EditorialStoryChapter
-from presentation.contract import build_layout_contract, build_presentation_contract
+from presentation.contract import (
+    DEFAULT_LAYOUT_MIN_ZOOM_DAYS,
+    _LabelCandidate,
+    _place_labels,
+    build_layout_contract,
+    build_presentation_contract,
+    layout_contract_to_json,
+    spatial_bucket_range,
+    spatial_lane_key,
+)
 from presentation.validate import validate_layout_contract
 from redesign_cli import _build_editorial_chapter_rows, _validate_editorial_chapter_rows
+from tests.presentation.helpers import synthetic_presentation_result
 
 
 NOW = datetime(2026, 4, 20, 12, 0, 0)
@@ -238,6 +250,8 @@ def test_layout_contract_projects_required_groups_headshots_and_chapters(tmp_pat
         "event_layout",
         "label_layout",
         "chapter_layout",
+        "lod_tiers",
+        "spatial_index",
     }
     lane_by_asset = {row.asset_id: row for row in layout_result.lane_layout}
     assert lane_by_asset["asset_john"].identity_marker.image_path == "headshots/john.png"
@@ -416,3 +430,138 @@ def test_required_lane_group_visibility_survives_layout_export():
 
     report = validate_layout_contract(result=layout_result, presentation_result=presentation_result)
     assert report.ok
+
+
+def test_layout_lod_tiers_aggregate_zoomed_out_views():
+    presentation_result = synthetic_presentation_result()
+    layout_result = build_layout_contract(presentation_result=presentation_result, built_at=NOW)
+    tiers = layout_result.lod_tiers
+
+    total_days = (layout_result.layout_meta.end_date - layout_result.layout_meta.start_date).days + 1
+    assert tiers[0].detail_level == "full"
+    assert (tiers[0].min_zoom_days, tiers[0].max_zoom_days) == (30, 180)
+    assert tiers[-1].max_zoom_days == total_days
+    assert [tier.min_zoom_days for tier in tiers[1:]] == [tier.max_zoom_days for tier in tiers[:-1]]
+
+    coarsest = tiers[-1]
+    assert len(coarsest.segments) < len(layout_result.lane_layout)
+    assert len(coarsest.event_clusters) < len(layout_result.event_layout)
+    assert sum(1 for row in coarsest.segments if row.label_text) < len(coarsest.segments)
+    segment_counts = [len(tier.segments) for tier in tiers[1:]]
+    assert segment_counts == sorted(segment_counts, reverse=True)
+    for row in coarsest.segments:
+        assert row.label_text is None or (row.date_end - row.date_start).days + 1 >= coarsest.min_label_days
+
+    report = validate_layout_contract(result=layout_result, presentation_result=presentation_result)
+    assert report.errors == []
+    assert report.lod_tier_count == len(tiers)
+
+    shifted = replace(layout_result, lod_tiers=[replace(tiers[0], min_zoom_days=DEFAULT_LAYOUT_MIN_ZOOM_DAYS + 1), *tiers[1:]])
+    shifted_report = validate_layout_contract(result=shifted, presentation_result=presentation_result)
+    assert f"first lod_tier must start at the minimum zoom of {DEFAULT_LAYOUT_MIN_ZOOM_DAYS} days" in shifted_report.errors
+
+
+def test_layout_label_placements_resolve_collisions_per_tier():
+    presentation_result = synthetic_presentation_result()
+    layout_result = build_layout_contract(presentation_result=presentation_result, built_at=NOW)
+
+    for tier in layout_result.lod_tiers:
+        expected_ids = (
+            {row.segment_id for row in layout_result.lane_layout}
+            if tier.detail_level == "full"
+            else {row.lod_segment_id for row in tier.segments}
+        )
+        assert {row.segment_id for row in tier.label_placements} == expected_ids
+        assert any(row.placed for row in tier.label_placements)
+        for row in tier.label_placements:
+            assert row.placed or row.suppressed_reason in {"collision", "no_label"}
+            assert row.placed is (row.suppressed_reason is None)
+
+    full_tier = layout_result.lod_tiers[0]
+    assert {row.placement_kind for row in full_tier.label_placements} >= {"inline", "marker"}
+    assert any(row.suppressed_reason == "collision" for tier in layout_result.lod_tiers for row in tier.label_placements)
+
+    payload = json.loads(layout_contract_to_json(layout_result))
+    assert payload["lod_tiers"][0]["label_placements"][0].keys() >= {"segment_id", "placed", "offset_days", "width_days"}
+
+    report = validate_layout_contract(result=layout_result, presentation_result=presentation_result)
+    assert report.errors == []
+
+
+def test_layout_label_placement_sweep_keeps_higher_priority_label():
+    def candidate(segment_id, start, priority, latest):
+        return _LabelCandidate(
+            segment_id=segment_id,
+            lane_group="main_roster",
+            band_slot=0,
+            start=start,
+            label_priority=priority,
+            kind="marker",
+            width=10,
+            preferred=1,
+            latest=latest,
+        )
+
+    placements = {
+        row.segment_id: row
+        for row in _place_labels(
+            [
+                candidate("a", 0, 5, 1),
+                candidate("b", 4, 1, 1),
+                candidate("c", 20, 9, 8),
+                candidate("d", 22, 3, 20),
+            ]
+        )
+    }
+    assert not placements["a"].placed and placements["a"].suppressed_reason == "collision"
+    assert placements["b"].placed and placements["b"].offset_days == 1
+    assert placements["c"].placed and placements["c"].offset_days == 1
+    assert placements["d"].placed and placements["d"].offset_days == 9
+
+
+def test_layout_spatial_index_matches_brute_force_viewport_filter():
+    presentation_result = synthetic_presentation_result()
+    layout_result = build_layout_contract(presentation_result=presentation_result, built_at=NOW)
+    index = layout_result.spatial_index
+    assert index is not None
+    assert index.origin_date == layout_result.layout_meta.start_date
+    assert sum(len(lane.segment_entries) for lane in index.lanes) == len(layout_result.lane_layout)
+
+    window_start = date(2022, 3, 1)
+    window_end = date(2022, 8, 27)
+    buckets = spatial_bucket_range(index.origin_date, index.bucket_days, index.bucket_count, window_start, window_end)
+    candidates = {
+        layout_result.lane_layout[row_index].segment_id
+        for lane in index.lanes
+        for start_bucket, bucket_span, row_index in lane.segment_entries
+        if start_bucket <= buckets[-1] and start_bucket + bucket_span > buckets[0]
+    }
+    visible = {
+        row.segment_id for row in layout_result.lane_layout if row.date_start <= window_end and row.date_end >= window_start
+    }
+    assert visible and visible <= candidates
+    assert all(
+        row.date_start <= window_end + timedelta(days=index.bucket_days)
+        and row.date_end >= window_start - timedelta(days=index.bucket_days)
+        for row in layout_result.lane_layout
+        if row.segment_id in candidates
+    )
+
+    lane = layout_result.lane_layout[0]
+    lane_entries = next(row for row in index.lanes if row.lane_key == spatial_lane_key(lane.lane_group, lane.band_slot))
+    first_bucket = spatial_bucket_range(index.origin_date, index.bucket_days, index.bucket_count, lane.date_start, lane.date_end)[0]
+    assert any(entry[0] == first_bucket and entry[2] == 0 for entry in lane_entries.segment_entries)
+    cluster_rows = {row_index for row in index.lanes for _, _, row_index in row.event_cluster_entries}
+    assert cluster_rows == set(range(len(layout_result.event_layout)))
+
+    payload = json.loads(layout_contract_to_json(layout_result))
+    assert payload["spatial_index"]["bucket_days"] == index.bucket_days
+    # Entries hold integer row indexes, so the index stays a small fraction of the rows it points at.
+    spatial_bytes = len(json.dumps(payload["spatial_index"]))
+    assert spatial_bytes * 5 < len(json.dumps(payload["lane_layout"]))
+    assert validate_layout_contract(result=layout_result, presentation_result=presentation_result).errors == []
+
+    broken_lane = replace(lane_entries, segment_entries=[entry for entry in lane_entries.segment_entries if entry[2] != 0])
+    broken = replace(layout_result, spatial_index=replace(index, lanes=[broken_lane if row is lane_entries else row for row in index.lanes]))
+    errors = validate_layout_contract(result=broken, presentation_result=presentation_result).errors
+    assert any(error.startswith("spatial_index entries do not match lane segment span") for error in errors)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+from presentation.publish import PUBLISH_MANIFEST_NAME, load_publish_manifest, publish_contract_artifacts
+
+
+def test_publish_is_deterministic_and_content_hashed(tmp_path: Path):
+    payloads = {"layout-contract": json.dumps({"lane_layout": [1, 2, 3]}), "presentation-contract": "{}"}
+
+    first = publish_contract_artifacts(payloads, tmp_path / "a")
+    second = publish_contract_artifacts(payloads, tmp_path / "b")
+    assert [row.as_dict() for row in first.artifacts] == [row.as_dict() for row in second.artifacts]
+    for row in first.artifacts:
+        plain = (tmp_path / "a" / row.file_name).read_bytes()
+        assert row.content_hash[:16] in row.file_name
+        assert gzip.decompress((tmp_path / "a" / row.gzip_file_name).read_bytes()) == plain
+        assert (tmp_path / "a" / row.gzip_file_name).read_bytes() == (tmp_path / "b" / row.gzip_file_name).read_bytes()
+    assert (tmp_path / "a" / PUBLISH_MANIFEST_NAME).read_bytes() == (tmp_path / "b" / PUBLISH_MANIFEST_NAME).read_bytes()
+
+    again = publish_contract_artifacts(payloads, tmp_path / "a")
+    assert again.written_file_count == 0
+
+    manifest = load_publish_manifest(first.manifest_path)
+    assert set(manifest) == {"layout-contract", "presentation-contract"}
+
+
+def test_publish_renames_changed_contracts_and_prunes_stale_files(tmp_path: Path):
+    before = publish_contract_artifacts({"layout-contract": '{"v": 1}', "presentation-contract": "{}"}, tmp_path)
+    after = publish_contract_artifacts({"layout-contract": '{"v": 2}', "presentation-contract": "{}"}, tmp_path, prune=True)
+
+    old_layout, new_layout = before.artifacts[0], after.artifacts[0]
+    assert old_layout.file_name != new_layout.file_name
+    assert before.artifacts[1].file_name == after.artifacts[1].file_name
+    assert after.pruned_file_count == 2
+    assert not (tmp_path / old_layout.file_name).exists()
+    assert (tmp_path / new_layout.gzip_file_name).exists()
+    assert load_publish_manifest(tmp_path / PUBLISH_MANIFEST_NAME)["layout-contract"].file_name == new_layout.file_name
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SyntheticFranchiseConfig, generate_synthetic_dataset
+from evidence.models import OverrideBundle
+from evidence.normalize import normalize_source_record
+from pipeline import run_stage
+from presentation.service import ContractService, ContractSlice, parse_contract_slice, slice_contract_payload
+from storage import InMemoryRepository
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _synthetic_repository() -> InMemoryRepository:
+    dataset = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=3, seasons=4, trades_per_season=4, seed=11))
+    repository = InMemoryRepository()
+    repository.insert_source_records(dataset.source_records)
+    repository.insert_override_bundle(OverrideBundle(overrides=[], override_links=[]))
+    repository.insert_normalized_claims(
+        [*(claim for record in dataset.source_records for claim in normalize_source_record(record)), *dataset.supplemental_claims]
+    )
+    for stage_name in (
+        "canonical-events",
+        "canonical-player-tenures",
+        "canonical-pick-lifecycle",
+        "canonical-event-asset-flows",
+        "presentation-contract",
+    ):
+        run_stage(stage_name, repository)
+    return repository
+
+
+def _service(repository: InMemoryRepository, clock: _Clock, tmp_path: Path, **options) -> ContractService:
+    opened = []
+
+    def repository_factory() -> InMemoryRepository:
+        opened.append(repository)
+        return repository
+
+    service = ContractService(
+        repository_factory,
+        headshot_manifest_path=tmp_path / "missing-manifest.yaml",
+        frontend_public_root=tmp_path,
+        clock=clock,
+        **options,
+    )
+    service.opened = opened
+    return service
+
+
+def test_parse_contract_slice_reads_dates_and_asset_ids() -> None:
+    contract_slice = parse_contract_slice("start=2020-01-01&end=2021-06-30&asset_id=a,b&asset_id=c")
+
+    assert contract_slice.as_dict() == {"start_date": "2020-01-01", "end_date": "2021-06-30", "asset_ids": ["a", "b", "c"]}
+    assert parse_contract_slice("").is_whole
+    with pytest.raises(ValueError, match="ISO date"):
+        parse_contract_slice("start=soon")
+    with pytest.raises(ValueError, match="unknown query parameters"):
+        parse_contract_slice("team=MEM")
+
+
+def test_slice_contract_payload_filters_rows_by_window_and_asset() -> None:
+    payload = {
+        "nodes": [
+            {"node_id": "n1", "event_date": "2020-01-01"},
+            {"node_id": "n2", "event_date": "2021-01-01"},
+            {"node_id": "n3", "event_date": "2022-01-01"},
+        ],
+        "edges": [
+            {"edge_id": "e1", "asset_id": "a", "source_node_id": "n1", "target_node_id": "n2", "start_date": "2020-01-01", "end_date": "2021-01-01"},
+            {"edge_id": "e2", "asset_id": "b", "source_node_id": "n2", "target_node_id": "n3", "start_date": "2021-01-01", "end_date": "2022-01-01"},
+        ],
+        "meta": {"presentation_build_id": "build"},
+    }
+
+    windowed = slice_contract_payload(payload, ContractSlice(start_date=date(2021, 6, 1)))
+    assert [row["node_id"] for row in windowed["nodes"]] == ["n3"]
+    assert [row["edge_id"] for row in windowed["edges"]] == ["e2"]
+    assert windowed["meta"] == payload["meta"]
+
+    by_asset = slice_contract_payload(payload, ContractSlice(asset_ids=frozenset({"a"})))
+    assert [row["edge_id"] for row in by_asset["edges"]] == ["e1"]
+    assert [row["node_id"] for row in by_asset["nodes"]] == ["n1", "n2"]
+    assert by_asset["slice"]["asset_ids"] == ["a"]
+
+
+def test_contract_service_answers_conditional_gets_and_invalidates_on_new_build(tmp_path: Path) -> None:
+    repository = _synthetic_repository()
+    clock = _Clock()
+    service = _service(repository, clock, tmp_path)
+
+    async def scenario() -> None:
+        first = await service.handle("GET", "/contracts/presentation", {})
+        assert first.status == 200 and first.etag
+        payload = json.loads(first.body)
+        assert payload["meta"]["presentation_build_id"] == repository.fetch_current_presentation_build_id()
+
+        not_modified = await service.handle("GET", "/contracts/presentation", {"if-none-match": first.etag})
+        assert not_modified.status == 304 and not_modified.body == b""
+
+        cached = await service.handle("GET", "/contracts/presentation", {})
+        assert cached.body == first.body
+
+        asset_id = payload["edges"][0]["asset_id"]
+        sliced = await service.handle("GET", f"/contracts/presentation?asset_id={asset_id}", {})
+        assert sliced.status == 200 and sliced.etag != first.etag
+        assert {row["asset_id"] for row in json.loads(sliced.body)["edges"]} == {asset_id}
+
+        layout = await service.handle("GET", "/contracts/layout?start=2000-01-01", {})
+        assert layout.status == 200 and "lane_layout" in json.loads(layout.body)
+        assert (await service.handle("GET", "/contracts/editorial", {})).status == 404
+        assert (await service.handle("GET", "/contracts/unknown", {})).status == 404
+        assert (await service.handle("POST", "/contracts/presentation", {})).status == 405
+        assert (await service.handle("GET", "/contracts/presentation?start=nope", {})).status == 400
+        assert service.stats.counts()["cache_hits"] == 1
+        assert service.stats.contract_loads == 2
+
+        run_stage("presentation-contract", repository)
+        # Within the refresh interval the old build is still served from cache.
+        assert (await service.handle("GET", "/contracts/presentation", {"if-none-match": first.etag})).status == 304
+        clock.now += 5.0
+        rebuilt = await service.handle("GET", "/contracts/presentation", {"if-none-match": first.etag})
+        assert rebuilt.status == 200 and rebuilt.etag != first.etag
+        assert json.loads(rebuilt.body)["meta"]["presentation_build_id"] == repository.fetch_current_presentation_build_id()
+        assert service.stats.invalidations == 1
+        assert len(service.opened) == 1
+
+    asyncio.run(scenario())
+
+
+def test_contract_service_slices_lod_tiers_and_drops_the_positional_spatial_index(tmp_path: Path) -> None:
+    service = _service(_synthetic_repository(), _Clock(), tmp_path)
+
+    async def scenario() -> tuple[dict, dict]:
+        whole = json.loads((await service.handle("GET", "/contracts/layout", {})).body)
+        start = whole["lane_layout"][len(whole["lane_layout"]) // 2]["date_start"]
+        sliced = json.loads((await service.handle("GET", f"/contracts/layout?start={start}", {})).body)
+        return whole, sliced
+
+    whole, sliced = asyncio.run(scenario())
+    assert whole["spatial_index"] is not None and sliced["spatial_index"] is None
+    start = sliced["slice"]["start_date"]
+    for whole_tier, sliced_tier in zip(whole["lod_tiers"], sliced["lod_tiers"]):
+        assert all(row["date_end"] >= start for row in sliced_tier["segments"])
+        assert len(sliced_tier["segments"]) <= len(whole_tier["segments"])
+        kept_ids = {row["lod_segment_id"] for row in sliced_tier["segments"]} | {row["segment_id"] for row in sliced["lane_layout"]}
+        assert {row["segment_id"] for row in sliced_tier["label_placements"]} <= kept_ids
+    assert sum(len(tier["segments"]) for tier in sliced["lod_tiers"]) < sum(len(tier["segments"]) for tier in whole["lod_tiers"])
+
+
+def test_contract_service_answers_from_the_known_build_while_a_load_holds_the_reader(tmp_path: Path) -> None:
+    clock = _Clock()
+    service = _service(_synthetic_repository(), clock, tmp_path)
+
+    async def scenario() -> tuple[str | None, str | None]:
+        known = await service.build_key()
+        clock.now += 5.0
+        async with service._reader_lock:
+            return known, await asyncio.wait_for(service.build_key(), timeout=1.0)
+
+    known, during_load = asyncio.run(scenario())
+    assert during_load == known
+
+
+def test_contract_service_evicts_least_recently_used_responses(tmp_path: Path) -> None:
+    service = _service(_synthetic_repository(), _Clock(), tmp_path, cache_entries=2)
+
+    async def scenario() -> None:
+        for query in ("start=2000-01-01", "start=2001-01-01", "start=2000-01-01", "start=2002-01-01", "start=2001-01-01"):
+            await service.handle("GET", f"/contracts/presentation?{query}", {})
+
+    asyncio.run(scenario())
+    assert service.stats.cache_hits == 1
+    assert service.stats.cache_misses == 4
+    assert len(service._responses) == 2
+
+
+def test_contract_service_serves_http_over_a_socket(tmp_path: Path) -> None:
+    service = _service(_synthetic_repository(), _Clock(), tmp_path)
+
+    async def scenario() -> tuple[bytes, bytes]:
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            responses = []
+            for method in ("GET", "HEAD"):
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(f"{method} /contracts/presentation HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+                await writer.drain()
+                responses.append(await reader.read())
+                writer.close()
+                await writer.wait_closed()
+        return responses[0], responses[1]
+
+    get_response, head_response = asyncio.run(scenario())
+    head, _, body = get_response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert b"ETag: " in head
+    assert json.loads(body)["meta"]["node_count"] > 0
+    assert head_response.partition(b"\r\n\r\n")[0] == head
+    assert head_response.endswith(b"\r\n\r\n")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from evidence.override_schema import OverrideBundleSchema
+from evidence.overrides import OVERRIDE_CACHE_NAMESPACE, load_override_bundle
+from shared.config_cache import active_config_cache_dir, config_cache_session, load_cached_file, schema_fingerprint
+
+CONFIG_DATA_DIR = Path(__file__).resolve().parents[2] / "configs" / "data"
+
+
+def _counting_loader(calls: list[str]):
+    def load(raw_text: str) -> dict[str, str]:
+        calls.append(raw_text)
+        return {"text": raw_text.strip()}
+
+    return load
+
+
+def test_load_cached_file_reuses_entries_until_the_content_changes(tmp_path: Path) -> None:
+    source = tmp_path / "bundle.yaml"
+    source.write_text("first\n", encoding="utf-8")
+    calls: list[str] = []
+    load = _counting_loader(calls)
+
+    with config_cache_session(tmp_path / "cache") as cache_dir:
+        assert active_config_cache_dir() == cache_dir
+        assert load_cached_file(source, "unit-v1", load) == {"text": "first"}
+        assert load_cached_file(source, "unit-v1", load) == {"text": "first"}
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_cached_file(source, "unit-v1", load) == {"text": "first"}
+        assert len(calls) == 1
+
+        source.write_text("second\n", encoding="utf-8")
+        assert load_cached_file(source, "unit-v1", load) == {"text": "second"}
+        assert len(calls) == 2
+
+        entry_path = next((cache_dir / "unit-v1").glob("*.pickle"))
+        entry_path.write_bytes(b"not a pickle")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert load_cached_file(source, "unit-v1", load) == {"text": "second"}
+        assert len(calls) == 3
+
+    assert active_config_cache_dir() is None
+    assert load_cached_file(source, "unit-v1", load) == {"text": "second"}
+    assert len(calls) == 4
+
+
+def test_cached_override_bundle_matches_an_uncached_load(tmp_path: Path) -> None:
+    uncached = load_override_bundle(CONFIG_DATA_DIR)
+    with config_cache_session(tmp_path / "cache"):
+        load_override_bundle(CONFIG_DATA_DIR)
+        cached = load_override_bundle(CONFIG_DATA_DIR)
+
+    assert [row.override_id for row in cached.overrides] == [row.override_id for row in uncached.overrides]
+    assert [row.payload for row in cached.overrides] == [row.payload for row in uncached.overrides]
+    assert list((tmp_path / "cache" / OVERRIDE_CACHE_NAMESPACE).glob("*.pickle"))
+
+
+def test_schema_fingerprint_changes_with_the_validated_schema() -> None:
+    class Before(BaseModel):
+        override_id: str
+
+    class After(BaseModel):
+        override_id: str
+        reason: str | None = None
+
+    assert schema_fingerprint(Before) != schema_fingerprint(After)
+    assert OVERRIDE_CACHE_NAMESPACE.endswith(schema_fingerprint(OverrideBundleSchema))
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shared.franchise import DEFAULT_FRANCHISE, FRANCHISES, franchise_for, franchise_partition_path, parse_franchise_codes
+
+
+def test_default_franchise_markers_match_the_memphis_heuristics() -> None:
+    assert DEFAULT_FRANCHISE.incoming_markers == (
+        "to memphis",
+        "to the grizzlies",
+        "joins memphis",
+        "acquired by memphis",
+        "memphis acquires",
+    )
+    assert DEFAULT_FRANCHISE.outgoing_markers == ("from memphis", "released by memphis", "waived by memphis")
+    assert DEFAULT_FRANCHISE.abbrevs == ("MEM", "VAN")
+
+
+def test_trade_direction_is_read_from_the_franchise_side() -> None:
+    description = "Jane Roe traded from Memphis to Boston"
+    assert franchise_for("mem").trade_direction(description) == "outgoing"
+    assert franchise_for("BOS").trade_direction(description) == "incoming"
+    assert franchise_for("DAL").trade_direction(description) == "unknown"
+    assert franchise_for("DAL").trade_direction("Dallas trades Jane Roe", outgoing_markers=("trades",)) == "outgoing"
+
+
+def test_parse_franchise_codes_and_partition_paths() -> None:
+    assert len(FRANCHISES) == 30
+    assert parse_franchise_codes("all") == list(FRANCHISES.values())
+    assert [row.code for row in parse_franchise_codes("bos, MEM,bos")] == ["BOS", "MEM"]
+    with pytest.raises(ValueError, match="unknown franchise code"):
+        parse_franchise_codes("MEM,XYZ")
+    assert franchise_partition_path(Path(".local/store.pickle"), franchise_for("BOS")) == Path(".local/bos/store.pickle")
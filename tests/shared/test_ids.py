@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+from shared.ids import MAX_INTERNED_LENGTH, IdDictionary, active_id_dictionary, id_dictionary_session, stable_id
+from storage.postgres import interning_tuple_row
+
+
+def _cursor(*names: str) -> SimpleNamespace:
+    return SimpleNamespace(description=[SimpleNamespace(name=name) for name in names])
+
+
+def test_id_dictionary_interns_and_encodes_each_id_once() -> None:
+    ids = IdDictionary()
+    first = ids.intern("".join(["claim_", "abc"]))
+    second = ids.intern("".join(["claim_", "abc"]))
+
+    assert first is second
+    assert ids.encode("claim_abc") == 0 and ids.encode("event_def") == 1
+    assert ids.decode(1) == "event_def"
+    assert ids.values() == ["claim_abc", "event_def"]
+    long_text = "x" * (MAX_INTERNED_LENGTH + 1)
+    assert ids.intern(long_text) is long_text and len(ids) == 2
+
+
+def test_stable_id_returns_one_shared_string_per_session() -> None:
+    assert active_id_dictionary() is None
+    assert stable_id("event", "a", 1) is not stable_id("event", "a", 1)
+
+    with id_dictionary_session() as ids:
+        with id_dictionary_session() as nested:
+            assert nested is ids
+        assert stable_id("event", "a", 1) is stable_id("event", "a", 1)
+        assert len(ids) == 1
+    assert active_id_dictionary() is None
+
+
+def test_id_dictionary_session_is_scoped_to_the_opening_thread() -> None:
+    seen_from_thread = []
+    with id_dictionary_session():
+        worker = threading.Thread(target=lambda: seen_from_thread.append(active_id_dictionary()))
+        worker.start()
+        worker.join()
+    assert seen_from_thread == [None]
+
+
+def test_interning_row_factory_shares_id_columns_only_inside_a_session() -> None:
+    cursor = _cursor("claim_id", "description", "source_record_id")
+    assert interning_tuple_row(cursor) is tuple
+
+    with id_dictionary_session() as ids:
+        assert interning_tuple_row(_cursor("description", "notes")) is tuple
+        make_row = interning_tuple_row(cursor)
+        first = make_row(["".join(["claim_", "abc"]), "".join(["free ", "text"]), None])
+        second = make_row(["".join(["claim_", "abc"]), "".join(["free ", "text"]), "".join(["source_", "x"])])
+
+    assert first[0] is second[0] is ids.intern("claim_abc")
+    assert first[1] == second[1] and first[1] is not second[1]
+    assert first[2] is None and second[2] is ids.intern("source_x")
+    assert ids.values() == ["claim_abc", "source_x"]
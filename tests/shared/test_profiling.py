@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from redesign_cli import main
+from shared.profiling import active_profiler, profiling_session, span, traced
+from storage import InMemoryRepository, open_repository
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "evidence" / "fixtures"
+
+
+@traced("build")
+def _build_rows(count: int) -> list[int]:
+    return list(range(count))
+
+
+def test_traced_functions_are_transparent_without_a_session() -> None:
+    assert active_profiler() is None
+    assert _build_rows(3) == [0, 1, 2]
+    with span("ignored", "build") as row:
+        assert row is None
+
+
+def test_profiling_session_records_spans_counters_and_chrome_trace(tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.json"
+    with profiling_session("unit", cprofile=True, memory=True, trace_path=trace_path) as profiler:
+        with span("outer", "stage"):
+            _build_rows(5)
+        payload = profiler.as_dict()
+        profiler.write_trace()
+
+    assert active_profiler() is None
+    spans = {row["name"]: row for row in payload["spans"]}
+    assert spans["_build_rows"]["attributes"]["rows"] == 5
+    assert spans["_build_rows"]["depth"] == spans["outer"]["depth"] + 1
+    assert payload["counters"] == {"build.calls": 1, "build.rows": 5, "stage.calls": 1}
+    assert "peak_memory_bytes" in payload
+    assert "id_hashing" in payload["cprofile"]
+
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    complete_events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {event["name"] for event in complete_events} == {"outer", "_build_rows"}
+    assert all(event["dur"] >= 0 for event in complete_events)
+
+
+def test_profiling_sessions_do_not_nest() -> None:
+    with profiling_session("outer"):
+        with pytest.raises(RuntimeError, match="already active"):
+            with profiling_session("inner"):
+                pass
+
+
+def test_profiling_session_is_scoped_to_the_opening_thread() -> None:
+    seen_from_thread = []
+    with profiling_session("unit") as profiler:
+        worker = threading.Thread(target=lambda: seen_from_thread.append((active_profiler(), _build_rows(2))))
+        worker.start()
+        worker.join()
+        payload = profiler.as_dict()
+
+    assert seen_from_thread == [(None, [0, 1])]
+    assert payload["spans"] == []
+
+
+def test_open_repository_instruments_calls_only_while_profiling(tmp_path: Path) -> None:
+    store_path = tmp_path / "store.pickle"
+    assert isinstance(open_repository("memory", store_path), InMemoryRepository)
+
+    with profiling_session("unit") as profiler:
+        with open_repository("memory", store_path) as repository:
+            assert not isinstance(repository, InMemoryRepository)
+            repository.insert_source_records([])
+            assert repository.fetch_source_records() == []
+            assert profiler.counters["fetch.bytes"] == 2
+        payload = profiler.as_dict()
+
+    assert [row["name"] for row in payload["spans"]] == ["insert_source_records", "fetch_source_records"]
+    assert payload["counters"]["fetch.rows"] == 0
+    assert payload["counters"]["fetch.bytes"] == 2
+
+
+def test_cli_profile_flag_adds_profile_payload_and_trace_file(tmp_path: Path, capsys) -> None:
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for path in FIXTURES_DIR.glob("*_raw.json"):
+        shutil.copy(path, input_dir / path.name)
+    trace_path = tmp_path / "trace.json"
+
+    argv = ["--storage", "memory", "--storage-path", str(tmp_path / "store.pickle"), "--config-cache-dir", str(tmp_path / "cache")]
+    assert main([*argv, "load-source-records", "--input-path", str(input_dir)]) == 0
+    assert "profile" not in json.loads(capsys.readouterr().out)
+
+    argv = [*argv, "--profile-trace-path", str(trace_path)]
+    assert main([*argv, "load-overrides"]) == 0
+    capsys.readouterr()
+    assert main([*argv, "build-canonical-events"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+
+    profile = payload["profile"]
+    assert profile["name"] == "build-canonical-events"
+    names = [row["name"] for row in profile["spans"]]
+    assert names[:4] == [
+        "canonical-events",
+        "fetch_event_build_inputs",
+        "build_canonical_events",
+        "persist_canonical_event_build",
+    ]
+    assert profile["counters"]["build.rows"] == payload["event_count"] + payload["event_provenance_count"]
+    assert profile["counters"]["fetch.bytes"] > 0
+    assert json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
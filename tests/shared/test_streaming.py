@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shared.streaming import CompactIdSet, DiskIdSet, keyset_rows, open_id_set
+
+
+class _FakeCursor:
+    def __init__(self, rows: list[tuple[object, ...]], calls: list[tuple[str, tuple[object, ...]]]) -> None:
+        self.rows = rows
+        self.calls = calls
+        self.description = [("created_at",), ("row_id",), ("value",)]
+        self._result: list[tuple[object, ...]] = []
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: tuple[object, ...]) -> None:
+        self.calls.append((sql, params))
+        *after, limit = params
+        ordered = sorted(self.rows, key=lambda row: (row[0], row[1]))
+        if after:
+            ordered = [row for row in ordered if (row[0], row[1]) > tuple(after)]
+        self._result = ordered[:limit]
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self._result
+
+
+class _FakeConnection:
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self.rows = rows
+        self.calls: list[tuple[str, tuple[object, ...]]] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.rows, self.calls)
+
+
+def test_keyset_rows_reads_every_row_once_in_key_order() -> None:
+    rows = [(f"2024-01-0{index % 3 + 1}", f"row-{index:02d}", index) for index in range(11)]
+    conn = _FakeConnection(rows)
+
+    streamed = list(keyset_rows(conn, "select * from t", key_columns=("created_at", "row_id"), page_size=4))
+
+    assert streamed == sorted(rows, key=lambda row: (row[0], row[1]))
+    assert len(conn.calls) == 3
+    assert "offset" not in conn.calls[-1][0]
+    assert "where (created_at, row_id) > (%s, %s)" in conn.calls[-1][0]
+    assert conn.calls[1][1] == (*streamed[3][:2], 4)
+
+
+def test_keyset_rows_rejects_empty_pages() -> None:
+    with pytest.raises(ValueError, match="page_size"):
+        list(keyset_rows(_FakeConnection([]), "select 1", key_columns=("row_id",), page_size=0))
+
+
+def test_id_sets_track_membership_in_memory_and_on_disk(tmp_path: Path) -> None:
+    spill_path = tmp_path / "spill" / "ids.sqlite"
+    for id_set in (CompactIdSet(["a", "b"]), DiskIdSet(spill_path, ["a", "b"])):
+        id_set.add("b")
+        id_set.update(["c"])
+        assert "a" in id_set and "c" in id_set
+        assert "d" not in id_set and 1 not in id_set
+        assert len(id_set) == 3
+        id_set.close()
+    assert not spill_path.exists()
+    assert isinstance(open_id_set(), CompactIdSet)
+    disk_set = open_id_set(spill_path)
+    assert isinstance(disk_set, DiskIdSet)
+    disk_set.close()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SyntheticFranchiseConfig, generate_synthetic_dataset
+from pipeline import run_editorial_stage, run_stage
+from pipeline.franchises import FranchiseRunJob, franchise_partition, run_franchise
+from presentation.compact import decode_compact_contract
+from redesign_cli import main
+from shared.franchise import DEFAULT_FRANCHISE
+from storage import InMemoryRepository, open_repository
+from tests.helpers import copy_raw_fixtures, run_memory_cli
+
+
+@pytest.fixture
+def raw_input_dir(tmp_path: Path) -> Path:
+    return copy_raw_fixtures(tmp_path)
+
+
+def test_memory_backend_runs_stage_commands_end_to_end(tmp_path: Path, raw_input_dir: Path, capsys) -> None:
+    store_path = tmp_path / "store.pickle"
+
+    loaded = run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+    assert loaded["source_record_count"] == 3
+    assert loaded["inserted_claim_count"] == loaded["normalized_claim_count"] > 0
+
+    reloaded = run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+    assert reloaded["inserted_source_record_count"] == 0
+    assert reloaded["inserted_claim_count"] == 0
+
+    run_memory_cli(capsys, store_path, "load-overrides")
+    events = run_memory_cli(capsys, store_path, "build-canonical-events")
+    assert events["event_count"] > 0
+    run_memory_cli(capsys, store_path, "build-canonical-player-tenures")
+    picks = run_memory_cli(capsys, store_path, "build-canonical-pick-lifecycle")
+    assert picks["pick_asset_count"] > 0
+    run_memory_cli(capsys, store_path, "build-canonical-event-asset-flows")
+    lineage = run_memory_cli(capsys, store_path, "build-canonical-asset-lineage")
+    assert lineage["refresh_mode"] == "full"
+    assert run_memory_cli(capsys, store_path, "build-canonical-asset-lineage")["changed_asset_lineage_count"] == 0
+    presentation = run_memory_cli(capsys, store_path, "build-presentation-contract")
+    editorial = run_memory_cli(capsys, store_path, "load-editorial-overlays")
+    layout = run_memory_cli(capsys, store_path, "validate-layout-contract")
+
+    assert layout["errors"] == []
+    index_path = tmp_path / "holdings.json"
+    holdings = run_memory_cli(capsys, store_path, "query-holdings", "--as-of", "2019-02-07", "--index-path", str(index_path))
+    assert index_path.exists()
+    assert holdings["canonical_build_id"] is not None
+    assert holdings["holding_count"] == len(holdings["holdings"])
+    diff = run_memory_cli(capsys, store_path, "query-holdings", "--diff", "2018-01-01", "2020-01-01", "--index-path", str(index_path))
+    assert set(diff) >= {"added", "removed", "from_date", "to_date"}
+    stale_index = json.loads(index_path.read_text())
+    index_path.write_text(json.dumps({**stale_index, "canonical_build_id": "stale", "intervals": []}))
+    rebuilt = run_memory_cli(capsys, store_path, "query-holdings", "--as-of", "2019-02-07", "--index-path", str(index_path))
+    assert rebuilt["canonical_build_id"] == holdings["canonical_build_id"]
+    assert rebuilt["holding_count"] == holdings["holding_count"]
+    base_path = tmp_path / "layout-base.json"
+    delta_path = tmp_path / "layout-delta.json"
+    run_memory_cli(capsys, store_path, "export-layout-contract", "--output-path", str(base_path))
+    delta = run_memory_cli(
+        capsys, store_path, "export-layout-contract", "--output-path", str(delta_path), "--base-path", str(base_path)
+    )
+    assert delta["added_row_count"] == delta["removed_row_count"] == delta["changed_row_count"] == 0
+    assert json.loads(delta_path.read_text())["target_content_hash"] == delta["target_content_hash"]
+    compact_path = tmp_path / "layout.bin"
+    compact = run_memory_cli(
+        capsys, store_path, "export-layout-contract", "--output-path", str(compact_path), "--format", "compact"
+    )
+    assert decode_compact_contract(compact_path.read_bytes()) == json.loads(base_path.read_text())
+    assert compact["compact_byte_count"] < compact["json_byte_count"]
+    published = run_memory_cli(capsys, store_path, "publish-contracts", "--output-dir", str(tmp_path / "published"))
+    assert {row["logical_name"] for row in published["artifacts"]} == {
+        "editorial-chapters",
+        "layout-contract",
+        "presentation-contract",
+    }
+    assert run_memory_cli(capsys, store_path, "publish-contracts", "--output-dir", str(tmp_path / "published"))["written_file_count"] == 0
+    with InMemoryRepository(path=store_path) as repository:
+        assert repository.fetch_current_presentation_build_id() == presentation["presentation_build_id"]
+        assert repository.fetch_editorial_overlays().build.editorial_build_id == editorial["editorial_build_id"]
+        assert len(repository.fetch_presentation_contract().nodes) == presentation["node_count"]
+
+
+def test_memory_backend_keeps_pick_assets_after_tenure_rebuild(tmp_path: Path, raw_input_dir: Path, capsys) -> None:
+    store_path = tmp_path / "store.pickle"
+    run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+    run_memory_cli(capsys, store_path, "load-overrides")
+
+    with open_repository("memory", store_path) as repository:
+        run_stage("canonical-events", repository)
+        run_stage("canonical-player-tenures", repository)
+        pick_counts = run_stage("canonical-pick-lifecycle", repository)
+        _, _, assets, _, _ = repository.fetch_event_asset_flow_build_inputs()
+
+    assert sum(asset.asset_kind == "pick_continuity" for asset in assets) == pick_counts["pick_asset_count"]
+
+    with open_repository("memory", store_path) as repository:
+        run_stage("canonical-player-tenures", repository)
+        _, _, assets, _, _ = repository.fetch_event_asset_flow_build_inputs()
+
+    assert not any(asset.asset_kind == "pick_continuity" for asset in assets)
+
+
+def test_incremental_normalize_skips_records_already_normalized_at_the_version(
+    tmp_path: Path, raw_input_dir: Path, capsys
+) -> None:
+    store_path = tmp_path / "store.pickle"
+    loaded = run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+
+    current = run_memory_cli(capsys, store_path, "normalize-evidence", "--incremental")
+    assert current["source_record_count"] == current["normalized_claim_count"] == 0
+    assert current["skipped_source_record_count"] == loaded["source_record_count"]
+
+    full = run_memory_cli(capsys, store_path, "normalize-evidence")
+    assert full["source_record_count"] == loaded["source_record_count"]
+    assert full["skipped_source_record_count"] == full["inserted_claim_count"] == 0
+
+    bumped = run_memory_cli(capsys, store_path, "normalize-evidence", "--incremental", "--normalizer-version", "stage1-normalizer-v2")
+    assert bumped["source_record_count"] == loaded["source_record_count"]
+    assert bumped["normalized_claim_count"] == loaded["normalized_claim_count"]
+    assert bumped["skipped_source_record_count"] == 0
+
+    # The bumped version re-derives the same claim ids, so only the ledger records that it ran.
+    rerun = run_memory_cli(capsys, store_path, "normalize-evidence", "--incremental", "--normalizer-version", "stage1-normalizer-v2")
+    assert rerun["source_record_count"] == rerun["normalized_claim_count"] == 0
+    assert rerun["skipped_source_record_count"] == loaded["source_record_count"]
+
+
+def test_stage_workers_read_through_read_only_handles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dataset = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=3, seasons=2, trades_per_season=2, seed=3))
+    partition = franchise_partition(DEFAULT_FRANCHISE, storage="memory", storage_path=tmp_path / "store.pickle")
+    opened: list[bool] = []
+    original_init = InMemoryRepository.__init__
+
+    def recording_init(self: InMemoryRepository, *args, **kwargs) -> None:
+        original_init(self, *args, **kwargs)
+        opened.append(self.read_only)
+
+    monkeypatch.setattr(InMemoryRepository, "__init__", recording_init)
+    result = run_franchise(
+        FranchiseRunJob(partition=partition, source_records=dataset.source_records, normalizer_version="stage1-normalizer-v1")
+    )
+
+    # The loader and the scheduler hold the only writable handles; every stage worker only reads.
+    assert opened.count(False) == 2
+    assert opened.count(True) == len(result.pipeline.counts()["stages"]) == 6
+
+
+def test_memory_backend_discards_uncommitted_changes_on_error(tmp_path: Path, raw_input_dir: Path, capsys) -> None:
+    store_path = tmp_path / "store.pickle"
+    run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+
+    with pytest.raises(RuntimeError, match="abort"):
+        with open_repository("memory", store_path) as repository:
+            run_editorial_stage(repository)
+            raise RuntimeError("abort")
+
+    with pytest.raises(RuntimeError, match="no editorial build found"):
+        with open_repository("memory", store_path) as repository:
+            repository.fetch_editorial_overlays()
+
+
+def test_memory_rollback_restores_the_last_commit() -> None:
+    dataset = generate_synthetic_dataset(SyntheticFranchiseConfig(teams=2, seasons=1, trades_per_season=1, seed=3))
+    repository = InMemoryRepository()
+    repository.insert_source_records(dataset.source_records[:1])
+    repository.commit()
+
+    repository.insert_source_records(dataset.source_records[1:])
+    run_editorial_stage(repository)
+    repository.rollback()
+
+    assert list(repository.state.source_records) == [dataset.source_records[0].source_record_id]
+    assert repository.state.editorial_builds == {}
+
+
+def test_read_only_memory_handle_never_overwrites_a_newer_build(tmp_path: Path, raw_input_dir: Path, capsys) -> None:
+    store_path = tmp_path / "store.pickle"
+    run_memory_cli(capsys, store_path, "load-source-records", "--input-path", str(raw_input_dir))
+    run_memory_cli(capsys, store_path, "run-pipeline")
+
+    with open_repository("memory", store_path, read_only=True) as reader:
+        stale_build_id = reader.fetch_current_presentation_build_id()
+        rebuilt = run_memory_cli(capsys, store_path, "build-presentation-contract")
+        assert reader.fetch_latest_editorial_build_id() is not None
+        assert reader.fetch_current_presentation_build_id() == stale_build_id
+        reader.refresh()
+        assert reader.fetch_current_presentation_build_id() == rebuilt["presentation_build_id"]
+
+    with InMemoryRepository(path=store_path) as repository:
+        assert repository.fetch_current_presentation_build_id() == rebuilt["presentation_build_id"] != stale_build_id
+
+
+def test_open_repository_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="unknown storage backend"):
+        open_repository("sqlite")
+
+
+def test_sql_only_commands_require_postgres_backend(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="postgres"):
+        main(["--storage", "memory", "--storage-path", str(tmp_path / "store.pickle"), "--no-config-cache", "validate-evidence"])